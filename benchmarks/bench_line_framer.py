@@ -0,0 +1,100 @@
+"""Microbenchmark for framing sleap-nn output into log lines.
+
+Compares the worker's previous framing loop (``read(512)``, ``buf += chunk``
+and ``buf = buf[match.end():]`` per line) against
+:class:`sleap_rtc.worker.line_framer.LineFramer` on synthetic output shaped
+like a sleap-nn training run: per-epoch logging lines plus bursts of tqdm
+``\\r`` redraws, some of them very wide.
+
+Run with::
+
+    python benchmarks/bench_line_framer.py [--epochs N] [--batches N]
+"""
+
+import argparse
+import re
+import time
+
+from sleap_rtc.worker.line_framer import LINE_READ_SIZE, LineFramer
+
+SEP = re.compile(rb"[\r\n]")
+
+
+def synthetic_output(epochs: int, batches: int, width: int) -> bytes:
+    """Build sleap-nn-like stdout: logging lines and tqdm ``\\r`` bursts."""
+    out = bytearray()
+    for epoch in range(1, epochs + 1):
+        out += f"INFO:sleap_nn.training.model_trainer:Epoch {epoch} started\n".encode()
+        for batch in range(1, batches + 1):
+            pct = batch * 100 // batches
+            bar = "█" * (pct * width // 100)
+            out += (
+                f"\rEpoch {epoch}: {pct:3d}%|{bar:<{width}}| {batch}/{batches} "
+                f"[00:01<00:02, 31.4it/s, loss={1 / (epoch + batch):.4f}, "
+                f"v_num=0]"
+            ).encode()
+        out += (
+            f"\nINFO:sleap_nn.training.model_trainer:Epoch {epoch} "
+            f"train/loss={1 / epoch:.4f} val/loss={1.1 / epoch:.4f}\n"
+        ).encode()
+    return bytes(out)
+
+
+def chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def frame_old(data: bytes) -> int:
+    """The previous loop from ``stream_logs_with_progress``."""
+    count = 0
+    buf = b""
+    for chunk in chunks(data, 512):
+        buf += chunk
+        while True:
+            match = SEP.search(buf)
+            if not match:
+                break
+            payload = buf[: match.start()]
+            buf = buf[match.end() :]
+            if payload.decode(errors="replace"):
+                count += 1
+    return count
+
+
+def frame_new(data: bytes) -> int:
+    count = 0
+    framer = LineFramer()
+    for chunk in chunks(data, LINE_READ_SIZE):
+        count += len(framer.feed(chunk))
+    return count
+
+
+def bench(name, fn, data, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        lines = fn(data)
+        best = min(best, time.perf_counter() - start)
+    mb = len(data) / 1e6
+    print(f"{name:>6}: {best * 1e3:8.1f} ms  {mb / best:8.1f} MB/s  {lines} lines")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--epochs", type=int, default=20)
+    parser.add_argument("--batches", type=int, default=2000)
+    parser.add_argument("--width", type=int, default=400, help="tqdm bar width")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = synthetic_output(args.epochs, args.batches, args.width)
+    print(f"{len(data) / 1e6:.1f} MB of synthetic sleap-nn output")
+    old = bench("old", frame_old, data, args.repeat)
+    new = bench("new", frame_new, data, args.repeat)
+    assert old == new, (old, new)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Microbenchmark for tracing received data-channel messages during an upload.
+
+Compares the worker's previous per-message logging (``len(str(message))``
+plus an eagerly built ``logging.info`` f-string, even for 64 KB binary
+chunks) against :class:`sleap_rtc.tracing.MessageTracer` in each of its
+modes. Reports CPU seconds per GB of uploaded chunks. Log records go to a
+handler that formats and drops them, so the cost of building each line is
+included but no I/O is.
+
+Run with::
+
+    python benchmarks/bench_message_trace.py [--megabytes N]
+"""
+
+import argparse
+import logging
+import time
+
+from sleap_rtc.tracing import MessageTracer
+
+CHUNK_SIZE = 64 * 1024
+
+
+class FormatOnlyHandler(logging.Handler):
+    """Format every record, as a real handler would, then drop it."""
+
+    def emit(self, record):
+        self.format(record)
+
+
+def trace_old(message):
+    """The previous logging from ``on_datachannel.on_message``."""
+    log_msg = message if len(str(message)) < 100 else f"{str(message)[:100]}..."
+    logging.info(f"Worker received: {log_msg}")
+
+
+def bench(name, trace, messages, total_bytes):
+    start = time.process_time()
+    for message in messages:
+        trace(message)
+    cpu = time.process_time() - start
+    per_gb = cpu * 1e9 / total_bytes
+    print(f"{name:>14}: {cpu * 1e3:9.1f} ms CPU  {per_gb:8.3f} s/GB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=int, default=256)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, handlers=[FormatOnlyHandler()])
+
+    chunk = bytes(range(256)) * (CHUNK_SIZE // 256)
+    count = args.megabytes * 1024 * 1024 // CHUNK_SIZE
+    messages = [chunk] * count
+    total = count * CHUNK_SIZE
+    print(f"{count} chunks of {CHUNK_SIZE // 1024} KB ({total / 1e6:.0f} MB)")
+
+    bench("old", trace_old, messages, total)
+    for mode in ("all", "sample", "count"):
+        tracer = MessageTracer("Worker", level=logging.INFO, mode=mode)
+        bench(f"tracer {mode}", tracer.trace, messages, total)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,8 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from typing import Callable
 
+    from sleap_rtc.client.hash_cache import HashCache
+
 __all__ = [
     # Availability
     "is_available",
@@ -217,9 +219,12 @@ class _StreamedFileReceiver:
         Returns True if the message was consumed by the file-transfer state
         machine (caller should not forward it further); False otherwise.
         """
-        if message.startswith("FILE_META::"):
-            # Format: FILE_META::<filename>:<size>:<hint>
-            _, meta = message.split("FILE_META::", 1)
+        striped = message.startswith("FILE_META_STRIPED::")
+        compressed = message.startswith("FILE_META_COMPRESSED::")
+        if message.startswith("FILE_META::") or striped or compressed:
+            # Format: FILE_META[_STRIPED]::<filename>:<size>:<hint>
+            #     or: FILE_META_COMPRESSED::<filename>:<size>:<hint>:<codec>
+            _, meta = message.split("::", 1)
             parts = meta.split(":")
             filename = parts[0] if parts else ""
 
@@ -266,6 +271,16 @@ class _StreamedFileReceiver:
                 "expected_size": expected_size,
                 "bytes_written": 0,
             }
+            if striped:
+                # Data arrives as offset-prefixed frames on stripe channels.
+                from sleap_rtc.striping import StripeReassembler
+
+                self._pending["reassembler"] = StripeReassembler(
+                    fh.fileno(), expected_size
+                )
+            if compressed:
+                # Every chunk is flag-prefixed and decoded with this codec.
+                self._pending["codec"] = parts[-1]
             return True
 
         if message == "END_OF_FILE":
@@ -273,54 +288,67 @@ class _StreamedFileReceiver:
                 # Stray terminator with no active transfer — ignore.
                 return True
             pending = self._pending
-            self._pending = None
-            try:
-                pending["fh"].close()
-            except OSError as exc:
-                logger.warning(f"Error closing streamed transfer: {exc}")
-                self._transfer_failed_reason = (
-                    f"close failed for {pending['filename']}: {exc}"
-                )
-                # Attempt to remove the partial file; best-effort.
-                try:
-                    os.unlink(pending["local_path"])
-                except OSError:
-                    logger.exception(
-                        f"Could not remove partial tempfile {pending['local_path']}"
-                    )
+            if (
+                "reassembler" in pending
+                and pending["bytes_written"] < pending["expected_size"]
+            ):
+                # END_OF_FILE overtook frames still in flight on the stripes;
+                # handle_stripe_frame() finishes the transfer.
+                pending["eof"] = True
                 return True
-
-            if pending["filename"].endswith("predictions.slp"):
-                # Retain for the caller to consume via take_predictions_path().
-                # Worker constructs the output filename as
-                # ``<input_data_path>.predictions.slp`` (job_executor builds
-                # this), so the basename is e.g.
-                # ``resolved_20260427_labels.v003.predictions.slp``, NOT the
-                # bare string ``predictions.slp``. Match by suffix (without a
-                # leading dot, so the bare ``predictions.slp`` literal also
-                # matches) rather than equality.
-                self._received_predictions_local_path = pending["local_path"]
-                # Register for atexit cleanup so the file doesn't leak in
-                # /tmp if the process dies before the caller consumes and
-                # unlinks it. The caller (SLEAP GUI) is expected to call
-                # untrack_temp_prediction() after a successful merge.
-                track_temp_prediction(pending["local_path"])
-                logger.info(
-                    f"Received predictions stream: {pending['local_path']} "
-                    f"({pending['bytes_written']} bytes)"
-                )
-            else:
-                # v1 only expects ``[*.]predictions.slp`` over this channel.
-                # Any other filename is a worker misbehavior; don't leave it
-                # lingering in /tmp.
-                try:
-                    os.unlink(pending["local_path"])
-                except OSError:
-                    pass
+            self._finish_pending()
             return True
 
         return False
 
+    def _finish_pending(self) -> None:
+        """Close the completed in-flight transfer and hand it to the caller."""
+        pending = self._pending
+        self._pending = None
+        try:
+            pending["fh"].close()
+        except OSError as exc:
+            logger.warning(f"Error closing streamed transfer: {exc}")
+            self._transfer_failed_reason = (
+                f"close failed for {pending['filename']}: {exc}"
+            )
+            # Attempt to remove the partial file; best-effort.
+            try:
+                os.unlink(pending["local_path"])
+            except OSError:
+                logger.exception(
+                    f"Could not remove partial tempfile {pending['local_path']}"
+                )
+            return
+
+        if pending["filename"].endswith("predictions.slp"):
+            # Retain for the caller to consume via take_predictions_path().
+            # Worker constructs the output filename as
+            # ``<input_data_path>.predictions.slp`` (job_executor builds
+            # this), so the basename is e.g.
+            # ``resolved_20260427_labels.v003.predictions.slp``, NOT the
+            # bare string ``predictions.slp``. Match by suffix (without a
+            # leading dot, so the bare ``predictions.slp`` literal also
+            # matches) rather than equality.
+            self._received_predictions_local_path = pending["local_path"]
+            # Register for atexit cleanup so the file doesn't leak in
+            # /tmp if the process dies before the caller consumes and
+            # unlinks it. The caller (SLEAP GUI) is expected to call
+            # untrack_temp_prediction() after a successful merge.
+            track_temp_prediction(pending["local_path"])
+            logger.info(
+                f"Received predictions stream: {pending['local_path']} "
+                f"({pending['bytes_written']} bytes)"
+            )
+        else:
+            # v1 only expects ``[*.]predictions.slp`` over this channel.
+            # Any other filename is a worker misbehavior; don't leave it
+            # lingering in /tmp.
+            try:
+                os.unlink(pending["local_path"])
+            except OSError:
+                pass
+
     def handle_bytes(self, message: bytes) -> None:
         """Process a binary message (a file chunk).
 
@@ -339,9 +367,13 @@ class _StreamedFileReceiver:
                 self._warned_on_dropped_bytes = True
             return
         try:
+            if "codec" in self._pending:
+                from sleap_rtc.compression import decode_chunk
+
+                message = decode_chunk(self._pending["codec"], message)
             self._pending["fh"].write(message)
             self._pending["bytes_written"] += len(message)
-        except OSError as exc:
+        except (OSError, ValueError) as exc:
             pending = self._pending
             self._pending = None
             logger.warning(
@@ -363,6 +395,47 @@ class _StreamedFileReceiver:
                     f"Could not remove partial tempfile {pending['local_path']}"
                 )
 
+    def handle_stripe_frame(self, frame: bytes) -> None:
+        """Process an offset-prefixed frame received on a stripe channel.
+
+        Frames for a FILE_META_STRIPED transfer are written at their offsets;
+        anything else is dropped. Completes the transfer if END_OF_FILE has
+        already arrived and this was the last missing frame.
+        """
+        pending = self._pending
+        if pending is None or "reassembler" not in pending:
+            return
+        try:
+            pending["reassembler"].write_frame(frame)
+        except (OSError, ValueError) as exc:
+            logger.warning(
+                f"Error writing striped frame for {pending['filename']}: {exc}"
+            )
+            self._abort_pending()
+            self._transfer_failed_reason = (
+                f"write failed for {pending['filename']}: {exc}"
+            )
+            return
+        pending["bytes_written"] = pending["reassembler"].bytes_written
+        if pending.get("eof") and pending["bytes_written"] >= pending["expected_size"]:
+            self._finish_pending()
+
+    async def wait_for_stripes(self) -> None:
+        """Wait for a striped transfer whose END_OF_FILE overtook its data.
+
+        Callers await this before acting on later control messages, so e.g.
+        INFERENCE_COMPLETE is not handled before the predictions file it
+        refers to has been fully received. Returns immediately otherwise.
+        """
+        pending = self._pending
+        if pending is None or not pending.get("eof"):
+            return
+        if not await pending["reassembler"].wait() and self._pending is pending:
+            self._abort_pending()
+            self._transfer_failed_reason = (
+                f"timed out waiting for striped data for {pending['filename']}"
+            )
+
     def take_predictions_path(self) -> str | None:
         """Return and clear the local path of the most-recently-received
         predictions.slp, or None if no transfer has completed since the
@@ -777,6 +850,9 @@ class InferenceResult:
         predictions_path: Path to the predictions file on the worker.
         frames_processed: Number of frames processed.
         error_message: Error message if inference failed.
+        spec_index: Position of the spec in the batch passed to
+            :func:`run_inference_batch`.
+        worker_id: Peer ID of the worker that ran the spec.
     """
 
     job_id: str
@@ -785,6 +861,8 @@ class InferenceResult:
     predictions_path: str | None = None
     frames_processed: int | None = None
     error_message: str | None = None
+    spec_index: int | None = None
+    worker_id: str | None = None
 
 
 @dataclass
@@ -1219,8 +1297,10 @@ def check_video_paths(
         on_path_rejected: Optional callback invoked when the worker rejects
             the SLP path (e.g., not within mounts, file not found). Called
             with (attempted_path, error_message, send_fn). ``send_fn`` is
-            the data channel's send method, allowing the callback to send
-            FS_* messages for remote file browsing. Should return a corrected
+            a thread-safe wrapper around the data channel's send method,
+            allowing the callback to send FS_* messages for remote file
+            browsing; its ``upload(local_path, dest_dir, create_subdir,
+            on_progress)`` method uploads a file to the worker. Should return a corrected
             path to retry, or None to abort. The retry reuses the same
             WebRTC connection, avoiding reconnection delays.
         on_fs_response: Optional callback for routing FS_* response messages
@@ -1263,6 +1343,215 @@ def check_video_paths(
     )
 
 
+class _ChannelSender:
+    """Thread-safe handle on a data channel for callbacks run off the loop.
+
+    Calling it schedules ``data_channel.send`` on the event loop, so Qt
+    dialogs can use it as their ``send_fn``. :meth:`upload` runs
+    :func:`sleap_rtc.client.file_transfer.upload_file` over the same channel.
+
+    Attributes:
+        upload_responses: Queue that the channel's message handler feeds
+            FILE_UPLOAD_* responses into while an upload runs, else None.
+    """
+
+    def __init__(
+        self,
+        data_channel,
+        loop: "asyncio.AbstractEventLoop",
+        pc=None,
+        stripes: int = 0,
+        hash_cache: "HashCache | None" = None,
+    ):
+        """Initialize the sender.
+
+        Args:
+            data_channel: Authenticated data channel to the worker.
+            loop: Event loop the channel belongs to.
+            pc: Peer connection of *data_channel*, used to open stripes.
+            stripes: Number of stripe channels to spread uploads across
+                (0 disables striping).
+            hash_cache: Digest cache shared by all uploads of this sender
+                (default: ~/.sleap-rtc/hash-cache.json).
+        """
+        from sleap_rtc.client.hash_cache import HashCache
+
+        self._channel = data_channel
+        self._loop = loop
+        self._hash_cache = hash_cache or HashCache()
+        self._pc = pc
+        self._stripes = stripes if pc is not None else 0
+        self._stripe_channels: "list | None" = None
+        self.upload_responses: "asyncio.Queue | None" = None
+
+    def __call__(self, message: str) -> None:
+        """Schedule ``data_channel.send(message)`` on the event loop."""
+        self._loop.call_soon_threadsafe(self._channel.send, message)
+
+    def upload(
+        self,
+        local_path: str,
+        dest_dir: str,
+        create_subdir: str,
+        on_progress: "Callable[[int, int], None] | None" = None,
+    ) -> str:
+        """Upload a local file to the worker and wait for it to finish.
+
+        Must be called from a thread other than the event loop's. Uploads
+        are resumable: after a dropped connection, uploading the same file
+        again only sends what the worker does not have yet. If the worker
+        still holds an earlier upload of the same filename, only the blocks
+        that changed since are sent. Digests of unchanged files are taken
+        from the hash cache instead of re-hashing. Chunks are compressed when the worker
+        accepts one of the offered codecs. With stripes configured, full
+        uploads are spread across the stripe channels instead; those are
+        neither resumable nor compressed.
+
+        Args:
+            local_path: Local file to upload.
+            dest_dir: Worker-side destination directory.
+            create_subdir: ``"1"`` to upload into a ``sleap_rtc_downloads``
+                subdirectory of *dest_dir*, ``"0"`` otherwise.
+            on_progress: Called on the event loop with (bytes_received,
+                total_bytes) as the worker reports progress.
+
+        Returns:
+            Absolute path of the uploaded file on the worker.
+
+        Raises:
+            RuntimeError: If the worker rejects the upload or stops answering.
+        """
+        import asyncio
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._upload(local_path, dest_dir, create_subdir, on_progress),
+            self._loop,
+        )
+        return future.result()
+
+    async def _upload(self, local_path, dest_dir, create_subdir, on_progress) -> str:
+        import asyncio
+
+        from sleap_rtc.client.file_transfer import UPLOAD_RESPONSE_TIMEOUT, upload_file
+
+        stripe_channels = await self._open_stripes()
+        self.upload_responses = asyncio.Queue()
+        try:
+            return await upload_file(
+                self._channel,
+                self.upload_responses,
+                local_path,
+                dest_dir,
+                create_subdir,
+                on_progress=on_progress,
+                resumable=not stripe_channels,
+                delta=True,
+                stripe_channels=stripe_channels,
+                hash_cache=self._hash_cache,
+                compress=True,
+            )
+        except asyncio.TimeoutError:
+            raise RuntimeError(
+                "Timed out waiting for worker response "
+                f"({UPLOAD_RESPONSE_TIMEOUT:.0f} s)"
+            ) from None
+        finally:
+            self.upload_responses = None
+
+    async def _open_stripes(self) -> list:
+        """Open the stripe channels on first use; empty if striping is off."""
+        if self._stripe_channels is None:
+            import asyncio
+
+            from sleap_rtc.striping import open_stripe_channels
+
+            self._stripe_channels = []
+            if self._stripes > 0:
+                try:
+                    self._stripe_channels = await open_stripe_channels(
+                        self._pc, self._stripes
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "Stripe channels did not open; uploading on a single channel"
+                    )
+        return self._stripe_channels
+
+
+async def _open_transfer_stripes(
+    pc, file_receiver: _StreamedFileReceiver, count: int
+) -> None:
+    """Open stripe channels for the worker to send result files on.
+
+    Not fatal on failure: without open stripes the worker sends files on the
+    control channel as before.
+
+    Args:
+        pc: Connected RTCPeerConnection to the worker.
+        file_receiver: Receiver that reassembles striped frames.
+        count: Number of stripe channels to open (0 disables striping).
+    """
+    if count <= 0:
+        return
+
+    import asyncio
+
+    from sleap_rtc.striping import open_stripe_channels
+
+    try:
+        await open_stripe_channels(
+            pc, count, on_frame=file_receiver.handle_stripe_frame
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Stripe channels did not open; using a single channel")
+
+
+def _announce_transfer_codecs(data_channel) -> None:
+    """Tell the worker which codecs it may compress result files with.
+
+    Workers that predate compression ignore the announcement and keep
+    sending plain FILE_META transfers.
+
+    Args:
+        data_channel: Authenticated data channel to the worker.
+    """
+    from sleap_rtc.compression import codec_offer
+
+    data_channel.send(f"TRANSFER_CODECS::{codec_offer()}")
+
+
+def _announce_output_batching(data_channel) -> None:
+    """Let the worker coalesce job output into OUTPUT_BATCH messages.
+
+    Workers that predate batching ignore the announcement.
+
+    Args:
+        data_channel: Authenticated data channel to the worker.
+    """
+    data_channel.send("OUTPUT_BATCHING::1")
+
+
+def _unbatch_output(message: str) -> list[str]:
+    """Split an OUTPUT_BATCH message into the messages it carries.
+
+    Args:
+        message: String message received from the worker.
+
+    Returns:
+        The batched messages in order, or ``[message]`` for any other message.
+    """
+    import json
+
+    if not message.startswith("OUTPUT_BATCH::"):
+        return [message]
+    try:
+        batch = json.loads(message.split("::", 1)[1])
+    except json.JSONDecodeError:
+        logger.warning("Ignoring malformed OUTPUT_BATCH message")
+        return []
+    return [m for m in batch if isinstance(m, str)]
+
+
 async def _authenticate_channel(
     data_channel,
     response_queue: "asyncio.Queue",
@@ -1392,6 +1681,8 @@ async def _check_video_paths_async(
     response_queue: asyncio.Queue = asyncio.Queue()
     data_channel = None
     pc = None
+    # Thread-safe sender handed to the callbacks, set once authenticated
+    sender: _ChannelSender | None = None
 
     try:
         async with websockets.connect(config.signaling_websocket) as ws:
@@ -1473,7 +1764,14 @@ async def _check_video_paths_async(
                         message.startswith(p) for p in _BROWSER_FS_PREFIXES
                     ):
                         on_fs_response(message)
-                    # Route FILE_UPLOAD_* responses to the upload dialog
+                    # Route FILE_UPLOAD_* responses to the running upload,
+                    # or to the upload dialog driving the protocol itself
+                    elif (
+                        sender is not None
+                        and sender.upload_responses is not None
+                        and message.startswith("FILE_UPLOAD_")
+                    ):
+                        await sender.upload_responses.put(message)
                     elif on_upload_response is not None and message.startswith(
                         "FILE_UPLOAD_"
                     ):
@@ -1520,10 +1818,9 @@ async def _check_video_paths_async(
             # executor threads (Qt dialogs).  Shared by on_path_rejected
             # and on_videos_missing.
             loop = asyncio.get_running_loop()
-
-            def _thread_safe_send(msg: str) -> None:
-                """Schedule data_channel.send on the event loop."""
-                loop.call_soon_threadsafe(data_channel.send, msg)
+            sender = _ChannelSender(
+                data_channel, loop, pc=pc, stripes=config.get_transfer_stripes()
+            )
 
             # Send SLP path to worker, with retry via callback on rejection
             current_path = slp_path
@@ -1552,7 +1849,7 @@ async def _check_video_paths_async(
                             on_path_rejected,
                             current_path,
                             error_msg,
-                            _thread_safe_send,
+                            sender,
                         )
                         if corrected is not None:
                             current_path = corrected
@@ -1620,7 +1917,7 @@ async def _check_video_paths_async(
                     None,
                     on_videos_missing,
                     videos,
-                    _thread_safe_send,
+                    sender,
                 )
                 if resolved_mappings_or_none is None:
                     raise ConfigurationError("Video path resolution cancelled by user.")
@@ -1916,6 +2213,7 @@ def run_training(
     on_raw_progress: "Callable[[str], None] | None" = None,
     on_model_type: "Callable[[str], None] | None" = None,
     on_inference_message: "Callable[[str, dict], None] | None" = None,
+    placement: str = "first",
 ) -> TrainingResult:
     """Run training remotely on a worker.
 
@@ -1969,6 +2267,10 @@ def run_training(
             ``"INFERENCE_SKIPPED"``.  When provided, the data channel stays
             open after the last ``JOB_COMPLETE`` until a terminal inference
             message is received.
+        placement: How to pick a worker when *worker_id* is None; one of
+            :data:`sleap_rtc.placement.PLACEMENT_POLICIES`. "first" takes the
+            first discovered worker; "least_loaded" and "balanced" use the
+            load workers publish, "balanced" also the signaling RTT.
 
     Returns:
         TrainingResult with job outcome and model paths.
@@ -2004,6 +2306,7 @@ def run_training(
             on_raw_progress=on_raw_progress,
             on_model_type=on_model_type,
             on_inference_message=on_inference_message,
+            placement=placement,
         )
     )
 
@@ -2030,6 +2333,7 @@ async def _run_training_async(
     on_raw_progress: "Callable[[str], None] | None" = None,
     on_model_type: "Callable[[str], None] | None" = None,
     on_inference_message: "Callable[[str, dict], None] | None" = None,
+    placement: str = "first",
 ) -> TrainingResult:
     """Async implementation of run_training."""
     import json
@@ -2038,6 +2342,7 @@ async def _run_training_async(
     from aiortc import RTCPeerConnection, RTCSessionDescription
     from sleap_rtc.auth.credentials import get_valid_jwt
     from sleap_rtc.config import get_config
+    from sleap_rtc.placement import place_job
     from sleap_rtc.protocol import (
         MSG_JOB_SUBMIT,
         MSG_JOB_ACCEPTED,
@@ -2142,10 +2447,11 @@ async def _run_training_async(
                         peers = response.get("peers", [])
                         if not peers:
                             raise RoomNotFoundError("No workers available in room")
-                        # Select first available worker
-                        worker_id = peers[0].get("peer_id")
                         break
 
+                ranked = await place_job(peers, placement, ws.send, ws.recv, peer_id)
+                worker_id = ranked[0].get("peer_id")
+
             # Create WebRTC connection
             pc = RTCPeerConnection()
             data_channel = pc.createDataChannel("training")
@@ -2183,15 +2489,18 @@ async def _run_training_async(
                     # are consumed by the receiver and not forwarded.
                     if file_receiver.handle_string(message):
                         return
-
-                    if (
-                        message.startswith("PROGRESS_REPORT::")
-                        and on_raw_progress is not None
-                    ):
-                        payload = message.split("PROGRESS_REPORT::", 1)[1]
-                        on_raw_progress(payload)
-                    else:
-                        await response_queue.put(message)
+                    # Don't let e.g. INFERENCE_COMPLETE overtake striped data.
+                    await file_receiver.wait_for_stripes()
+
+                    for item in _unbatch_output(message):
+                        if (
+                            item.startswith("PROGRESS_REPORT::")
+                            and on_raw_progress is not None
+                        ):
+                            payload = item.split("PROGRESS_REPORT::", 1)[1]
+                            on_raw_progress(payload)
+                        else:
+                            await response_queue.put(item)
 
             # Send offer
             offer = await pc.createOffer()
@@ -2228,6 +2537,14 @@ async def _run_training_async(
             # Authenticate with worker via PSK
             await _authenticate_channel(data_channel, response_queue)
 
+            # Let the worker stripe result files across extra channels, or
+            # compress them when they go over this one.
+            await _open_transfer_stripes(
+                pc, file_receiver, config.get_transfer_stripes()
+            )
+            _announce_transfer_codecs(data_channel)
+            _announce_output_batching(data_channel)
+
             # Expose thread-safe send function for bidirectional communication
             if on_channel_ready:
                 loop = asyncio.get_running_loop()
@@ -2501,6 +2818,7 @@ def run_inference(
     on_channel_ready: "Callable[[Callable[[str], None]], None] | None" = None,
     on_log: "Callable[[str], None] | None" = None,
     on_job_message: "Callable[[str, dict], None] | None" = None,
+    placement: str = "first",
 ) -> InferenceResult:
     """Run inference remotely on a worker.
 
@@ -2536,6 +2854,10 @@ def run_inference(
         on_job_message: Optional callback invoked with ``(msg_type, payload)``
             for typed ``JOB_*`` dispatches (Task 9 wiring; accepted in
             Task 8 for forward compatibility).
+        placement: How to pick a worker when *worker_id* is None; one of
+            :data:`sleap_rtc.placement.PLACEMENT_POLICIES`. "first" takes the
+            first discovered worker; "least_loaded" and "balanced" use the
+            load workers publish, "balanced" also the signaling RTT.
 
     Returns:
         InferenceResult with job outcome and predictions path.
@@ -2570,10 +2892,15 @@ def run_inference(
         on_job_message=on_job_message,
         on_log=on_log,
         timeout=timeout,
+        placement=placement,
     )
     return results[0]
 
 
+BATCH_ORDERS = ("submitted", "largest_first")
+BATCH_FAILURE_POLICIES = ("stop", "continue", "retry")
+
+
 def run_inference_batch(
     specs: list["TrackJobSpec"],
     room_id: str,
@@ -2583,36 +2910,72 @@ def run_inference_batch(
     on_log: "Callable[[str], None] | None" = None,
     on_spec_complete: "Callable[[InferenceResult], None] | None" = None,
     timeout: float = 3600.0,
+    distributed: bool = False,
+    max_workers: int | None = None,
+    order: "str | Callable[[TrackJobSpec], float]" = "submitted",
+    on_failure: str = "stop",
+    max_retries: int = 1,
+    placement: str = "first",
 ) -> list[InferenceResult]:
-    """Run multiple inference specs sequentially over a single WebRTC connection.
+    """Run multiple inference specs over WebRTC.
 
-    Opens one WebRTC connection to the worker and submits each spec in order.
-    If a spec fails the batch stops early (fail-fast).
+    By default opens one WebRTC connection to a single worker and submits the
+    specs one after another. With ``distributed=True`` it connects to every
+    available worker in the room instead, and each worker takes the next spec
+    from a shared queue as soon as it finishes its previous one.
 
     Args:
-        specs: List of TrackJobSpec instances to run sequentially.
+        specs: List of TrackJobSpec instances to run.
         room_id: The room ID containing the worker.
         worker_id: Specific worker ID. If None, auto-selects best available.
         on_channel_ready: Optional callback invoked once with a thread-safe
-            ``send_fn(str)`` after the data channel is authenticated.
+            ``send_fn(str)`` after the data channel is authenticated. In
+            distributed mode the function sends to every worker.
         on_job_message: Optional callback invoked with ``(msg_type, payload)``
             for typed ``JOB_*`` dispatches. Payloads are enriched with
             ``job_index`` and ``jobs_total`` fields.
         on_log: Optional callback invoked with raw log lines from the worker.
         on_spec_complete: Optional callback invoked after each spec completes
             (success or failure) with the corresponding ``InferenceResult``.
+            In distributed mode specs complete out of order; use
+            ``InferenceResult.spec_index`` to match them up.
         timeout: Maximum time to wait for each individual spec in seconds.
+        distributed: Spread the specs over all available workers in the room.
+            Ignored when *worker_id* is given.
+        max_workers: Maximum number of workers to use in distributed mode.
+            None uses all of them.
+        order: Dispatch order. "submitted" keeps the order of *specs*;
+            "largest_first" starts the biggest specs first so a long video is
+            not left to run alone at the end. A callable is used as the
+            estimated cost of each spec (e.g. its frame count), highest first.
+        on_failure: What to do when a spec fails. "stop" dispatches no further
+            specs (fail-fast); "continue" runs the remaining specs; "retry"
+            also re-runs the failed spec on a worker that has not tried it.
+        max_retries: Retries per spec when *on_failure* is "retry".
+        placement: How to pick workers when *worker_id* is None; one of
+            :data:`sleap_rtc.placement.PLACEMENT_POLICIES`. In distributed
+            mode it decides which workers *max_workers* keeps.
 
     Returns:
-        List of InferenceResult, one per spec that was attempted. On fail-fast
-        the list will be shorter than *specs*.
+        List of InferenceResult, one per spec that finished, in spec order.
+        When the batch stops early the list will be shorter than *specs*.
 
     Raises:
         AuthenticationError: If user is not logged in.
         RoomNotFoundError: If room does not exist or has no workers.
+        ValueError: If *order*, *on_failure* or *placement* is not recognized.
     """
     import asyncio
 
+    from sleap_rtc.placement import PLACEMENT_POLICIES
+
+    if not callable(order) and order not in BATCH_ORDERS:
+        raise ValueError(f"order must be one of {BATCH_ORDERS} or a callable")
+    if on_failure not in BATCH_FAILURE_POLICIES:
+        raise ValueError(f"on_failure must be one of {BATCH_FAILURE_POLICIES}")
+    if placement not in PLACEMENT_POLICIES:
+        raise ValueError(f"placement must be one of {PLACEMENT_POLICIES}")
+
     return asyncio.run(
         _run_inference_batch_async(
             specs=specs,
@@ -2623,10 +2986,289 @@ def run_inference_batch(
             on_log=on_log,
             on_spec_complete=on_spec_complete,
             timeout=timeout,
+            distributed=distributed,
+            max_workers=max_workers,
+            order=order,
+            on_failure=on_failure,
+            max_retries=max_retries,
+            placement=placement,
         )
     )
 
 
+def _count_range_frames(frames: str) -> int | None:
+    """Count the frames in a range string such as ``"0-100,200-300"``.
+
+    Returns None if the string cannot be parsed.
+    """
+    count = 0
+    try:
+        for part in frames.split(","):
+            first, _, last = part.strip().partition("-")
+            count += int(last) - int(first) + 1 if last else 1
+    except ValueError:
+        return None
+    return count
+
+
+def _estimate_spec_workload(spec: "TrackJobSpec") -> tuple:
+    """Sort key estimating how long a spec takes, larger is longer.
+
+    Specs over a frame range compare by the number of frames in it. Specs
+    over whole files rank above them, larger files first; the size is only
+    known when ``data_path`` is readable from this machine (e.g. a shared
+    filesystem) and counts as 0 otherwise.
+    """
+    frames = _count_range_frames(spec.frames) if spec.frames else None
+    try:
+        size = os.path.getsize(spec.data_path)
+    except OSError:
+        size = 0
+    return (frames is None, frames or 0, size)
+
+
+def _order_batch_specs(
+    specs: list["TrackJobSpec"],
+    order: "str | Callable[[TrackJobSpec], float]",
+) -> list[int]:
+    """Return spec indices in the order they should be dispatched."""
+    indices = list(range(len(specs)))
+    if order == "submitted":
+        return indices
+    key = order if callable(order) else _estimate_spec_workload
+    # sorted() is stable, so equal estimates keep their submitted order.
+    return sorted(indices, key=lambda i: key(specs[i]), reverse=True)
+
+
+@dataclass
+class _InferenceConnection:
+    """An authenticated inference data channel to one worker."""
+
+    worker_id: str
+    pc: object
+    data_channel: object
+    response_queue: "asyncio.Queue"
+    file_receiver: "_StreamedFileReceiver"
+
+
+async def _connect_inference_worker(
+    ws, peer_id: str, worker_id: str, config
+) -> _InferenceConnection:
+    """Open and authenticate an inference data channel to one worker.
+
+    The offer/answer exchange goes over the already-registered signaling
+    websocket *ws*. Connect to several workers one at a time so that each
+    answer is read by the call waiting for it.
+
+    Raises:
+        ConfigurationError: If authentication fails.
+        asyncio.TimeoutError: If the data channel does not open.
+    """
+    import asyncio
+    import json
+
+    from aiortc import RTCPeerConnection, RTCSessionDescription
+
+    # Response handling
+    response_queue: asyncio.Queue = asyncio.Queue()
+    pc = RTCPeerConnection()
+    try:
+        data_channel = pc.createDataChannel("inference")
+
+        channel_open = asyncio.Event()
+
+        # State machine for incoming FILE_META/bytes/END_OF_FILE
+        # transfers (the post-track predictions.slp stream from the
+        # worker).
+        file_receiver = _StreamedFileReceiver()
+
+        @data_channel.on("open")
+        def on_open():
+            channel_open.set()
+
+        @data_channel.on("message")
+        async def on_message(message):
+            if isinstance(message, bytes) and message == b"KEEP_ALIVE":
+                return
+
+            if isinstance(message, bytes):
+                file_receiver.handle_bytes(message)
+                return
+
+            if isinstance(message, str):
+                if file_receiver.handle_string(message):
+                    return
+                # Don't let e.g. INFERENCE_COMPLETE overtake striped data.
+                await file_receiver.wait_for_stripes()
+
+                for item in _unbatch_output(message):
+                    await response_queue.put(item)
+
+        # Send offer
+        offer = await pc.createOffer()
+        await pc.setLocalDescription(offer)
+
+        offer_msg = json.dumps(
+            {
+                "type": pc.localDescription.type,
+                "sender": peer_id,
+                "target": worker_id,
+                "sdp": pc.localDescription.sdp,
+            }
+        )
+        await ws.send(offer_msg)
+
+        # Wait for answer
+        while True:
+            response = json.loads(await ws.recv())
+            if response.get("sender", worker_id) != worker_id:
+                # Late signaling from a worker we connected to earlier.
+                continue
+            if response.get("type") == "answer":
+                answer = RTCSessionDescription(
+                    sdp=response.get("sdp"),
+                    type="answer",
+                )
+                await pc.setRemoteDescription(answer)
+                break
+            elif response.get("type") == "candidate":
+                candidate = response.get("candidate")
+                if candidate:
+                    await pc.addIceCandidate(candidate)
+
+        # Wait for channel
+        await asyncio.wait_for(channel_open.wait(), timeout=30.0)
+
+        # Authenticate with worker via PSK
+        await _authenticate_channel(data_channel, response_queue)
+
+        # Let the worker stripe result files across extra channels, or
+        # compress them when they go over this one.
+        await _open_transfer_stripes(pc, file_receiver, config.get_transfer_stripes())
+        _announce_transfer_codecs(data_channel)
+        _announce_output_batching(data_channel)
+    except BaseException:
+        await pc.close()
+        raise
+
+    return _InferenceConnection(
+        worker_id=worker_id,
+        pc=pc,
+        data_channel=data_channel,
+        response_queue=response_queue,
+        file_receiver=file_receiver,
+    )
+
+
+async def _dispatch_inference_specs(
+    specs: list["TrackJobSpec"],
+    connections: list[_InferenceConnection],
+    batch_id: str,
+    timeout: float,
+    order: "str | Callable[[TrackJobSpec], float]" = "submitted",
+    on_failure: str = "stop",
+    max_retries: int = 1,
+    on_job_message: "Callable[[str, dict], None] | None" = None,
+    on_log: "Callable[[str], None] | None" = None,
+    on_spec_complete: "Callable[[InferenceResult], None] | None" = None,
+) -> list["InferenceResult"]:
+    """Run specs from a shared queue, one at a time on each connection.
+
+    Every connection takes the next spec from the queue as soon as it is
+    idle. A spec retried under ``on_failure="retry"`` goes back to the front
+    of the queue and is only taken by a worker that has not tried it yet.
+
+    Returns:
+        Final result of every spec that finished, in spec order.
+    """
+    import asyncio
+    from collections import deque
+
+    pending = deque(_order_batch_specs(specs, order))
+    tried: dict[int, set[str]] = {i: set() for i in range(len(specs))}
+    results: dict[int, InferenceResult] = {}
+    active = {conn.worker_id for conn in connections}
+    in_flight = 0
+    stopped = False
+    changed = asyncio.Condition()
+
+    def take(worker_id: str) -> int | None:
+        for index in pending:
+            if worker_id not in tried[index]:
+                pending.remove(index)
+                return index
+        return None
+
+    async def run(conn: _InferenceConnection, index: int) -> InferenceResult:
+        attempt = len(tried[index]) - 1
+        job_id = f"{batch_id}-{index}" + (f"-{attempt}" if attempt else "")
+        enriched = _enriched_job_message_wrapper(on_job_message, index, len(specs))
+        try:
+            result = await _run_single_spec_async(
+                spec=specs[index],
+                job_id=job_id,
+                data_channel=conn.data_channel,
+                response_queue=conn.response_queue,
+                file_receiver=conn.file_receiver,
+                timeout=timeout,
+                on_job_message=enriched,
+                on_log=on_log,
+            )
+        except (ConfigurationError, JobError) as e:
+            result = InferenceResult(
+                job_id=job_id,
+                success=False,
+                error_message=str(e),
+            )
+        result.spec_index = index
+        result.worker_id = conn.worker_id
+        return result
+
+    async def serve(conn: _InferenceConnection) -> None:
+        nonlocal in_flight, stopped
+        while True:
+            async with changed:
+                index = None
+                while not stopped:
+                    index = take(conn.worker_id)
+                    # With nothing in flight, no failed spec can come back.
+                    if index is not None or in_flight == 0:
+                        break
+                    await changed.wait()
+                if index is None:
+                    active.discard(conn.worker_id)
+                    return
+                tried[index].add(conn.worker_id)
+                in_flight += 1
+
+            result = await run(conn, index)
+
+            async with changed:
+                in_flight -= 1
+                retry = (
+                    not result.success
+                    and on_failure == "retry"
+                    and len(tried[index]) <= max_retries
+                    and not active <= tried[index]
+                )
+                if retry:
+                    logger.warning(
+                        f"Spec {index} failed on {conn.worker_id} "
+                        f"({result.error_message}); retrying on another worker"
+                    )
+                    pending.appendleft(index)
+                else:
+                    results[index] = result
+                    if on_spec_complete is not None:
+                        on_spec_complete(result)
+                    if not result.success and on_failure == "stop":
+                        stopped = True
+                changed.notify_all()
+
+    await asyncio.gather(*(serve(conn) for conn in connections))
+    return [results[i] for i in sorted(results)]
+
+
 async def _run_inference_batch_async(
     specs: list["TrackJobSpec"],
     room_id: str,
@@ -2636,6 +3278,12 @@ async def _run_inference_batch_async(
     on_log: "Callable[[str], None] | None" = None,
     on_spec_complete: "Callable[[InferenceResult], None] | None" = None,
     timeout: float = 3600.0,
+    distributed: bool = False,
+    max_workers: int | None = None,
+    order: "str | Callable[[TrackJobSpec], float]" = "submitted",
+    on_failure: str = "stop",
+    max_retries: int = 1,
+    placement: str = "first",
 ) -> list["InferenceResult"]:
     """Async implementation of run_inference_batch."""
     import asyncio
@@ -2643,10 +3291,10 @@ async def _run_inference_batch_async(
     import uuid
 
     import websockets
-    from aiortc import RTCPeerConnection, RTCSessionDescription
 
     from sleap_rtc.auth.credentials import get_valid_jwt
     from sleap_rtc.config import get_config
+    from sleap_rtc.placement import place_job
 
     jwt = get_valid_jwt()
     if jwt is None:
@@ -2656,9 +3304,7 @@ async def _run_inference_batch_async(
     batch_id = str(uuid.uuid4())[:8]
     peer_id = f"api-infer-{uuid.uuid4().hex[:8]}"
 
-    # Response handling
-    response_queue: asyncio.Queue = asyncio.Queue()
-    pc = None
+    connections: list[_InferenceConnection] = []
 
     try:
         async with websockets.connect(config.signaling_websocket) as ws:
@@ -2687,7 +3333,9 @@ async def _run_inference_batch_async(
                     )
 
             # Discover workers if not specified
-            if worker_id is None:
+            if worker_id is not None:
+                worker_ids = [worker_id]
+            else:
                 discover_msg = {
                     "type": "discover_peers",
                     "from_peer_id": peer_id,
@@ -2705,113 +3353,55 @@ async def _run_inference_batch_async(
                         peers = response.get("peers", [])
                         if not peers:
                             raise RoomNotFoundError("No workers available in room")
-                        worker_id = peers[0].get("peer_id")
                         break
 
-            # Create WebRTC connection
-            pc = RTCPeerConnection()
-            data_channel = pc.createDataChannel("inference")
-
-            channel_open = asyncio.Event()
-
-            # State machine for incoming FILE_META/bytes/END_OF_FILE
-            # transfers (the post-track predictions.slp stream from the
-            # worker).
-            file_receiver = _StreamedFileReceiver()
-
-            @data_channel.on("open")
-            def on_open():
-                channel_open.set()
-
-            @data_channel.on("message")
-            async def on_message(message):
-                if isinstance(message, bytes) and message == b"KEEP_ALIVE":
-                    return
-
-                if isinstance(message, bytes):
-                    file_receiver.handle_bytes(message)
-                    return
-
-                if isinstance(message, str):
-                    if file_receiver.handle_string(message):
-                        return
-
-                    await response_queue.put(message)
-
-            # Send offer
-            offer = await pc.createOffer()
-            await pc.setLocalDescription(offer)
-
-            offer_msg = json.dumps(
-                {
-                    "type": pc.localDescription.type,
-                    "sender": peer_id,
-                    "target": worker_id,
-                    "sdp": pc.localDescription.sdp,
-                }
-            )
-            await ws.send(offer_msg)
-
-            # Wait for answer
-            while True:
-                response = json.loads(await ws.recv())
-                if response.get("type") == "answer":
-                    answer = RTCSessionDescription(
-                        sdp=response.get("sdp"),
-                        type="answer",
+                if distributed:
+                    peers = [
+                        peer
+                        for peer in peers
+                        if peer.get("metadata", {}).get("properties", {}).get("status")
+                        != "busy"
+                    ] or peers
+                ranked = await place_job(peers, placement, ws.send, ws.recv, peer_id)
+                worker_ids = [peer.get("peer_id") for peer in ranked]
+                worker_ids = worker_ids[:max_workers] if distributed else worker_ids[:1]
+
+            # Create one WebRTC connection per worker
+            for target in worker_ids:
+                try:
+                    connections.append(
+                        await _connect_inference_worker(ws, peer_id, target, config)
                     )
-                    await pc.setRemoteDescription(answer)
-                    break
-                elif response.get("type") == "candidate":
-                    candidate = response.get("candidate")
-                    if candidate:
-                        await pc.addIceCandidate(candidate)
-
-            # Wait for channel
-            await asyncio.wait_for(channel_open.wait(), timeout=30.0)
-
-            # Authenticate with worker via PSK
-            await _authenticate_channel(data_channel, response_queue)
+                except (asyncio.TimeoutError, ConfigurationError) as e:
+                    if len(worker_ids) == 1:
+                        raise
+                    logger.warning(f"Skipping worker {target}: {e}")
+            if not connections:
+                raise RoomNotFoundError("Could not connect to any worker in room")
 
             # Expose thread-safe send function for bidirectional communication.
             if on_channel_ready:
                 loop = asyncio.get_running_loop()
 
                 def _thread_safe_send(msg: str) -> None:
-                    loop.call_soon_threadsafe(data_channel.send, msg)
+                    for conn in connections:
+                        loop.call_soon_threadsafe(conn.data_channel.send, msg)
 
                 on_channel_ready(_thread_safe_send)
 
-            # Run specs sequentially over the single connection
-            results: list[InferenceResult] = []
-            for i, spec in enumerate(specs):
-                job_id = f"{batch_id}-{i}"
-                enriched = _enriched_job_message_wrapper(on_job_message, i, len(specs))
-                try:
-                    result = await _run_single_spec_async(
-                        spec=spec,
-                        job_id=job_id,
-                        data_channel=data_channel,
-                        response_queue=response_queue,
-                        file_receiver=file_receiver,
-                        timeout=timeout,
-                        on_job_message=enriched,
-                        on_log=on_log,
-                    )
-                except (ConfigurationError, JobError) as e:
-                    result = InferenceResult(
-                        job_id=job_id,
-                        success=False,
-                        error_message=str(e),
-                    )
-                results.append(result)
-                if on_spec_complete is not None:
-                    on_spec_complete(result)
-                if not result.success:
-                    break
-
-            return results
+            return await _dispatch_inference_specs(
+                specs=specs,
+                connections=connections,
+                batch_id=batch_id,
+                timeout=timeout,
+                order=order,
+                on_failure=on_failure,
+                max_retries=max_retries,
+                on_job_message=on_job_message,
+                on_log=on_log,
+                on_spec_complete=on_spec_complete,
+            )
 
     finally:
-        if pc:
-            await pc.close()
+        for conn in connections:
+            await conn.pc.close()
@@ -70,6 +70,7 @@ from sleap_rtc.rtc_worker import run_RTCworker
 from sleap_rtc.rtc_client import run_RTCclient, run_job_submit
 from sleap_rtc.rtc_client_track import run_RTCclient_track
 from sleap_rtc.jobs.spec import TrainJobSpec, TrackJobSpec
+from sleap_rtc.placement import PLACEMENT_POLICIES
 
 # =============================================================================
 # Authentication Helpers
@@ -1525,6 +1526,26 @@ def show_worker_help():
     default=None,
     help="Max time to keep retrying signaling server before exiting. Examples: '30m', '2h'. Default: no limit (retry forever).",
 )
+@click.option(
+    "--max-jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Jobs to run at once, each on its own GPU(s); extra jobs are queued. 0 = one per GPU.",
+)
+@click.option(
+    "--max-queue",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Jobs allowed to wait for a free GPU; clients are turned away once it is full. 0 = no limit.",
+)
+@click.option(
+    "--parallel-pipelines",
+    is_flag=True,
+    default=False,
+    help="Train the models of a multi-model pipeline at the same time, each on its own GPU(s), when the job has enough GPUs.",
+)
 def worker(
     api_key,
     account_key,
@@ -1534,6 +1555,9 @@ def worker(
     verbose,
     room_secret,
     max_reconnect_time,
+    max_jobs,
+    max_queue,
+    parallel_pipelines,
 ):
     """Start the sleap-RTC worker node.
 
@@ -1625,6 +1649,9 @@ def worker(
         name=name,
         room_secret=room_secret,
         max_reconnect_time=max_reconnect_seconds,
+        max_jobs=max_jobs,
+        parallel_pipelines=parallel_pipelines,
+        max_queue=max_queue,
     )
 
 
@@ -1659,6 +1686,13 @@ def worker(
     default=False,
     help="Automatically select best worker by GPU memory (use with --room).",
 )
+@click.option(
+    "--placement",
+    type=click.Choice(PLACEMENT_POLICIES),
+    default="gpu_memory",
+    show_default=True,
+    help="How --auto-select ranks workers: most GPU memory, least loaded, or balanced (load and network round-trip time).",
+)
 @click.option(
     "--pkg-path",
     "--pkg_path",
@@ -1793,7 +1827,7 @@ def train(**kwargs):
        Join a room and discover available workers. Requires login first
        (sleap-rtc login). Supports:
        - Interactive selection (default)
-       - Auto-select: --auto-select
+       - Auto-select: --auto-select [--placement least_loaded|balanced]
        - Direct worker: --worker-id PEER_ID
        - GPU filter: --min-gpu-memory MB
 
@@ -1835,6 +1869,7 @@ def train(**kwargs):
     worker_id = kwargs.pop("worker_id", None)
     auto_select = kwargs.pop("auto_select", False)
     min_gpu_memory = kwargs.pop("min_gpu_memory", None)
+    placement = kwargs.pop("placement", "gpu_memory")
 
     # Extract path resolution options
     worker_path = kwargs.pop("worker_path", None)
@@ -1994,6 +2029,7 @@ def train(**kwargs):
             worker_id=worker_id,
             auto_select=auto_select,
             min_gpu_memory=min_gpu_memory,
+            placement=placement,
             room_secret=room_secret,
             jwt_token=jwt_token,
             verbosity=verbosity,
@@ -2014,6 +2050,7 @@ def train(**kwargs):
             worker_id=worker_id,
             auto_select=auto_select,
             min_gpu_memory=min_gpu_memory,
+            placement=placement,
             jwt_token=jwt_token,
             verbosity=verbosity,
         )
@@ -2050,6 +2087,13 @@ def train(**kwargs):
     default=False,
     help="Automatically select best worker by GPU memory (use with --room).",
 )
+@click.option(
+    "--placement",
+    type=click.Choice(PLACEMENT_POLICIES),
+    default="gpu_memory",
+    show_default=True,
+    help="How --auto-select ranks workers: most GPU memory, least loaded, or balanced (load and network round-trip time).",
+)
 @click.option(
     "--data-path",
     "--data_path",
@@ -2137,7 +2181,7 @@ def track(**kwargs):
     2. Room-based discovery: --room ROOM
        Join a room and discover available workers. Supports:
        - Interactive selection (default)
-       - Auto-select: --auto-select
+       - Auto-select: --auto-select [--placement least_loaded|balanced]
        - Direct worker: --worker-id PEER_ID
        - GPU filter: --min-gpu-memory MB
 
@@ -2182,6 +2226,7 @@ def track(**kwargs):
     worker_id = kwargs.pop("worker_id", None)
     auto_select = kwargs.pop("auto_select", False)
     min_gpu_memory = kwargs.pop("min_gpu_memory", None)
+    placement = kwargs.pop("placement", "gpu_memory")
 
     # Extract P2P authentication options
     room_secret = kwargs.pop("room_secret", None)
@@ -2268,6 +2313,7 @@ def track(**kwargs):
         worker_id=worker_id,
         auto_select=auto_select,
         min_gpu_memory=min_gpu_memory,
+        placement=placement,
         room_secret=room_secret,
         jwt_token=jwt_token,
         verbosity=verbosity,
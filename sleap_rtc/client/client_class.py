@@ -10,6 +10,7 @@ import logging
 import os
 import re
 import zmq
+import zmq.asyncio
 import platform
 import time
 
@@ -33,6 +34,7 @@ from sleap_rtc.exceptions import (
     WorkerDiscoveryError,
 )
 from sleap_rtc.filesystem import safe_mkdir
+from sleap_rtc.placement import place_job, worker_load
 from sleap_rtc.protocol import (
     parse_message,
     format_message,
@@ -62,6 +64,8 @@ from sleap_rtc.protocol import (
     MSG_JOB_COMPLETE,
     MSG_JOB_FAILED,
 )
+from sleap_rtc.rpc import RpcClient
+from sleap_rtc.tracing import MessageTracer
 from sleap_rtc.auth.psk import compute_hmac
 from sleap_rtc.auth.secret_resolver import resolve_secret
 from sleap_rtc.client.file_selector import (
@@ -115,8 +119,12 @@ class RTCClient:
         # (Only handle_connection() calls recv(), other functions wait on these queues)
         self.registration_queue = asyncio.Queue()  # For registered_auth responses
         self.peer_list_queue = asyncio.Queue()  # For peer_list responses
+        self.pong_queue = asyncio.Queue()  # For RTT probe replies (placement)
+        self._message_tracer = MessageTracer.from_config("Client")
         self.job_response_queues = {}  # job_id -> asyncio.Queue for job responses
         self.fs_response_queue = asyncio.Queue()  # For FS_* responses via data channel
+        # FS_* requests with correlation IDs, once the worker accepts them
+        self.fs_rpc = RpcClient(lambda msg: self.data_channel.send(msg))
 
         # Video resolution UI callback and data
         self.on_missing_videos_detected = (
@@ -198,36 +206,17 @@ class RTCClient:
         socket.connect(zmq_address)
         socket.setsockopt_string(zmq.SUBSCRIBE, "")
 
-        loop = asyncio.get_event_loop()
-
-        def recv_msg():
-            """Receives a message from the ZMQ socket in a non-blocking way.
-
-            Returns:
-                The received message as a JSON object, or None if no message is available.
-            """
-            try:
-                # logging.info("Receiving message from ZMQ...")
-                return socket.recv_string(
-                    flags=zmq.NOBLOCK
-                )  # or jsonpickle.decode(msg_str) if needed
-            except zmq.Again:
-                return None
+        # Await messages on the socket's file descriptor instead of polling.
+        socket = zmq.asyncio.Socket.from_socket(socket)
 
         while True:
-            # Send progress as JSON string with prefix.
-            msg = await loop.run_in_executor(None, recv_msg)
+            msg = await socket.recv_string()
 
-            if msg:
-                try:
-                    logging.info(f"Sending ZMQ command to worker: {msg}")
-                    channel.send(f"ZMQ_CTRL::{msg}")
-                    # logging.info("Progress report sent to client.")
-                except Exception as e:
-                    logging.error(f"Failed to send ZMQ progress: {e}")
-
-            # Polling interval.
-            await asyncio.sleep(0.05)
+            try:
+                logging.info(f"Sending ZMQ command to worker: {msg}")
+                channel.send(f"ZMQ_CTRL::{msg}")
+            except Exception as e:
+                logging.error(f"Failed to send ZMQ progress: {e}")
 
     def start_zmq_control(
         self, zmq_address: str = "tcp://127.0.0.1:9001"
@@ -392,7 +381,10 @@ class RTCClient:
                     payload = data.get("payload", {})
                     app_msg_type = payload.get("app_message_type")
 
-                    if app_msg_type == "job_response":
+                    if app_msg_type == "pong":
+                        await self.pong_queue.put(data)
+
+                    elif app_msg_type == "job_response":
                         # Route to job-specific queue
                         job_id = payload.get("job_id")
                         if job_id and job_id in self.job_response_queues:
@@ -443,17 +435,30 @@ class RTCClient:
 
     # ===== Filesystem Path Resolution =====
 
-    async def _send_fs_get_mounts(self, timeout: float = 10.0) -> list:
-        """Send FS_GET_MOUNTS message to Worker and wait for response.
+    async def _fs_request(self, message: str, timeout: float) -> str:
+        """Send an FS_* request to Worker and wait for its response.
+
+        Uses a correlation ID when the worker accepts them, so concurrent
+        requests get their own responses; otherwise sends the plain message
+        and takes the next response from ``fs_response_queue``.
 
         Args:
-            timeout: Timeout in seconds for response.
+            message: The FS_* request.
+            timeout: Timeout in seconds for the response.
 
         Returns:
-            List of mount dictionaries with 'label' and 'path' keys.
+            The response message.
+
+        Raises:
+            asyncio.TimeoutError: If no response arrived in time.
+            ConnectionError: If the data channel closed while waiting.
         """
-        if self.data_channel.readyState != "open":
-            return []
+        if self.fs_rpc.enabled:
+            with self.fs_rpc.start(message) as call:
+                response = await call.reply(timeout)
+            if response is None:
+                raise ConnectionError("Data channel closed")
+            return response
 
         # Clear any stale responses
         while not self.fs_response_queue.empty():
@@ -462,15 +467,27 @@ class RTCClient:
             except asyncio.QueueEmpty:
                 break
 
+        self.data_channel.send(message)
+        return await asyncio.wait_for(self.fs_response_queue.get(), timeout=timeout)
+
+    async def _send_fs_get_mounts(self, timeout: float = 10.0) -> list:
+        """Send FS_GET_MOUNTS message to Worker and wait for response.
+
+        Args:
+            timeout: Timeout in seconds for response.
+
+        Returns:
+            List of mount dictionaries with 'label' and 'path' keys.
+        """
+        if self.data_channel.readyState != "open":
+            return []
+
         # Send request
         logging.info("Sending FS_GET_MOUNTS")
-        self.data_channel.send(MSG_FS_GET_MOUNTS)
 
         # Wait for response
         try:
-            response = await asyncio.wait_for(
-                self.fs_response_queue.get(), timeout=timeout
-            )
+            response = await self._fs_request(MSG_FS_GET_MOUNTS, timeout)
             if response.startswith(MSG_FS_MOUNTS_RESPONSE):
                 json_str = response.split(MSG_SEPARATOR, 1)[1]
                 return json.loads(json_str)
@@ -512,22 +529,12 @@ class RTCClient:
         parts.append(mount_label if mount_label else "")
         message = MSG_SEPARATOR.join(parts)
 
-        # Clear any stale responses
-        while not self.fs_response_queue.empty():
-            try:
-                self.fs_response_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
         # Send request
         logging.info(f"Sending FS_RESOLVE: {pattern}")
-        self.data_channel.send(message)
 
         # Wait for response
         try:
-            response = await asyncio.wait_for(
-                self.fs_response_queue.get(), timeout=timeout
-            )
+            response = await self._fs_request(message, timeout)
 
             # Parse response
             if response.startswith(MSG_FS_RESOLVE_RESPONSE):
@@ -551,6 +558,8 @@ class RTCClient:
         except asyncio.TimeoutError:
             logging.warning("FS_RESOLVE timed out")
             return {"error": "Resolution timed out", "timeout": True, "candidates": []}
+        except ConnectionError as e:
+            return {"error": str(e), "candidates": []}
 
     async def resolve_file_path(
         self,
@@ -804,6 +813,7 @@ class RTCClient:
 
             viewer_server = FSViewerServer(
                 send_to_worker=lambda msg: self.data_channel.send(msg),
+                rpc=self.fs_rpc,
             )
             viewer_server.set_video_check_data(video_data)
 
@@ -1026,6 +1036,10 @@ class RTCClient:
                 print("Check that the room secret matches the worker's configuration.")
                 return
 
+        # Ask whether FS_* requests may carry correlation IDs
+        self.fs_rpc.reset()
+        self.fs_rpc.hello()
+
         # Handle structured job submission if job_spec is set
         if self.job_spec:
             logging.info(
@@ -1207,9 +1221,8 @@ class RTCClient:
         Returns:
             None
         """
-        # Log the received message in verbose mode only (truncate for readability).
-        log_msg = message if len(str(message)) < 100 else f"{str(message)[:100]}..."
-        logging.debug(f"Client received: {log_msg}")
+        # Log the received message in verbose mode only.
+        self._message_tracer.trace(message)
 
         # Handle string and bytes messages differently.
         if isinstance(message, str):
@@ -1224,6 +1237,10 @@ class RTCClient:
                 self._handle_auth_failure(message)
                 return
 
+            # Replies to FS_* requests with correlation IDs
+            if self.fs_rpc.handle(message):
+                return
+
             # Handle structured job submission responses (JOB_*)
             if message.startswith("JOB_"):
                 await self.job_response_queue.put(message)
@@ -1676,11 +1693,14 @@ class RTCClient:
             logging.error(f"Worker discovery error: {e}")
             return []
 
-    def _auto_select_worker(self, workers: list) -> str:
-        """Automatically select best worker based on GPU memory.
+    async def _auto_select_worker(
+        self, workers: list, placement: str = "gpu_memory"
+    ) -> str:
+        """Automatically select the best worker under a placement policy.
 
         Args:
             workers: List of worker peer info dicts
+            placement: One of ``sleap_rtc.placement.PLACEMENT_POLICIES``
 
         Returns:
             Selected worker peer_id
@@ -1688,21 +1708,19 @@ class RTCClient:
         if not workers:
             raise ValueError("No workers available for auto-selection")
 
-        # Sort by GPU memory (descending)
-        sorted_workers = sorted(
-            workers,
-            key=lambda w: w.get("metadata", {})
-            .get("properties", {})
-            .get("gpu_memory_mb", 0),
-            reverse=True,
+        ranked = await place_job(
+            workers, placement, self.websocket.send, self.pong_queue.get, self.peer_id
         )
 
-        selected = sorted_workers[0]
+        selected = ranked[0]
         peer_id = selected["peer_id"]
         metadata = selected.get("metadata", {}).get("properties", {})
         gpu_memory = metadata.get("gpu_memory_mb", "unknown")
 
-        logging.info(f"Auto-selected worker {peer_id} (GPU memory: {gpu_memory}MB)")
+        logging.info(
+            f"Auto-selected worker {peer_id} by {placement} "
+            f"(GPU memory: {gpu_memory}MB, load: {worker_load(metadata):.2f})"
+        )
         logging.info("Worker transfer mode: RTC")
 
         return peer_id
@@ -2405,6 +2423,7 @@ class RTCClient:
         room_secret: str = None,
         job_spec=None,
         verbosity: str = "default",
+        placement: str = "gpu_memory",
     ):
         """Sends initial SDP offer to worker peer and establishes both connection & datachannel to be used by both parties.
 
@@ -2426,6 +2445,9 @@ class RTCClient:
                 will try to resolve from SLEAP_ROOM_SECRET env var, filesystem, or config.
             job_spec: Optional TrainJobSpec or TrackJobSpec for structured job submission.
                 If provided, uses the new job submission protocol instead of file transfer.
+            verbosity: Output verbosity level ("quiet", "default", "verbose").
+            placement: Placement policy used by auto_select (see
+                ``sleap_rtc.placement``). Defaults to the most GPU memory.
 
         Returns:
             None
@@ -2578,7 +2600,9 @@ class RTCClient:
                             logging.info(f"Using specified worker: {worker_id}")
                         elif auto_select:
                             # Auto-select best worker
-                            self.target_worker = self._auto_select_worker(workers)
+                            self.target_worker = await self._auto_select_worker(
+                                workers, placement
+                            )
                             logging.info(f"Auto-selected worker: {self.target_worker}")
                         else:
                             # Interactive worker selection
@@ -5,30 +5,137 @@ client to worker over a WebRTC data channel.
 """
 
 import asyncio
-import hashlib
+import json
 import logging
+import time
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence
 
 from aiortc import RTCDataChannel
 
+from sleap_rtc.client.hash_cache import HashCache, sha256_file_cached
+from sleap_rtc.compression import ChunkEncoder, codec_offer, supported_codecs
+from sleap_rtc.delta_sync import compute_delta, delta_literal_bytes
 from sleap_rtc.protocol import (
     MSG_FILE_UPLOAD_CACHE_HIT,
     MSG_FILE_UPLOAD_CHECK,
     MSG_FILE_UPLOAD_COMPLETE,
+    MSG_FILE_UPLOAD_COPY,
+    MSG_FILE_UPLOAD_DELTA_REQUEST,
+    MSG_FILE_UPLOAD_DELTA_START,
     MSG_FILE_UPLOAD_END,
     MSG_FILE_UPLOAD_ERROR,
+    MSG_FILE_UPLOAD_OFFSET,
     MSG_FILE_UPLOAD_PROGRESS,
     MSG_FILE_UPLOAD_READY,
+    MSG_FILE_UPLOAD_RESUME,
+    MSG_FILE_UPLOAD_SIGNATURE,
     MSG_FILE_UPLOAD_START,
+    MSG_FILE_UPLOAD_STRIPED,
     MSG_SEPARATOR,
 )
+from sleap_rtc.striping import log_transfer_rate, send_striped
 
 UPLOAD_CHUNK_SIZE = 64 * 1024  # 64 KB
 UPLOAD_RESPONSE_TIMEOUT = 30.0  # seconds
 BUFFER_HIGH_WATER = 16 * 1024 * 1024  # 16 MB
 
 
+async def _send_file_range(
+    channel: RTCDataChannel,
+    fh,
+    offset: int,
+    length: Optional[int] = None,
+    encoder: Optional[ChunkEncoder] = None,
+) -> None:
+    """Send a byte range of an open file as binary chunks.
+
+    Args:
+        channel: Open RTCDataChannel to the worker.
+        fh: File object opened in binary mode.
+        offset: Byte offset to start from.
+        length: Number of bytes to send, or None to send until EOF.
+        encoder: Compresses each chunk if the worker accepted a codec.
+    """
+    fh.seek(offset)
+    remaining = length
+    while remaining is None or remaining > 0:
+        size = (
+            UPLOAD_CHUNK_SIZE
+            if remaining is None
+            else min(UPLOAD_CHUNK_SIZE, remaining)
+        )
+        chunk = fh.read(size)
+        if not chunk:
+            break
+        while (
+            channel.bufferedAmount is not None
+            and channel.bufferedAmount > BUFFER_HIGH_WATER
+        ):
+            await asyncio.sleep(0.1)
+        channel.send(encoder.encode(chunk) if encoder else chunk)
+        if remaining is not None:
+            remaining -= len(chunk)
+
+
+def _accepted_encoder(reply_args: list) -> Optional[ChunkEncoder]:
+    """Return an encoder for the codec the worker accepted, if any.
+
+    Args:
+        reply_args: Fields of the worker's reply after the ones every worker
+            sends; the first, if present, is the chosen codec.
+
+    Raises:
+        RuntimeError: If the worker chose a codec that was not offered.
+    """
+    if not reply_args or not reply_args[0]:
+        return None
+    codec = reply_args[0]
+    if codec not in supported_codecs():
+        raise RuntimeError(f"Worker chose unsupported compression codec: {codec}")
+    logging.info(f"Worker accepted {codec} compression")
+    return ChunkEncoder(codec)
+
+
+async def _request_delta_signature(
+    channel: RTCDataChannel, response_queue: asyncio.Queue, filename: str
+) -> Optional[dict]:
+    """Ask the worker for the block signature of its best delta basis.
+
+    Args:
+        channel: Open RTCDataChannel to the worker.
+        response_queue: Queue receiving FILE_UPLOAD_* responses.
+        filename: Base filename of the file being uploaded.
+
+    Returns:
+        Dict with "basis", "block_size" and "blocks", or None if the worker
+        has no previous upload of this filename.
+    """
+    channel.send(f"{MSG_FILE_UPLOAD_DELTA_REQUEST}{MSG_SEPARATOR}{filename}")
+    blocks: list = []
+    while True:
+        resp = await asyncio.wait_for(
+            response_queue.get(), timeout=UPLOAD_RESPONSE_TIMEOUT
+        )
+        if resp.startswith(MSG_FILE_UPLOAD_ERROR + MSG_SEPARATOR):
+            reason = resp.split(MSG_SEPARATOR, 1)[1]
+            raise RuntimeError(f"Worker rejected delta request: {reason}")
+        if not resp.startswith(MSG_FILE_UPLOAD_SIGNATURE + MSG_SEPARATOR):
+            raise RuntimeError(
+                f"Unexpected response to FILE_UPLOAD_DELTA_REQUEST: {resp[:80]}"
+            )
+        page = json.loads(resp.split(MSG_SEPARATOR, 1)[1])
+        if page["basis"] is None:
+            return None
+        blocks.extend((weak, strong) for weak, strong in page["blocks"])
+        if len(blocks) >= page["total_blocks"]:
+            return {
+                "basis": page["basis"],
+                "block_size": page["block_size"],
+                "blocks": blocks,
+            }
+
+
 async def upload_file(
     channel: RTCDataChannel,
     response_queue: asyncio.Queue,
@@ -36,17 +143,37 @@ async def upload_file(
     dest_dir: str,
     create_subdir: str,
     on_progress: Optional[Callable[[int, int], None]] = None,
+    resumable: bool = False,
+    delta: bool = False,
+    stripe_channels: Sequence[RTCDataChannel] = (),
+    hash_cache: Optional[HashCache] = None,
+    compress: bool = True,
 ) -> str:
     """Upload a file from client to worker over an RTC data channel.
 
     Protocol flow:
-      1. Compute SHA-256 of the local file.
-      2. Send FILE_UPLOAD_CHECK::{sha256}::{filename}.
+      1. Compute SHA-256 of the local file in a worker thread, or reuse the
+         digest cached for it if the file is unchanged.
+      2. Send FILE_UPLOAD_CHECK::{sha256}::{filename}::{dest_dir}::{create_subdir}.
          - If worker replies FILE_UPLOAD_CACHE_HIT::{path}, return that path.
          - If worker replies FILE_UPLOAD_READY, proceed to step 3.
       3. Send FILE_UPLOAD_START::{filename}::{total_bytes}::{dest_dir}::{create_subdir}.
          - Wait for FILE_UPLOAD_READY (or FILE_UPLOAD_ERROR).
-      4. Send binary chunks (back-pressuring on channel.bufferedAmount).
+         With ``resumable=True`` send FILE_UPLOAD_RESUME::{sha256}::... instead
+         and wait for FILE_UPLOAD_OFFSET::{offset}, the number of bytes the
+         worker already holds from an earlier, interrupted attempt.
+         With ``delta=True`` the client first sends FILE_UPLOAD_DELTA_REQUEST;
+         if the worker advertises a basis (a previous upload of the same
+         filename) only changed blocks are sent after
+         FILE_UPLOAD_DELTA_START, interleaved with FILE_UPLOAD_COPY
+         instructions for unchanged ones.
+         With ``stripe_channels`` send FILE_UPLOAD_STRIPED::... instead and
+         spread the data across those channels (see sleap_rtc.striping).
+         Except for striped uploads, the supported compression codecs are
+         offered as a trailing field; a worker that accepts one names it in
+         its reply.
+      4. Send binary chunks from offset (back-pressuring on channel.bufferedAmount),
+         compressed if a codec was accepted.
       5. Send FILE_UPLOAD_END.
          - Drain FILE_UPLOAD_PROGRESS messages, calling on_progress each time.
          - Return path from FILE_UPLOAD_COMPLETE, or raise on FILE_UPLOAD_ERROR.
@@ -62,6 +189,20 @@ async def upload_file(
             dest_dir, "0" to write directly into dest_dir.
         on_progress: Optional callable(bytes_sent, total_bytes) invoked for each
             FILE_UPLOAD_PROGRESS message received from the worker.
+        resumable: If True, the worker keeps a checkpointed partial file so
+            that calling upload_file again after a dropped connection only
+            re-sends the missing tail. Requires a worker that understands
+            FILE_UPLOAD_RESUME.
+        delta: If True, diff against the worker's previous upload of the same
+            filename and send only changed blocks. Falls back to a full
+            (or resumable) upload when the worker has no such file.
+        stripe_channels: Open stripe channels (from
+            sleap_rtc.striping.open_stripe_channels) to spread a full upload
+            across. Ignored for resumable and delta uploads, which rely on
+            in-order data.
+        hash_cache: Cache of file digests (default: ~/.sleap-rtc/hash-cache.json).
+        compress: If True, offer per-chunk compression (see
+            sleap_rtc.compression). Chunks that do not shrink are sent as-is.
 
     Returns:
         Absolute path of the uploaded file on the worker.
@@ -74,18 +215,16 @@ async def upload_file(
     filename = path.name
     total_bytes = path.stat().st_size
 
-    # Step 1: Compute SHA-256 (streaming to avoid large RAM usage)
+    # Step 1: Compute SHA-256 off the event loop (cached for unchanged files)
     logging.info(f"Computing SHA-256 for {filename}...")
-    sha256_ctx = hashlib.sha256()
-    with open(file_path, "rb") as fh:
-        while chunk := fh.read(UPLOAD_CHUNK_SIZE):
-            sha256_ctx.update(chunk)
-    sha256 = sha256_ctx.hexdigest()
+    loop = asyncio.get_running_loop()
+    sha256 = await loop.run_in_executor(None, sha256_file_cached, file_path, hash_cache)
 
     # Step 2: SHA-256 pre-check
     logging.info(f"Sending FILE_UPLOAD_CHECK for {filename}")
     channel.send(
         f"{MSG_FILE_UPLOAD_CHECK}{MSG_SEPARATOR}{sha256}{MSG_SEPARATOR}{filename}"
+        f"{MSG_SEPARATOR}{dest_dir}{MSG_SEPARATOR}{create_subdir}"
     )
     resp = await asyncio.wait_for(response_queue.get(), timeout=UPLOAD_RESPONSE_TIMEOUT)
 
@@ -101,31 +240,120 @@ async def upload_file(
     if resp != MSG_FILE_UPLOAD_READY:
         raise RuntimeError(f"Unexpected response to FILE_UPLOAD_CHECK: {resp}")
 
-    # Step 3: Send FILE_UPLOAD_START
-    logging.info(f"Sending FILE_UPLOAD_START for {filename} ({total_bytes} bytes)")
-    channel.send(
-        f"{MSG_FILE_UPLOAD_START}{MSG_SEPARATOR}{filename}{MSG_SEPARATOR}"
-        f"{total_bytes}{MSG_SEPARATOR}{dest_dir}{MSG_SEPARATOR}{create_subdir}"
-    )
-    resp = await asyncio.wait_for(response_queue.get(), timeout=UPLOAD_RESPONSE_TIMEOUT)
+    started = time.monotonic()
+    signature = None
+    striped = False
+    encoder = None
+    offer = f"{MSG_SEPARATOR}{codec_offer()}" if compress else ""
+    if delta:
+        signature = await _request_delta_signature(channel, response_queue, filename)
 
-    if resp.startswith(MSG_FILE_UPLOAD_ERROR + MSG_SEPARATOR):
-        reason = resp.split(MSG_SEPARATOR, 1)[1]
-        raise RuntimeError(f"Worker rejected upload: {reason}")
+    if signature is not None:
+        # Step 3/4 (delta): diff against the worker's basis off the event loop.
+        ops = await loop.run_in_executor(
+            None,
+            compute_delta,
+            file_path,
+            signature["block_size"],
+            signature["blocks"],
+        )
+        literal = delta_literal_bytes(ops)
+        bytes_to_send = literal
+        logging.info(
+            f"Delta upload of {filename}: sending {literal} of {total_bytes} bytes "
+            f"({100 * (1 - literal / max(total_bytes, 1)):.1f}% saved)"
+        )
+        channel.send(
+            f"{MSG_FILE_UPLOAD_DELTA_START}{MSG_SEPARATOR}{sha256}{MSG_SEPARATOR}"
+            f"{filename}{MSG_SEPARATOR}{total_bytes}{MSG_SEPARATOR}{dest_dir}"
+            f"{MSG_SEPARATOR}{create_subdir}{MSG_SEPARATOR}{signature['basis']}"
+            f"{offer}"
+        )
+        resp = await asyncio.wait_for(
+            response_queue.get(), timeout=UPLOAD_RESPONSE_TIMEOUT
+        )
+        if resp.startswith(MSG_FILE_UPLOAD_ERROR + MSG_SEPARATOR):
+            reason = resp.split(MSG_SEPARATOR, 1)[1]
+            raise RuntimeError(f"Worker rejected upload: {reason}")
+        reply = resp.split(MSG_SEPARATOR)
+        if reply[0] != MSG_FILE_UPLOAD_READY:
+            raise RuntimeError(
+                f"Unexpected response to FILE_UPLOAD_DELTA_START: {resp}"
+            )
+        encoder = _accepted_encoder(reply[1:])
 
-    if resp != MSG_FILE_UPLOAD_READY:
-        raise RuntimeError(f"Unexpected response to FILE_UPLOAD_START: {resp}")
-
-    # Step 4: Send binary chunks
-    logging.info(f"Sending {filename} in {UPLOAD_CHUNK_SIZE // 1024} KB chunks...")
-    with open(file_path, "rb") as fh:
-        while chunk := fh.read(UPLOAD_CHUNK_SIZE):
-            while (
-                channel.bufferedAmount is not None
-                and channel.bufferedAmount > BUFFER_HIGH_WATER
-            ):
-                await asyncio.sleep(0.1)
-            channel.send(chunk)
+        with open(file_path, "rb") as fh:
+            for op in ops:
+                if op[0] == "copy":
+                    channel.send(
+                        f"{MSG_FILE_UPLOAD_COPY}{MSG_SEPARATOR}{op[1]}{MSG_SEPARATOR}{op[2]}"
+                    )
+                else:
+                    await _send_file_range(channel, fh, op[1], op[2], encoder)
+    else:
+        # Step 3: Send FILE_UPLOAD_START (or FILE_UPLOAD_RESUME / _STRIPED)
+        offset = 0
+        striped = bool(stripe_channels) and not resumable
+        if resumable:
+            logging.info(
+                f"Sending FILE_UPLOAD_RESUME for {filename} ({total_bytes} bytes)"
+            )
+            channel.send(
+                f"{MSG_FILE_UPLOAD_RESUME}{MSG_SEPARATOR}{sha256}{MSG_SEPARATOR}"
+                f"{filename}{MSG_SEPARATOR}{total_bytes}{MSG_SEPARATOR}{dest_dir}"
+                f"{MSG_SEPARATOR}{create_subdir}{offer}"
+            )
+        elif striped:
+            logging.info(
+                f"Sending FILE_UPLOAD_STRIPED for {filename} ({total_bytes} bytes, "
+                f"{len(stripe_channels)} stripes)"
+            )
+            channel.send(
+                f"{MSG_FILE_UPLOAD_STRIPED}{MSG_SEPARATOR}{filename}{MSG_SEPARATOR}"
+                f"{total_bytes}{MSG_SEPARATOR}{dest_dir}{MSG_SEPARATOR}{create_subdir}"
+            )
+        else:
+            logging.info(
+                f"Sending FILE_UPLOAD_START for {filename} ({total_bytes} bytes)"
+            )
+            channel.send(
+                f"{MSG_FILE_UPLOAD_START}{MSG_SEPARATOR}{filename}{MSG_SEPARATOR}"
+                f"{total_bytes}{MSG_SEPARATOR}{dest_dir}{MSG_SEPARATOR}{create_subdir}"
+                f"{offer}"
+            )
+        resp = await asyncio.wait_for(
+            response_queue.get(), timeout=UPLOAD_RESPONSE_TIMEOUT
+        )
+
+        if resp.startswith(MSG_FILE_UPLOAD_ERROR + MSG_SEPARATOR):
+            reason = resp.split(MSG_SEPARATOR, 1)[1]
+            raise RuntimeError(f"Worker rejected upload: {reason}")
+
+        reply = resp.split(MSG_SEPARATOR)
+        if resumable:
+            if reply[0] != MSG_FILE_UPLOAD_OFFSET or len(reply) < 2:
+                raise RuntimeError(f"Unexpected response to FILE_UPLOAD_RESUME: {resp}")
+            offset = int(reply[1])
+            encoder = _accepted_encoder(reply[2:])
+            if offset:
+                logging.info(
+                    f"Resuming {filename} at byte {offset} "
+                    f"({total_bytes - offset} bytes left)"
+                )
+        elif reply[0] != MSG_FILE_UPLOAD_READY or (striped and len(reply) > 1):
+            request = MSG_FILE_UPLOAD_STRIPED if striped else MSG_FILE_UPLOAD_START
+            raise RuntimeError(f"Unexpected response to {request}: {resp}")
+        else:
+            encoder = _accepted_encoder(reply[1:])
+
+        # Step 4: Send binary chunks
+        logging.info(f"Sending {filename} in {UPLOAD_CHUNK_SIZE // 1024} KB chunks...")
+        bytes_to_send = total_bytes - offset
+        with open(file_path, "rb") as fh:
+            if striped:
+                await send_striped(stripe_channels, fh)
+            else:
+                await _send_file_range(channel, fh, offset, encoder=encoder)
 
     # Step 5: Send FILE_UPLOAD_END and await completion
     logging.info("Sending FILE_UPLOAD_END")
@@ -149,6 +377,14 @@ async def upload_file(
         if resp.startswith(MSG_FILE_UPLOAD_COMPLETE + MSG_SEPARATOR):
             worker_path = resp.split(MSG_SEPARATOR, 1)[1]
             logging.info(f"Upload complete: {worker_path}")
+            if encoder is not None:
+                encoder.log_ratio(f"Upload of {filename}")
+            log_transfer_rate(
+                f"Upload of {filename}",
+                bytes_to_send,
+                started,
+                len(stripe_channels) if striped else 1,
+            )
             return worker_path
 
         if resp.startswith(MSG_FILE_UPLOAD_ERROR + MSG_SEPARATOR):
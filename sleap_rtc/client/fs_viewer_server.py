@@ -2,6 +2,12 @@
 
 This module provides a local web server that serves the filesystem browser UI
 and relays messages between the browser and Worker via WebRTC.
+
+With an :class:`~sleap_rtc.rpc.RpcClient` whose worker accepts correlation
+IDs, every browser request is sent as its own call and its replies are
+forwarded as they arrive, so Miller columns list in parallel. Otherwise
+requests are sent as plain messages and the browse command passes the
+worker's responses to :meth:`FSViewerServer.handle_worker_response`.
 """
 
 import asyncio
@@ -10,10 +16,13 @@ import logging
 import secrets
 import webbrowser
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Set
 
 from aiohttp import web, WSMsgType
 
+from sleap_rtc.protocol import FS_LIST_STREAM_ENTRIES
+from sleap_rtc.rpc import RpcClient
+
 # Default port range to try
 DEFAULT_PORT = 8765
 MAX_PORT_TRIES = 10
@@ -35,16 +44,21 @@ class FSViewerServer:
     def __init__(
         self,
         send_to_worker: Callable[[str], None],
-        on_worker_response: Optional[Callable[[str], None]] = None,
+        on_worker_response: Optional[Callable[[str], Any]] = None,
+        rpc: Optional[RpcClient] = None,
     ):
         """Initialize the server.
 
         Args:
             send_to_worker: Callback to send messages to Worker via WebRTC.
-            on_worker_response: Optional callback when Worker responds.
+            on_worker_response: Optional callback (sync or async) when Worker
+                responds.
+            rpc: Client for requests with correlation IDs, used once its
+                worker accepts them.
         """
         self.send_to_worker = send_to_worker
         self.on_worker_response = on_worker_response
+        self.rpc = rpc
 
         # Generate secure token for this session
         self.token = secrets.token_urlsafe(16)
@@ -61,12 +75,18 @@ class FSViewerServer:
         # Response queue for Worker responses
         self.response_queue: asyncio.Queue = asyncio.Queue()
 
-        # Debounce state
-        self._debounce_task: Optional[asyncio.Task] = None
-        self._pending_request: Optional[Dict[str, Any]] = None
+        # Debounce state, per column when listings can run in parallel
+        self._debounce_tasks: Dict[Any, asyncio.Task] = {}
+        self._pending_lists: Dict[Any, Dict[str, Any]] = {}
 
-        # Track request metadata for column view support
+        # Track request metadata for column view support (plain requests)
         self._request_metadata: Optional[Dict[str, Any]] = None
+        # Listing call per column, and every call in flight (multiplexed)
+        self._list_tasks: Dict[Any, asyncio.Task] = {}
+        self._calls: Set[asyncio.Task] = set()
+        # Worker listing cursor per path, so "load more" continues the same
+        # sorted snapshot of the directory
+        self._list_cursors: Dict[str, str] = {}
 
         # Video resolution data
         self.pending_video_check_data: Optional[Dict[str, Any]] = None
@@ -117,6 +137,10 @@ class FSViewerServer:
 
     async def stop(self):
         """Stop the server and close all connections."""
+        # Abandon requests still in flight
+        for task in list(self._calls) + list(self._debounce_tasks.values()):
+            task.cancel()
+
         # Close all WebSocket clients
         for ws in list(self.ws_clients):
             await ws.close()
@@ -194,10 +218,10 @@ class FSViewerServer:
     async def _request_worker_info(self, ws: web.WebSocketResponse):
         """Request worker info and mounts when client connects."""
         # Request FS_GET_INFO
-        self.send_to_worker("FS_GET_INFO")
+        self._request("FS_GET_INFO")
 
         # Request FS_GET_MOUNTS
-        self.send_to_worker("FS_GET_MOUNTS")
+        self._request("FS_GET_MOUNTS")
 
     async def _handle_browser_message(self, ws: web.WebSocketResponse, data: str):
         """Handle message from browser client.
@@ -222,7 +246,7 @@ class FSViewerServer:
                 # Path resolution request
                 pattern = msg.get("pattern", "")
                 file_size = msg.get("file_size")
-                self.send_to_worker(f"FS_RESOLVE::{pattern}::{file_size or ''}")
+                self._request(f"FS_RESOLVE::{pattern}::{file_size or ''}")
 
             elif msg_type == "scan_dir":
                 # Directory scanning for missing video filenames
@@ -231,7 +255,7 @@ class FSViewerServer:
                 request_payload = json.dumps(
                     {"directory": directory, "filenames": filenames}
                 )
-                self.send_to_worker(f"FS_SCAN_DIR::{request_payload}")
+                self._request(f"FS_SCAN_DIR::{request_payload}")
 
             elif msg_type == "write_slp":
                 # Write SLP file with corrected video paths
@@ -247,7 +271,7 @@ class FSViewerServer:
                         "filename_map": filename_map,
                     }
                 )
-                self.send_to_worker(f"FS_WRITE_SLP::{request_payload}")
+                self._request(f"FS_WRITE_SLP::{request_payload}")
 
             elif msg_type == "resolve_with_prefix":
                 # Prefix-based resolution for missing videos (SLEAP-style)
@@ -261,13 +285,13 @@ class FSViewerServer:
                         "other_missing": other_missing,
                     }
                 )
-                self.send_to_worker(f"FS_RESOLVE_WITH_PREFIX::{request_payload}")
+                self._request(f"FS_RESOLVE_WITH_PREFIX::{request_payload}")
 
             elif msg_type == "apply_prefix":
                 # User confirmed prefix application
                 confirmed = msg.get("confirmed", True)
                 request_payload = json.dumps({"confirmed": confirmed})
-                self.send_to_worker(f"FS_APPLY_PREFIX::{request_payload}")
+                self._request(f"FS_APPLY_PREFIX::{request_payload}")
 
             elif msg_type == "get_video_check":
                 # Request video check data (for resolution UI initial load)
@@ -289,11 +313,70 @@ class FSViewerServer:
         except json.JSONDecodeError:
             logging.error(f"Invalid JSON from browser: {data[:100]}")
 
+    @property
+    def multiplexed(self) -> bool:
+        """Whether requests are sent with correlation IDs."""
+        return self.rpc is not None and self.rpc.enabled
+
+    def _request(self, message: str, metadata: Optional[Dict[str, Any]] = None):
+        """Send a request to the Worker.
+
+        Args:
+            message: The FS_* request.
+            metadata: Listing metadata (see :meth:`_send_list_dir_after_delay`)
+                when the request is an FS_LIST_DIR.
+
+        Returns:
+            The task forwarding the replies, or None for a plain request.
+        """
+        if not self.multiplexed:
+            if metadata is not None:
+                self._request_metadata = metadata
+            self.send_to_worker(message)
+            return None
+        task = asyncio.create_task(self._run_call(message, metadata))
+        self._calls.add(task)
+        task.add_done_callback(self._calls.discard)
+        return task
+
+    async def _run_call(self, message: str, metadata: Optional[Dict[str, Any]]):
+        """Forward the replies to one multiplexed request to the browser."""
+        try:
+            with self.rpc.start(message) as call:
+                while True:
+                    reply = await call.reply()
+                    if reply is None:
+                        return
+                    if metadata is not None and reply.startswith("FS_LIST_RESPONSE::"):
+                        more = await self._forward_list_page(
+                            json.loads(reply.split("::", 1)[1]), metadata
+                        )
+                        await self._notify(reply)
+                        if not more:
+                            return
+                    else:
+                        await self.handle_worker_response(reply)
+                        return
+        except asyncio.TimeoutError:
+            logging.warning(f"Timeout waiting for Worker response to {message[:50]}")
+            await self._broadcast(
+                {
+                    "type": "error",
+                    "code": "TIMEOUT",
+                    "message": "Worker did not respond",
+                }
+            )
+
     async def _debounced_list_dir(
         self, path: str, offset: int, column_index: Optional[int], append: bool
     ):
-        """Debounce list_dir requests (100ms)."""
-        self._pending_request = {
+        """Debounce list_dir requests (100ms).
+
+        Multiplexed listings are debounced per column, so columns fill in
+        parallel; plain ones share a single debounce.
+        """
+        key = column_index if self.multiplexed else None
+        self._pending_lists[key] = {
             "path": path,
             "offset": offset,
             "column_index": column_index,
@@ -301,27 +384,94 @@ class FSViewerServer:
         }
 
         # Cancel previous debounce task
-        if self._debounce_task and not self._debounce_task.done():
-            self._debounce_task.cancel()
+        task = self._debounce_tasks.get(key)
+        if task and not task.done():
+            task.cancel()
 
         # Create new debounce task
-        self._debounce_task = asyncio.create_task(self._send_list_dir_after_delay())
+        self._debounce_tasks[key] = asyncio.create_task(
+            self._send_list_dir_after_delay(key)
+        )
 
-    async def _send_list_dir_after_delay(self):
+    async def _send_list_dir_after_delay(self, key: Any = None):
         """Send list_dir after debounce delay."""
         await asyncio.sleep(0.1)  # 100ms debounce
 
-        if self._pending_request:
-            path = self._pending_request["path"]
-            offset = self._pending_request["offset"]
+        pending = self._pending_lists.pop(key, None)
+        if pending:
+            path = pending["path"]
+            offset = pending["offset"]
             # Store metadata to attach to response
-            self._request_metadata = {
+            metadata = {
                 "path": path,
-                "column_index": self._pending_request.get("column_index"),
-                "append": self._pending_request.get("append", False),
+                "column_index": pending.get("column_index"),
+                "append": pending.get("append", False),
+                "offset": offset,
+                "end": offset + FS_LIST_STREAM_ENTRIES,
+            }
+            # A new listing for a column supersedes the one still streaming
+            previous = self._list_tasks.pop(key, None)
+            if previous is not None:
+                previous.cancel()
+            # Ask for a streamed listing; the worker sends several
+            # FS_LIST_RESPONSE pages, which are forwarded as they arrive
+            cursor = self._list_cursors.get(path, "") if offset else ""
+            task = self._request(
+                f"FS_LIST_DIR::{path}::{offset}::{FS_LIST_STREAM_ENTRIES}::{cursor}",
+                metadata,
+            )
+            if task is not None:
+                self._list_tasks[key] = task
+
+    async def _forward_list_page(
+        self, data: Dict[str, Any], metadata: Optional[Dict[str, Any]]
+    ) -> bool:
+        """Broadcast one FS_LIST_RESPONSE page with its request's metadata.
+
+        Args:
+            data: The parsed page.
+            metadata: Metadata of the listing request; updated so the next
+                page of a streamed listing extends this one.
+
+        Returns:
+            True if more pages of the listing are expected.
+        """
+        more = False
+        expected = metadata["offset"] if metadata else None
+        if metadata and data.get("offset", expected) != expected:
+            # Leftover page of a listing the browser has moved on from
+            return True
+        if metadata:
+            data["path"] = metadata.get("path")
+            data["column_index"] = metadata.get("column_index")
+            data["append"] = metadata.get("append", False)
+            if data.get("cursor"):
+                self._list_cursors[metadata["path"]] = data["cursor"]
+            # Later pages of a streamed listing extend this one;
+            # workers without streaming send a single page
+            next_offset = data.get("next_offset")
+            if (
+                data.get("has_more")
+                and next_offset is not None
+                and next_offset < metadata["end"]
+            ):
+                metadata["append"] = True
+                metadata["offset"] = next_offset
+                more = True
+        await self._broadcast(
+            {
+                "type": "list_response",
+                "data": data,
             }
-            self.send_to_worker(f"FS_LIST_DIR::{path}::{offset}")
-            self._pending_request = None
+        )
+        return more
+
+    async def _notify(self, message: str):
+        """Call the optional on_worker_response callback."""
+        if self.on_worker_response:
+            result = self.on_worker_response(message)
+            if asyncio.iscoroutine(result):
+                await result
 
     async def handle_worker_response(self, message: str):
         """Handle response from Worker (called by browse command).
@@ -355,17 +505,8 @@ class FSViewerServer:
                 json_str = message.split("::", 1)[1]
                 data = json.loads(json_str)
                 # Attach request metadata for column view support
-                if self._request_metadata:
-                    data["path"] = self._request_metadata.get("path")
-                    data["column_index"] = self._request_metadata.get("column_index")
-                    data["append"] = self._request_metadata.get("append", False)
+                if not await self._forward_list_page(data, self._request_metadata):
                     self._request_metadata = None
-                await self._broadcast(
-                    {
-                        "type": "list_response",
-                        "data": data,
-                    }
-                )
 
             elif message.startswith("FS_RESOLVE_RESPONSE::"):
                 json_str = message.split("::", 1)[1]
@@ -457,8 +598,7 @@ class FSViewerServer:
                 )
 
             # Call optional callback
-            if self.on_worker_response:
-                self.on_worker_response(message)
+            await self._notify(message)
 
         except Exception as e:
             logging.error(f"Error handling worker response: {e}")
@@ -0,0 +1,125 @@
+"""Persistent cache of file SHA-256 digests for uploads.
+
+Hashing a multi-GB labels package takes minutes, and ``upload_file`` needs the
+digest before it can even ask the worker whether it already has the file.
+Digests are therefore cached in ``~/.sleap-rtc/hash-cache.json`` keyed by the
+file's real path and validated against its (size, mtime_ns, inode), so an
+unchanged file is never re-hashed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+# Large reads keep per-call overhead negligible when hashing in a thread.
+HASH_READ_SIZE = 8 * 1024 * 1024  # 8 MB
+# Oldest entries beyond this are dropped so the cache file stays small.
+HASH_CACHE_MAX_ENTRIES = 1000
+
+
+def default_hash_cache_path() -> Path:
+    """Return the default location of the hash cache file."""
+    return Path.home() / ".sleap-rtc" / "hash-cache.json"
+
+
+def _fingerprint(st: os.stat_result) -> list:
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+class HashCache:
+    """JSON-backed map of file path → SHA-256, invalidated by file changes.
+
+    Attributes:
+        path: Location of the cache file.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize hash cache.
+
+        Args:
+            path: Location of the cache file (default ~/.sleap-rtc/hash-cache.json).
+        """
+        self.path = Path(path) if path else default_hash_cache_path()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path) as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable hash cache {self.path}: {e}")
+            return {}
+
+    def _save(self, entries: dict) -> None:
+        if len(entries) > HASH_CACHE_MAX_ENTRIES:
+            newest = sorted(entries.items(), key=lambda e: e[1]["used"])
+            entries = dict(newest[-HASH_CACHE_MAX_ENTRIES:])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w") as fh:
+            json.dump(entries, fh)
+        os.replace(tmp, self.path)
+
+    def lookup(self, file_path: str, st: os.stat_result) -> Optional[str]:
+        """Return the cached digest of a file if it has not changed.
+
+        Args:
+            file_path: Path to the file.
+            st: Current ``os.stat`` result of the file.
+
+        Returns:
+            SHA-256 hex digest, or None on a miss.
+        """
+        entry = self._load().get(os.path.realpath(file_path))
+        if entry and entry["stat"] == _fingerprint(st):
+            return entry["sha256"]
+        return None
+
+    def store(self, file_path: str, st: os.stat_result, sha256: str) -> None:
+        """Record the digest of a file as of ``st``."""
+        entries = self._load()
+        entries[os.path.realpath(file_path)] = {
+            "stat": _fingerprint(st),
+            "sha256": sha256,
+            "used": time.time(),
+        }
+        try:
+            self._save(entries)
+        except OSError as e:
+            logging.warning(f"Could not write hash cache {self.path}: {e}")
+
+
+def sha256_file_cached(file_path: str, cache: Optional[HashCache] = None) -> str:
+    """Return the SHA-256 of a file, hashing it only if it changed.
+
+    Blocking; call it from a worker thread (e.g. ``loop.run_in_executor``).
+
+    Args:
+        file_path: Path to the file.
+        cache: Hash cache to use (default: the one in ~/.sleap-rtc).
+
+    Returns:
+        SHA-256 hex digest of the file contents.
+    """
+    cache = cache or HashCache()
+    st = os.stat(file_path)
+    cached = cache.lookup(file_path, st)
+    if cached:
+        logging.info(f"Using cached SHA-256 for {Path(file_path).name}")
+        return cached
+
+    sha256_ctx = hashlib.sha256()
+    with open(file_path, "rb") as fh:
+        while chunk := fh.read(HASH_READ_SIZE):
+            sha256_ctx.update(chunk)
+    sha256 = sha256_ctx.hexdigest()
+
+    # Don't cache a digest of a file that changed while it was being read.
+    if _fingerprint(os.stat(file_path)) == _fingerprint(st):
+        cache.store(file_path, st, sha256)
+    return sha256
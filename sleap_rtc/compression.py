@@ -0,0 +1,198 @@
+"""Negotiated per-chunk compression for data-channel file transfers.
+
+Labels packages, training configs, logs and result zips often shrink a lot
+under a fast compressor, which matters on relayed TURN links where transfers
+are bandwidth-bound. Compression is opt-in per transfer:
+
+- The receiver advertises the codecs it can decode (``"zstd,zlib"``) and the
+  sender picks the first one it also supports, so peers that predate this
+  module simply never see compressed data.
+- Every binary chunk is compressed on its own and prefixed with a one-byte
+  flag (``0`` raw, ``1`` compressed). Chunks stay independently decodable, so
+  resumable offsets and progress keep counting uncompressed bytes.
+- The encoder measures the first few chunks and stops compressing when they
+  do not shrink enough (already-compressed MP4 or HDF5 data), after which
+  chunks are sent raw behind the flag byte.
+
+zstd is used when the optional ``zstandard`` package is installed; zlib is
+always available.
+"""
+
+import logging
+import zlib
+from typing import List, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+
+# Chunks measured before deciding whether compression is worth it.
+COMPRESSION_SAMPLE_CHUNKS = 8
+# Minimum fraction the sample must shrink by to keep compressing.
+COMPRESSION_MIN_SAVING = 0.1
+# Upper bound on a decoded chunk, so a hostile peer cannot send a zip bomb.
+MAX_DECODED_CHUNK = 16 * 1024 * 1024
+
+_FLAG_RAW = 0
+_FLAG_COMPRESSED = 1
+_ZLIB_LEVEL = 1
+_ZSTD_LEVEL = 3
+
+
+def supported_codecs() -> List[str]:
+    """Return the codecs this peer can use, most preferred first."""
+    if zstandard is not None:
+        return [CODEC_ZSTD, CODEC_ZLIB]
+    return [CODEC_ZLIB]
+
+
+def codec_offer() -> str:
+    """Return the comma-separated codec list to advertise to the peer."""
+    return ",".join(supported_codecs())
+
+
+def choose_codec(offer: str) -> Optional[str]:
+    """Pick the preferred codec that appears in the peer's offer.
+
+    Args:
+        offer: Comma-separated codec names advertised by the peer (may be
+            empty).
+
+    Returns:
+        The codec to use, or None to send uncompressed.
+    """
+    offered = {name.strip() for name in offer.split(",")}
+    for codec in supported_codecs():
+        if codec in offered:
+            return codec
+    return None
+
+
+class ChunkEncoder:
+    """Compress a stream of chunks, bypassing compression when it does not pay.
+
+    Attributes:
+        codec: Codec in use.
+        bypassed: True once the sample showed compression is not worthwhile.
+        bytes_in: Uncompressed bytes encoded so far.
+        bytes_out: Encoded bytes produced so far (including flag bytes).
+    """
+
+    def __init__(
+        self,
+        codec: str,
+        sample_chunks: int = COMPRESSION_SAMPLE_CHUNKS,
+        min_saving: float = COMPRESSION_MIN_SAVING,
+    ):
+        """Initialize encoder.
+
+        Args:
+            codec: Codec returned by :func:`choose_codec`.
+            sample_chunks: Chunks measured before deciding on a bypass.
+            min_saving: Minimum fraction the sample must shrink by.
+
+        Raises:
+            ValueError: If the codec is not supported here.
+        """
+        if codec not in supported_codecs():
+            raise ValueError(f"Unsupported compression codec: {codec!r}")
+        self.codec = codec
+        self.bypassed = False
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._sample_chunks = sample_chunks
+        self._min_saving = min_saving
+        self._sampled = 0
+        self._sampled_in = 0
+        self._sampled_out = 0
+        self._zstd = (
+            zstandard.ZstdCompressor(level=_ZSTD_LEVEL) if codec == CODEC_ZSTD else None
+        )
+
+    def _compress(self, chunk: bytes) -> bytes:
+        if self._zstd is not None:
+            return self._zstd.compress(chunk)
+        return zlib.compress(chunk, _ZLIB_LEVEL)
+
+    def encode(self, chunk: bytes) -> bytes:
+        """Return the flagged wire form of one chunk."""
+        self.bytes_in += len(chunk)
+        if self.bypassed:
+            return self._emit(_FLAG_RAW, chunk)
+
+        compressed = self._compress(chunk)
+        if self._sampled < self._sample_chunks:
+            self._sampled += 1
+            self._sampled_in += len(chunk)
+            self._sampled_out += min(len(compressed), len(chunk))
+            if (
+                self._sampled == self._sample_chunks
+                and self._sampled_out > self._sampled_in * (1 - self._min_saving)
+            ):
+                self.bypassed = True
+                logging.info(
+                    f"Data does not compress ({self._sampled_out}/"
+                    f"{self._sampled_in} bytes in sample); sending uncompressed"
+                )
+
+        if len(compressed) < len(chunk):
+            return self._emit(_FLAG_COMPRESSED, compressed)
+        return self._emit(_FLAG_RAW, chunk)
+
+    def _emit(self, flag: int, payload: bytes) -> bytes:
+        self.bytes_out += len(payload) + 1
+        return bytes((flag,)) + payload
+
+    def log_ratio(self, description: str) -> None:
+        """Log how much the encoded stream saved."""
+        if not self.bytes_in:
+            return
+        saved = 100 * (1 - self.bytes_out / self.bytes_in)
+        logging.info(
+            f"{description}: {self.codec} sent {self.bytes_out} of "
+            f"{self.bytes_in} bytes ({saved:.1f}% saved)"
+        )
+
+
+def decode_chunk(codec: str, data: bytes) -> bytes:
+    """Decode one flagged chunk produced by :class:`ChunkEncoder`.
+
+    Args:
+        codec: Codec negotiated for the transfer.
+        data: Flag byte followed by the (possibly compressed) payload.
+
+    Returns:
+        The original chunk bytes.
+
+    Raises:
+        ValueError: If the chunk is malformed, uses an unknown flag, or
+            decodes to more than MAX_DECODED_CHUNK bytes.
+    """
+    if not data:
+        raise ValueError("Empty compressed chunk")
+    flag, payload = data[0], memoryview(data)[1:]
+    if flag == _FLAG_RAW:
+        return bytes(payload)
+    if flag != _FLAG_COMPRESSED:
+        raise ValueError(f"Unknown chunk flag {flag}")
+
+    try:
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise ValueError("zstd chunk received but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(
+                payload, max_output_size=MAX_DECODED_CHUNK
+            )
+        if codec == CODEC_ZLIB:
+            decompressor = zlib.decompressobj()
+            chunk = decompressor.decompress(payload, MAX_DECODED_CHUNK)
+            if decompressor.unconsumed_tail or not decompressor.eof:
+                raise ValueError("Compressed chunk is truncated or too large")
+            return chunk
+    except (zlib.error, getattr(zstandard, "ZstdError", zlib.error)) as e:
+        raise ValueError(f"Corrupt {codec} chunk: {e}") from e
+    raise ValueError(f"Unsupported compression codec: {codec!r}")
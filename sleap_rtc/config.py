@@ -79,10 +79,25 @@ class WorkerIOConfig:
     Attributes:
         mounts: List of configured mount points for filesystem browsing.
         working_dir: Optional working directory for the worker.
+        upload_cache_dir: Directory of the persistent upload cache, or None
+            for the default (~/.sleap-rtc/upload-cache).
+        upload_cache_max_gb: Size budget of the persistent upload cache in GB;
+            0 disables it.
+        filename_index_dir: Directory where mount filename indexes are saved,
+            or None for the default (~/.sleap-rtc/fs-index).
+        filename_index_refresh_minutes: Minutes between background rescans of
+            the mounts for the filename index; 0 disables the index.
+        job_queue_dir: Directory where accepted jobs are kept until they
+            finish, or None for the default (~/.sleap-rtc/job-queue/<name>).
     """
 
     mounts: List[MountConfig] = field(default_factory=list)
     working_dir: Optional[str] = None
+    upload_cache_dir: Optional[str] = None
+    upload_cache_max_gb: float = 50.0
+    filename_index_dir: Optional[str] = None
+    filename_index_refresh_minutes: float = 30.0
+    job_queue_dir: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: dict) -> "WorkerIOConfig":
@@ -113,7 +128,17 @@ class WorkerIOConfig:
 
         working_dir = data.get("working_dir")
 
-        return cls(mounts=mounts, working_dir=working_dir)
+        return cls(
+            mounts=mounts,
+            working_dir=working_dir,
+            upload_cache_dir=data.get("upload_cache_dir"),
+            upload_cache_max_gb=data.get("upload_cache_max_gb", 50.0),
+            filename_index_dir=data.get("filename_index_dir"),
+            filename_index_refresh_minutes=data.get(
+                "filename_index_refresh_minutes", 30.0
+            ),
+            job_queue_dir=data.get("job_queue_dir"),
+        )
 
     def get_valid_mounts(self) -> List[MountConfig]:
         """Get list of mounts that pass validation.
@@ -261,6 +286,58 @@ class Config:
         io_config = worker_config.get("io", {})
         return WorkerIOConfig.from_dict(io_config)
 
+    def get_transfer_stripes(self) -> int:
+        """Get the number of stripe channels to use for bulk file transfers.
+
+        Read from ``[transfer] stripes`` in the config file, overridden by the
+        SLEAP_RTC_TRANSFER_STRIPES environment variable. 0 (the default)
+        keeps transfers on the single control channel.
+
+        Returns:
+            Number of extra data channels to open for striped transfers.
+        """
+        value = os.getenv("SLEAP_RTC_TRANSFER_STRIPES")
+        if value is None:
+            value = self._config_data.get("transfer", {}).get("stripes", 0)
+        try:
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid transfer stripe count {value!r}; striping off")
+            return 0
+
+    def get_message_trace(self) -> dict:
+        """Get how received data-channel messages are traced in the logs.
+
+        Read from the ``[trace]`` section of the config file (``mode``,
+        ``sample_every`` and a per-type ``types`` table, e.g.
+        ``types = {binary = 1000}``). ``mode`` and ``sample_every`` are
+        overridden by the SLEAP_RTC_TRACE and SLEAP_RTC_TRACE_SAMPLE
+        environment variables. See :mod:`sleap_rtc.tracing`.
+
+        Returns:
+            Keyword arguments for :class:`sleap_rtc.tracing.MessageTracer`.
+        """
+        from sleap_rtc.tracing import (
+            DEFAULT_TYPE_SAMPLE_EVERY,
+            TRACE_MODES,
+        )
+
+        section = self._config_data.get("trace", {})
+        mode = os.getenv("SLEAP_RTC_TRACE") or section.get("mode", "sample")
+        if mode not in TRACE_MODES:
+            logger.warning(f"Invalid trace mode {mode!r}; using 'sample'")
+            mode = "sample"
+        sample_every = os.getenv("SLEAP_RTC_TRACE_SAMPLE")
+        if sample_every is None:
+            sample_every = section.get("sample_every", 1)
+        try:
+            sample_every = max(1, int(sample_every))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid trace sample interval {sample_every!r}")
+            sample_every = 1
+        types = {**DEFAULT_TYPE_SAMPLE_EVERY, **section.get("types", {})}
+        return {"mode": mode, "sample_every": sample_every, "type_sample_every": types}
+
     # ------------------------------------------------------------------
     # Path mapping persistence
     # ------------------------------------------------------------------
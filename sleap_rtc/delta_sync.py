@@ -0,0 +1,177 @@
+"""Block-level delta encoding for re-uploading slightly modified files.
+
+This implements the rsync algorithm on top of the FILE_UPLOAD_* protocol:
+
+1. The worker splits a file it already holds (the *basis*) into fixed-size
+   blocks and publishes a weak (Adler-32) and strong (BLAKE2b) checksum for
+   each one (:func:`compute_signature`).
+2. The client scans the new file for byte ranges that match a basis block
+   and turns the file into a list of copy/literal operations
+   (:func:`compute_delta`). Only literal bytes travel over the data channel.
+3. The worker rebuilds the file from the basis blocks and literal data.
+
+Weak checksums are Adler-32 so the common case — an unchanged block at the
+current position — is computed by ``zlib`` at C speed. Only after a miss does
+the client fall back to rsync's byte-by-byte rolling search, which runs in
+Python and is therefore capped by ``roll_budget``.
+"""
+
+import hashlib
+import mmap
+import zlib
+from typing import Dict, List, Tuple
+
+# Smallest block we will use, and the signature size we aim to stay under.
+MIN_DELTA_BLOCK_SIZE = 64 * 1024
+MAX_DELTA_BLOCKS = 4096
+
+# Bytes of Python-speed rolling search allowed per delta computation.
+DELTA_ROLL_BUDGET = 32 * 1024 * 1024
+
+_ADLER_MOD = 65521
+
+
+def choose_block_size(file_size: int) -> int:
+    """Pick a power-of-two block size that keeps the signature small.
+
+    Args:
+        file_size: Size of the basis file in bytes.
+
+    Returns:
+        Block size in bytes (at least MIN_DELTA_BLOCK_SIZE).
+    """
+    block_size = MIN_DELTA_BLOCK_SIZE
+    while file_size > block_size * MAX_DELTA_BLOCKS:
+        block_size *= 2
+    return block_size
+
+
+def strong_checksum(data) -> str:
+    """Return the strong checksum used to confirm a weak-checksum match."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def compute_signature(file_path: str, block_size: int) -> List[Tuple[int, str]]:
+    """Compute per-block (weak, strong) checksums of a basis file.
+
+    A trailing partial block is not included; it is always sent as literal
+    data.
+
+    Args:
+        file_path: Path to the basis file.
+        block_size: Block size in bytes.
+
+    Returns:
+        List of (adler32, blake2b_hex) tuples, one per full block.
+    """
+    blocks = []
+    with open(file_path, "rb") as fh:
+        while True:
+            block = fh.read(block_size)
+            if len(block) < block_size:
+                break
+            blocks.append((zlib.adler32(block), strong_checksum(block)))
+    return blocks
+
+
+def compute_delta(
+    file_path: str,
+    block_size: int,
+    signature: List[Tuple[int, str]],
+    roll_budget: int = DELTA_ROLL_BUDGET,
+) -> List[tuple]:
+    """Express a file as copies of basis blocks plus literal byte ranges.
+
+    Args:
+        file_path: Path to the new file.
+        block_size: Block size the signature was computed with.
+        signature: Basis signature from :func:`compute_signature`.
+        roll_budget: Maximum number of bytes to examine with the per-byte
+            rolling search. Once spent, only block-aligned positions (relative
+            to the last match) are checked.
+
+    Returns:
+        Ordered list of operations, each either ``("copy", first_block,
+        block_count)`` or ``("literal", offset, length)`` where offset and
+        length refer to the new file.
+    """
+    table: Dict[int, List[Tuple[int, str]]] = {}
+    for index, (weak, strong) in enumerate(signature):
+        table.setdefault(weak, []).append((index, strong))
+
+    ops: List[tuple] = []
+
+    def emit_literal(start: int, end: int) -> None:
+        if end > start:
+            ops.append(("literal", start, end - start))
+
+    def emit_copy(index: int) -> None:
+        if ops and ops[-1][0] == "copy" and ops[-1][1] + ops[-1][2] == index:
+            ops[-1] = ("copy", ops[-1][1], ops[-1][2] + 1)
+        else:
+            ops.append(("copy", index, 1))
+
+    with open(file_path, "rb") as fh:
+        fh.seek(0, 2)
+        size = fh.tell()
+        if size == 0:
+            return ops
+        if not table or size < block_size:
+            emit_literal(0, size)
+            return ops
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+
+            def lookup(pos: int, weak: int):
+                candidates = table.get(weak)
+                if not candidates:
+                    return None
+                strong = strong_checksum(mm[pos : pos + block_size])
+                for index, expected in candidates:
+                    if strong == expected:
+                        return index
+                return None
+
+            pos = 0
+            literal_start = 0
+            rolled = 0
+            last_start = size - block_size
+
+            while pos <= last_start:
+                weak = zlib.adler32(mm[pos : pos + block_size])
+                index = lookup(pos, weak)
+
+                if index is None and rolled < roll_budget and pos < last_start:
+                    # rsync rolling search: slide the window one byte at a time.
+                    stop = min(pos + block_size, last_start)
+                    a, b = weak & 0xFFFF, weak >> 16
+                    while pos < stop:
+                        out_byte, in_byte = mm[pos], mm[pos + block_size]
+                        a = (a - out_byte + in_byte) % _ADLER_MOD
+                        b = (b - block_size * out_byte + a - 1) % _ADLER_MOD
+                        pos += 1
+                        rolled += 1
+                        rolled_weak = (b << 16) | a
+                        if rolled_weak in table:
+                            index = lookup(pos, rolled_weak)
+                            if index is not None:
+                                break
+                    if index is None:
+                        continue
+                elif index is None:
+                    pos += block_size
+                    continue
+
+                emit_literal(literal_start, pos)
+                emit_copy(index)
+                pos += block_size
+                literal_start = pos
+
+            emit_literal(literal_start, size)
+
+    return ops
+
+
+def delta_literal_bytes(ops: List[tuple]) -> int:
+    """Return how many bytes of literal data a delta will send."""
+    return sum(op[2] for op in ops if op[0] == "literal")
@@ -897,10 +897,14 @@ class _ExportThread(QThread):
 class _UploadThread(QThread):
     """Background thread that executes the client-to-worker upload protocol.
 
-    Sends FILE_UPLOAD_CHECK / FILE_UPLOAD_START / binary chunks /
-    FILE_UPLOAD_END via ``send_fn`` and reads worker responses from
-    ``response_queue`` (a ``queue.Queue`` fed by the main thread via
-    ``SlpPathDialog.on_upload_response()``).
+    When ``send_fn`` has an ``upload`` method (the sender that
+    ``sleap_rtc.api.check_video_paths`` passes to its callbacks), the upload
+    is handed to it: ``upload_file`` then runs on the connection's event
+    loop, resumable so a retry after a dropped connection only sends the
+    missing tail. Otherwise the thread sends FILE_UPLOAD_CHECK /
+    FILE_UPLOAD_START / binary chunks / FILE_UPLOAD_END via ``send_fn`` and
+    reads worker responses from ``response_queue`` (a ``queue.Queue`` fed by
+    the main thread via ``SlpPathDialog.on_upload_response()``).
 
     Signals:
         progress: Emitted with (bytes_sent, total_bytes) for each
@@ -942,8 +946,8 @@ class _UploadThread(QThread):
             raise RuntimeError(f"Timed out waiting for worker response ({t:.0f} s)")
 
     def run(self):
-        import hashlib
         from pathlib import Path
+        from sleap_rtc.client.hash_cache import sha256_file_cached
         from sleap_rtc.protocol import (
             MSG_FILE_UPLOAD_CACHE_HIT,
             MSG_FILE_UPLOAD_CHECK,
@@ -956,17 +960,28 @@ class _UploadThread(QThread):
             MSG_SEPARATOR,
         )
 
+        upload = getattr(self._send_fn, "upload", None)
+        if upload is not None:
+            try:
+                worker_path = upload(
+                    self._local_path,
+                    self._dest_dir,
+                    self._create_subdir,
+                    on_progress=self.progress.emit,
+                )
+            except Exception as exc:
+                self.error.emit(str(exc))
+                return
+            self.complete.emit(worker_path)
+            return
+
         try:
             path = Path(self._local_path)
             filename = path.name
             total_bytes = path.stat().st_size
 
-            # Step 1: SHA-256 (streaming)
-            sha256_ctx = hashlib.sha256()
-            with open(self._local_path, "rb") as fh:
-                while chunk := fh.read(self._CHUNK_SIZE):
-                    sha256_ctx.update(chunk)
-            sha256 = sha256_ctx.hexdigest()
+            # Step 1: SHA-256 (cached for unchanged files)
+            sha256 = sha256_file_cached(self._local_path)
 
             # Step 2: FILE_UPLOAD_CHECK
             self._send_fn(
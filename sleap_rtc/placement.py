@@ -0,0 +1,176 @@
+"""Choose which worker in a room a job is sent to.
+
+Workers publish their state in their signaling metadata: ``status`` and
+``gpu_memory_mb`` always, plus ``job_slots``, ``running_jobs`` and
+``queue_depth`` when they run several jobs at once. Placement ranks the
+``peer_list`` from ``discover_peers`` by that metadata under a *policy*:
+
+- ``first``: keep the discovery order.
+- ``gpu_memory``: most GPU memory first.
+- ``least_loaded``: fewest running and queued jobs per job slot first, then
+  most GPU memory.
+- ``balanced``: load plus the signaling round-trip time to each worker,
+  measured with a ``ping`` peer message that workers answer with ``pong``.
+  Workers that do not answer (e.g. older versions) count as
+  :data:`RTT_PROBE_TIMEOUT` away.
+"""
+
+import asyncio
+import json
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Union
+
+PLACEMENT_POLICIES = ("first", "gpu_memory", "least_loaded", "balanced")
+
+RTT_PROBE_TIMEOUT = 0.5  # seconds to wait for pong replies
+
+# Score of one second of signaling RTT, relative to one fully used job slot.
+RTT_WEIGHT = 2.0
+
+
+def _properties(peer: dict) -> dict:
+    return (peer.get("metadata") or {}).get("properties") or {}
+
+
+def worker_load(properties: dict) -> float:
+    """Estimate how busy a worker is from its published metadata.
+
+    Args:
+        properties: ``metadata.properties`` of a discovered worker.
+
+    Returns:
+        0 for an idle worker, 1 when all of its job slots are in use, and more
+        when jobs are queued behind them. Workers that do not publish queue
+        information count as 1 unless their status is "available".
+    """
+    slots = properties.get("job_slots")
+    if slots:
+        jobs = properties.get("running_jobs", 0) + properties.get("queue_depth", 0)
+        return jobs / slots
+    return 0.0 if properties.get("status", "available") == "available" else 1.0
+
+
+def rank_workers(
+    peers: Sequence[dict],
+    policy: str = "balanced",
+    rtts: Optional[Dict[str, float]] = None,
+) -> List[dict]:
+    """Order discovered workers best first.
+
+    Args:
+        peers: Peer dicts from a ``peer_list`` response.
+        policy: One of :data:`PLACEMENT_POLICIES`.
+        rtts: Signaling RTT in seconds per peer ID, used by "balanced".
+
+    Returns:
+        The peers, best first. Ties keep the discovery order.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+    if policy not in PLACEMENT_POLICIES:
+        raise ValueError(f"placement must be one of {PLACEMENT_POLICIES}")
+    if policy == "first":
+        return list(peers)
+
+    rtts = rtts or {}
+
+    def key(peer: dict):
+        props = _properties(peer)
+        memory = -(props.get("gpu_memory_mb") or 0)
+        if policy == "gpu_memory":
+            return (memory,)
+        score = worker_load(props)
+        if policy == "balanced":
+            rtt = rtts.get(peer.get("peer_id"), RTT_PROBE_TIMEOUT)
+            score += RTT_WEIGHT * rtt
+        return (score, memory)
+
+    return sorted(peers, key=key)
+
+
+async def probe_rtts(
+    send: Callable[[str], Awaitable[None]],
+    recv: Callable[[], Awaitable[Union[str, dict]]],
+    peer_id: str,
+    worker_ids: Sequence[str],
+    timeout: float = RTT_PROBE_TIMEOUT,
+) -> Dict[str, float]:
+    """Measure the round trip to each worker over the signaling server.
+
+    Pings every worker at once and collects ``pong`` replies for up to
+    *timeout* seconds. Other messages returned by *recv* in that time are
+    dropped.
+
+    Args:
+        send: Sends one JSON message to the signaling server.
+        recv: Returns the next signaling message, raw or already decoded.
+        peer_id: This client's peer ID.
+        worker_ids: Workers to probe.
+        timeout: Seconds to wait for replies.
+
+    Returns:
+        RTT in seconds of every worker that answered in time.
+    """
+    loop = asyncio.get_running_loop()
+    nonce = uuid.uuid4().hex
+    sent_at: Dict[str, float] = {}
+    for worker_id in worker_ids:
+        sent_at[worker_id] = loop.time()
+        await send(
+            json.dumps(
+                {
+                    "type": "peer_message",
+                    "from_peer_id": peer_id,
+                    "to_peer_id": worker_id,
+                    "payload": {"app_message_type": "ping", "nonce": nonce},
+                }
+            )
+        )
+
+    rtts: Dict[str, float] = {}
+    deadline = loop.time() + timeout
+    while len(rtts) < len(sent_at):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            message = await asyncio.wait_for(recv(), timeout=remaining)
+        except asyncio.TimeoutError:
+            break
+        data = json.loads(message) if isinstance(message, (str, bytes)) else message
+        payload = data.get("payload") or {}
+        sender = data.get("from_peer_id")
+        if (
+            data.get("type") == "peer_message"
+            and payload.get("app_message_type") == "pong"
+            and payload.get("nonce") == nonce
+            and sender in sent_at
+        ):
+            rtts.setdefault(sender, loop.time() - sent_at[sender])
+    return rtts
+
+
+async def place_job(
+    peers: Sequence[dict],
+    policy: str,
+    send: Callable[[str], Awaitable[None]],
+    recv: Callable[[], Awaitable[Union[str, dict]]],
+    peer_id: str,
+) -> List[dict]:
+    """Rank discovered workers, probing RTT first if the policy uses it.
+
+    Args:
+        peers: Peer dicts from a ``peer_list`` response.
+        policy: One of :data:`PLACEMENT_POLICIES`.
+        send: Sends one JSON message to the signaling server.
+        recv: Returns the next signaling message, raw or already decoded.
+        peer_id: This client's peer ID.
+
+    Returns:
+        The peers, best first.
+    """
+    rtts = None
+    if policy == "balanced" and len(peers) > 1:
+        rtts = await probe_rtts(send, recv, peer_id, [p["peer_id"] for p in peers])
+    return rank_workers(peers, policy, rtts)
@@ -173,6 +173,16 @@ send(FILE_EXISTS, filename)
 
 # RTC Transfer Message Types
 MSG_FILE_META = "FILE_META"
+# Same format as FILE_META; the data arrives as offset-prefixed frames on the
+# client's stripe channels instead of raw chunks on the control channel.
+MSG_FILE_META_STRIPED = "FILE_META_STRIPED"
+# FILE_META format plus a trailing ":{codec}"; every binary chunk carries a
+# one-byte flag and is compressed with that codec (see compression.py). Only
+# sent to clients that announced the codec with TRANSFER_CODECS.
+MSG_FILE_META_COMPRESSED = "FILE_META_COMPRESSED"
+# Client → Worker after authentication: comma-separated codecs the client can
+# decode, e.g. "TRANSFER_CODECS::zstd,zlib".
+MSG_TRANSFER_CODECS = "TRANSFER_CODECS"
 MSG_CHUNK = "CHUNK"
 MSG_FILE_COMPLETE = "FILE_COMPLETE"
 MSG_TRANSFER_PROGRESS = "TRANSFER_PROGRESS"
@@ -208,13 +218,30 @@ MSG_ERROR = "ERROR"
 #    Response: {"candidates": [...], "truncated": false, "timeout": false}
 #
 # 4. List Directory Contents:
-#    Client → Worker: FS_LIST_DIR::{path}::{offset}
-#    Worker → Client: FS_LIST_RESPONSE::{json}
-#    Response: {"path": "...", "entries": [...], "total_count": N, "has_more": bool}
-#
-# 5. Error Response:
+#    Client → Worker: FS_LIST_DIR::{path}::{offset}[::{max_entries}[::{cursor}]]
+#    Worker → Client: FS_LIST_RESPONSE::{json}   (one or more)
+#    Response: {"path": "...", "entries": [...], "total_count": N, "has_more": bool,
+#               "offset": N, "next_offset": N, "cursor": "...", "mtime_ns": N}
+#    Without max_entries the worker sends one page of 20 entries. With it, the
+#    worker streams consecutive pages (up to 200 entries each) until
+#    max_entries entries were sent or has_more is false. Passing back the
+#    cursor of a previous page continues the same sorted snapshot of the
+#    directory, even if it changed since; unknown or expired cursors are
+#    ignored.
+#    mtime_ns is the directory's mtime when it was listed, so clients can tell
+#    whether a listing they cached is still current.
+#
+# 5. Refresh Filename Index:
+#    Client → Worker: FS_REFRESH_INDEX
+#    Worker → Client: FS_REFRESH_INDEX_RESPONSE::{json}
+#    Response: {"refreshing": bool}
+#    Asks a worker that answers FS_RESOLVE from a background filename index to
+#    rescan its mounts now, e.g. after copying files onto them. refreshing is
+#    false if the worker has no index (it walks the mounts on every request).
+#
+# 6. Error Response:
 #    Worker → Client: FS_ERROR::{error_code}::{message}
-#    Error codes: ACCESS_DENIED, PATTERN_TOO_BROAD, PATH_NOT_FOUND
+#    Error codes: ACCESS_DENIED, PATTERN_TOO_BROAD, PATH_NOT_FOUND, TIMEOUT
 #
 
 # Filesystem info messages
@@ -229,9 +256,15 @@ MSG_FS_MOUNTS_RESPONSE = "FS_MOUNTS_RESPONSE"
 MSG_FS_RESOLVE = "FS_RESOLVE"
 MSG_FS_RESOLVE_RESPONSE = "FS_RESOLVE_RESPONSE"
 
+# Filename index refresh messages
+MSG_FS_REFRESH_INDEX = "FS_REFRESH_INDEX"
+MSG_FS_REFRESH_INDEX_RESPONSE = "FS_REFRESH_INDEX_RESPONSE"
+
 # Directory listing messages
 MSG_FS_LIST_DIR = "FS_LIST_DIR"
 MSG_FS_LIST_RESPONSE = "FS_LIST_RESPONSE"
+# Entries browsers request per streamed FS_LIST_DIR (initial load or "load more")
+FS_LIST_STREAM_ENTRIES = 1000
 
 # Filesystem error message
 MSG_FS_ERROR = "FS_ERROR"
@@ -241,6 +274,7 @@ FS_ERROR_ACCESS_DENIED = "ACCESS_DENIED"
 FS_ERROR_PATTERN_TOO_BROAD = "PATTERN_TOO_BROAD"
 FS_ERROR_PATH_NOT_FOUND = "PATH_NOT_FOUND"
 FS_ERROR_INVALID_REQUEST = "INVALID_REQUEST"
+FS_ERROR_TIMEOUT = "TIMEOUT"
 
 # =============================================================================
 # Worker Path Messages
@@ -322,6 +356,34 @@ MSG_FS_WRITE_SLP = "FS_WRITE_SLP"
 MSG_FS_WRITE_SLP_OK = "FS_WRITE_SLP_OK"
 MSG_FS_WRITE_SLP_ERROR = "FS_WRITE_SLP_ERROR"
 
+# =============================================================================
+# Multiplexed Request Messages
+# =============================================================================
+#
+# Wrap FS_* and USE_WORKER_PATH requests in a correlation ID so a client can
+# have many in flight at once (see sleap_rtc/rpc.py).
+#
+# Message Flows:
+#
+# 1. Negotiate (after authentication; workers without support ignore it):
+#    Client → Worker: RPC_HELLO
+#    Worker → Client: RPC_HELLO::{version}
+#
+# 2. Request:
+#    Client → Worker: RPC::{id}::{request}
+#    Worker → Client: RPC_REPLY::{id}::{response}   (one or more)
+#    Each reply carries the response the plain request would get: one per
+#    listing page, WORKER_PATH_OK then FS_CHECK_VIDEOS_RESPONSE, and so on.
+#
+# 3. Cancel (client stopped waiting):
+#    Client → Worker: RPC_CANCEL::{id}
+#
+
+MSG_RPC_HELLO = "RPC_HELLO"
+MSG_RPC = "RPC"
+MSG_RPC_REPLY = "RPC_REPLY"
+MSG_RPC_CANCEL = "RPC_CANCEL"
+
 # =============================================================================
 # Prefix-Based Video Path Resolution Messages
 # =============================================================================
@@ -442,6 +504,15 @@ MSG_JOB_LOG = "JOB_LOG"  # subprocess log line forwarded over the data channel
 MSG_JOB_COMPLETE = "JOB_COMPLETE"
 MSG_JOB_FAILED = "JOB_FAILED"
 
+# Coalesced job output (see worker/output_batcher.py)
+# Client → Worker after authentication: "OUTPUT_BATCHING::1" announces that
+# the client unpacks OUTPUT_BATCH messages. Older workers ignore it.
+# Worker → Client: OUTPUT_BATCH::{json_array} carries several ordinary
+# string messages (JOB_LOG::…, CR::…, PROGRESS_REPORT::…, log lines) in
+# order; the client handles each element as if it had arrived on its own.
+MSG_OUTPUT_BATCHING = "OUTPUT_BATCHING"
+MSG_OUTPUT_BATCH = "OUTPUT_BATCH"
+
 # Job control messages (client → worker)
 MSG_JOB_STOP = "JOB_STOP"  # Graceful stop (SIGINT, saves checkpoint)
 MSG_JOB_CANCEL = "JOB_CANCEL"  # Hard cancel (SIGTERM, immediate termination)
@@ -464,14 +535,21 @@ MSG_CONTROL_COMMAND = "CONTROL_COMMAND"
 # Message Flow:
 #
 # 1. Content-hash pre-check (avoids re-uploading unchanged files):
-#    Client → Worker: FILE_UPLOAD_CHECK::{sha256}::{filename}
+#    Client → Worker: FILE_UPLOAD_CHECK::{sha256}::{filename}[::{dest_dir}::{create_subdir}]
 #    Worker → Client: FILE_UPLOAD_CACHE_HIT::{absolute_path}  (file already on worker)
 #    or: Worker → Client: FILE_UPLOAD_READY                   (proceed with upload)
+#    Workers keep a persistent content-addressed store of past uploads. If
+#    the optional destination is given and only the store still holds the
+#    content, the worker links it into that destination and reports a hit.
 #
 # 2. Upload:
-#    Client → Worker: FILE_UPLOAD_START::{filename}::{total_bytes}::{dest_dir}::{create_subdir}
+#    Client → Worker: FILE_UPLOAD_START::{filename}::{total_bytes}::{dest_dir}::{create_subdir}[::{codecs}]
 #      create_subdir: "1" to create sleap-rtc-downloads/ subfolder, "0" otherwise
-#    Worker → Client: FILE_UPLOAD_READY
+#      codecs: optional comma-separated compression codecs the client offers
+#    Worker → Client: FILE_UPLOAD_READY[::{codec}]
+#      codec: the offered codec the worker picked; when present every binary
+#      chunk is flag-prefixed and compressed (see compression.py). Workers
+#      that predate compression ignore the offer and reply FILE_UPLOAD_READY.
 #    Client → Worker: <binary chunk> ... (repeated)
 #    Client → Worker: FILE_UPLOAD_END
 #
@@ -480,6 +558,41 @@ MSG_CONTROL_COMMAND = "CONTROL_COMMAND"
 #    Worker → Client: FILE_UPLOAD_COMPLETE::{absolute_path}
 #    or: Worker → Client: FILE_UPLOAD_ERROR::{reason}
 #
+# 4. Resumable upload (used instead of FILE_UPLOAD_START when the client opts in):
+#    Client → Worker: FILE_UPLOAD_RESUME::{sha256}::{filename}::{total_bytes}::{dest_dir}::{create_subdir}[::{codecs}]
+#    Worker → Client: FILE_UPLOAD_OFFSET::{offset}[::{codec}]
+#      offset: bytes the worker already holds for this sha256 (0 if none),
+#      counted in uncompressed bytes
+#    Client → Worker: <binary chunks starting at offset> ... (repeated)
+#    Client → Worker: FILE_UPLOAD_END
+#    The worker writes {filename}.part and checkpoints verified blocks to a
+#    {filename}.part.json sidecar, so after a dropped connection the client
+#    repeats FILE_UPLOAD_RESUME and only the missing tail is re-sent. The
+#    final file is checked against sha256 before it is moved into place.
+#
+# 5. Delta upload (rsync-style, for re-uploading a slightly modified file):
+#    Client → Worker: FILE_UPLOAD_DELTA_REQUEST::{filename}
+#    Worker → Client: FILE_UPLOAD_SIGNATURE::{json}  (one or more pages)
+#      {"basis": sha256|null, "block_size": N, "total_blocks": M, "start": i,
+#       "blocks": [[adler32, blake2b_hex], ...]}
+#      basis is the most recent upload with the same filename; null means
+#      there is nothing to diff against and the client falls back to step 2.
+#    Client → Worker: FILE_UPLOAD_DELTA_START::{sha256}::{filename}::{total_bytes}::{dest_dir}::{create_subdir}::{basis_sha256}[::{codecs}]
+#    Worker → Client: FILE_UPLOAD_READY[::{codec}]
+#    Client → Worker: FILE_UPLOAD_COPY::{first_block}::{block_count}  and/or
+#                     <binary literal chunk> ... (in file order)
+#    Client → Worker: FILE_UPLOAD_END
+#    The worker rebuilds the file from basis blocks and literal data and
+#    checks it against sha256 before moving it into place.
+#
+# 6. Striped upload (client has opened stripe-<n> data channels, see striping.py):
+#    Client → Worker: FILE_UPLOAD_STRIPED::{filename}::{total_bytes}::{dest_dir}::{create_subdir}
+#    Worker → Client: FILE_UPLOAD_READY
+#    Client → Worker: <offset-prefixed frames on the stripe channels> ...
+#    Client → Worker: FILE_UPLOAD_END  (on the control channel)
+#    The worker writes each frame at its offset and waits for all bytes to
+#    arrive before completing the upload.
+#
 # Security:
 #   dest_dir is validated to resolve within a configured worker mount before
 #   any file is written. Uploads to paths outside configured mounts are
@@ -492,12 +605,33 @@ MSG_FILE_UPLOAD_CHECK = "FILE_UPLOAD_CHECK"
 # Client → Worker: begin an upload session
 MSG_FILE_UPLOAD_START = "FILE_UPLOAD_START"
 
+# Client → Worker: begin or continue a resumable upload session
+MSG_FILE_UPLOAD_RESUME = "FILE_UPLOAD_RESUME"
+
+# Client → Worker: ask for the block signature of the best delta basis
+MSG_FILE_UPLOAD_DELTA_REQUEST = "FILE_UPLOAD_DELTA_REQUEST"
+
+# Client → Worker: begin a delta upload against an advertised basis
+MSG_FILE_UPLOAD_DELTA_START = "FILE_UPLOAD_DELTA_START"
+
+# Client → Worker: copy a run of basis blocks into the delta upload
+MSG_FILE_UPLOAD_COPY = "FILE_UPLOAD_COPY"
+
+# Client → Worker: begin an upload whose data arrives on stripe channels
+MSG_FILE_UPLOAD_STRIPED = "FILE_UPLOAD_STRIPED"
+
 # Client → Worker: signals all chunks have been sent
 MSG_FILE_UPLOAD_END = "FILE_UPLOAD_END"
 
 # Worker → Client: worker is ready to receive (or begin) the upload
 MSG_FILE_UPLOAD_READY = "FILE_UPLOAD_READY"
 
+# Worker → Client: resumable session ready; carries the byte offset to send from
+MSG_FILE_UPLOAD_OFFSET = "FILE_UPLOAD_OFFSET"
+
+# Worker → Client: one page of per-block checksums of the delta basis
+MSG_FILE_UPLOAD_SIGNATURE = "FILE_UPLOAD_SIGNATURE"
+
 # Worker → Client: periodic progress during upload
 MSG_FILE_UPLOAD_PROGRESS = "FILE_UPLOAD_PROGRESS"
 
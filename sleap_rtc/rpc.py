@@ -0,0 +1,359 @@
+"""Request/response multiplexing for FS_* and worker queries on a data channel.
+
+Plain FS_* responses say nothing about the request they answer: an
+``FS_LIST_RESPONSE`` belongs to whichever ``FS_LIST_DIR`` is outstanding, so a
+client with two listings in flight cannot tell their pages apart, and every
+browser UI sends one request at a time. Requests wrapped in an *envelope*
+carry a correlation ID instead::
+
+    Client → Worker: RPC::{id}::{request}
+    Worker → Client: RPC_REPLY::{id}::{response}   (one or more)
+    Client → Worker: RPC_CANCEL::{id}
+
+The request and responses inside are the unchanged FS_* / USE_WORKER_PATH
+messages. A streamed listing answers with one reply per page, and
+USE_WORKER_PATH with the path check followed by the video check. The worker
+runs every request as its own task (:class:`RpcServer`), so one client's
+requests are served concurrently, within the limits of the worker's
+``FSService``; ``RPC_CANCEL`` cancels the task.
+
+Clients opt in with ``RPC_HELLO``, which workers answer with
+``RPC_HELLO::{version}``. Until that answer arrives, and for good with
+workers that predate envelopes (they ignore the hello), :class:`RpcClient`
+reports ``enabled = False`` and callers fall back to plain messages.
+"""
+
+import asyncio
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sleap_rtc.protocol import (
+    FS_ERROR_INVALID_REQUEST,
+    MSG_FS_ERROR,
+    MSG_RPC,
+    MSG_RPC_CANCEL,
+    MSG_RPC_HELLO,
+    MSG_RPC_REPLY,
+    MSG_SEPARATOR,
+)
+
+RPC_VERSION = 1
+RPC_TIMEOUT = 30.0  # seconds a caller waits for each reply by default
+
+_REQUEST_PREFIX = f"{MSG_RPC}{MSG_SEPARATOR}"
+_REPLY_PREFIX = f"{MSG_RPC_REPLY}{MSG_SEPARATOR}"
+_CANCEL_PREFIX = f"{MSG_RPC_CANCEL}{MSG_SEPARATOR}"
+
+
+def _is_hello(message: str) -> bool:
+    return message == MSG_RPC_HELLO or message.startswith(
+        f"{MSG_RPC_HELLO}{MSG_SEPARATOR}"
+    )
+
+
+def parse_envelope(message: str) -> Tuple[str, str]:
+    """Split an ``RPC::`` or ``RPC_REPLY::`` message.
+
+    Args:
+        message: Enveloped message.
+
+    Returns:
+        Tuple of (request ID, inner message).
+
+    Raises:
+        ValueError: If the message is not an envelope.
+    """
+    parts = message.split(MSG_SEPARATOR, 2)
+    if len(parts) != 3 or parts[0] not in (MSG_RPC, MSG_RPC_REPLY) or not parts[1]:
+        raise ValueError(f"Not an RPC envelope: {message[:50]}")
+    return parts[1], parts[2]
+
+
+class RpcCall:
+    """One request in flight, receiving the replies sent under its ID.
+
+    Use as a context manager: leaving the block through an exception (a
+    timeout, or the caller being cancelled) cancels the request on the worker.
+
+    Attributes:
+        request_id: Correlation ID of the request.
+        message: The request that was sent.
+    """
+
+    def __init__(self, client: "RpcClient", request_id: str, message: str):
+        """Initialize call.
+
+        Args:
+            client: Client that sent the request.
+            request_id: Correlation ID of the request.
+            message: The request that was sent.
+        """
+        self.request_id = request_id
+        self.message = message
+        self._client = client
+        self._replies: asyncio.Queue = asyncio.Queue()
+
+    async def reply(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Wait for the next reply.
+
+        Args:
+            timeout: Seconds to wait; defaults to the client's timeout.
+
+        Returns:
+            The inner response message, or None if the connection was lost.
+
+        Raises:
+            asyncio.TimeoutError: If no reply arrived in time.
+        """
+        if timeout is None:
+            timeout = self._client.timeout
+        return await asyncio.wait_for(self._replies.get(), timeout=timeout)
+
+    def close(self, cancel: bool = False) -> None:
+        """Stop receiving replies, optionally cancelling the request.
+
+        Args:
+            cancel: Whether to tell the worker to abandon the request.
+        """
+        if self._client._calls.pop(self.request_id, None) is not None and cancel:
+            self._client.send(f"{_CANCEL_PREFIX}{self.request_id}")
+
+    def __enter__(self) -> "RpcCall":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(cancel=exc_type is not None)
+
+
+class RpcClient:
+    """Send enveloped requests and route replies back to their callers.
+
+    Attributes:
+        send: Sends one message to the worker.
+        timeout: Default seconds to wait for each reply.
+        enabled: Whether the worker answered ``RPC_HELLO``.
+    """
+
+    def __init__(self, send: Callable[[str], Any], timeout: float = RPC_TIMEOUT):
+        """Initialize client.
+
+        Args:
+            send: Sends one message to the worker.
+            timeout: Default seconds to wait for each reply.
+        """
+        self.send = send
+        self.timeout = timeout
+        self.enabled = False
+        self._calls: Dict[str, RpcCall] = {}
+        self._ids = itertools.count(1)
+
+    @property
+    def pending(self) -> int:
+        """Number of requests waiting for replies."""
+        return len(self._calls)
+
+    def hello(self) -> None:
+        """Ask the worker whether it accepts enveloped requests."""
+        self.send(MSG_RPC_HELLO)
+
+    def handle(self, message: Any) -> bool:
+        """Consume a message from the worker if it belongs to this layer.
+
+        Args:
+            message: Message received on the data channel.
+
+        Returns:
+            True if the message was a hello answer or a reply.
+        """
+        if not isinstance(message, str):
+            return False
+        if _is_hello(message):
+            if not self.enabled:
+                logging.info("Worker accepts multiplexed requests")
+            self.enabled = True
+            return True
+        if not message.startswith(_REPLY_PREFIX):
+            return False
+        try:
+            request_id, response = parse_envelope(message)
+        except ValueError as e:
+            logging.warning(str(e))
+            return True
+        call = self._calls.get(request_id)
+        if call is None:
+            logging.debug(f"Dropping reply to finished request {request_id}")
+        else:
+            call._replies.put_nowait(response)
+        return True
+
+    def start(self, message: str) -> RpcCall:
+        """Send a request and return the call that receives its replies.
+
+        Args:
+            message: Plain FS_* or USE_WORKER_PATH request.
+
+        Returns:
+            The call; close it (or leave its ``with`` block) when done.
+        """
+        request_id = f"{next(self._ids):x}"
+        call = RpcCall(self, request_id, message)
+        self._calls[request_id] = call
+        self.send(f"{_REQUEST_PREFIX}{request_id}{MSG_SEPARATOR}{message}")
+        return call
+
+    async def request(
+        self, message: str, timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """Send a request and wait for its single reply.
+
+        Args:
+            message: Plain FS_* request.
+            timeout: Seconds to wait; defaults to :attr:`timeout`.
+
+        Returns:
+            The inner response, or None on timeout or lost connection.
+        """
+        try:
+            with self.start(message) as call:
+                return await call.reply(timeout)
+        except asyncio.TimeoutError:
+            logging.warning(f"Timeout waiting for reply to {message[:50]}")
+            return None
+
+    def reset(self) -> None:
+        """Forget the negotiation and wake every caller with None.
+
+        Called when the data channel closes.
+        """
+        self.enabled = False
+        for call in list(self._calls.values()):
+            call._replies.put_nowait(None)
+        self._calls.clear()
+
+
+class ReplyChannel:
+    """Data-channel stand-in that sends everything as replies to one request."""
+
+    def __init__(self, channel, request_id: str):
+        """Initialize reply channel.
+
+        Args:
+            channel: The client's data channel.
+            request_id: Correlation ID of the request being answered.
+        """
+        self.channel = channel
+        self.request_id = request_id
+
+    @property
+    def label(self) -> str:
+        """Label of the underlying channel."""
+        return self.channel.label
+
+    @property
+    def readyState(self) -> str:  # noqa: N802 - mirrors RTCDataChannel
+        """State of the underlying channel."""
+        return self.channel.readyState
+
+    def send(self, message: str) -> None:
+        """Send a response to the request."""
+        self.channel.send(f"{_REPLY_PREFIX}{self.request_id}{MSG_SEPARATOR}{message}")
+
+
+class RpcServer:
+    """Run enveloped requests as cancellable tasks on the worker.
+
+    Attributes:
+        handler: Coroutine function ``handler(channel, message, client_id)``
+            that answers a plain request on ``channel`` and returns False if
+            it does not handle that kind of request.
+        client_key: Returns the ID under which a channel's requests are
+            tracked; the channel label unless given.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any, str, str], Awaitable[bool]],
+        client_key: Optional[Callable[[Any], str]] = None,
+    ):
+        """Initialize server.
+
+        Args:
+            handler: Answers one plain request; see :attr:`handler`.
+            client_key: Maps a channel to its client ID, for workers whose
+                clients may open channels with the same label.
+        """
+        self.handler = handler
+        self.client_key = client_key or (lambda channel: channel.label)
+        # (client ID, request ID) → task answering it
+        self._tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    def pending(self, label: str) -> int:
+        """Return the number of requests of a channel still being answered."""
+        return sum(1 for key in self._tasks if key[0] == label)
+
+    def handle(self, channel, message: Any) -> bool:
+        """Consume a hello, request or cancel message from a client.
+
+        Args:
+            channel: Data channel the message arrived on.
+            message: The received message.
+
+        Returns:
+            True if the message belonged to this layer.
+        """
+        if not isinstance(message, str):
+            return False
+        if _is_hello(message):
+            channel.send(f"{MSG_RPC_HELLO}{MSG_SEPARATOR}{RPC_VERSION}")
+            return True
+        if message.startswith(_CANCEL_PREFIX):
+            request_id = message[len(_CANCEL_PREFIX) :]
+            task = self._tasks.get((self.client_key(channel), request_id))
+            if task is not None:
+                task.cancel()
+            return True
+        if not message.startswith(_REQUEST_PREFIX):
+            return False
+        try:
+            request_id, request = parse_envelope(message)
+        except ValueError as e:
+            logging.warning(str(e))
+            return True
+
+        key = (self.client_key(channel), request_id)
+        task = asyncio.ensure_future(
+            self._serve(ReplyChannel(channel, request_id), request, key[0])
+        )
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return True
+
+    async def _serve(self, reply: ReplyChannel, request: str, client_id: str) -> None:
+        try:
+            handled = await self.handler(reply, request, client_id)
+        except asyncio.CancelledError:
+            logging.info(f"Request {reply.request_id} of {reply.label} cancelled")
+            raise
+        except Exception as e:
+            logging.error(f"Request {reply.request_id} of {reply.label} failed: {e}")
+            handled = False
+        if not handled and reply.readyState == "open":
+            reply.send(
+                f"{MSG_FS_ERROR}{MSG_SEPARATOR}{FS_ERROR_INVALID_REQUEST}"
+                f"{MSG_SEPARATOR}Unsupported request"
+            )
+
+    def cancel_channel(self, label: str) -> int:
+        """Cancel every request of a channel, e.g. when it closes.
+
+        Args:
+            label: Client ID of the closed channel (see :attr:`client_key`).
+
+        Returns:
+            Number of requests cancelled.
+        """
+        tasks = [task for key, task in self._tasks.items() if key[0] == label]
+        for task in tasks:
+            task.cancel()
+        return len(tasks)
@@ -15,6 +15,7 @@ from sleap_rtc.config import get_config
 from sleap_rtc.client.fs_viewer_server import FSViewerServer
 from sleap_rtc.auth.psk import compute_hmac
 from sleap_rtc.auth.secret_resolver import resolve_secret
+from sleap_rtc.rpc import RpcClient
 from sleap_rtc.protocol import (
     MSG_AUTH_CHALLENGE,
     MSG_AUTH_RESPONSE,
@@ -66,6 +67,8 @@ class BrowseClient:
 
         # Viewer server
         self.viewer_server = None
+        # Requests with correlation IDs, once the worker accepts them
+        self.rpc = RpcClient(self._send_to_worker)
 
         # Shutdown flag
         self.shutting_down = False
@@ -155,9 +158,12 @@ class BrowseClient:
                         print("Make sure the room secret matches the worker's secret.")
                     return
 
+                self.rpc.hello()
+
                 # Create and start viewer server
                 self.viewer_server = FSViewerServer(
                     send_to_worker=self._send_to_worker,
+                    rpc=self.rpc,
                 )
 
                 url = await self.viewer_server.start(
@@ -428,6 +434,10 @@ class BrowseClient:
                 self._handle_auth_failure(message)
                 return
 
+            # Replies to requests with correlation IDs
+            if self.rpc.handle(message):
+                return
+
             # Forward FS_* messages to viewer server
             if message.startswith("FS_"):
                 if self.viewer_server:
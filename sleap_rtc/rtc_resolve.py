@@ -27,6 +27,7 @@ from sleap_rtc.protocol import (
 )
 from sleap_rtc.auth.psk import compute_hmac
 from sleap_rtc.auth.secret_resolver import resolve_secret
+from sleap_rtc.rpc import RpcClient
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -82,6 +83,8 @@ class ResolveClient:
 
         # Viewer server for resolution UI
         self.viewer_server = None
+        # Requests with correlation IDs, once the worker accepts them
+        self.rpc = RpcClient(self._send_to_worker)
 
         # Video check result
         self.video_check_data = None
@@ -182,6 +185,8 @@ class ResolveClient:
                         print("Make sure the room secret matches the worker's secret.")
                         return None
 
+                self.rpc.hello()
+
                 # Send SLP path to Worker for video check
                 print(f"\nChecking video accessibility for: {self.slp_path}")
                 result = await self._send_worker_path(self.slp_path)
@@ -218,6 +223,7 @@ class ResolveClient:
                 # Create and start viewer server for resolution
                 self.viewer_server = FSViewerServer(
                     send_to_worker=self._send_to_worker,
+                    rpc=self.rpc,
                 )
                 self.viewer_server.set_video_check_data(video_data)
 
@@ -564,6 +570,10 @@ class ResolveClient:
                 self._handle_auth_failure(message)
                 return
 
+            # Replies to requests with correlation IDs
+            if self.rpc.handle(message):
+                return
+
             # Forward specific messages to response queue
             if (
                 message.startswith(MSG_WORKER_PATH_OK)
@@ -7,6 +7,9 @@ import logging
 from aiortc import RTCPeerConnection
 from sleap_rtc.worker.worker_class import RTCWorkerClient
 from sleap_rtc.config import get_config
+from sleap_rtc.worker.filename_index import default_index_dir
+from sleap_rtc.worker.job_queue_store import default_job_queue_dir
+from sleap_rtc.worker.upload_store import default_upload_cache_dir
 
 
 def run_RTCworker(
@@ -17,6 +20,9 @@ def run_RTCworker(
     name=None,
     room_secret=None,
     max_reconnect_time=None,
+    max_jobs=1,
+    parallel_pipelines=False,
+    max_queue=0,
 ):
     """Create RTCWorkerClient and start it.
 
@@ -29,6 +35,12 @@ def run_RTCworker(
         room_secret: Optional room secret for P2P authentication (CLI override).
         max_reconnect_time: Maximum time in seconds to keep retrying signaling server
             reconnection before exiting. None means retry forever.
+        max_jobs: Number of jobs to run concurrently, each on its own GPUs;
+            0 runs one job per visible GPU.
+        parallel_pipelines: Train independent pipeline models concurrently on
+            disjoint GPUs instead of one after another.
+        max_queue: Number of jobs allowed to wait for a free GPU; 0 means no
+            limit.
     """
     # Get configuration
     config = get_config()
@@ -53,7 +65,23 @@ def run_RTCworker(
 
     # Create the worker instance with mounts
     worker = RTCWorkerClient(
-        mounts=valid_mounts, working_dir=effective_working_dir, name=name
+        mounts=valid_mounts,
+        working_dir=effective_working_dir,
+        name=name,
+        upload_cache_dir=(
+            worker_io_config.upload_cache_dir or str(default_upload_cache_dir())
+        ),
+        upload_cache_max_bytes=int(worker_io_config.upload_cache_max_gb * 1024**3),
+        filename_index_dir=(
+            worker_io_config.filename_index_dir or str(default_index_dir())
+        ),
+        filename_index_refresh=worker_io_config.filename_index_refresh_minutes * 60,
+        max_concurrent_jobs=max_jobs,
+        parallel_pipelines=parallel_pipelines,
+        max_queued_jobs=max_queue,
+        job_queue_dir=(
+            worker_io_config.job_queue_dir or str(default_job_queue_dir(name))
+        ),
     )
 
     # Create the RTCPeerConnection object.
@@ -0,0 +1,228 @@
+"""Striped bulk transfer across several data channels of one peer connection.
+
+A single RTCDataChannel is drained by one SCTP stream, which caps bulk
+throughput well below what the link can carry. In striped mode the client
+opens extra channels labelled ``stripe-<n>`` on the existing
+RTCPeerConnection, and file data is spread across them:
+
+- Every binary message on a stripe channel is a *frame*: an 8-byte
+  big-endian file offset followed by the payload bytes.
+- The sender always writes the next chunk to the least-backlogged stripe.
+- The receiver writes each frame at its offset (``pwrite``), so frames may
+  arrive in any order across stripes. The control channel still carries the
+  start/end messages; the receiver waits until every byte has landed before
+  finalising the file.
+
+The number of stripes is chosen by the client (see
+:meth:`sleap_rtc.config.Config.get_transfer_stripes`); the worker simply uses
+whatever stripe channels the client opened.
+"""
+
+import asyncio
+import logging
+import os
+import struct
+import time
+from typing import Callable, List, Optional, Sequence
+
+from aiortc import RTCDataChannel, RTCPeerConnection
+
+STRIPE_LABEL_PREFIX = "stripe-"
+STRIPE_CHUNK_SIZE = 64 * 1024  # 64 KB payload per frame
+STRIPE_HIGH_WATER = 4 * 1024 * 1024  # 4 MB buffered per stripe
+STRIPE_OPEN_TIMEOUT = 10.0  # seconds
+STRIPE_DRAIN_TIMEOUT = 60.0  # seconds to wait for in-flight frames
+
+_FRAME_HEADER = struct.Struct("!Q")
+
+
+def is_stripe_channel(channel: RTCDataChannel) -> bool:
+    """Return True if a data channel was opened as a transfer stripe."""
+    return channel.label.startswith(STRIPE_LABEL_PREFIX)
+
+
+async def open_stripe_channels(
+    pc: RTCPeerConnection,
+    count: int,
+    on_frame: Optional[Callable[[bytes], None]] = None,
+    timeout: float = STRIPE_OPEN_TIMEOUT,
+) -> List[RTCDataChannel]:
+    """Open ``count`` stripe channels on a connected peer connection.
+
+    Args:
+        pc: Connected RTCPeerConnection.
+        count: Number of stripe channels to open.
+        on_frame: Optional callback for binary frames the peer sends on the
+            stripes. Registered before the channels open so no frame is lost.
+        timeout: Seconds to wait for all channels to open.
+
+    Returns:
+        The open stripe channels.
+
+    Raises:
+        asyncio.TimeoutError: If the channels do not open in time.
+    """
+    channels = [pc.createDataChannel(f"{STRIPE_LABEL_PREFIX}{i}") for i in range(count)]
+    opened = []
+    for channel in channels:
+        if on_frame is not None:
+
+            @channel.on("message")
+            def on_message(message):
+                if isinstance(message, bytes):
+                    on_frame(message)
+
+        event = asyncio.Event()
+        channel.on("open", event.set)
+        if channel.readyState == "open":
+            event.set()
+        opened.append(event.wait())
+    await asyncio.wait_for(asyncio.gather(*opened), timeout=timeout)
+    logging.info(f"Opened {count} stripe channels")
+    return channels
+
+
+def pack_frame(offset: int, payload: bytes) -> bytes:
+    """Prefix a payload with its file offset."""
+    return _FRAME_HEADER.pack(offset) + payload
+
+
+def unpack_frame(frame: bytes) -> tuple:
+    """Split a frame into ``(offset, payload)``.
+
+    Raises:
+        ValueError: If the frame is too short to hold an offset.
+    """
+    if len(frame) < _FRAME_HEADER.size:
+        raise ValueError(f"Stripe frame too short ({len(frame)} bytes)")
+    (offset,) = _FRAME_HEADER.unpack_from(frame)
+    return offset, memoryview(frame)[_FRAME_HEADER.size :]
+
+
+async def send_striped(
+    channels: Sequence[RTCDataChannel],
+    fh,
+    offset: int = 0,
+    length: int = None,
+    chunk_size: int = STRIPE_CHUNK_SIZE,
+    high_water: int = STRIPE_HIGH_WATER,
+) -> int:
+    """Send a byte range of an open file as frames spread across stripes.
+
+    Args:
+        channels: Open stripe channels.
+        fh: File object opened in binary mode.
+        offset: Byte offset to start from.
+        length: Number of bytes to send, or None to send until EOF.
+        chunk_size: Payload bytes per frame.
+        high_water: Per-stripe bufferedAmount above which sending pauses.
+
+    Returns:
+        Number of payload bytes sent.
+
+    Raises:
+        ConnectionError: If every stripe channel has closed.
+    """
+    fh.seek(offset)
+    sent = 0
+    while length is None or sent < length:
+        size = chunk_size if length is None else min(chunk_size, length - sent)
+        chunk = fh.read(size)
+        if not chunk:
+            break
+
+        while True:
+            open_channels = [c for c in channels if c.readyState == "open"]
+            if not open_channels:
+                raise ConnectionError("All stripe channels closed during transfer")
+            channel = min(open_channels, key=lambda c: c.bufferedAmount or 0)
+            if (channel.bufferedAmount or 0) <= high_water:
+                break
+            await asyncio.sleep(0.01)
+
+        channel.send(pack_frame(offset + sent, chunk))
+        sent += len(chunk)
+    return sent
+
+
+class StripeReassembler:
+    """Write striped frames into a file at their offsets.
+
+    Attributes:
+        total_bytes: Expected size of the file.
+        bytes_written: Payload bytes written so far.
+    """
+
+    def __init__(self, fileno: int, total_bytes: int):
+        """Initialize reassembler.
+
+        Args:
+            fileno: File descriptor opened for writing.
+            total_bytes: Expected size of the file.
+        """
+        self.total_bytes = total_bytes
+        self.bytes_written = 0
+        self._fileno = fileno
+        self._complete = asyncio.Event()
+        if total_bytes == 0:
+            self._complete.set()
+
+    def write_frame(self, frame: bytes) -> None:
+        """Write one frame at its offset.
+
+        Raises:
+            ValueError: If the frame is malformed or extends past the end of
+                the file.
+            OSError: If the write fails.
+        """
+        offset, payload = unpack_frame(frame)
+        if offset + len(payload) > self.total_bytes:
+            raise ValueError(
+                f"Stripe frame at {offset}+{len(payload)} exceeds file size "
+                f"{self.total_bytes}"
+            )
+        if hasattr(os, "pwrite"):
+            written = 0
+            while written < len(payload):
+                written += os.pwrite(self._fileno, payload[written:], offset + written)
+        else:  # Windows: no pwrite, but the event loop serialises writes anyway.
+            os.lseek(self._fileno, offset, os.SEEK_SET)
+            os.write(self._fileno, payload)
+        self.bytes_written += len(payload)
+        if self.bytes_written >= self.total_bytes:
+            self._complete.set()
+
+    async def wait(self, timeout: float = STRIPE_DRAIN_TIMEOUT) -> bool:
+        """Wait until every byte has been written.
+
+        Returns:
+            True if the file is complete, False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._complete.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+def log_transfer_rate(
+    description: str, nbytes: int, started: float, stripes: int = 1
+) -> float:
+    """Log and return the achieved throughput of a transfer in MB/s.
+
+    Args:
+        description: What was transferred, e.g. "Upload of labels.slp".
+        nbytes: Bytes transferred.
+        started: ``time.monotonic()`` value taken when the transfer began.
+        stripes: Number of channels the transfer used.
+
+    Returns:
+        Throughput in MB/s (MiB per second).
+    """
+    elapsed = max(time.monotonic() - started, 1e-6)
+    rate = nbytes / (1024 * 1024) / elapsed
+    logging.info(
+        f"{description}: {nbytes / (1024 * 1024):.1f} MB in {elapsed:.2f}s "
+        f"({rate:.1f} MB/s over {stripes} channel{'s' if stripes != 1 else ''})"
+    )
+    return rate
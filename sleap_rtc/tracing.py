@@ -0,0 +1,181 @@
+"""Low-overhead tracing of data-channel messages.
+
+Logging every received message in full is expensive on the transfer path:
+``str()`` of a 64 KB binary upload chunk builds a repr several times the
+chunk size before it is truncated, and an f-string log line is built even
+when its level is disabled. :class:`MessageTracer` instead
+
+- counts every message by type (the text before ``::``, or ``binary``),
+- builds a log line only when the logger will emit it, and then only for a
+  sample of each type's messages,
+- never turns a binary payload into text; it is logged by size.
+
+Modes (see :meth:`sleap_rtc.config.Config.get_message_trace`): ``all`` logs
+every message, ``sample`` (the default) logs every ``sample_every``-th
+message of each type, ``count`` only keeps the counts and ``off`` does
+nothing.
+"""
+
+import logging
+from collections import Counter
+from typing import Dict, Optional, Union
+
+TRACE_MODES = ("off", "count", "sample", "all")
+BINARY = "binary"
+PREVIEW_CHARS = 100  # characters of a text message shown in the log
+
+# Types that arrive in bulk are sampled more sparsely by default.
+DEFAULT_TYPE_SAMPLE_EVERY: Dict[str, int] = {BINARY: 256}
+
+_TYPE_SCAN = 64  # characters searched for the "::" type separator
+_BARE_TYPE_CHARS = 32  # longest separator-less message counted as its own type
+
+
+def message_type(message: Union[str, bytes]) -> str:
+    """Return the type a message is counted and sampled under.
+
+    Args:
+        message: A received data-channel message.
+
+    Returns:
+        ``binary`` for bytes, the prefix before ``::`` for protocol messages,
+        short bare messages (e.g. ``AUTH_SUCCESS``) as-is, and ``text`` for
+        anything else.
+    """
+    if not isinstance(message, str):
+        return BINARY
+    end = message.find("::", 0, _TYPE_SCAN)
+    if end >= 0:
+        return message[:end]
+    if len(message) <= _BARE_TYPE_CHARS and " " not in message:
+        return message
+    return "text"
+
+
+class _Preview:
+    """Shorten a message for the log, only when the record is formatted."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: Union[str, bytes]):
+        self.message = message
+
+    def __str__(self) -> str:
+        message = self.message
+        if not isinstance(message, str):
+            return f"<{len(message)} bytes>"
+        if len(message) <= PREVIEW_CHARS:
+            return message
+        return f"{message[:PREVIEW_CHARS]}..."
+
+
+class MessageTracer:
+    """Count and sample-log the messages received on a data channel.
+
+    Attributes:
+        name: Label for log lines, e.g. "Worker".
+        logger: Logger the sampled messages go to.
+        level: Log level of the sampled messages.
+        mode: One of :data:`TRACE_MODES`.
+        sample_every: In ``sample`` mode, log one of every this many messages
+            of a type that has no entry in ``type_sample_every``.
+        type_sample_every: Per-type overrides of ``sample_every``.
+        counts: Messages seen so far, by type.
+        binary_bytes: Total size of the binary messages seen so far.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.DEBUG,
+        mode: str = "sample",
+        sample_every: int = 1,
+        type_sample_every: Optional[Dict[str, int]] = None,
+    ):
+        """Initialize tracer.
+
+        Args:
+            name: Label for log lines, e.g. "Worker".
+            logger: Logger to write to. Defaults to the root logger.
+            level: Log level of the sampled messages.
+            mode: One of :data:`TRACE_MODES`.
+            sample_every: Default sampling interval in ``sample`` mode.
+            type_sample_every: Per-type sampling intervals. Defaults to
+                :data:`DEFAULT_TYPE_SAMPLE_EVERY`.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in TRACE_MODES:
+            raise ValueError(f"trace mode must be one of {TRACE_MODES}")
+        self.name = name
+        self.logger = logger or logging.getLogger()
+        self.level = level
+        self.mode = mode
+        self.sample_every = max(1, sample_every)
+        self.type_sample_every = (
+            DEFAULT_TYPE_SAMPLE_EVERY
+            if type_sample_every is None
+            else type_sample_every
+        )
+        self.counts: Counter = Counter()
+        self.binary_bytes = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        name: str,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.DEBUG,
+    ) -> "MessageTracer":
+        """Create a tracer with the mode and sampling from the user's config.
+
+        Args:
+            name: Label for log lines, e.g. "Worker".
+            logger: Logger to write to. Defaults to the root logger.
+            level: Log level of the sampled messages.
+
+        Returns:
+            A new MessageTracer.
+        """
+        from sleap_rtc.config import get_config
+
+        settings = get_config().get_message_trace()
+        return cls(name, logger=logger, level=level, **settings)
+
+    def trace(self, message: Union[str, bytes]) -> None:
+        """Record one received message, logging it if it is sampled.
+
+        Args:
+            message: The received message.
+        """
+        if self.mode == "off":
+            return
+        kind = message_type(message)
+        seen = self.counts[kind]
+        self.counts[kind] = seen + 1
+        if kind == BINARY:
+            self.binary_bytes += len(message)
+        if self.mode == "count":
+            return
+        if self.mode == "sample":
+            every = self.type_sample_every.get(kind, self.sample_every)
+            if seen % every:
+                return
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level,
+                "%s received (%s #%d): %s",
+                self.name,
+                kind,
+                seen + 1,
+                _Preview(message),
+            )
+
+    def summary(self) -> str:
+        """Return the message counts by type, most frequent first."""
+        parts = [f"{kind}={count}" for kind, count in self.counts.most_common()]
+        if self.binary_bytes:
+            parts.append(f"binary_bytes={self.binary_bytes}")
+        return ", ".join(parts)
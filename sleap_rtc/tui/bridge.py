@@ -17,8 +17,11 @@ from aiortc import RTCPeerConnection, RTCSessionDescription
 
 from sleap_rtc.config import get_config
 from sleap_rtc.protocol import (
+    FS_LIST_STREAM_ENTRIES,
+    MSG_FS_ERROR,
     MSG_FS_GET_MOUNTS,
     MSG_FS_LIST_DIR,
+    MSG_FS_LIST_RESPONSE,
     MSG_USE_WORKER_PATH,
     MSG_WORKER_PATH_OK,
     MSG_WORKER_PATH_ERROR,
@@ -39,6 +42,7 @@ from sleap_rtc.protocol import (
 )
 from sleap_rtc.auth.psk import compute_hmac
 from sleap_rtc.auth.secret_resolver import resolve_secret
+from sleap_rtc.rpc import RpcClient
 
 
 class WebRTCBridge:
@@ -98,6 +102,11 @@ class WebRTCBridge:
         # Message queue for request/response pattern
         self._response_queue: asyncio.Queue = asyncio.Queue()
         self._pending_requests: dict[str, asyncio.Future] = {}
+        # Receives FS_LIST_RESPONSE pages while list_dir_stream is running.
+        self._list_stream: Optional[asyncio.Queue] = None
+        # Requests with correlation IDs, once the worker accepts them; the
+        # two attributes above serve workers that do not.
+        self._rpc = RpcClient(self.send)
 
         # Shutdown flag
         self._running = False
@@ -128,6 +137,11 @@ class WebRTCBridge:
         """Get the reason for authentication failure, if any."""
         return self._auth_failed_reason
 
+    @property
+    def multiplexed(self) -> bool:
+        """Check if requests can run concurrently (worker accepts request IDs)."""
+        return self._rpc.enabled
+
     @property
     def requires_auth(self) -> bool:
         """Check if this connection requires PSK authentication."""
@@ -153,6 +167,7 @@ class WebRTCBridge:
         self._authenticated = False
         self._auth_event.clear()
         self._auth_failed_reason = None
+        self._rpc.reset()
 
         try:
             await self._connect_to_worker(worker_id)
@@ -179,6 +194,7 @@ class WebRTCBridge:
             if self._on_auth_status:
                 await self._call_async(self._on_auth_status, "Authenticated")
 
+            self._rpc.hello()
             return True
         except Exception as e:
             logging.error(f"Failed to connect to worker: {e}")
@@ -286,6 +302,11 @@ class WebRTCBridge:
     ) -> Optional[str]:
         """Send a message and wait for a specific response.
 
+        Once the worker accepts requests with correlation IDs, any number of
+        calls may be in flight, including several of the same type; with
+        older workers a second request expecting the same prefix takes over
+        the first one's response.
+
         Args:
             message: The message to send.
             response_prefix: The expected response message prefix, or a list of
@@ -295,14 +316,25 @@ class WebRTCBridge:
         Returns:
             The response message, or None if timeout/error.
         """
-        if not self.send(message):
-            return None
-
         # Normalize to list
         prefixes = (
             [response_prefix] if isinstance(response_prefix, str) else response_prefix
         )
 
+        if self._rpc.enabled:
+            if not self.is_connected:
+                logging.warning("Cannot send: data channel not open")
+                return None
+            response = await self._rpc.request(message, timeout=timeout)
+            if response is None or not response.startswith(tuple(prefixes)):
+                if response is not None:
+                    logging.warning(f"Unexpected response: {response[:100]}")
+                return None
+            return response
+
+        if not self.send(message):
+            return None
+
         # Create a future for this request
         future: asyncio.Future = asyncio.Future()
         for prefix in prefixes:
@@ -361,6 +393,83 @@ class WebRTCBridge:
                     logging.error("Failed to parse list response")
         return None
 
+    async def list_dir_stream(
+        self,
+        path: str,
+        on_page: Callable[[dict], Any],
+        offset: int = 0,
+        cursor: str = "",
+        max_entries: int = FS_LIST_STREAM_ENTRIES,
+        timeout: float = 60.0,
+    ) -> bool:
+        """List directory contents, handing each streamed page to a callback.
+
+        The worker answers with consecutive FS_LIST_RESPONSE pages (see
+        protocol.py), so large directories fill in incrementally. Workers that
+        predate streaming send a single page, which ends the stream.
+
+        Args:
+            path: Directory path to list.
+            on_page: Called (sync or async) with each page dict as it arrives.
+            offset: Pagination offset.
+            cursor: Cursor of a previous page, to continue the same listing.
+            max_entries: Entries to request in total.
+            timeout: Maximum time to wait for each page.
+
+        Returns:
+            True if the listing was received, False on error or timeout.
+        """
+        message = format_message(
+            MSG_FS_LIST_DIR, path, str(offset), str(max_entries), cursor
+        )
+        queue: Optional[asyncio.Queue] = None
+        call = None
+        finished = False
+        try:
+            if self._rpc.enabled and self.is_connected:
+                # Pages carry the request's ID, so other listings may run
+                # at the same time; leaving early cancels the rest.
+                call = self._rpc.start(message)
+            else:
+                queue = asyncio.Queue()
+                self._list_stream = queue
+                if not self.send(message):
+                    return False
+            end = offset + max_entries
+            while True:
+                if call is not None:
+                    response = await call.reply(timeout)
+                    if response is None:
+                        return False
+                else:
+                    response = await asyncio.wait_for(queue.get(), timeout=timeout)
+                msg_type, args = parse_message(response)
+                if msg_type != MSG_FS_LIST_RESPONSE or not args:
+                    logging.error(f"Directory listing failed: {response}")
+                    finished = True
+                    return False
+                try:
+                    page = json.loads(args[0])
+                except json.JSONDecodeError:
+                    logging.error("Failed to parse list response")
+                    return False
+                await self._call_async(on_page, page)
+                next_offset = page.get("next_offset")
+                if not page.get("has_more") or next_offset is None:
+                    finished = True
+                    return True
+                if next_offset >= end:
+                    finished = True
+                    return True
+        except asyncio.TimeoutError:
+            logging.warning(f"Timeout waiting for listing of {path}")
+            return False
+        finally:
+            if call is not None:
+                call.close(cancel=not finished)
+            if queue is not None and self._list_stream is queue:
+                self._list_stream = None
+
     async def check_slp_videos(self, slp_path: str) -> Optional[dict]:
         """Check video accessibility for an SLP file.
 
@@ -387,6 +496,22 @@ class WebRTCBridge:
         # Send USE_WORKER_PATH to trigger video check
         message = format_message(MSG_USE_WORKER_PATH, slp_path)
 
+        if self._rpc.enabled:
+            # Both responses come back under the request's ID, so checks of
+            # several files can run at once.
+            try:
+                with self._rpc.start(message) as call:
+                    path_response = await call.reply(10.0)
+                    if path_response is None or path_response.startswith(
+                        MSG_WORKER_PATH_ERROR
+                    ):
+                        return self._video_check_result(path_response, None)
+                    video_response = await call.reply(30.0)
+                    return self._video_check_result(path_response, video_response)
+            except asyncio.TimeoutError:
+                logging.warning("Timeout waiting for video check response")
+                return None
+
         # We need to wait for both WORKER_PATH_OK and FS_CHECK_VIDEOS_RESPONSE
         path_future: asyncio.Future = asyncio.Future()
         video_future: asyncio.Future = asyncio.Future()
@@ -400,20 +525,12 @@ class WebRTCBridge:
 
             # Wait for path confirmation first
             path_response = await asyncio.wait_for(path_future, timeout=10.0)
-
             if path_response.startswith(MSG_WORKER_PATH_ERROR):
-                _, args = parse_message(path_response)
-                error = args[0] if args else "Unknown error"
-                return {"error": error}
+                return self._video_check_result(path_response, None)
 
             # Now wait for video check response
             video_response = await asyncio.wait_for(video_future, timeout=30.0)
-
-            _, args = parse_message(video_response)
-            if args:
-                return json.loads(args[0])
-
-            return None
+            return self._video_check_result(path_response, video_response)
 
         except asyncio.TimeoutError:
             logging.warning("Timeout waiting for video check response")
@@ -423,6 +540,24 @@ class WebRTCBridge:
             self._pending_requests.pop(MSG_WORKER_PATH_ERROR, None)
             self._pending_requests.pop(MSG_FS_CHECK_VIDEOS_RESPONSE, None)
 
+    @staticmethod
+    def _video_check_result(
+        path_response: Optional[str], video_response: Optional[str]
+    ) -> Optional[dict]:
+        """Turn the responses to USE_WORKER_PATH into check_slp_videos' result."""
+        if path_response is None:
+            return None
+        if path_response.startswith(MSG_WORKER_PATH_ERROR):
+            _, args = parse_message(path_response)
+            error = args[0] if args else "Unknown error"
+            return {"error": error}
+        if video_response is None:
+            return None
+        _, args = parse_message(video_response)
+        if args:
+            return json.loads(args[0])
+        return None
+
     async def compute_prefix_resolution(
         self,
         original_path: str,
@@ -736,6 +871,7 @@ class WebRTCBridge:
         @self.data_channel.on("close")
         def on_close():
             logging.info("Data channel closed")
+            self._rpc.reset()
             if self._on_disconnected:
                 asyncio.create_task(self._call_async(self._on_disconnected))
 
@@ -797,6 +933,17 @@ class WebRTCBridge:
             self._handle_auth_failure(message)
             return
 
+        # Replies to requests with correlation IDs
+        if self._rpc.handle(message):
+            return
+
+        # Pages of a streamed directory listing
+        if self._list_stream is not None and (
+            message.startswith(MSG_FS_LIST_RESPONSE) or message.startswith(MSG_FS_ERROR)
+        ):
+            self._list_stream.put_nowait(message)
+            return
+
         # Check for pending request responses
         for prefix, future in list(self._pending_requests.items()):
             if message.startswith(prefix) and not future.done():
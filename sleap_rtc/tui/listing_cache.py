@@ -0,0 +1,163 @@
+"""Client-side cache of worker directory listings for the TUI browser.
+
+Every column the Miller view opens is an FS_LIST_DIR round trip, which over a
+relayed TURN link is noticeable on every keypress, and going back to a
+directory lists it again. :class:`ListingCache` keeps the pages received for
+each ``(worker, path)``, with stale-while-revalidate semantics:
+
+- A cached listing is shown immediately.
+- A listing fetched within the last ``fresh_for`` seconds (e.g. by a
+  prefetch just before the user opened the directory) is used as is.
+- An older one is revalidated in the background with a single-page request:
+  if the directory's ``mtime_ns`` (sent with every FS_LIST_RESPONSE page) is
+  unchanged the cached listing stays, otherwise it is replaced. Listings
+  without an mtime (the mounts at ``/``, workers that do not send one) are
+  always replaced.
+
+Listings may be partial: a prefetched sibling only has its first page. The
+cache also records where the next page starts and the worker cursor, so the
+rest can be streamed on top of it.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+LISTING_CACHE_SIZE = 256  # directories
+LISTING_FRESH_FOR = 10.0  # seconds a listing is used without revalidation
+
+
+@dataclass
+class CachedListing:
+    """Pages of one directory listing received from a worker.
+
+    Attributes:
+        path: Directory path.
+        entries: Entry dicts as sent by the worker, in listing order.
+        total_count: Entries in the directory.
+        has_more: Whether entries after ``entries`` exist.
+        next_offset: Where the next page starts.
+        cursor: Worker cursor continuing the same listing.
+        mtime_ns: Directory mtime when listed, if the worker sent it.
+        fetched_at: ``time.monotonic()`` when the listing was last fetched
+            or revalidated.
+    """
+
+    path: str
+    entries: list = field(default_factory=list)
+    total_count: int = 0
+    has_more: bool = False
+    next_offset: Optional[int] = None
+    cursor: str = ""
+    mtime_ns: Optional[int] = None
+    fetched_at: float = 0.0
+
+
+class ListingCache:
+    """LRU cache of :class:`CachedListing` objects keyed by (worker, path).
+
+    Attributes:
+        max_listings: Maximum listings kept.
+        fresh_for: Seconds a listing is used without revalidation.
+    """
+
+    def __init__(
+        self,
+        max_listings: int = LISTING_CACHE_SIZE,
+        fresh_for: float = LISTING_FRESH_FOR,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_listings: Maximum listings kept.
+            fresh_for: Seconds a listing is used without revalidation.
+        """
+        self.max_listings = max_listings
+        self.fresh_for = fresh_for
+        # (worker, path) → listing, least recently used first
+        self._listings: "OrderedDict[Tuple[str, str], CachedListing]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def get(self, worker: str, path: str) -> Optional[CachedListing]:
+        """Return the cached listing of a directory, if any.
+
+        Args:
+            worker: Worker the listing came from.
+            path: Directory path.
+
+        Returns:
+            The listing, or None if the directory was not listed yet.
+        """
+        listing = self._listings.get((worker, path))
+        if listing is not None:
+            self._listings.move_to_end((worker, path))
+        return listing
+
+    def store_page(self, worker: str, path: str, page: dict, first: bool) -> None:
+        """Record a page of a listing.
+
+        Args:
+            worker: Worker the page came from.
+            path: Directory path the page was requested for.
+            page: FS_LIST_RESPONSE page (or the equivalent dict built for
+                ``/``); pages with an ``error`` are ignored.
+            first: Whether the page starts a new listing. Other pages extend
+                the cached listing if they continue it, and are otherwise
+                dropped.
+        """
+        if "error" in page:
+            return
+        key = (worker, path)
+        listing = self._listings.get(key)
+        if first:
+            listing = CachedListing(path=path)
+            self._listings[key] = listing
+        elif listing is None or page.get("offset") != listing.next_offset:
+            return
+        entries = page.get("entries", [])
+        listing.entries.extend(entries)
+        listing.total_count = page.get("total_count", len(listing.entries))
+        listing.has_more = page.get("has_more", False)
+        listing.next_offset = page.get("next_offset", len(listing.entries))
+        listing.cursor = page.get("cursor", "")
+        if first:
+            listing.mtime_ns = page.get("mtime_ns")
+            listing.fetched_at = time.monotonic()
+        self._listings.move_to_end(key)
+        while len(self._listings) > self.max_listings:
+            self._listings.popitem(last=False)
+
+    def is_fresh(self, listing: CachedListing) -> bool:
+        """Return whether a listing can be used without revalidation."""
+        return time.monotonic() - listing.fetched_at < self.fresh_for
+
+    def revalidate(self, listing: CachedListing, page: dict) -> bool:
+        """Check a cached listing against a freshly fetched first page.
+
+        Args:
+            listing: The cached listing.
+            page: First page of a new listing of the same directory.
+
+        Returns:
+            True if the directory is unchanged and the listing was marked
+            fresh; False if it must be replaced.
+        """
+        mtime_ns = page.get("mtime_ns")
+        if "error" in page or mtime_ns is None or mtime_ns != listing.mtime_ns:
+            return False
+        listing.fetched_at = time.monotonic()
+        return True
+
+    def invalidate(self, worker: str, path: Optional[str] = None) -> None:
+        """Forget the listing of a directory, or every listing of a worker.
+
+        Args:
+            worker: Worker whose listings to forget.
+            path: Directory to forget; all of the worker's if None.
+        """
+        for key in list(self._listings):
+            if key[0] == worker and (path is None or key[1] == path):
+                del self._listings[key]
@@ -8,7 +8,7 @@ import asyncio
 import os
 import platform
 import subprocess
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal
@@ -22,6 +22,7 @@ from sleap_rtc.tui.widgets.tree_browser import TreeBrowser
 from sleap_rtc.tui.widgets.worker_tabs import WorkerTabs, WorkerInfo
 from sleap_rtc.tui.widgets.slp_panel import SLPContextPanel, SLPInfo, VideoInfo
 from sleap_rtc.tui.bridge import WebRTCBridge
+from sleap_rtc.tui.listing_cache import ListingCache
 from sleap_rtc.tui.screens.resolve_confirm import ResolveConfirmScreen
 from sleap_rtc.tui.screens.secret_input import SecretInputScreen
 
@@ -212,6 +213,9 @@ class BrowserScreen(Screen):
         self._miller_loaded = False
         self._tree_loaded = False
 
+        # Directory listings of every worker visited this session
+        self.listing_cache = ListingCache()
+
     def compose(self) -> ComposeResult:
         # Get user info for profile display
         from sleap_rtc.auth.credentials import get_user
@@ -256,6 +260,9 @@ class BrowserScreen(Screen):
                         with Container(id="miller-container"):
                             yield MillerColumns(
                                 fetch_directory=self._fetch_directory,
+                                stream_directory=self._stream_directory,
+                                listing_cache=self.listing_cache,
+                                can_prefetch=self._can_prefetch,
                                 id="miller-columns",
                             )
 
@@ -655,6 +662,32 @@ class BrowserScreen(Screen):
 
         return result
 
+    async def _stream_directory(
+        self, path: str, offset: int, cursor: str, on_page: Callable[[dict], Any]
+    ) -> bool:
+        """Stream directory contents from worker page by page.
+
+        Args:
+            path: Directory path to list.
+            offset: Pagination offset.
+            cursor: Cursor of the previous page, to continue the same listing.
+            on_page: Called with each page dict as it arrives.
+
+        Returns:
+            True if the listing was received, False on error.
+        """
+        if path == "/" or not self.bridge or not self.bridge.is_connected:
+            on_page(await self._fetch_directory(path, offset))
+            return True
+
+        return await self.bridge.list_dir_stream(
+            path, on_page, offset=offset, cursor=cursor
+        )
+
+    def _can_prefetch(self) -> bool:
+        """Whether listings may be prefetched without delaying other requests."""
+        return self.bridge is not None and self.bridge.multiplexed
+
     def _try_load_root(self):
         """Try to load root directory."""
         if not self.bridge:
@@ -663,6 +696,7 @@ class BrowserScreen(Screen):
         # Only load the active view to avoid race conditions
         if self.view_mode == "miller":
             miller = self.query_one("#miller-columns", MillerColumns)
+            miller.worker_id = self.bridge.worker_id or ""
             miller.load_root()
             self._miller_loaded = True
         else:
@@ -961,6 +995,7 @@ class BrowserScreen(Screen):
             # Load miller view if not already loaded
             if not self._miller_loaded and self._connected:
                 miller = self.query_one("#miller-columns", MillerColumns)
+                miller.worker_id = self.bridge.worker_id or ""
                 miller.load_root()
                 self._miller_loaded = True
             self.notify("Switched to Miller Columns", timeout=2)
@@ -2,9 +2,15 @@
 
 This module provides a Miller columns interface (like macOS Finder) for
 navigating directory hierarchies.
+
+Given a :class:`~sleap_rtc.tui.listing_cache.ListingCache`, columns open
+from cached listings and revalidate them in the background. While the
+connection can run requests concurrently, highlighting a directory also
+prefetches its listing and the first page of the directories next to it.
 """
 
 import asyncio
+import logging
 from dataclasses import dataclass
 from typing import Optional, Callable, Any
 
@@ -16,6 +22,12 @@ from textual.reactive import reactive
 from textual.message import Message
 from textual.binding import Binding
 
+from sleap_rtc.protocol import FS_LIST_STREAM_ENTRIES
+from sleap_rtc.tui.listing_cache import CachedListing, ListingCache
+
+PREFETCH_DELAY = 0.15  # seconds the highlight must rest before prefetching
+PREFETCH_SIBLINGS = 3  # directories prefetched on each side of the highlight
+
 
 @dataclass
 class FileEntry:
@@ -130,6 +142,9 @@ class MillerColumn(ListView):
         self.has_more = False
         self.is_loading = False
         self.error: Optional[str] = None
+        # Where the next page starts and which worker listing it continues
+        self.next_offset: Optional[int] = None
+        self.cursor = ""
 
     def set_entries(self, entries: list[FileEntry], total: int, has_more: bool):
         """Set the entries for this column."""
@@ -257,6 +272,11 @@ class MillerColumns(Widget):
         self,
         fetch_directory: Optional[Callable[[str, int], Any]] = None,
         num_columns: int = 4,
+        stream_directory: Optional[
+            Callable[[str, int, str, Callable[[dict], None]], Any]
+        ] = None,
+        listing_cache: Optional[ListingCache] = None,
+        can_prefetch: Optional[Callable[[], bool]] = None,
         **kwargs,
     ):
         """Initialize Miller columns.
@@ -265,9 +285,27 @@ class MillerColumns(Widget):
             fetch_directory: Async callback to fetch directory contents.
                 Should return dict with entries, total_count, has_more.
             num_columns: Number of visible columns.
+            stream_directory: Optional async callback
+                ``(path, offset, cursor, on_page)`` that delivers a listing as
+                several pages; preferred over fetch_directory when given, so
+                large directories fill in as pages arrive. Returns False if
+                the listing failed.
+            listing_cache: Optional cache of listings, shared across
+                workers; listings are stored under :attr:`worker_id`.
+            can_prefetch: Optional callback telling whether listings may be
+                prefetched now, i.e. whether the connection runs requests
+                concurrently. Prefetching also needs ``listing_cache``.
         """
         super().__init__(**kwargs)
         self.fetch_directory = fetch_directory
+        self.stream_directory = stream_directory
+        self.listing_cache = listing_cache
+        self.can_prefetch = can_prefetch
+        # Worker the listings come from (cache key)
+        self.worker_id = ""
+        # Debounced prefetch scheduling, and prefetches in flight per path
+        self._prefetch_task: Optional[asyncio.Task] = None
+        self._prefetches: dict[str, asyncio.Task] = {}
         self.num_columns = num_columns
         self.columns: list[MillerColumn] = []
         self.path_stack: list[str] = ["/"]  # Stack of paths for each column
@@ -294,7 +332,7 @@ class MillerColumns(Widget):
 
     def load_root(self):
         """Load the root directory. Call this after connection is ready."""
-        if self.fetch_directory:
+        if self.fetch_directory or self.stream_directory:
             # Reset history state
             self.full_path_history = ["/"]
             self.history_offset = 0
@@ -343,6 +381,8 @@ class MillerColumns(Widget):
             dst_col.total_count = src_col.total_count
             dst_col.has_more = src_col.has_more
             dst_col.error = src_col.error
+            dst_col.next_offset = src_col.next_offset
+            dst_col.cursor = src_col.cursor
 
             # Repopulate the destination column with the copied data
             dst_col._populate()
@@ -359,7 +399,7 @@ class MillerColumns(Widget):
         self.active_column = last_col_index
 
         # Fetch the new directory contents
-        if self.fetch_directory:
+        if self.fetch_directory or self.stream_directory:
             asyncio.create_task(self._fetch_and_populate(last_col_index, new_path))
 
         # Focus the new column
@@ -397,6 +437,8 @@ class MillerColumns(Widget):
             dst_col.total_count = src_col.total_count
             dst_col.has_more = src_col.has_more
             dst_col.error = src_col.error
+            dst_col.next_offset = src_col.next_offset
+            dst_col.cursor = src_col.cursor
 
             # Repopulate the destination column with the copied data
             dst_col._populate()
@@ -412,7 +454,7 @@ class MillerColumns(Widget):
         self.active_column = 0
 
         # Fetch the parent directory contents
-        if self.fetch_directory:
+        if self.fetch_directory or self.stream_directory:
             asyncio.create_task(self._fetch_and_populate(0, parent_path))
 
         # Focus the first column
@@ -449,47 +491,259 @@ class MillerColumns(Widget):
             self.columns[i].display = False
 
         # Fetch directory contents
-        if self.fetch_directory:
+        if self.fetch_directory or self.stream_directory:
             asyncio.create_task(self._fetch_and_populate(col_index, path))
 
+    @staticmethod
+    def _entries_from(result: dict, path: str) -> list[FileEntry]:
+        """Build FileEntry objects from a listing response."""
+        return [
+            FileEntry(
+                name=e["name"],
+                type=e["type"],
+                size=e.get("size", 0),
+                modified=e.get("modified", 0),
+                # Use actual_path if provided (for mounts), otherwise construct path
+                path=e.get("actual_path") or f"{path.rstrip('/')}/{e['name']}",
+            )
+            for e in result.get("entries", [])
+        ]
+
+    async def _stream_into(
+        self, col: MillerColumn, path: str, offset: int, replace: bool
+    ) -> None:
+        """Stream a listing into a column, page by page.
+
+        Args:
+            col: Column to fill.
+            path: Directory being listed; pages are dropped once the column
+                shows a different path.
+            offset: Pagination offset.
+            replace: Replace the column's entries with the first page instead
+                of appending to them.
+        """
+        received = False
+        worker = self.worker_id
+        first_page = replace
+
+        def on_page(result: dict):
+            nonlocal received, first_page
+            self._remember(worker, path, result, first=first_page)
+            first_page = False
+            if col.path != path:
+                return
+            if "error" in result:
+                if not received:
+                    col.set_error(result["error"])
+                return
+            entries = self._entries_from(result, path)
+            has_more = result.get("has_more", False)
+            col.next_offset = result.get("next_offset")
+            col.cursor = result.get("cursor", "")
+            if replace and not received:
+                col.set_entries(
+                    entries, result.get("total_count", len(entries)), has_more
+                )
+                if col.column_index == self.active_column:
+                    col.focus()
+            else:
+                col.append_entries(entries, has_more)
+            received = True
+
+        cursor = "" if replace else col.cursor
+        ok = await self.stream_directory(path, offset, cursor, on_page)
+        if not ok and replace and not received and col.path == path:
+            col.set_error("Failed to load directory")
+
     async def _fetch_and_populate(self, col_index: int, path: str):
         """Fetch directory contents and populate column."""
         col = self.columns[col_index]
 
         try:
-            result = await self.fetch_directory(path, 0)
-
-            if result is None:
-                col.set_error("Failed to load directory")
+            # A prefetch of this directory may already be on its way
+            pending = self._prefetches.get(path)
+            if pending is not None and not pending.done():
+                await asyncio.wait([pending])
+                if col.path != path:
+                    return
+
+            cached = self._cached(path)
+            if cached is not None:
+                await self._populate_cached(col, path, cached)
                 return
 
-            if "error" in result:
-                col.set_error(result["error"])
+            if self.stream_directory:
+                await self._stream_into(col, path, 0, replace=True)
                 return
 
-            entries = [
-                FileEntry(
-                    name=e["name"],
-                    type=e["type"],
-                    size=e.get("size", 0),
-                    modified=e.get("modified", 0),
-                    # Use actual_path if provided (for mounts), otherwise construct path
-                    path=e.get("actual_path") or f"{path.rstrip('/')}/{e['name']}",
-                )
-                for e in result.get("entries", [])
-            ]
+            result = await self.fetch_directory(path, 0)
+            self._remember(self.worker_id, path, result, first=True)
+            self._populate_result(col, path, result)
 
-            total_count = result.get("total_count", len(entries))
-            has_more = result.get("has_more", False)
+        except Exception as e:
+            col.set_error(str(e))
 
-            col.set_entries(entries, total_count, has_more)
+    def _populate_result(self, col: MillerColumn, path: str, result: Optional[dict]):
+        """Fill a column with the first page returned by fetch_directory."""
+        if col.path != path:
+            return
 
-            # Focus this column if it's the active one
-            if col_index == self.active_column:
-                col.focus()
+        if result is None:
+            col.set_error("Failed to load directory")
+            return
+
+        if "error" in result:
+            col.set_error(result["error"])
+            return
+
+        entries = self._entries_from(result, path)
+
+        total_count = result.get("total_count", len(entries))
+        has_more = result.get("has_more", False)
 
+        col.set_entries(entries, total_count, has_more)
+        col.next_offset = result.get("next_offset")
+        col.cursor = result.get("cursor", "")
+
+        # Focus this column if it's the active one
+        if col.column_index == self.active_column:
+            col.focus()
+
+    # --- Listing cache and prefetch ---
+
+    def _cached(self, path: str) -> Optional[CachedListing]:
+        """Return the cached listing of a directory on the current worker."""
+        if self.listing_cache is None:
+            return None
+        return self.listing_cache.get(self.worker_id, path)
+
+    def _remember(
+        self, worker: str, path: str, result: Optional[dict], first: bool
+    ) -> None:
+        """Store a received listing page in the cache."""
+        if self.listing_cache is not None and result is not None:
+            self.listing_cache.store_page(worker, path, result, first)
+
+    async def _populate_cached(
+        self, col: MillerColumn, path: str, cached: CachedListing
+    ) -> None:
+        """Show a cached listing, then revalidate and complete it.
+
+        Args:
+            col: Column to fill.
+            path: Directory shown.
+            cached: Its cached listing.
+        """
+        col.set_entries(
+            self._entries_from({"entries": cached.entries}, path),
+            cached.total_count,
+            cached.has_more,
+        )
+        col.next_offset = cached.next_offset
+        col.cursor = cached.cursor
+        if col.column_index == self.active_column:
+            col.focus()
+
+        if not self.listing_cache.is_fresh(cached):
+            if await self._revalidate(col, path, cached):
+                return
+
+        # A prefetched first page; stream the rest of the usual amount
+        if (
+            cached.has_more
+            and self.stream_directory
+            and len(cached.entries) < FS_LIST_STREAM_ENTRIES
+            and col.path == path
+        ):
+            await self._stream_into(col, path, cached.next_offset, replace=False)
+
+    async def _revalidate(
+        self, col: MillerColumn, path: str, cached: CachedListing
+    ) -> bool:
+        """Check a cached listing shown in a column against the worker.
+
+        Returns:
+            True if the directory changed and the column was reloaded.
+        """
+        worker = self.worker_id
+        if self.fetch_directory is not None:
+            result = await self.fetch_directory(path, 0)
+            if result is not None and self.listing_cache.revalidate(cached, result):
+                return False
+        else:
+            result = None
+
+        self.listing_cache.invalidate(worker, path)
+        if col.path != path:
+            return True
+        if self.stream_directory and (
+            result is None or ("error" not in result and result.get("has_more"))
+        ):
+            await self._stream_into(col, path, 0, replace=True)
+        else:
+            # The page is the whole listing, or an error to show
+            self._remember(worker, path, result, first=True)
+            self._populate_result(col, path, result)
+        return True
+
+    def _schedule_prefetch(self, col: MillerColumn) -> None:
+        """Prefetch around the highlighted entry once the highlight rests."""
+        if self.listing_cache is None or self.can_prefetch is None:
+            return
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        self._prefetch_task = asyncio.create_task(self._prefetch_around(col))
+
+    async def _prefetch_around(self, col: MillerColumn) -> None:
+        """Prefetch the highlighted directory and the first page of its siblings."""
+        await asyncio.sleep(PREFETCH_DELAY)
+        if not self.can_prefetch():
+            return
+        index = col.index
+        if index is None or not 0 <= index < len(col.entries):
+            return
+
+        highlighted = col.entries[index]
+        nearby = col.entries[
+            max(0, index - PREFETCH_SIBLINGS) : index + PREFETCH_SIBLINGS + 1
+        ]
+        for entry in [highlighted] + nearby:
+            if (
+                entry.is_dir
+                and entry.path not in self._prefetches
+                and self._cached(entry.path) is None
+            ):
+                task = asyncio.create_task(
+                    self._prefetch(entry.path, full=entry is highlighted)
+                )
+                self._prefetches[entry.path] = task
+                task.add_done_callback(
+                    lambda _, path=entry.path: self._prefetches.pop(path, None)
+                )
+
+    async def _prefetch(self, path: str, full: bool) -> None:
+        """Fetch a listing into the cache only.
+
+        Args:
+            path: Directory to list.
+            full: Stream the usual number of entries instead of one page.
+        """
+        worker = self.worker_id
+        try:
+            if full and self.stream_directory:
+                first = True
+
+                def on_page(result: dict):
+                    nonlocal first
+                    self._remember(worker, path, result, first)
+                    first = False
+
+                await self.stream_directory(path, 0, "", on_page)
+            elif self.fetch_directory:
+                result = await self.fetch_directory(path, 0)
+                self._remember(worker, path, result, first=True)
         except Exception as e:
-            col.set_error(str(e))
+            logging.debug(f"Prefetch of {path} failed: {e}")
 
     def _load_more(self, col: MillerColumn):
         """Load more entries for a column (pagination).
@@ -497,16 +751,23 @@ class MillerColumns(Widget):
         Args:
             col: The column to load more entries for.
         """
-        if not self.fetch_directory or not col.has_more:
+        if not (self.fetch_directory or self.stream_directory) or not col.has_more:
             return
 
-        # Current offset is the number of entries already loaded
-        offset = len(col.entries)
+        # Continue where the worker said the last page ended; older workers
+        # don't say, so fall back to the number of entries already loaded
+        offset = col.next_offset
+        if offset is None:
+            offset = len(col.entries)
         asyncio.create_task(self._fetch_more(col, offset))
 
     async def _fetch_more(self, col: MillerColumn, offset: int):
         """Fetch more entries for pagination."""
         try:
+            if self.stream_directory:
+                await self._stream_into(col, col.path, offset, replace=False)
+                return
+
             result = await self.fetch_directory(col.path, offset)
 
             if result is None:
@@ -515,18 +776,12 @@ class MillerColumns(Widget):
             if "error" in result:
                 return
 
-            new_entries = [
-                FileEntry(
-                    name=e["name"],
-                    type=e["type"],
-                    size=e.get("size", 0),
-                    modified=e.get("modified", 0),
-                    path=e.get("actual_path") or f"{col.path.rstrip('/')}/{e['name']}",
-                )
-                for e in result.get("entries", [])
-            ]
+            self._remember(self.worker_id, col.path, result, first=False)
+
+            new_entries = self._entries_from(result, col.path)
 
             col.append_entries(new_entries, result.get("has_more", False))
+            col.next_offset = result.get("next_offset")
 
         except Exception as e:
             pass  # Silently fail for pagination errors
@@ -580,6 +835,7 @@ class MillerColumns(Widget):
             entry = item.entry
             self.current_path = entry.path
             self.post_message(self.PathChanged(entry.path, entry))
+            self._schedule_prefetch(col)
 
     def action_column_left(self):
         """Move focus to the previous column."""
@@ -648,6 +904,8 @@ class MillerColumns(Widget):
         """Refresh the current column."""
         col = self.columns[self.active_column]
         if col.path:
+            if self.listing_cache is not None:
+                self.listing_cache.invalidate(self.worker_id, col.path)
             self._load_column(self.active_column, col.path)
 
     def get_selected_entry(self) -> Optional[FileEntry]:
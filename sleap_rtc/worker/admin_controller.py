@@ -54,6 +54,9 @@ class AdminController:
         self._pending_verifications: Dict[str, asyncio.Event] = {}
         self._verification_counter = 0
 
+        # Last CRDT state vector each worker acknowledged (delta broadcasts)
+        self._peer_state_vectors: Dict[str, bytes] = {}
+
     @staticmethod
     def elect_admin(workers: Dict[str, Dict[str, Any]]) -> str:
         """Deterministically elect admin from available workers.
@@ -315,6 +318,7 @@ class AdminController:
             departed_peer_id: peer_id of the departed worker
         """
         logger.info(f"Worker departed: {departed_peer_id}")
+        self._peer_state_vectors.pop(departed_peer_id, None)
 
         # Check if this was the admin
         if departed_peer_id == self.admin_peer_id:
@@ -387,10 +391,13 @@ class AdminController:
     async def broadcast_state_update(self) -> None:
         """Broadcast CRDT state update to all connected workers.
 
-        Only called if this worker is the admin. Sends CRDT update
-        to all workers in the mesh so they can merge state changes.
-
-        Implemented in Phase 4.
+        Only called if this worker is the admin. Each worker receives only
+        the changes since the state vector it last acknowledged, as a binary
+        CRDT frame. Workers that have not acknowledged a state vector yet
+        (first sync, older workers, or after a resync request) receive the
+        full document as a base64 state_broadcast message, which every
+        worker version understands; the "_delta" marker in it tells newer
+        workers to acknowledge so later broadcasts can be deltas.
         """
         import base64
 
@@ -398,37 +405,70 @@ class AdminController:
             logger.warning("Cannot broadcast state: not admin")
             return
 
-        # Get current CRDT state
-        state = self.crdt_state.get_state()
-        version = state.get("version", 0)
-
-        # Serialize CRDT to binary and base64 encode for JSON transport
-        crdt_binary = self.crdt_state.serialize()
-        crdt_b64 = base64.b64encode(crdt_binary).decode("utf-8")
-
-        logger.debug(f"Broadcasting state update (version {version}) to all workers")
-
         # Import here to avoid circular dependency
         from sleap_rtc.worker.mesh_messages import (
+            CRDT_FRAME_UPDATE,
             create_state_broadcast,
-            serialize_message,
+            encode_crdt_frame,
         )
 
-        # Create broadcast message with base64-encoded CRDT binary
-        message = create_state_broadcast(
-            from_peer_id=self.worker.peer_id,
-            crdt_snapshot={"_crdt_b64": crdt_b64},  # Wrap in dict with marker
-            version=version,
-        )
+        version = self.crdt_state.get_version()
+        logger.debug(f"Broadcasting state update (version {version}) to all workers")
 
-        # Send to all connected workers
+        snapshot_message = None
         for peer_id in list(self.worker.worker_connections.keys()):
-            if peer_id != self.worker.peer_id:  # Don't send to self
+            if peer_id == self.worker.peer_id:  # Don't send to self
+                continue
+
+            message = None
+            state_vector = self._peer_state_vectors.get(peer_id)
+            if state_vector is not None:
                 try:
-                    self.worker._send_mesh_message_to_peer(peer_id, message)
-                    logger.debug(f"Sent state broadcast to {peer_id}")
-                except Exception as e:
-                    logger.error(f"Failed to broadcast to {peer_id}: {e}")
+                    update = self.crdt_state.get_update_since(state_vector)
+                    message = encode_crdt_frame(CRDT_FRAME_UPDATE, update)
+                except ValueError:
+                    logger.warning(
+                        f"Undecodable state vector from {peer_id}; "
+                        "sending full snapshot"
+                    )
+                    del self._peer_state_vectors[peer_id]
+
+            if message is None:
+                if snapshot_message is None:
+                    # Serialize CRDT to binary and base64 encode for JSON
+                    crdt_b64 = base64.b64encode(self.crdt_state.serialize()).decode(
+                        "utf-8"
+                    )
+                    snapshot_message = create_state_broadcast(
+                        from_peer_id=self.worker.peer_id,
+                        crdt_snapshot={"_crdt_b64": crdt_b64, "_delta": True},
+                        version=version,
+                    )
+                message = snapshot_message
+
+            try:
+                self.worker._send_mesh_message_to_peer(peer_id, message)
+                logger.debug(f"Sent state broadcast to {peer_id}")
+            except Exception as e:
+                logger.error(f"Failed to broadcast to {peer_id}: {e}")
+
+    async def on_state_ack(self, peer_id: str, state_vector: bytes) -> None:
+        """Record the CRDT state a worker acknowledged.
+
+        Args:
+            peer_id: Acknowledging worker's peer_id
+            state_vector: Worker's CRDT state vector after its last update.
+                Empty if the worker could not apply an update and needs a
+                full snapshot, which is sent right away.
+        """
+        if state_vector:
+            self._peer_state_vectors[peer_id] = state_vector
+            return
+
+        logger.info(f"Worker {peer_id} requested a full CRDT snapshot")
+        self._peer_state_vectors.pop(peer_id, None)
+        if self.is_admin:
+            await self.broadcast_state_update()
 
     async def handle_client_query(self, query: Dict[str, Any]) -> Dict[str, Any]:
         """Handle client query for worker discovery.
@@ -5,6 +5,7 @@ and resource utilization reporting for SLEAP-RTC workers.
 """
 
 import logging
+import os
 from typing import Any, Dict, List, Optional
 
 
@@ -19,6 +20,8 @@ class WorkerCapabilities:
         gpu_memory_mb: Total GPU memory in megabytes.
         gpu_model: GPU model name (e.g., "NVIDIA RTX 3090").
         cuda_version: CUDA version string (e.g., "11.8").
+        gpu_devices: CUDA device identifiers visible to the worker, as they
+            would be written to ``CUDA_VISIBLE_DEVICES``.
         supported_models: List of supported model types.
         supported_job_types: List of supported job types.
         status: Current worker status ("available", "busy", "reserved").
@@ -43,6 +46,7 @@ class WorkerCapabilities:
         self.gpu_memory_mb = self._detect_gpu_memory()
         self.gpu_model = self._detect_gpu_model()
         self.cuda_version = self._detect_cuda_version()
+        self.gpu_devices = self._detect_gpu_devices()
         self.supported_models = supported_models or ["base", "centroid", "topdown"]
         self.supported_job_types = supported_job_types or ["training", "inference"]
         self.status = "available"  # Managed by StateManager, but read here
@@ -119,6 +123,30 @@ class WorkerCapabilities:
             logging.warning(f"Failed to detect CUDA version: {e}")
         return "N/A"
 
+    def _detect_gpu_devices(self) -> List[str]:
+        """Detect the CUDA devices this worker may hand out to jobs.
+
+        Respects an existing ``CUDA_VISIBLE_DEVICES`` so a worker confined to
+        some GPUs only schedules jobs on those.
+
+        Returns:
+            Device identifiers, or an empty list if no GPU is available.
+        """
+        count = 0
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                count = torch.cuda.device_count()
+        except (ImportError, RuntimeError) as e:
+            logging.warning(f"Failed to detect GPU count: {e}")
+
+        visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+        if visible is not None:
+            devices = [d.strip() for d in visible.split(",") if d.strip()]
+            return devices[:count] if count else []
+        return [str(i) for i in range(count)]
+
     def check_job_compatibility(self, request: Dict) -> bool:
         """Check if this worker can handle the job.
 
@@ -233,6 +261,7 @@ class WorkerCapabilities:
             "gpu_memory_mb": self.gpu_memory_mb,
             "gpu_model": self.gpu_model,
             "cuda_version": self.cuda_version,
+            "gpu_count": len(self.gpu_devices),
             "supported_models": self.supported_models,
             "supported_job_types": self.supported_job_types,
         }
@@ -6,15 +6,59 @@ document tracks all workers, their metadata, status, and the current admin worke
 
 The CRDT structure mirrors the existing worker metadata format for backwards
 compatibility and uses pycrdt's Yrs-backed CRDTs for automatic conflict resolution.
+
+Each worker is a nested map (worker → metadata → properties), so a status or
+heartbeat change writes a single field and concurrent changes to different
+fields of one worker merge instead of overwriting each other. Documents
+written by older workers store each worker as a JSON string; those records
+are still read, and converted to nested maps the first time they are
+updated.
+
+Worker reads are served from cached plain dicts. A deep observer on the
+root map marks the workers touched by each change (local or from an applied
+update), and only those are re-read on the next access. pycrdt stores
+numbers as doubles, so integral numbers are turned back into ints.
 """
 
 import json
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 from pycrdt import Doc, Map
 
 
+def _ints(value: Any) -> Any:
+    """Turn integral floats (pycrdt stores all numbers as doubles) into ints."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, dict):
+        return {k: _ints(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_ints(v) for v in value]
+    return value
+
+
+def _load_worker(value: Any) -> Dict[str, Any]:
+    """Convert a stored worker record (nested map or legacy JSON) to a dict."""
+    if isinstance(value, str):
+        return json.loads(value)
+    if isinstance(value, Map):
+        value = value.to_py()
+    return _ints(value)
+
+
+def _worker_map(worker: Dict[str, Any]) -> Map:
+    """Build the nested map stored for a worker record."""
+    metadata = dict(worker.get("metadata") or {})
+    properties = metadata.pop("properties", None) or {}
+    return Map(
+        {
+            **{k: v for k, v in worker.items() if k != "metadata"},
+            "metadata": Map({**metadata, "properties": Map(properties)}),
+        }
+    )
+
+
 class RoomStateCRDT:
     """Conflict-free replicated data type for room-level worker registry.
 
@@ -42,6 +86,12 @@ class RoomStateCRDT:
         self.room_id = room_id
         self.doc = doc
 
+        # Cached plain-dict worker records; see _get_workers()
+        self._workers: Dict[str, Dict[str, Any]] = {}
+        self._workers_stale = True
+        self._dirty_workers: Set[str] = set()
+        self._subscription = self._get_root().observe_deep(self._on_change)
+
     @classmethod
     def create(
         cls, room_id: str, creator_peer_id: Optional[str] = None
@@ -93,6 +143,29 @@ class RoomStateCRDT:
         """
         return self.doc.get_update()
 
+    def get_state_vector(self) -> bytes:
+        """Get the state vector of the CRDT document.
+
+        Returns:
+            Encoded state vector identifying the updates this document holds
+        """
+        return self.doc.get_state()
+
+    def get_update_since(self, state_vector: bytes) -> bytes:
+        """Get the changes a document with the given state vector is missing.
+
+        Args:
+            state_vector: State vector from the other document's
+                get_state_vector()
+
+        Returns:
+            Binary CRDT update to pass to the other document's apply_update()
+
+        Raises:
+            ValueError: If state_vector cannot be decoded
+        """
+        return self.doc.get_update(state_vector)
+
     def merge(self, other: "RoomStateCRDT") -> None:
         """Merge another CRDT document into this one.
 
@@ -120,6 +193,45 @@ class RoomStateCRDT:
         """Get the root state map."""
         return self.doc.get("state", type=Map)
 
+    def _on_change(self, events) -> None:
+        """Mark the cached worker records a document change touched."""
+        for event in events:
+            path = event.path
+            if not path:
+                if "workers" in event.keys:
+                    self._workers_stale = True
+            elif len(path) == 1:
+                # Workers added, removed or replaced
+                self._dirty_workers.update(event.keys)
+            else:
+                self._dirty_workers.add(path[1])
+
+    def _get_workers(self) -> Dict[str, Dict[str, Any]]:
+        """Get cached worker records, re-reading only changed workers.
+
+        The returned dicts are shared between callers and must not be
+        modified.
+        """
+        if not self._workers_stale and not self._dirty_workers:
+            return self._workers
+
+        workers = self._get_root().get("workers")
+        if not isinstance(workers, Map):
+            self._workers = {}
+        elif self._workers_stale:
+            self._workers = {
+                peer_id: _load_worker(workers[peer_id]) for peer_id in workers
+            }
+        else:
+            for peer_id in self._dirty_workers:
+                if peer_id in workers:
+                    self._workers[peer_id] = _load_worker(workers[peer_id])
+                else:
+                    self._workers.pop(peer_id, None)
+        self._workers_stale = False
+        self._dirty_workers.clear()
+        return self._workers
+
     def get_state(self) -> Dict[str, Any]:
         """Get the current state as a dictionary.
 
@@ -127,30 +239,35 @@ class RoomStateCRDT:
             Dictionary containing room_id, workers, admin_peer_id, and version
         """
         root = self._get_root()
-        if root is None:
-            return {"room_id": "", "workers": {}, "admin_peer_id": "", "version": 0}
-
-        workers_map = root.get("workers")
-        workers_dict = {}
-
-        # Convert pycrdt Map to Python dict
-        if workers_map is not None and isinstance(workers_map, Map):
-            for peer_id in workers_map:
-                worker_data = workers_map[peer_id]
-                if isinstance(worker_data, str):
-                    # Stored as JSON string
-                    workers_dict[peer_id] = json.loads(worker_data)
-                else:
-                    workers_dict[peer_id] = worker_data
-
         admin_id = root.get("admin_peer_id", "")
         return {
             "room_id": root.get("room_id", ""),
-            "workers": workers_dict,
+            "workers": dict(self._get_workers()),
             "admin_peer_id": admin_id if admin_id else None,
-            "version": root.get("version", 0),
+            "version": _ints(root.get("version", 0)),
         }
 
+    def _get_properties(self, workers: Map, peer_id: str) -> Optional[Map]:
+        """Get a worker's properties map, creating missing levels.
+
+        Legacy JSON-string records are converted to nested maps. Must be
+        called inside a transaction.
+        """
+        if peer_id not in workers:
+            return None
+        worker = workers[peer_id]
+        if not isinstance(worker, Map):
+            worker = _load_worker(worker)
+            workers[peer_id] = _worker_map(worker)
+            worker = workers[peer_id]
+
+        if not isinstance(worker.get("metadata"), Map):
+            worker["metadata"] = Map({"properties": Map()})
+        metadata = worker["metadata"]
+        if not isinstance(metadata.get("properties"), Map):
+            metadata["properties"] = Map()
+        return metadata["properties"]
+
     def add_worker(
         self, peer_id: str, metadata: Dict[str, Any], is_admin: bool = False
     ) -> None:
@@ -180,8 +297,7 @@ class RoomStateCRDT:
             # Create worker entry
             worker_data = {"peer_id": peer_id, "role": "worker", "metadata": metadata}
 
-            # Store as JSON string
-            workers[peer_id] = json.dumps(worker_data)
+            workers[peer_id] = _worker_map(worker_data)
 
             # Update admin if this is the admin worker
             if is_admin:
@@ -191,7 +307,11 @@ class RoomStateCRDT:
             root["version"] = root.get("version", 0) + 1
 
     def update_worker_status(
-        self, peer_id: str, status: str, current_job: Optional[str] = None
+        self,
+        peer_id: str,
+        status: str,
+        current_job: Optional[str] = None,
+        properties: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Update a worker's status.
 
@@ -199,6 +319,7 @@ class RoomStateCRDT:
             peer_id: Worker to update
             status: New status (available, busy, reserved, maintenance)
             current_job: Optional current job identifier
+            properties: Optional extra properties to set (e.g. queue depth)
         """
         with self.doc.transaction():
             root = self._get_root()
@@ -206,28 +327,17 @@ class RoomStateCRDT:
                 return
 
             workers = root.get("workers")
-            if not isinstance(workers, Map) or peer_id not in workers:
+            if not isinstance(workers, Map):
+                return
+            props = self._get_properties(workers, peer_id)
+            if props is None:
                 return
 
-            # Load existing worker data
-            worker_json = workers[peer_id]
-            worker = (
-                json.loads(worker_json) if isinstance(worker_json, str) else worker_json
-            )
-
-            # Update status fields
-            if "metadata" not in worker:
-                worker["metadata"] = {}
-            if "properties" not in worker["metadata"]:
-                worker["metadata"]["properties"] = {}
-
-            properties = worker["metadata"]["properties"]
-            properties["status"] = status
-            properties["current_job"] = current_job
-            properties["last_heartbeat"] = int(time.time() * 1000)
-
-            # Store updated worker
-            workers[peer_id] = json.dumps(worker)
+            for key, value in (properties or {}).items():
+                props[key] = value
+            props["status"] = status
+            props["current_job"] = current_job
+            props["last_heartbeat"] = int(time.time() * 1000)
             root["version"] = root.get("version", 0) + 1
 
     def update_worker_heartbeat(self, peer_id: str) -> None:
@@ -242,25 +352,13 @@ class RoomStateCRDT:
                 return
 
             workers = root.get("workers")
-            if not isinstance(workers, Map) or peer_id not in workers:
+            if not isinstance(workers, Map):
+                return
+            properties = self._get_properties(workers, peer_id)
+            if properties is None:
                 return
 
-            # Load existing worker data
-            worker_json = workers[peer_id]
-            worker = (
-                json.loads(worker_json) if isinstance(worker_json, str) else worker_json
-            )
-
-            # Update heartbeat
-            if "metadata" not in worker:
-                worker["metadata"] = {}
-            if "properties" not in worker["metadata"]:
-                worker["metadata"]["properties"] = {}
-
-            worker["metadata"]["properties"]["last_heartbeat"] = int(time.time() * 1000)
-
-            # Store updated worker
-            workers[peer_id] = json.dumps(worker)
+            properties["last_heartbeat"] = int(time.time() * 1000)
             root["version"] = root.get("version", 0) + 1
 
     def remove_worker(self, peer_id: str) -> None:
@@ -296,20 +394,10 @@ class RoomStateCRDT:
             workers = root.get("workers")
             if isinstance(workers, Map):
                 for worker_id in list(workers.keys()):
-                    worker_json = workers[worker_id]
-                    worker = (
-                        json.loads(worker_json)
-                        if isinstance(worker_json, str)
-                        else worker_json
-                    )
-
-                    if "metadata" not in worker:
-                        worker["metadata"] = {}
-                    if "properties" not in worker["metadata"]:
-                        worker["metadata"]["properties"] = {}
-
-                    worker["metadata"]["properties"]["is_admin"] = worker_id == peer_id
-                    workers[worker_id] = json.dumps(worker)
+                    properties = self._get_properties(workers, worker_id)
+                    is_admin = worker_id == peer_id
+                    if properties.get("is_admin") != is_admin:
+                        properties["is_admin"] = is_admin
 
             root["version"] = root.get("version", 0) + 1
 
@@ -319,10 +407,7 @@ class RoomStateCRDT:
         Returns:
             Admin peer_id or None if no admin set
         """
-        root = self._get_root()
-        if root is None:
-            return None
-        admin_id = root.get("admin_peer_id", "")
+        admin_id = self._get_root().get("admin_peer_id", "")
         return admin_id if admin_id else None
 
     def get_worker(self, peer_id: str) -> Optional[Dict[str, Any]]:
@@ -332,41 +417,17 @@ class RoomStateCRDT:
             peer_id: Worker to retrieve
 
         Returns:
-            Worker data dictionary or None if not found
+            Worker data dictionary (shared, do not modify) or None if not found
         """
-        root = self._get_root()
-        if root is None:
-            return None
-
-        workers = root.get("workers")
-        if not isinstance(workers, Map) or peer_id not in workers:
-            return None
-
-        worker_json = workers[peer_id]
-        return json.loads(worker_json) if isinstance(worker_json, str) else worker_json
+        return self._get_workers().get(peer_id)
 
     def get_all_workers(self) -> Dict[str, Dict[str, Any]]:
         """Get all workers in the room.
 
         Returns:
-            Dictionary mapping peer_id to worker data
+            Dictionary mapping peer_id to worker data (shared, do not modify)
         """
-        root = self._get_root()
-        if root is None:
-            return {}
-
-        workers = root.get("workers")
-        if not isinstance(workers, Map):
-            return {}
-
-        result = {}
-        for peer_id in workers:
-            worker_json = workers[peer_id]
-            result[peer_id] = (
-                json.loads(worker_json) if isinstance(worker_json, str) else worker_json
-            )
-
-        return result
+        return dict(self._get_workers())
 
     def get_available_workers(self) -> Dict[str, Dict[str, Any]]:
         """Get all workers with status 'available'.
@@ -374,10 +435,9 @@ class RoomStateCRDT:
         Returns:
             Dictionary mapping peer_id to worker data for available workers
         """
-        all_workers = self.get_all_workers()
         return {
             peer_id: worker
-            for peer_id, worker in all_workers.items()
+            for peer_id, worker in self._get_workers().items()
             if worker.get("metadata", {}).get("properties", {}).get("status")
             == "available"
         }
@@ -388,7 +448,4 @@ class RoomStateCRDT:
         Returns:
             Document version number
         """
-        root = self._get_root()
-        if root is None:
-            return 0
-        return root.get("version", 0)
+        return _ints(self._get_root().get("version", 0))
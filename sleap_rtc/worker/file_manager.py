@@ -7,23 +7,49 @@ and filesystem browsing for SLEAP-RTC workers.
 import asyncio
 import fnmatch
 import hashlib
+import json
 import logging
 import os
 import shutil
+import stat
 import time
+import zlib
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from aiortc import RTCDataChannel
 
+from sleap_rtc.compression import ChunkEncoder, choose_codec, decode_chunk
+from sleap_rtc.delta_sync import choose_block_size, compute_signature
 from sleap_rtc.protocol import (
+    MSG_FILE_META_COMPRESSED,
+    MSG_FILE_META_STRIPED,
     MSG_FILE_UPLOAD_CACHE_HIT,
     MSG_FILE_UPLOAD_COMPLETE,
     MSG_FILE_UPLOAD_ERROR,
+    MSG_FILE_UPLOAD_OFFSET,
     MSG_FILE_UPLOAD_PROGRESS,
     MSG_FILE_UPLOAD_READY,
+    MSG_FILE_UPLOAD_SIGNATURE,
     MSG_SEPARATOR,
 )
+from sleap_rtc.striping import (
+    STRIPE_DRAIN_TIMEOUT,
+    StripeReassembler,
+    log_transfer_rate,
+    send_striped,
+)
+from sleap_rtc.worker.filename_index import FilenameIndex, MountIndex
+from sleap_rtc.worker.fs_walk import walk
+from sleap_rtc.worker.listing_cache import ListingCache
+from sleap_rtc.worker.slp_metadata import (
+    SlpHeaderCache,
+    patch_video_paths,
+    paths_exist,
+    video_entry_embedded,
+    video_entry_path,
+)
+from sleap_rtc.worker.upload_store import UploadStore
 
 # Import sleap_io for SLP file operations (lazy import to avoid startup cost)
 try:
@@ -37,6 +63,15 @@ except ImportError:
     HDF5Video = None
 
 
+def _sha256_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in 1 MB blocks."""
+    sha256_ctx = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(1024 * 1024):
+            sha256_ctx.update(chunk)
+    return sha256_ctx.hexdigest()
+
+
 class FileManager:
     """Manages file transfer, compression, and filesystem browsing for worker nodes.
 
@@ -57,12 +92,27 @@ class FileManager:
     SEARCH_TIMEOUT = 10.0  # seconds
     MAX_SEARCH_DEPTH = 5
     MIN_PATTERN_CHARS = 3
+    # Largest FS_LIST_DIR page; streamed listings are sent in pages this size
+    LIST_PAGE_MAX = 200
+
+    # Resumable uploads checkpoint the partial file every UPLOAD_BLOCK_SIZE bytes
+    UPLOAD_BLOCK_SIZE = 8 * 1024 * 1024
+    UPLOAD_PART_SUFFIX = ".part"
+    UPLOAD_SIDECAR_SUFFIX = ".part.json"
+
+    # Delta uploads publish the basis signature in pages of this many blocks
+    DELTA_SIGNATURE_PAGE = 1024
 
     def __init__(
         self,
         chunk_size: int = 32 * 1024,
         mounts: list = None,
         working_dir: str = None,
+        upload_cache_dir: str = None,
+        upload_cache_max_bytes: int = 0,
+        filename_index_dir: str = None,
+        filename_index_refresh: float = 0,
+        client_key: Optional[Callable[[RTCDataChannel], Optional[str]]] = None,
     ):
         """Initialize file manager.
 
@@ -70,6 +120,17 @@ class FileManager:
             chunk_size: Size of chunks for file transfer (default 32KB).
             mounts: List of MountConfig objects for filesystem browsing.
             working_dir: Worker's current working directory.
+            upload_cache_dir: Directory of the persistent upload store. None
+                keeps the upload cache in memory only.
+            upload_cache_max_bytes: Byte budget of the persistent upload store;
+                0 disables it.
+            filename_index_dir: Directory where mount filename indexes are
+                saved between restarts.
+            filename_index_refresh: Seconds between background rescans of the
+                mounts for the filename index; 0 disables the index.
+            client_key: Maps a data channel to the client it belongs to, so
+                uploads, stripe channels and the download codec are kept per
+                client. None treats every channel as one client's.
         """
         self.chunk_size = chunk_size
         self.save_dir = "."
@@ -81,14 +142,99 @@ class FileManager:
         # Client-to-worker upload state
         # Maps sha256 hex → absolute path for files received this session.
         self._upload_cache: Dict[str, str] = {}
-        # Holds state for an in-progress upload (one at a time).
-        self._upload_session: Optional[dict] = None
+        self.client_key = client_key
+        # In-progress upload of each client (one at a time per client).
+        self._upload_sessions: Dict[Optional[str], dict] = {}
+        # Maps basis sha256 hex → {"block_size": int, "blocks": [...]} so a
+        # basis file is only checksummed once for repeated delta uploads.
+        self._delta_signatures: Dict[str, dict] = {}
+        # Content-addressed copies of past uploads that survive restarts.
+        self.upload_store: Optional[UploadStore] = None
+        if upload_cache_dir and upload_cache_max_bytes > 0:
+            try:
+                self.upload_store = UploadStore(
+                    upload_cache_dir, upload_cache_max_bytes
+                )
+            except OSError as e:
+                logging.warning(f"Persistent upload cache disabled: {e}")
+        # Background-built index of mount filenames (filename_index.py) used
+        # by resolve_path and directory lookups. None walks the mounts.
+        self.filename_index: Optional[FilenameIndex] = None
+        # Sorted directory snapshots reused across list_directory pages.
+        self._listing_cache = ListingCache()
+        # Video lists of SLP files, reused until the file changes.
+        self._slp_headers = SlpHeaderCache()
+        if filename_index_refresh > 0:
+            self.filename_index = FilenameIndex(
+                [mount.path for mount in self.mounts],
+                filename_index_dir,
+                filename_index_refresh,
+            )
+            self.filename_index.start()
+        # Stripe data channels opened by each client (striping.py).
+        self._stripe_channels: Dict[Optional[str], List[RTCDataChannel]] = {}
+        # Codec for files sent to each client, set when it announces
+        # TRANSFER_CODECS (compression.py). Clients without one get files
+        # uncompressed.
+        self._download_codecs: Dict[Optional[str], str] = {}
+
+    def _client(self, channel: Optional[RTCDataChannel]) -> Optional[str]:
+        """Return the key of the client a channel belongs to."""
+        if channel is None or self.client_key is None:
+            return None
+        return self.client_key(channel)
+
+    def add_stripe_channel(self, channel: RTCDataChannel) -> None:
+        """Register a stripe channel opened by a client."""
+        self._stripe_channels.setdefault(self._client(channel), []).append(channel)
+
+    def remove_stripe_channel(self, channel: RTCDataChannel) -> None:
+        """Forget a stripe channel that closed."""
+        for client, stripes in list(self._stripe_channels.items()):
+            if channel in stripes:
+                stripes.remove(channel)
+                if not stripes:
+                    del self._stripe_channels[client]
+
+    def set_download_codec(self, channel: RTCDataChannel, codec: Optional[str]) -> None:
+        """Set the codec for files sent to the client owning ``channel``.
+
+        Args:
+            channel: Channel the client announced TRANSFER_CODECS on.
+            codec: Negotiated codec, or None to send files uncompressed.
+        """
+        client = self._client(channel)
+        if codec:
+            self._download_codecs[client] = codec
+        else:
+            self._download_codecs.pop(client, None)
+
+    def forget_client(self, client: Optional[str] = None) -> None:
+        """Drop the upload, stripe channels and codec of a client that left.
+
+        Args:
+            client: Key of the client, as returned by ``client_key``.
+        """
+        self.abandon_upload_session(client)
+        self._stripe_channels.pop(client, None)
+        self._download_codecs.pop(client, None)
+
+    def _open_stripes(self, client: Optional[str] = None) -> List[RTCDataChannel]:
+        """Return a client's stripe channels that are currently open."""
+        return [
+            c for c in self._stripe_channels.get(client, []) if c.readyState == "open"
+        ]
 
     async def send_file(
         self, channel: RTCDataChannel, file_path: str, output_dir: str = ""
     ):
         """Send a file to client via RTC data channel.
 
+        If the client owning ``channel`` opened stripe channels, the file data
+        is spread across them (FILE_META_STRIPED); otherwise it is sent on
+        ``channel``, compressed (FILE_META_COMPRESSED) if the client announced
+        a codec.
+
         Args:
             channel: RTC data channel for sending file.
             file_path: Path to file to send.
@@ -100,10 +246,40 @@ class FileManager:
 
         file_name = os.path.basename(file_path)
         file_size = os.path.getsize(file_path)
+        output_hint = output_dir or self.output_dir
+        started = time.monotonic()
+        client = self._client(channel)
+
+        stripes = self._open_stripes(client)
+        if stripes:
+            channel.send(
+                f"{MSG_FILE_META_STRIPED}::{file_name}:{file_size}:{output_hint}"
+            )
+            logging.info(
+                f"Sending file: {file_name} ({file_size} bytes) "
+                f"across {len(stripes)} stripes"
+            )
+            try:
+                with open(file_path, "rb") as file:
+                    await send_striped(stripes, file)
+            except ConnectionError as e:
+                logging.error(f"Striped send of {file_name} failed: {e}")
+                return
+            channel.send("END_OF_FILE")
+            log_transfer_rate(f"Sent {file_name}", file_size, started, len(stripes))
+            return
 
         # Send file metadata
-        output_hint = output_dir or self.output_dir
-        channel.send(f"FILE_META::{file_name}:{file_size}:{output_hint}")
+        encoder = None
+        codec = self._download_codecs.get(client)
+        if codec:
+            encoder = ChunkEncoder(codec)
+            channel.send(
+                f"{MSG_FILE_META_COMPRESSED}::{file_name}:{file_size}:{output_hint}"
+                f":{codec}"
+            )
+        else:
+            channel.send(f"FILE_META::{file_name}:{file_size}:{output_hint}")
         logging.info(f"Sending file: {file_name} ({file_size} bytes)")
 
         # Send file in chunks
@@ -117,12 +293,15 @@ class FileManager:
                 ):
                     await asyncio.sleep(0.1)
 
-                channel.send(chunk)
+                channel.send(encoder.encode(chunk) if encoder else chunk)
                 bytes_sent += len(chunk)
 
         # Signal end of file
         channel.send("END_OF_FILE")
         logging.info("File sent successfully")
+        if encoder:
+            encoder.log_ratio(f"Sent {file_name}")
+        log_transfer_rate(f"Sent {file_name}", file_size, started)
 
     async def zip_results(self, file_name: str, dir_path: Optional[str] = None):
         """Zip directory contents into archive.
@@ -182,6 +361,9 @@ class FileManager:
     def check_upload_cache(self, sha256: str, filename: str) -> Optional[str]:
         """Check whether a previously-uploaded file is still on disk.
 
+        Consults this session's uploads first, then the persistent upload
+        store for an unmodified copy placed by an earlier session.
+
         Args:
             sha256: SHA-256 hex digest of the file to look up.
             filename: Filename (unused; reserved for future logging/hints).
@@ -196,60 +378,612 @@ class FileManager:
         # Remove stale entry so subsequent uploads repopulate it.
         if sha256 in self._upload_cache:
             del self._upload_cache[sha256]
+
+        if self.upload_store is not None:
+            placed = self.upload_store.find_placed_path(sha256)
+            if placed and self._is_path_allowed(Path(placed)):
+                self._upload_cache[sha256] = placed
+                return placed
         return None
 
-    async def start_upload_session(
+    async def place_cached_upload(
+        self, sha256: str, filename: str, dest_dir: str, create_subdir: str
+    ) -> Optional[str]:
+        """Link a stored upload into the directory the client asked for.
+
+        Used when the persistent store holds the content but no unmodified
+        placed copy of it is left, so the client does not have to re-send it.
+
+        Args:
+            sha256: SHA-256 hex digest of the file.
+            filename: Base filename to place it under.
+            dest_dir: Absolute destination directory path on the worker.
+            create_subdir: "1" to place it in a sleap_rtc_downloads/ subfolder.
+
+        Returns:
+            Absolute path of the placed file, or None if it could not be placed.
+        """
+        if self.upload_store is None:
+            return None
+        dest_path = Path(dest_dir)
+        if not self._is_path_allowed(dest_path):
+            return None
+        if create_subdir == "1":
+            dest_path = dest_path / "sleap_rtc_downloads"
+
+        target = dest_path / filename
+        loop = asyncio.get_running_loop()
+        try:
+            dest_path.mkdir(parents=True, exist_ok=True)
+            placed = await loop.run_in_executor(
+                None, self.upload_store.place, sha256, target
+            )
+        except OSError as e:
+            logging.warning(f"Could not place cached upload at {target}: {e}")
+            return None
+        if not placed:
+            return None
+        self._remember_upload(sha256, str(target))
+        return str(target)
+
+    def _remember_upload(self, sha256: str, path: str) -> None:
+        """Point the in-memory cache at ``path``, dropping stale entries for it."""
+        for stale_sha, stale_path in list(self._upload_cache.items()):
+            if stale_path == path:
+                del self._upload_cache[stale_sha]
+                self._delta_signatures.pop(stale_sha, None)
+        self._upload_cache[sha256] = path
+
+    def _resolve_upload_dest(
+        self, channel: RTCDataChannel, dest_dir: str, create_subdir: str
+    ) -> Optional[Path]:
+        """Validate an upload destination and create the subfolder if requested.
+
+        Sends FILE_UPLOAD_ERROR on failure.
+
+        Args:
+            channel: RTC data channel to send errors on.
+            dest_dir: Absolute destination directory path on the worker.
+            create_subdir: "1" to create a sleap_rtc_downloads/ subfolder,
+                "0" to write directly into dest_dir.
+
+        Returns:
+            Directory the file should be written into, or None on failure.
+        """
+        dest_path = Path(dest_dir)
+
+        # Security: destination must resolve within a configured mount.
+        if not self._is_path_allowed(dest_path):
+            channel.send(
+                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
+                "Destination outside configured mounts"
+            )
+            return None
+
+        if create_subdir == "1":
+            dest_path = dest_path / "sleap_rtc_downloads"
+            try:
+                dest_path.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                channel.send(
+                    f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
+                    f"Cannot create sleap_rtc_downloads/: {e}"
+                )
+                return None
+
+        return dest_path
+
+    async def start_upload_session(
+        self,
+        channel: RTCDataChannel,
+        filename: str,
+        total_bytes: int,
+        dest_dir: str,
+        create_subdir: str,
+        codecs: str = "",
+    ) -> None:
+        """Validate destination, open write handle, and signal readiness.
+
+        Sends FILE_UPLOAD_READY[::{codec}] on success or FILE_UPLOAD_ERROR on
+        failure.
+
+        Args:
+            channel: RTC data channel to send responses on.
+            filename: Base filename of the incoming file.
+            total_bytes: Expected total file size in bytes.
+            dest_dir: Absolute destination directory path on the worker.
+            create_subdir: "1" to create a sleap_rtc_downloads/ subfolder,
+                "0" to write directly into dest_dir.
+            codecs: Comma-separated compression codecs offered by the client.
+        """
+        client = self._client(channel)
+        self.abandon_upload_session(client)
+
+        dest_path = self._resolve_upload_dest(channel, dest_dir, create_subdir)
+        if dest_path is None:
+            return
+
+        file_path = dest_path / filename
+
+        try:
+            # Replace rather than truncate: the old file may be a hard link
+            # into the persistent upload store.
+            file_path.unlink(missing_ok=True)
+            file_handle = open(file_path, "wb")  # noqa: WPS515
+        except OSError as e:
+            channel.send(
+                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}Cannot open file for writing: {e}"
+            )
+            return
+
+        session = self._upload_sessions[client] = {
+            "filename": filename,
+            "total_bytes": total_bytes,
+            "file_path": file_path,
+            "file_handle": file_handle,
+            "bytes_received": 0,
+            "channel": channel,
+            "last_progress_time": 0.0,
+            "sha256_ctx": hashlib.sha256(),
+            "mode": "plain",
+            "started": time.monotonic(),
+            "codec": choose_codec(codecs),
+        }
+
+        channel.send(self._with_codec(MSG_FILE_UPLOAD_READY, session))
+        logging.info(
+            f"Upload session started: {filename} ({total_bytes} bytes) → {file_path}"
+        )
+
+    async def start_striped_upload_session(
+        self,
+        channel: RTCDataChannel,
+        filename: str,
+        total_bytes: int,
+        dest_dir: str,
+        create_subdir: str,
+    ) -> None:
+        """Start an upload whose data arrives as frames on stripe channels.
+
+        Sends FILE_UPLOAD_READY on success or FILE_UPLOAD_ERROR on failure.
+
+        Args:
+            channel: RTC data channel to send responses on.
+            filename: Base filename of the incoming file.
+            total_bytes: Expected total file size in bytes.
+            dest_dir: Absolute destination directory path on the worker.
+            create_subdir: "1" to create a sleap_rtc_downloads/ subfolder,
+                "0" to write directly into dest_dir.
+        """
+        client = self._client(channel)
+        self.abandon_upload_session(client)
+
+        if not self._open_stripes(client):
+            channel.send(
+                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}No stripe channels are open"
+            )
+            return
+
+        dest_path = self._resolve_upload_dest(channel, dest_dir, create_subdir)
+        if dest_path is None:
+            return
+
+        file_path = dest_path / filename
+
+        try:
+            # Replace rather than truncate: the old file may be a hard link
+            # into the persistent upload store.
+            file_path.unlink(missing_ok=True)
+            file_handle = open(file_path, "wb")  # noqa: WPS515
+        except OSError as e:
+            channel.send(
+                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}Cannot open file for writing: {e}"
+            )
+            return
+
+        session = self._upload_sessions[client] = {
+            "filename": filename,
+            "total_bytes": total_bytes,
+            "file_path": file_path,
+            "file_handle": file_handle,
+            "bytes_received": 0,
+            "channel": channel,
+            "last_progress_time": 0.0,
+            # Frames arrive out of order, so the file is hashed once complete.
+            "sha256_ctx": None,
+            "reassembler": StripeReassembler(file_handle.fileno(), total_bytes),
+            "mode": "striped",
+            "started": time.monotonic(),
+        }
+
+        channel.send(MSG_FILE_UPLOAD_READY)
+        logging.info(
+            f"Striped upload session started: {filename} ({total_bytes} bytes) "
+            f"→ {file_path}"
+        )
+
+    async def start_resumable_upload_session(
+        self,
+        channel: RTCDataChannel,
+        sha256: str,
+        filename: str,
+        total_bytes: int,
+        dest_dir: str,
+        create_subdir: str,
+        codecs: str = "",
+    ) -> None:
+        """Open (or reopen) a resumable upload and report how much is on disk.
+
+        Data is written to ``{filename}.part`` next to the final destination.
+        After every UPLOAD_BLOCK_SIZE bytes a ``{filename}.part.json`` sidecar
+        records the verified block checksums, so a later call for the same
+        content hash can pick up at the last complete block instead of
+        starting over.
+
+        Sends FILE_UPLOAD_OFFSET::{offset}[::{codec}] on success or
+        FILE_UPLOAD_ERROR on failure.
+
+        Args:
+            channel: RTC data channel to send responses on.
+            sha256: SHA-256 hex digest of the complete file.
+            filename: Base filename of the incoming file.
+            total_bytes: Expected total file size in bytes.
+            dest_dir: Absolute destination directory path on the worker.
+            create_subdir: "1" to create a sleap_rtc_downloads/ subfolder,
+                "0" to write directly into dest_dir.
+            codecs: Comma-separated compression codecs offered by the client.
+        """
+        client = self._client(channel)
+        self.abandon_upload_session(client)
+
+        dest_path = self._resolve_upload_dest(channel, dest_dir, create_subdir)
+        if dest_path is None:
+            return
+
+        file_path = dest_path / filename
+        part_path = dest_path / f"{filename}{self.UPLOAD_PART_SUFFIX}"
+        sidecar_path = dest_path / f"{filename}{self.UPLOAD_SIDECAR_SUFFIX}"
+
+        # Re-verifying the partial file is a sequential read of up to the
+        # whole upload, so keep it off the event loop.
+        loop = asyncio.get_running_loop()
+        offset, sha256_ctx, blocks = await loop.run_in_executor(
+            None,
+            self._load_partial_upload,
+            part_path,
+            sidecar_path,
+            sha256,
+            total_bytes,
+        )
+
+        try:
+            file_handle = open(part_path, "r+b" if offset else "wb")  # noqa: WPS515
+            file_handle.seek(offset)
+            file_handle.truncate()
+        except OSError as e:
+            channel.send(
+                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}Cannot open file for writing: {e}"
+            )
+            return
+
+        session = self._upload_sessions[client] = {
+            "filename": filename,
+            "total_bytes": total_bytes,
+            "file_path": file_path,
+            "file_handle": file_handle,
+            "bytes_received": offset,
+            "channel": channel,
+            "last_progress_time": 0.0,
+            "sha256_ctx": sha256_ctx,
+            "mode": "resumable",
+            "started": time.monotonic(),
+            "start_offset": offset,
+            "expected_sha256": sha256,
+            "part_path": part_path,
+            "sidecar_path": sidecar_path,
+            "blocks": blocks,
+            "block_crc": 0,
+            "block_bytes": 0,
+            "codec": choose_codec(codecs),
+        }
+        if not offset:
+            self._write_upload_sidecar(session)
+
+        channel.send(
+            self._with_codec(
+                f"{MSG_FILE_UPLOAD_OFFSET}{MSG_SEPARATOR}{offset}",
+                session,
+            )
+        )
+        logging.info(
+            f"Resumable upload session started: {filename} "
+            f"({offset}/{total_bytes} bytes already on disk) → {file_path}"
+        )
+
+    def _load_partial_upload(
+        self,
+        part_path: Path,
+        sidecar_path: Path,
+        sha256: str,
+        total_bytes: int,
+    ) -> tuple:
+        """Recover the verified prefix of a partial upload from its sidecar.
+
+        Blocks whose CRC no longer matches the data on disk (and everything
+        after them) are discarded.
+
+        Args:
+            part_path: Path of the ``.part`` file.
+            sidecar_path: Path of the ``.part.json`` sidecar.
+            sha256: Expected SHA-256 of the complete file.
+            total_bytes: Expected total file size in bytes.
+
+        Returns:
+            Tuple of (offset, sha256_ctx, blocks) where offset is the number of
+            verified bytes, sha256_ctx has consumed exactly those bytes and
+            blocks is the list of verified per-block CRC32 values.
+        """
+        sha256_ctx = hashlib.sha256()
+        try:
+            with open(sidecar_path) as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return 0, sha256_ctx, []
+
+        if (
+            sidecar.get("sha256") != sha256
+            or sidecar.get("total_bytes") != total_bytes
+            or sidecar.get("block_size") != self.UPLOAD_BLOCK_SIZE
+        ):
+            logging.info(f"Discarding stale partial upload at {part_path}")
+            return 0, sha256_ctx, []
+
+        blocks = []
+        try:
+            with open(part_path, "rb") as fh:
+                for expected_crc in sidecar.get("blocks", []):
+                    block = fh.read(self.UPLOAD_BLOCK_SIZE)
+                    if len(block) != self.UPLOAD_BLOCK_SIZE:
+                        break
+                    if zlib.crc32(block) != expected_crc:
+                        logging.warning(
+                            f"Partial upload {part_path} corrupt at block "
+                            f"{len(blocks)}; resuming from there"
+                        )
+                        break
+                    sha256_ctx.update(block)
+                    blocks.append(expected_crc)
+        except OSError:
+            return 0, hashlib.sha256(), []
+
+        return len(blocks) * self.UPLOAD_BLOCK_SIZE, sha256_ctx, blocks
+
+    def _write_upload_sidecar(self, session: dict) -> None:
+        """Atomically persist the verified-block sidecar for a resumable upload.
+
+        Args:
+            session: The active resumable upload session.
+        """
+        sidecar_path = session["sidecar_path"]
+        tmp_path = sidecar_path.with_name(sidecar_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "sha256": session["expected_sha256"],
+                    "filename": session["filename"],
+                    "total_bytes": session["total_bytes"],
+                    "block_size": self.UPLOAD_BLOCK_SIZE,
+                    "blocks": session["blocks"],
+                },
+                f,
+            )
+        os.replace(tmp_path, sidecar_path)
+
+    def _checkpoint_upload_blocks(self, session: dict, chunk: bytes) -> None:
+        """Fold a chunk into the per-block CRCs, persisting each completed block.
+
+        Args:
+            session: The active resumable upload session.
+            chunk: Bytes that were just written to the partial file.
+        """
+        view = memoryview(chunk)
+        completed = False
+        while view:
+            room = self.UPLOAD_BLOCK_SIZE - session["block_bytes"]
+            piece = view[:room]
+            session["block_crc"] = zlib.crc32(piece, session["block_crc"])
+            session["block_bytes"] += len(piece)
+            view = view[len(piece) :]
+            if session["block_bytes"] == self.UPLOAD_BLOCK_SIZE:
+                session["blocks"].append(session["block_crc"])
+                session["block_crc"] = 0
+                session["block_bytes"] = 0
+                completed = True
+
+        if completed:
+            # Data must reach the file before the sidecar vouches for it.
+            session["file_handle"].flush()
+            self._write_upload_sidecar(session)
+
+    def find_delta_basis(self, filename: str) -> Optional[tuple]:
+        """Find the previously-uploaded file that best matches a new upload.
+
+        Args:
+            filename: Base filename of the incoming file.
+
+        Returns:
+            Tuple of (sha256, path) for the most recently modified cached file
+            with the same name, or None if there is no candidate on disk.
+        """
+        best = None
+        best_mtime = -1.0
+        for sha256, cached in self._upload_cache.items():
+            cached_path = Path(cached)
+            if cached_path.name != filename:
+                continue
+            try:
+                mtime = cached_path.stat().st_mtime
+            except OSError:
+                continue
+            if mtime > best_mtime:
+                best, best_mtime = (sha256, cached), mtime
+        if best is None and self.upload_store is not None:
+            # After a restart, fall back to earlier sessions' uploads.
+            for sha256 in self.upload_store.find_by_name(filename):
+                cached = self.check_upload_cache(sha256, filename)
+                if cached:
+                    return sha256, cached
+        return best
+
+    def _get_delta_signature(self, basis_sha256: str, basis_path: str) -> dict:
+        """Return the (cached) block signature of a basis file.
+
+        Args:
+            basis_sha256: SHA-256 of the basis file, used as the cache key.
+            basis_path: Path of the basis file on disk.
+
+        Returns:
+            Dict with "block_size" and "blocks" (list of [weak, strong]).
+        """
+        signature = self._delta_signatures.get(basis_sha256)
+        if signature is None:
+            block_size = choose_block_size(os.path.getsize(basis_path))
+            signature = {
+                "block_size": block_size,
+                "blocks": [list(b) for b in compute_signature(basis_path, block_size)],
+            }
+            self._delta_signatures[basis_sha256] = signature
+        return signature
+
+    async def send_upload_signature(
+        self, channel: RTCDataChannel, filename: str
+    ) -> None:
+        """Advertise block checksums of the best delta basis for a filename.
+
+        Sends one or more FILE_UPLOAD_SIGNATURE::{json} pages. Each page carries
+        ``basis`` (sha256 or null when there is nothing to diff against),
+        ``block_size``, ``total_blocks``, ``start`` and ``blocks``.
+
+        Args:
+            channel: RTC data channel to send the signature on.
+            filename: Base filename of the incoming file.
+        """
+        loop = asyncio.get_running_loop()
+        # The upload store index is read under a file lock, off the loop.
+        basis = await loop.run_in_executor(None, self.find_delta_basis, filename)
+        if basis is None:
+            channel.send(
+                f"{MSG_FILE_UPLOAD_SIGNATURE}{MSG_SEPARATOR}"
+                + json.dumps(
+                    {
+                        "basis": None,
+                        "block_size": 0,
+                        "total_blocks": 0,
+                        "start": 0,
+                        "blocks": [],
+                    }
+                )
+            )
+            return
+
+        basis_sha256, basis_path = basis
+        try:
+            signature = await loop.run_in_executor(
+                None, self._get_delta_signature, basis_sha256, basis_path
+            )
+        except OSError as e:
+            channel.send(
+                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}Cannot read delta basis: {e}"
+            )
+            return
+
+        blocks = signature["blocks"]
+        logging.info(
+            f"Sending delta signature for {filename}: {len(blocks)} blocks of "
+            f"{signature['block_size']} bytes from {basis_path}"
+        )
+        start = 0
+        while True:
+            page = blocks[start : start + self.DELTA_SIGNATURE_PAGE]
+            channel.send(
+                f"{MSG_FILE_UPLOAD_SIGNATURE}{MSG_SEPARATOR}"
+                + json.dumps(
+                    {
+                        "basis": basis_sha256,
+                        "block_size": signature["block_size"],
+                        "total_blocks": len(blocks),
+                        "start": start,
+                        "blocks": page,
+                    }
+                )
+            )
+            start += len(page)
+            if start >= len(blocks):
+                break
+
+    async def start_delta_upload_session(
         self,
         channel: RTCDataChannel,
+        sha256: str,
         filename: str,
         total_bytes: int,
         dest_dir: str,
         create_subdir: str,
+        basis_sha256: str,
+        codecs: str = "",
     ) -> None:
-        """Validate destination, open write handle, and signal readiness.
+        """Open an upload that is rebuilt from a basis file plus literal data.
 
-        Sends FILE_UPLOAD_READY on success or FILE_UPLOAD_ERROR on failure.
+        Binary chunks are written at the current cursor and FILE_UPLOAD_COPY
+        instructions reserve space for basis blocks (see
+        :meth:`receive_upload_copy`). The result is checked against sha256
+        before it is moved into place.
+
+        Sends FILE_UPLOAD_READY[::{codec}] on success or FILE_UPLOAD_ERROR on
+        failure.
 
         Args:
             channel: RTC data channel to send responses on.
+            sha256: SHA-256 hex digest of the complete new file.
             filename: Base filename of the incoming file.
             total_bytes: Expected total file size in bytes.
             dest_dir: Absolute destination directory path on the worker.
             create_subdir: "1" to create a sleap_rtc_downloads/ subfolder,
                 "0" to write directly into dest_dir.
+            basis_sha256: SHA-256 of the basis advertised by
+                :meth:`send_upload_signature`.
+            codecs: Comma-separated compression codecs offered by the client.
         """
-        dest_path = Path(dest_dir)
+        client = self._client(channel)
+        self.abandon_upload_session(client)
 
-        # Security: destination must resolve within a configured mount.
-        if not self._is_path_allowed(dest_path):
+        loop = asyncio.get_running_loop()
+        basis_path = await loop.run_in_executor(
+            None, self.check_upload_cache, basis_sha256, filename
+        )
+        signature = self._delta_signatures.get(basis_sha256)
+        if basis_path is None or signature is None:
             channel.send(
-                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
-                "Destination outside configured mounts"
+                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}Delta basis is no longer available"
             )
             return
 
-        if create_subdir == "1":
-            dest_path = dest_path / "sleap_rtc_downloads"
-            try:
-                dest_path.mkdir(parents=True, exist_ok=True)
-            except OSError as e:
-                channel.send(
-                    f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
-                    f"Cannot create sleap_rtc_downloads/: {e}"
-                )
-                return
+        dest_path = self._resolve_upload_dest(channel, dest_dir, create_subdir)
+        if dest_path is None:
+            return
 
         file_path = dest_path / filename
+        part_path = dest_path / f"{filename}{self.UPLOAD_PART_SUFFIX}"
 
         try:
-            file_handle = open(file_path, "wb")  # noqa: WPS515
+            file_handle = open(part_path, "wb")  # noqa: WPS515
         except OSError as e:
             channel.send(
                 f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}Cannot open file for writing: {e}"
             )
             return
 
-        self._upload_session = {
+        session = self._upload_sessions[client] = {
             "filename": filename,
             "total_bytes": total_bytes,
             "file_path": file_path,
@@ -257,48 +991,224 @@ class FileManager:
             "bytes_received": 0,
             "channel": channel,
             "last_progress_time": 0.0,
-            "sha256_ctx": hashlib.sha256(),
+            "sha256_ctx": None,
+            "mode": "delta",
+            "started": time.monotonic(),
+            "expected_sha256": sha256,
+            "part_path": part_path,
+            "basis_path": Path(basis_path),
+            "block_size": signature["block_size"],
+            "basis_blocks": len(signature["blocks"]),
+            # (target_offset, first_block, block_count) applied on finish
+            "copies": [],
+            "codec": choose_codec(codecs),
         }
 
-        channel.send(MSG_FILE_UPLOAD_READY)
+        channel.send(self._with_codec(MSG_FILE_UPLOAD_READY, session))
         logging.info(
-            f"Upload session started: {filename} ({total_bytes} bytes) → {file_path}"
+            f"Delta upload session started: {filename} ({total_bytes} bytes) "
+            f"against {basis_path} → {file_path}"
         )
 
-    def receive_upload_chunk(self, chunk: bytes) -> None:
-        """Append an incoming binary chunk to the active upload session.
+    @staticmethod
+    def _with_codec(message: str, session: dict) -> str:
+        """Append the session's negotiated codec, if any, to a reply."""
+        if session.get("codec"):
+            return f"{message}{MSG_SEPARATOR}{session['codec']}"
+        return message
+
+    def _apply_delta_copies(self, session: dict) -> None:
+        """Fill the recorded basis-block copies into a delta upload's part file.
+
+        Args:
+            session: The finished delta upload session.
+        """
+        block_size = session["block_size"]
+        with (
+            open(session["basis_path"], "rb") as basis,
+            open(session["part_path"], "r+b") as out,
+        ):
+            for target_offset, first_block, block_count in session["copies"]:
+                basis.seek(first_block * block_size)
+                out.seek(target_offset)
+                remaining = block_count * block_size
+                while remaining:
+                    data = basis.read(min(remaining, 1024 * 1024))
+                    if not data:
+                        raise OSError("Delta basis file is shorter than expected")
+                    out.write(data)
+                    remaining -= len(data)
+
+    def has_upload_session(self, channel: RTCDataChannel) -> bool:
+        """Whether the client owning ``channel`` has an upload in progress."""
+        return self._client(channel) in self._upload_sessions
+
+    def abandon_upload_session(self, client: Optional[str] = None) -> None:
+        """Drop a client's upload session, e.g. after the data channel closed.
+
+        Resumable sessions keep their ``.part`` file and sidecar so the client
+        can continue later; plain sessions delete their partial output.
+
+        Args:
+            client: Key of the client, as returned by ``client_key``.
+        """
+        session = self._upload_sessions.pop(client, None)
+        if session is None:
+            return
+
+        try:
+            session["file_handle"].close()
+        except OSError:
+            pass
+
+        if session["mode"] == "resumable":
+            logging.info(
+                f"Upload of {session['filename']} interrupted at "
+                f"{len(session['blocks']) * self.UPLOAD_BLOCK_SIZE} verified bytes; "
+                "partial file kept for resume"
+            )
+        else:
+            session.get("part_path", session["file_path"]).unlink(missing_ok=True)
+            logging.info(f"Upload of {session['filename']} abandoned")
+
+    def receive_upload_chunk(
+        self, chunk: bytes, channel: Optional[RTCDataChannel] = None
+    ) -> None:
+        """Append an incoming binary chunk to the sender's upload session.
 
         Sends FILE_UPLOAD_PROGRESS at most every 500 ms.
-        Sends FILE_UPLOAD_ERROR and cleans up on I/O failure.
+        Sends FILE_UPLOAD_ERROR and cleans up on I/O failure or a chunk that
+        does not decode.
 
         Args:
-            chunk: Raw bytes received from the client.
+            chunk: Bytes received from the client, flag-prefixed and possibly
+                compressed if the session negotiated a codec.
+            channel: Channel the chunk arrived on. Chunks must arrive on the
+                channel that started the session.
         """
-        if self._upload_session is None:
+        client = self._client(channel)
+        session = self._upload_sessions.get(client)
+        if session is None:
             logging.warning(
                 "Received upload chunk with no active upload session; ignoring."
             )
             return
+        if channel is not None and channel is not session["channel"]:
+            logging.warning(
+                f"Received upload chunk on {channel.label}, not on the channel "
+                f"uploading {session['filename']}; ignoring."
+            )
+            return
 
-        session = self._upload_session
         try:
+            if session.get("codec"):
+                chunk = decode_chunk(session["codec"], chunk)
             session["file_handle"].write(chunk)
-            session["sha256_ctx"].update(chunk)
+            # Delta uploads are hashed once assembled, not chunk by chunk.
+            if session["sha256_ctx"] is not None:
+                session["sha256_ctx"].update(chunk)
             session["bytes_received"] += len(chunk)
-        except OSError as e:
+            if session["mode"] == "resumable":
+                self._checkpoint_upload_blocks(session, chunk)
+        except (OSError, ValueError) as e:
             logging.error(f"Upload write error: {e}")
             session["file_handle"].close()
-            try:
-                session["file_path"].unlink(missing_ok=True)
-            except OSError:
-                pass
+            # Resumable uploads keep everything the sidecar already vouches for.
+            if session["mode"] != "resumable":
+                try:
+                    session.get("part_path", session["file_path"]).unlink(
+                        missing_ok=True
+                    )
+                except OSError:
+                    pass
+            session["channel"].send(
+                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}Write error: {e}"
+            )
+            del self._upload_sessions[client]
+            return
+
+        self._maybe_send_upload_progress(session)
+
+    def receive_stripe_frame(
+        self, frame: bytes, channel: Optional[RTCDataChannel] = None
+    ) -> None:
+        """Write a frame received on a stripe channel into the sender's upload.
+
+        Sends FILE_UPLOAD_ERROR and cleans up on a bad frame or I/O failure.
+
+        Args:
+            frame: Offset-prefixed frame (see striping.py).
+            channel: Stripe channel the frame arrived on.
+        """
+        client = self._client(channel)
+        session = self._upload_sessions.get(client)
+        if session is None or session["mode"] != "striped":
+            logging.warning("Received stripe frame with no striped upload; ignoring.")
+            return
+
+        try:
+            session["reassembler"].write_frame(frame)
+        except (OSError, ValueError) as e:
+            logging.error(f"Striped upload error: {e}")
+            session["file_handle"].close()
+            session["file_path"].unlink(missing_ok=True)
             session["channel"].send(
                 f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}Write error: {e}"
             )
-            self._upload_session = None
+            del self._upload_sessions[client]
+            return
+
+        session["bytes_received"] = session["reassembler"].bytes_written
+        self._maybe_send_upload_progress(session)
+
+    def receive_upload_copy(
+        self,
+        first_block: int,
+        block_count: int,
+        channel: Optional[RTCDataChannel] = None,
+    ) -> None:
+        """Append a run of basis blocks to the sender's delta upload.
+
+        The copy is only recorded here (the write cursor skips ahead); the
+        blocks are read from the basis file when the upload is finished, so
+        large copies never block the event loop.
+
+        Args:
+            first_block: Index of the first basis block to copy.
+            block_count: Number of consecutive basis blocks to copy.
+            channel: Channel the FILE_UPLOAD_COPY arrived on.
+        """
+        client = self._client(channel)
+        session = self._upload_sessions.get(client)
+        if session is None or session["mode"] != "delta":
+            logging.warning(
+                "Received FILE_UPLOAD_COPY with no delta session; ignoring."
+            )
             return
 
-        # Progress at most every 500 ms.
+        if (
+            first_block < 0
+            or block_count < 1
+            or first_block + block_count > session["basis_blocks"]
+        ):
+            session["file_handle"].close()
+            session["part_path"].unlink(missing_ok=True)
+            session["channel"].send(
+                f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
+                f"Copy of blocks {first_block}+{block_count} is outside the basis file"
+            )
+            del self._upload_sessions[client]
+            return
+
+        length = block_count * session["block_size"]
+        session["copies"].append((session["bytes_received"], first_block, block_count))
+        session["file_handle"].seek(length, os.SEEK_CUR)
+        session["bytes_received"] += length
+
+        self._maybe_send_upload_progress(session)
+
+    def _maybe_send_upload_progress(self, session: dict) -> None:
+        """Send FILE_UPLOAD_PROGRESS for a session at most every 500 ms."""
         now = time.time()
         if now - session["last_progress_time"] >= 0.5:
             session["channel"].send(
@@ -308,22 +1218,42 @@ class FileManager:
             session["last_progress_time"] = now
 
     async def finish_upload_session(self, channel: RTCDataChannel) -> None:
-        """Finalise the active upload: close file, verify size, update cache.
+        """Finalise the sender's upload: close file, verify size, update cache.
 
         Sends FILE_UPLOAD_COMPLETE::{absolute_path} on success or
         FILE_UPLOAD_ERROR::{reason} on failure.
 
         Args:
-            channel: RTC data channel to send the result on.
+            channel: RTC data channel the FILE_UPLOAD_END arrived on; the
+                result is sent on it.
         """
-        if self._upload_session is None:
+        client = self._client(channel)
+        session = self._upload_sessions.get(client)
+        if session is None:
             logging.warning(
                 "Received FILE_UPLOAD_END with no active session; ignoring."
             )
             return
 
-        session = self._upload_session
-        self._upload_session = None
+        written_path = session.get("part_path", session["file_path"])
+
+        if session["mode"] == "striped":
+            # FILE_UPLOAD_END travels on the control channel and can overtake
+            # frames still queued on the stripes.
+            complete = await session["reassembler"].wait(STRIPE_DRAIN_TIMEOUT)
+            if self._upload_sessions.get(client) is not session:
+                return  # failed or abandoned while waiting
+            if not complete:
+                del self._upload_sessions[client]
+                session["file_handle"].close()
+                written_path.unlink(missing_ok=True)
+                channel.send(
+                    f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
+                    "Timed out waiting for striped data"
+                )
+                return
+
+        del self._upload_sessions[client]
 
         try:
             session["file_handle"].close()
@@ -333,22 +1263,78 @@ class FileManager:
             )
             return
 
+        loop = asyncio.get_running_loop()
+        if session["mode"] == "delta":
+            try:
+                await loop.run_in_executor(None, self._apply_delta_copies, session)
+            except OSError as e:
+                written_path.unlink(missing_ok=True)
+                channel.send(
+                    f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
+                    f"Failed to assemble delta upload: {e}"
+                )
+                return
+
         # Verify written size matches declared total.
-        actual_size = session["file_path"].stat().st_size
+        actual_size = written_path.stat().st_size
         if actual_size != session["total_bytes"]:
             channel.send(
                 f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
                 f"Size mismatch: expected {session['total_bytes']}, got {actual_size}"
             )
-            session["file_path"].unlink(missing_ok=True)
+            # A short resumable upload can still be continued from its sidecar.
+            if session["mode"] != "resumable":
+                written_path.unlink(missing_ok=True)
             return
 
+        if session["sha256_ctx"] is None:
+            sha256 = await loop.run_in_executor(None, _sha256_file, written_path)
+        else:
+            sha256 = session["sha256_ctx"].hexdigest()
+
+        if session["mode"] in ("resumable", "delta"):
+            if session["mode"] == "resumable":
+                session["sidecar_path"].unlink(missing_ok=True)
+            if sha256 != session["expected_sha256"]:
+                written_path.unlink(missing_ok=True)
+                channel.send(
+                    f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
+                    f"Checksum mismatch: expected {session['expected_sha256']}, "
+                    f"got {sha256}"
+                )
+                return
+            try:
+                os.replace(written_path, session["file_path"])
+            except OSError as e:
+                channel.send(
+                    f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}"
+                    f"Failed to move upload into place: {e}"
+                )
+                return
+
         # Cache by content hash so future uploads of the same file are instant.
-        sha256 = session["sha256_ctx"].hexdigest()
-        self._upload_cache[sha256] = str(session["file_path"])
+        # Entries for whatever previously lived at this path are now stale.
+        self._remember_upload(sha256, str(session["file_path"]))
+        if self.upload_store is not None:
+            try:
+                await loop.run_in_executor(
+                    None,
+                    self.upload_store.add,
+                    sha256,
+                    session["file_path"],
+                    session["filename"],
+                )
+            except OSError as e:
+                logging.warning(f"Could not add upload to persistent cache: {e}")
 
         channel.send(f"{MSG_FILE_UPLOAD_COMPLETE}{MSG_SEPARATOR}{session['file_path']}")
         logging.info(f"Upload complete: {session['file_path']} (sha256={sha256[:12]}…)")
+        log_transfer_rate(
+            f"Received {session['filename']}",
+            session["total_bytes"] - session.get("start_offset", 0),
+            session["started"],
+            len(self._open_stripes(client)) if session["mode"] == "striped" else 1,
+        )
 
     # =========================================================================
     # Filesystem Browser Methods
@@ -361,6 +1347,8 @@ class FileManager:
             mounts: List of MountConfig objects.
         """
         self.mounts = mounts or []
+        if self.filename_index is not None:
+            self.filename_index.set_mounts([mount.path for mount in self.mounts])
 
     def get_mounts(self) -> List[dict]:
         """Get list of available mount points.
@@ -511,6 +1499,7 @@ class FileManager:
         start_time = time.time()
         candidates = []
         timed_out = False
+        deadline = time.monotonic() + self.SEARCH_TIMEOUT
 
         # Extract just the filename if a full path was provided
         search_name = Path(pattern).name
@@ -528,6 +1517,7 @@ class FileManager:
                     "error_code": "MOUNT_NOT_FOUND",
                 }
 
+        indexed_mounts = []
         for mount in mounts_to_search:
             if timed_out:
                 break
@@ -536,25 +1526,37 @@ class FileManager:
             if not mount_path.exists():
                 continue
 
-            # Scan the mount directory
-            for match in self._scan_directory(
-                mount_path,
-                search_name,
-                0,
-                max_depth,
-                file_size,
-                start_time,
-            ):
-                if match is None:
-                    # Timeout signal
-                    timed_out = True
-                    break
-
-                candidates.append(match)
+            index = (
+                self.filename_index.get(mount.path)
+                if self.filename_index is not None
+                else None
+            )
+            if index is not None:
+                candidates.extend(
+                    self._search_index(index, search_name, max_depth, file_size)
+                )
+                indexed_mounts.append(mount_path)
+                continue
 
-                # Early termination after MAX_RESULTS
-                if len(candidates) >= self.MAX_RESULTS:
+            # Scan the mount directory
+            matches, timed_out = self._walk_mount(
+                mount_path, search_name, max_depth, file_size, deadline
+            )
+            candidates.extend(matches)
+
+        # An index only knows the files present at its last rescan. Before
+        # reporting no match, walk the indexed mounts within the same
+        # deadline for files created since, and rescan if any turn up.
+        if not candidates and indexed_mounts:
+            for mount_path in indexed_mounts:
+                if timed_out:
                     break
+                matches, timed_out = self._walk_mount(
+                    mount_path, search_name, max_depth, file_size, deadline
+                )
+                candidates.extend(matches)
+            if candidates:
+                self.refresh_filename_index()
 
         # Sort candidates by score (descending)
         candidates.sort(key=lambda c: c.get("score", 0), reverse=True)
@@ -572,84 +1574,116 @@ class FileManager:
             "search_time_ms": search_time_ms,
         }
 
-    def _scan_directory(
+    def refresh_filename_index(self) -> bool:
+        """Ask the background filename index to rescan the mounts now.
+
+        Returns:
+            True if a rescan was requested, False if there is no index.
+        """
+        if self.filename_index is None:
+            return False
+        self.filename_index.request_refresh()
+        return True
+
+    def _search_index(
         self,
-        dir_path: Path,
+        index: MountIndex,
         pattern: str,
-        depth: int,
         max_depth: int,
         file_size: int,
-        start_time: float,
-    ):
-        """Lazily scan a directory for matching files.
+    ) -> List[dict]:
+        """Find matching files of one mount in its filename index.
+
+        Unlike a walk, the index yields every match, so candidates are ranked
+        across the whole mount. Only the best ``MAX_RESULTS + 1`` are returned,
+        each re-stat'ed so files removed or changed since the last rescan are
+        dropped or reported with their current size.
 
         Args:
-            dir_path: Directory to scan.
+            index: Ready index of the mount.
             pattern: Pattern to match.
-            depth: Current depth.
-            max_depth: Maximum depth.
+            max_depth: Maximum directory depth below the mount root.
             file_size: Expected file size for scoring.
-            start_time: Search start time for timeout.
 
-        Yields:
-            Match dictionaries, or None if timeout.
+        Returns:
+            Match dictionaries, best first.
         """
-        # Check timeout
-        if time.time() - start_time > self.SEARCH_TIMEOUT:
-            yield None
-            return
+        matches = []
+        for match_type, path, size, _, depth in index.search(
+            lambda name: self._match_filename(pattern, name)["match_type"]
+        ):
+            if depth <= max_depth:
+                score = self._calculate_score(match_type, size, file_size, path)
+                matches.append((score, match_type, path))
+        matches.sort(key=lambda m: m[0], reverse=True)
 
-        # Check depth limit
-        if depth > max_depth:
-            return
+        candidates = []
+        for _, match_type, path in matches:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            candidates.append(
+                {
+                    "path": path,
+                    "name": os.path.basename(path),
+                    "size": stat.st_size,
+                    "modified": stat.st_mtime,
+                    "match_type": match_type,
+                    "score": self._calculate_score(
+                        match_type, stat.st_size, file_size, path
+                    ),
+                }
+            )
+            if len(candidates) > self.MAX_RESULTS:
+                break
+        return candidates
 
-        try:
-            entries = list(dir_path.iterdir())
-        except (PermissionError, OSError):
-            # Skip directories we can't read
-            return
+    def _walk_mount(
+        self,
+        mount_path: Path,
+        pattern: str,
+        max_depth: int,
+        file_size: int,
+        deadline: float,
+    ) -> tuple:
+        """Scan a mount for matching files with the parallel scandir walker.
 
-        for entry in entries:
-            # Check timeout periodically
-            if time.time() - start_time > self.SEARCH_TIMEOUT:
-                yield None
-                return
+        Args:
+            mount_path: Mount directory to scan.
+            pattern: Pattern to match.
+            max_depth: Maximum depth.
+            file_size: Expected file size for scoring.
+            deadline: ``time.monotonic()`` value at which to give up.
 
-            try:
-                if entry.is_file():
-                    match_result = self._match_filename(pattern, entry.name)
-                    if match_result["matches"]:
-                        stat = entry.stat()
-                        score = self._calculate_score(
-                            match_result["match_type"],
-                            stat.st_size,
-                            file_size,
-                            str(entry),
-                        )
-                        yield {
-                            "path": str(entry),
-                            "name": entry.name,
-                            "size": stat.st_size,
-                            "modified": stat.st_mtime,
-                            "match_type": match_result["match_type"],
-                            "score": score,
-                        }
-
-                elif entry.is_dir():
-                    # Recursively scan subdirectories
-                    for sub_match in self._scan_directory(
-                        entry,
-                        pattern,
-                        depth + 1,
-                        max_depth,
-                        file_size,
-                        start_time,
-                    ):
-                        yield sub_match
+        Returns:
+            Tuple of (match dictionaries, whether the search timed out).
+        """
 
-            except (PermissionError, OSError):
-                # Skip files/directories we can't access
-                continue
+        def visit(entry: os.DirEntry, depth: int) -> Optional[dict]:
+            match_result = self._match_filename(pattern, entry.name)
+            if not match_result["matches"]:
+                return None
+            stat = entry.stat()
+            return {
+                "path": entry.path,
+                "name": entry.name,
+                "size": stat.st_size,
+                "modified": stat.st_mtime,
+                "match_type": match_result["match_type"],
+                "score": self._calculate_score(
+                    match_result["match_type"], stat.st_size, file_size, entry.path
+                ),
+            }
+
+        # One more than MAX_RESULTS so resolve_path can report truncation.
+        return walk(
+            str(mount_path),
+            visit,
+            max_depth,
+            deadline=deadline,
+            limit=self.MAX_RESULTS + 1,
+        )
 
     def _calculate_score(
         self,
@@ -695,16 +1729,34 @@ class FileManager:
 
         return score
 
-    def list_directory(self, path: str, offset: int = 0) -> dict:
+    def list_directory(
+        self,
+        path: str,
+        offset: int = 0,
+        limit: int = None,
+        cursor: str = None,
+    ) -> dict:
         """List contents of a directory within allowed mounts.
 
+        The sorted listing is cached (see listing_cache.py), so each page
+        after the first costs one ``stat`` of the directory plus one per
+        returned entry.
+
         Args:
             path: Directory path to list.
             offset: Number of entries to skip (for pagination).
+            limit: Page size (default MAX_RESULTS, at most LIST_PAGE_MAX).
+            cursor: Cursor returned with a previous page; continues that
+                listing even if the directory changed since.
 
         Returns:
-            Dictionary with path, entries, total_count, and has_more.
+            Dictionary with path, entries, total_count, has_more, offset,
+            next_offset (where the next page starts), cursor and mtime_ns
+            (the directory's mtime when listed, for client-side caches).
         """
+        if limit is None:
+            limit = self.MAX_RESULTS
+        limit = max(1, min(limit, self.LIST_PAGE_MAX))
         dir_path = Path(path)
 
         # Canonicalize path to prevent traversal attacks
@@ -752,7 +1804,7 @@ class FileManager:
             }
 
         try:
-            all_entries = list(resolved_path.iterdir())
+            snapshot = self._listing_cache.get(str(resolved_path), cursor)
         except PermissionError:
             return {
                 "path": path,
@@ -763,37 +1815,45 @@ class FileManager:
                 "error_code": "ACCESS_DENIED",
             }
 
-        # Sort: directories first, then alphabetically
-        all_entries.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
-
+        # Directories first, then alphabetically; the snapshot holds names and
+        # types only, so the returned page is stat'ed now and sizes of files
+        # still being written are current.
+        all_entries = snapshot.entries
         total_count = len(all_entries)
 
         # Apply offset and limit
-        paginated = all_entries[offset : offset + self.MAX_RESULTS]
+        paginated = all_entries[offset : offset + limit]
 
         entries = []
         for entry in paginated:
             try:
-                stat = entry.stat()
-                entries.append(
-                    {
-                        "name": entry.name,
-                        "type": "directory" if entry.is_dir() else "file",
-                        "size": stat.st_size if entry.is_file() else 0,
-                        "modified": stat.st_mtime,
-                    }
-                )
+                st = os.stat(os.path.join(snapshot.path, entry.name))
             except (PermissionError, OSError):
                 # Skip entries we can't stat
                 continue
+            is_dir = stat.S_ISDIR(st.st_mode)
+            entries.append(
+                {
+                    "name": entry.name,
+                    "type": "directory" if is_dir else "file",
+                    "size": st.st_size if stat.S_ISREG(st.st_mode) else 0,
+                    "modified": st.st_mtime,
+                }
+            )
 
-        has_more = offset + len(entries) < total_count
+        # Entries that could not be stat'ed are skipped but still consumed.
+        next_offset = offset + len(paginated)
+        has_more = next_offset < total_count
 
         return {
             "path": str(resolved_path),
             "entries": entries,
             "total_count": total_count,
             "has_more": has_more,
+            "offset": offset,
+            "next_offset": next_offset,
+            "cursor": snapshot.cursor,
+            "mtime_ns": snapshot.mtime_ns,
         }
 
     # =========================================================================
@@ -819,8 +1879,10 @@ class FileManager:
     def check_video_accessibility(self, slp_path: str) -> dict:
         """Check if video paths in an SLP file are accessible on this filesystem.
 
-        Loads the SLP file and checks if each video's filename exists on the
-        Worker filesystem. Embedded videos (frames stored in the SLP) are skipped.
+        Reads the video list from the SLP's HDF5 metadata (cached until the
+        file changes) and checks, concurrently, whether each video's filename
+        exists on the Worker filesystem. Embedded videos (frames stored in the
+        SLP) are skipped. Files that are not HDF5 SLPs are loaded with sleap-io.
 
         Args:
             slp_path: Path to the SLP file to check.
@@ -857,40 +1919,59 @@ class FileManager:
                 "error": f"SLP file not found: {slp_path}",
             }
 
+        # (embedded, path) of each video, from the cached SLP header when the
+        # file is an HDF5 SLP, so the labeled frames are never parsed.
+        videos = None
         try:
-            # Load SLP without opening video backends
-            labels = sio.load_file(slp_path, open_videos=False)
+            header = self._slp_headers.get(slp_path)
         except Exception as e:
-            return {
-                "slp_path": slp_path,
-                "total_videos": 0,
-                "missing": [],
-                "accessible": 0,
-                "embedded": 0,
-                "error": f"Failed to load SLP file: {e}",
-            }
+            logging.warning(f"Failed to read SLP header of {slp_path}: {e}")
+            header = None
+        if header is not None:
+            videos = [
+                (video_entry_embedded(entry), video_entry_path(entry, slp_path))
+                for entry in header.videos
+            ]
+
+        if videos is None:
+            try:
+                # Load SLP without opening video backends
+                labels = sio.load_file(slp_path, open_videos=False)
+            except Exception as e:
+                return {
+                    "slp_path": slp_path,
+                    "total_videos": 0,
+                    "missing": [],
+                    "accessible": 0,
+                    "embedded": 0,
+                    "error": f"Failed to load SLP file: {e}",
+                }
+            videos = []
+            for video in labels.videos:
+                video_path = video.filename
+                if isinstance(video_path, list):
+                    # Image sequence - check first image
+                    video_path = video_path[0] if video_path else ""
+                videos.append((self._is_video_embedded(video), video_path))
+
+        exists = paths_exist(
+            path for is_embedded, path in videos if path and not is_embedded
+        )
 
         missing = []
         accessible = 0
         embedded = 0
 
-        for video in labels.videos:
+        for is_embedded, video_path in videos:
             # Skip embedded videos (frames stored in SLP file)
-            if self._is_video_embedded(video):
+            if is_embedded:
                 embedded += 1
                 continue
 
-            # Get the video filename/path
-            video_path = video.filename
-            if isinstance(video_path, list):
-                # Image sequence - check first image
-                video_path = video_path[0] if video_path else ""
-
             if not video_path:
                 continue
 
-            # Check if the video file exists
-            if Path(video_path).exists():
+            if exists[video_path]:
                 accessible += 1
             else:
                 # Extract just the filename for display
@@ -904,7 +1985,7 @@ class FileManager:
 
         return {
             "slp_path": slp_path,
-            "total_videos": len(labels.videos),
+            "total_videos": len(videos),
             "missing": missing,
             "accessible": accessible,
             "embedded": embedded,
@@ -958,6 +2039,14 @@ class FileManager:
                 "error_code": "PATH_NOT_FOUND",
             }
 
+        # One stat of the directory validates its indexed listing; otherwise
+        # each filename is stat'ed.
+        listing = (
+            self.filename_index.listing(str(dir_path))
+            if self.filename_index is not None
+            else None
+        )
+
         # Scan for each filename
         found = {}
         for filename in filenames:
@@ -970,7 +2059,9 @@ class FileManager:
                 continue
 
             candidate = dir_path / filename
-            if candidate.exists() and candidate.is_file():
+            if listing is not None:
+                found[filename] = str(candidate) if filename in listing[1] else None
+            elif candidate.exists() and candidate.is_file():
                 found[filename] = str(candidate)
             else:
                 found[filename] = None
@@ -989,8 +2080,10 @@ class FileManager:
     ) -> dict:
         """Write a new SLP file with updated video paths.
 
-        Loads the SLP file, applies the filename_map to replace video paths,
-        and saves a new SLP file with a timestamped name.
+        Copies the SLP file (a reflink where supported) and rewrites only its
+        ``videos_json`` metadata, so labels and embedded frames are never
+        decoded. Files that are not HDF5 SLP containers are loaded with
+        sleap-io, updated with ``replace_filenames`` and saved instead.
 
         Args:
             slp_path: Path to the original SLP file.
@@ -1037,6 +2130,40 @@ class FileManager:
                 "error": f"Output path is not a directory: {output_dir}",
             }
 
+        # Use custom filename if provided, otherwise generate default
+        if output_filename:
+            final_filename = output_filename
+        else:
+            # Generate output filename: resolved_YYYYMMDD_<original>.slp
+            from datetime import datetime
+
+            date_str = datetime.now().strftime("%Y%m%d")
+            original_name = slp_file.stem
+            # Handle .pkg.slp extension
+            if original_name.endswith(".pkg"):
+                original_name = original_name[:-4]
+                final_filename = f"resolved_{date_str}_{original_name}.pkg.slp"
+            else:
+                final_filename = f"resolved_{date_str}_{original_name}.slp"
+
+        output_full_path = output_path_obj / final_filename
+
+        # Fast path: copy the container and rewrite only the videos metadata,
+        # leaving labels and embedded frames untouched.
+        try:
+            videos_updated = patch_video_paths(slp_file, output_full_path, filename_map)
+        except Exception as e:
+            logging.warning(
+                f"In-place path patch of {slp_path} failed ({e}); "
+                "falling back to a full load and save"
+            )
+            videos_updated = None
+        if videos_updated is not None:
+            return {
+                "output_path": str(output_full_path),
+                "videos_updated": videos_updated,
+            }
+
         try:
             # Load SLP without opening video backends
             labels = sio.load_file(slp_path, open_videos=False)
@@ -1072,24 +2199,6 @@ class FileManager:
                 video.backend_metadata["filename"] = video.filename[0]
                 video.backend_metadata["filenames"] = video.filename
 
-        # Use custom filename if provided, otherwise generate default
-        if output_filename:
-            final_filename = output_filename
-        else:
-            # Generate output filename: resolved_YYYYMMDD_<original>.slp
-            from datetime import datetime
-
-            date_str = datetime.now().strftime("%Y%m%d")
-            original_name = slp_file.stem
-            # Handle .pkg.slp extension
-            if original_name.endswith(".pkg"):
-                original_name = original_name[:-4]
-                final_filename = f"resolved_{date_str}_{original_name}.pkg.slp"
-            else:
-                final_filename = f"resolved_{date_str}_{original_name}.slp"
-
-        output_full_path = output_path_obj / final_filename
-
         # Save the updated SLP file
         try:
             labels.save(str(output_full_path))
@@ -1204,6 +2313,8 @@ class FileManager:
 
         would_resolve = []
         would_not_resolve = []
+        # Indexed listings of candidate parent directories, validated once each.
+        listings = {}
 
         for missing_path in other_missing:
             # Check if this path shares the same old prefix
@@ -1220,7 +2331,7 @@ class FileManager:
                 continue
 
             # Check if the transformed path exists on the Worker filesystem
-            if Path(candidate).exists():
+            if self._path_exists(candidate, listings):
                 would_resolve.append(
                     {
                         "original": missing_path,
@@ -1236,3 +2347,25 @@ class FileManager:
             "would_resolve": would_resolve,
             "would_not_resolve": would_not_resolve,
         }
+
+    def _path_exists(self, path: str, listings: dict) -> bool:
+        """Check whether a path exists, using the filename index if possible.
+
+        Args:
+            path: Path to check.
+            listings: Per-call cache of parent directory → indexed listing
+                (or None when the directory is not indexed or has changed).
+
+        Returns:
+            True if the path exists.
+        """
+        if self.filename_index is None:
+            return Path(path).exists()
+        parent, name = os.path.split(os.path.normpath(path))
+        if parent not in listings:
+            listings[parent] = self.filename_index.listing(parent)
+        listing = listings[parent]
+        if listing is None:
+            return Path(path).exists()
+        _, files, subdirs = listing
+        return name in files or any(os.path.basename(sub) == name for sub in subdirs)
@@ -0,0 +1,357 @@
+"""Background-built filename index of worker mounts.
+
+Walking a multi-petabyte network mount for every FS_RESOLVE request usually
+hits ``FileManager.SEARCH_TIMEOUT`` before the wanted video turns up. Instead,
+a background thread walks each mount once, records every directory's files
+(name → size, mtime) and subdirectories, and answers lookups from memory.
+
+Keeping the index current is incremental: a rescan stats each directory and
+only re-reads those whose mtime changed (a file was created, deleted or
+renamed in it), so a refresh of an unchanged tree costs one ``stat`` per
+directory. Rescans run periodically rather than via inotify, which has no
+standard-library binding, needs one watch per directory (far beyond the
+default watch limit on large mounts) and does not see changes made by other
+NFS clients.
+
+Each mount's index is saved (gzipped JSON) after every scan, so a restarted
+worker answers lookups immediately from the last snapshot while it rescans.
+
+A directory listing is only trusted when the directory's mtime still matches
+the index (see :meth:`MountIndex.listing`), so callers that need an exact
+answer for one directory never see stale data.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+INDEX_MAX_DEPTH = 16
+INDEX_REFRESH_INTERVAL = 30 * 60.0  # seconds
+
+# (mtime_ns, {filename: (size, mtime)}, [subdirectory paths])
+DirRecord = Tuple[int, Dict[str, Tuple[int, float]], List[str]]
+# (path, size, mtime, depth below the mount root)
+FileRecord = Tuple[str, int, float, int]
+
+
+def default_index_dir() -> Path:
+    """Return the default location of saved mount indexes."""
+    return Path.home() / ".sleap-rtc" / "fs-index"
+
+
+class MountIndex:
+    """Filename index of a single mount.
+
+    Attributes:
+        root: Normalised mount path.
+        cache_file: Where the index is saved, or None to keep it in memory.
+        scanned_at: ``time.time()`` of the last completed scan or load, or
+            None before the index is usable.
+    """
+
+    def __init__(self, root: str, cache_file: Optional[Path] = None):
+        """Initialize the index, loading a saved snapshot if there is one.
+
+        Args:
+            root: Mount path.
+            cache_file: Where the index is saved, or None to keep it in memory.
+        """
+        self.root = os.path.normpath(root)
+        self.cache_file = cache_file
+        self.scanned_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._dirs: Dict[str, DirRecord] = {}
+        self._names: Dict[str, List[FileRecord]] = {}
+        if cache_file is not None:
+            self._load()
+
+    @property
+    def ready(self) -> bool:
+        """True once the index holds a completed scan (or saved snapshot)."""
+        return self.scanned_at is not None
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def refresh(self, stop: Optional[threading.Event] = None) -> bool:
+        """Rescan the mount, re-reading only directories that changed.
+
+        Args:
+            stop: Event that aborts the scan when set.
+
+        Returns:
+            True if the scan completed, False if it was aborted.
+        """
+        started = time.monotonic()
+        with self._lock:
+            previous = self._dirs
+        dirs: Dict[str, DirRecord] = {}
+        visited = set()
+        reread = 0
+        stack = [(self.root, 0)]
+        while stack:
+            if stop is not None and stop.is_set():
+                return False
+            path, depth = stack.pop()
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            # Symlinked directories are followed, but each one only once.
+            if (st.st_dev, st.st_ino) in visited:
+                continue
+            visited.add((st.st_dev, st.st_ino))
+
+            record = previous.get(path)
+            if record is None or record[0] != st.st_mtime_ns:
+                record = self._read_dir(path, st.st_mtime_ns)
+                if record is None:
+                    continue
+                reread += 1
+            dirs[path] = record
+            if depth < INDEX_MAX_DEPTH:
+                stack.extend((sub, depth + 1) for sub in record[2])
+
+        names = self._build_names(dirs)
+        with self._lock:
+            self._dirs = dirs
+            self._names = names
+            self.scanned_at = time.time()
+        logging.info(
+            f"Indexed {self.root}: {sum(len(v) for v in names.values())} files in "
+            f"{len(dirs)} directories ({reread} re-read) in "
+            f"{time.monotonic() - started:.1f}s"
+        )
+        if self.cache_file is not None:
+            self._save(dirs)
+        return True
+
+    @staticmethod
+    def _read_dir(path: str, mtime_ns: int) -> Optional[DirRecord]:
+        files: Dict[str, Tuple[int, float]] = {}
+        subdirs: List[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            st = entry.stat()
+                            files[entry.name] = (st.st_size, st.st_mtime)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        return (mtime_ns, files, subdirs)
+
+    def _build_names(self, dirs: Dict[str, DirRecord]) -> Dict[str, List[FileRecord]]:
+        names: Dict[str, List[FileRecord]] = {}
+        root_depth = self.root.count(os.sep)
+        for path, (_, files, _) in dirs.items():
+            depth = path.count(os.sep) - root_depth
+            for name, (size, mtime) in files.items():
+                names.setdefault(name.lower(), []).append(
+                    (os.path.join(path, name), size, mtime, depth)
+                )
+        return names
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _save(self, dirs: Dict[str, DirRecord]) -> None:
+        tmp = self.cache_file.with_name(f"{self.cache_file.name}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp, "wt") as fh:
+                json.dump({"version": 1, "root": self.root, "dirs": dirs}, fh)
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            logging.warning(f"Could not save filename index for {self.root}: {e}")
+
+    def _load(self) -> None:
+        try:
+            with gzip.open(self.cache_file, "rt") as fh:
+                data = json.load(fh)
+            if data.get("version") != 1 or data.get("root") != self.root:
+                return
+            dirs = {
+                path: (
+                    mtime_ns,
+                    {name: tuple(info) for name, info in files.items()},
+                    subdirs,
+                )
+                for path, (mtime_ns, files, subdirs) in data["dirs"].items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(
+                f"Ignoring unreadable filename index {self.cache_file}: {e}"
+            )
+            return
+        self._dirs = dirs
+        self._names = self._build_names(dirs)
+        self.scanned_at = self.cache_file.stat().st_mtime
+        logging.info(f"Loaded filename index for {self.root} ({len(dirs)} directories)")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def search(self, match: Callable[[str], Optional[str]]) -> List[tuple]:
+        """Return every indexed file whose name matches.
+
+        Args:
+            match: Called with each distinct lower-cased filename; returns a
+                match type, or None if the name does not match.
+
+        Returns:
+            List of ``(match_type, path, size, mtime, depth)`` tuples.
+        """
+        with self._lock:
+            names = self._names
+        results = []
+        for name, records in names.items():
+            match_type = match(name)
+            if match_type is not None:
+                results.extend((match_type, *record) for record in records)
+        return results
+
+    def listing(self, directory: str) -> Optional[DirRecord]:
+        """Return the indexed contents of a directory if they are current.
+
+        The directory is stat'ed and its record only returned if the mtime
+        still matches, i.e. no entry was added, removed or renamed since the
+        index read it.
+
+        Args:
+            directory: Directory path.
+
+        Returns:
+            ``(mtime_ns, files, subdirs)`` or None if the directory is not
+            indexed or has changed.
+        """
+        directory = os.path.normpath(directory)
+        with self._lock:
+            record = self._dirs.get(directory)
+        if record is None:
+            return None
+        try:
+            if os.stat(directory).st_mtime_ns != record[0]:
+                return None
+        except OSError:
+            return None
+        return record
+
+
+class FilenameIndex:
+    """Filename indexes of all mounts, refreshed by a background thread.
+
+    Attributes:
+        refresh_interval: Seconds between rescans.
+        mounts: Map of normalised mount path → :class:`MountIndex`.
+    """
+
+    def __init__(
+        self,
+        mount_paths: List[str],
+        cache_dir: Optional[str] = None,
+        refresh_interval: float = INDEX_REFRESH_INTERVAL,
+    ):
+        """Initialize indexes (loading saved snapshots) without scanning.
+
+        Args:
+            mount_paths: Paths of the mounts to index.
+            cache_dir: Directory for saved indexes, or None for memory only.
+            refresh_interval: Seconds between rescans.
+        """
+        self.refresh_interval = refresh_interval
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.mounts: Dict[str, MountIndex] = {}
+        self.set_mounts(mount_paths)
+
+    def _cache_file(self, root: str) -> Optional[Path]:
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.sha256(root.encode()).hexdigest()[:16]
+        return self._cache_dir / f"{digest}.json.gz"
+
+    def set_mounts(self, mount_paths: List[str]) -> None:
+        """Replace the indexed mounts, keeping indexes of unchanged ones."""
+        roots = [os.path.normpath(p) for p in mount_paths]
+        self.mounts = {
+            root: self.mounts.get(root) or MountIndex(root, self._cache_file(root))
+            for root in roots
+        }
+
+    def start(self) -> None:
+        """Start the background thread that scans and rescans the mounts."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sleap-rtc-fs-index", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread after its current directory."""
+        self._stop.set()
+        self._wake.set()
+        self._thread = None
+
+    def request_refresh(self) -> None:
+        """Ask the background thread to rescan now instead of at the next interval.
+
+        Rescans re-read only changed directories, so this is cheap to call
+        whenever the index is known to be missing files.
+        """
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            for index in list(self.mounts.values()):
+                try:
+                    index.refresh(self._stop)
+                except Exception as e:
+                    logging.error(f"Indexing {index.root} failed: {e}")
+            self._wake.wait(self.refresh_interval)
+
+    def refresh_all(self) -> None:
+        """Scan every mount now, in the calling thread."""
+        for index in list(self.mounts.values()):
+            index.refresh()
+
+    def get(self, mount_path: str) -> Optional[MountIndex]:
+        """Return the index of a mount if it is ready."""
+        index = self.mounts.get(os.path.normpath(mount_path))
+        return index if index is not None and index.ready else None
+
+    def for_path(self, path: str) -> Optional[MountIndex]:
+        """Return the ready index of the mount containing ``path``."""
+        path = os.path.normpath(path)
+        for root, index in self.mounts.items():
+            if index.ready and (path == root or path.startswith(root + os.sep)):
+                return index
+        return None
+
+    def listing(self, directory: str) -> Optional[DirRecord]:
+        """Return the current indexed contents of a directory, if any.
+
+        See :meth:`MountIndex.listing`.
+        """
+        index = self.for_path(directory)
+        return index.listing(directory) if index is not None else None
@@ -0,0 +1,132 @@
+"""Run blocking filesystem requests off the worker's event loop.
+
+Filesystem browser requests (FS_RESOLVE scans, FS_LIST_DIR on slow network
+mounts, video checks that load a whole SLP, writing corrected SLP files) can
+take seconds. Running them inside a data-channel ``on_message`` coroutine
+stalls heartbeats, ICE keepalives, progress forwarding and every other
+client's messages, so the worker hands them to :class:`FSService` instead.
+
+Requests run on a bounded thread pool. A global limit keeps at most
+``max_workers`` requests in flight; a per-client limit stops one busy browser
+from taking every slot. Requests that have not started yet wait on the event
+loop, where they can be cancelled cleanly (e.g. when the client disconnects);
+a request that is already running in a thread finishes, but its result is
+discarded.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Set
+
+FS_MAX_WORKERS = 8
+FS_PER_CLIENT_LIMIT = 4  # clients pipeline requests (see sleap_rtc/rpc.py)
+FS_REQUEST_TIMEOUT = 60.0  # seconds
+
+
+class FSRequestCancelled(Exception):
+    """Raised when :meth:`FSService.cancel_client` cancels a pending request."""
+
+
+class FSService:
+    """Bounded thread pool for blocking filesystem requests.
+
+    Attributes:
+        max_workers: Maximum requests running at once across all clients.
+        per_client_limit: Maximum requests running at once for one client.
+        timeout: Seconds a request may take before the caller gets
+            asyncio.TimeoutError.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = FS_MAX_WORKERS,
+        per_client_limit: int = FS_PER_CLIENT_LIMIT,
+        timeout: float = FS_REQUEST_TIMEOUT,
+    ):
+        """Initialize the service.
+
+        Args:
+            max_workers: Maximum requests running at once across all clients.
+            per_client_limit: Maximum requests running at once for one client.
+            timeout: Seconds a request may take before it is abandoned.
+        """
+        self.max_workers = max_workers
+        self.per_client_limit = per_client_limit
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sleap-rtc-fs"
+        )
+        self._slots = asyncio.Semaphore(max_workers)
+        self._client_slots: Dict[str, asyncio.Semaphore] = {}
+        self._client_tasks: Dict[str, Set[asyncio.Task]] = {}
+
+    async def run(self, client_id: str, func: Callable, *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` on the pool on behalf of a client.
+
+        Args:
+            client_id: Identifies the requesting client (e.g. the data channel
+                label) for the per-client limit and :meth:`cancel_client`.
+            func: Blocking callable to run.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            Whatever ``func`` returns.
+
+        Raises:
+            FSRequestCancelled: If :meth:`cancel_client` cancelled the request.
+            asyncio.TimeoutError: If the request took longer than ``timeout``.
+        """
+        request = asyncio.ensure_future(
+            self._run(client_id, functools.partial(func, *args, **kwargs))
+        )
+        tasks = self._client_tasks.setdefault(client_id, set())
+        tasks.add(request)
+        try:
+            return await request
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            raise FSRequestCancelled(f"Filesystem request of {client_id} cancelled")
+        finally:
+            tasks.discard(request)
+            if not tasks:
+                self._client_tasks.pop(client_id, None)
+                self._client_slots.pop(client_id, None)
+
+    async def _run(self, client_id: str, call: Callable) -> Any:
+        client_slots = self._client_slots.setdefault(
+            client_id, asyncio.Semaphore(self.per_client_limit)
+        )
+        async with client_slots, self._slots:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, call)
+            return await asyncio.wait_for(future, timeout=self.timeout)
+
+    def pending(self, client_id: str) -> int:
+        """Return the number of queued or running requests for a client."""
+        return len(self._client_tasks.get(client_id, ()))
+
+    def cancel_client(self, client_id: str) -> int:
+        """Cancel every queued or running request of a client.
+
+        Args:
+            client_id: Client whose requests should be cancelled.
+
+        Returns:
+            Number of requests cancelled.
+        """
+        tasks = list(self._client_tasks.get(client_id, ()))
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            logging.info(f"Cancelled {len(tasks)} filesystem request(s) of {client_id}")
+        return len(tasks)
+
+    def shutdown(self) -> None:
+        """Cancel all requests and stop the thread pool without waiting."""
+        for client_id in list(self._client_tasks):
+            self.cancel_client(client_id)
+        self._executor.shutdown(wait=False, cancel_futures=True)
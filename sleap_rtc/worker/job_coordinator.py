@@ -93,6 +93,15 @@ class JobCoordinator:
         app_message_type = payload.get("app_message_type")
         from_peer_id = message.get("from_peer_id")
 
+        if app_message_type == "ping":
+            # RTT probe from a client choosing where to place a job; answer
+            # before anything else so the measurement stays tight.
+            await self.send_peer_message(
+                from_peer_id,
+                {"app_message_type": "pong", "nonce": payload.get("nonce")},
+            )
+            return
+
         logging.info(f"Received peer message from {from_peer_id}: {app_message_type}")
 
         if app_message_type == "job_request":
@@ -28,14 +28,19 @@ _WATCHDOG_INTERVAL_SECS = 30
 # subprocess to flush its progress bar and exit cleanly on most hardware.
 _CANCEL_GRACE_SECS = 5
 
+from sleap_rtc.worker.line_framer import (
+    LINE_CR,
+    LINE_EOF,
+    LINE_LF,
+    LINE_OVERFLOW,
+    read_lines,
+)
+from sleap_rtc.worker.output_batcher import output_batcher
 from sleap_rtc.worker.progress_reporter import ProgressReporter
 
 if TYPE_CHECKING:
     from sleap_rtc.worker.capabilities import WorkerCapabilities
 
-# Set chunk separator for log streaming
-SEP = re.compile(rb"[\r\n]")
-
 
 def _read_rss_mb(pid: int) -> float | None:
     """Read resident set size in MB for a process from /proc/<pid>/status.
@@ -178,6 +183,7 @@ class JobExecutor:
         unzipped_dir: Working directory for current job.
         output_dir: Output directory for job results.
         package_type: Type of package ("train" or "track").
+        env: Extra environment variables for job subprocesses.
     """
 
     def __init__(
@@ -198,6 +204,9 @@ class JobExecutor:
         self.unzipped_dir = ""
         self.output_dir = ""
         self.package_type = "train"  # Default to training
+        # Extra environment for job subprocesses (e.g. CUDA_VISIBLE_DEVICES
+        # of the scheduler slot this executor belongs to)
+        self.env: dict[str, str] = {}
         self._running_process: asyncio.subprocess.Process | None = None
         self._progress_reporter = None
         self._stop_requested = False  # True when ZMQ "stop" command was sent
@@ -377,9 +386,16 @@ class JobExecutor:
             else None
         )
 
+        # Set when the worker forwards the trainer's ZMQ progress (GUI clients)
+        reporter = self.worker.progress_reporter
+        if not reporter.is_progress_listener_running():
+            reporter = None
+
         try:
             for config_name in training_jobs:
                 job_name = Path(config_name).stem
+                if reporter is not None and not reporter.is_progress_listener_running():
+                    reporter.start_progress_listener_task(channel)
 
                 # Send RTC msg over channel to indicate job start.
                 logging.info(
@@ -424,59 +440,39 @@ class JobExecutor:
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.STDOUT,
                     cwd=self.unzipped_dir,
-                    env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                    env={**os.environ, **self.env, "PYTHONUNBUFFERED": "1"},
                 )
 
                 assert process.stdout is not None
                 logging.info(f"Process started with PID: {process.pid}")
+                out = output_batcher(channel)
 
-                async def stream_logs(read_size=512, max_flush=64 * 1024):
-                    buf = b""
+                async def stream_logs():
                     pending_cr = ""
                     try:
-                        while True:
-                            chunk = await process.stdout.read(read_size)
-                            if not chunk:
+                        async for text, kind in read_lines(process.stdout):
+                            if kind == LINE_EOF:
                                 # process ended; flush any remaining text
                                 if pending_cr:
-                                    channel.send(pending_cr + "\n")
-                                if buf:
-                                    channel.send(buf.decode(errors="replace") + "\n")
-                                break
-
-                            buf += chunk
-
-                            while True:
-                                m = SEP.search(buf)
-                                if not m:
-                                    # If tqdm keeps extending one long line, hold as
-                                    # pending and clear the buffer
-                                    if len(buf) > max_flush:
-                                        pending_cr = buf.decode(errors="replace")
-                                        buf = b""
-                                    break
-
-                                sep = buf[m.start() : m.end()]
-                                payload = buf[: m.start()]
-                                buf = buf[m.end() :]
-
-                                text = payload.decode(errors="replace")
-                                if not text:
-                                    continue
-
-                                if sep == b"\n":
-                                    # \n supersedes any pending \r line (tqdm
-                                    # emits \r...\n for each batch; discard the
-                                    # \r version to avoid duplicate sends)
-                                    pending_cr = ""
-                                    channel.send(text + "\n")
-                                else:  # sep == b'\r' — hold, keep only latest
-                                    pending_cr = text
+                                    out.send(pending_cr + "\n")
+                                if text:
+                                    out.send(text + "\n")
+                            elif kind == LINE_LF:
+                                # \n supersedes any pending \r line (tqdm
+                                # emits \r...\n for each batch; discard the
+                                # \r version to avoid duplicate sends)
+                                pending_cr = ""
+                                out.send(text + "\n")
+                            else:
+                                # \r — hold, keep only latest. If tqdm keeps
+                                # extending one long line, it is held as
+                                # pending too (LINE_OVERFLOW).
+                                pending_cr = text
 
                     except Exception as e:
                         logging.exception("stream_logs failed: %s", e)
                         try:
-                            channel.send(f"[log-stream error] {e}\n")
+                            out.send(f"[log-stream error] {e}\n")
                         except Exception:
                             pass
 
@@ -484,11 +480,15 @@ class JobExecutor:
                 start_time = time.time()
 
                 await stream_logs()
+                out.flush()
                 logging.info("Waiting for process to complete...")
                 await process.wait()
                 logging.info(
                     f"Process completed with return code: {process.returncode}"
                 )
+                # The trainer's last reports go out before TRAIN_JOB_END/ERROR.
+                if reporter is not None:
+                    await reporter.flush_reports(channel)
 
                 # Calculate training duration
                 training_duration = (time.time() - start_time) / 60
@@ -654,7 +654,7 @@ class JobExecutor:
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.STDOUT,
                     cwd=self.unzipped_dir,
-                    env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                    env={**os.environ, **self.env, "PYTHONUNBUFFERED": "1"},
                 )
 
                 # Stream logs
@@ -802,7 +802,7 @@ class JobExecutor:
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
-                env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                env={**os.environ, **self.env, "PYTHONUNBUFFERED": "1"},
                 start_new_session=True,
             )
             self._running_process = process
@@ -902,6 +902,20 @@ class JobExecutor:
         # Delegate to worker's peer messaging
         await self.worker._send_peer_message(to_peer_id, payload)
 
+    async def _flush_progress(self, progress_reporter, channel: RTCDataChannel):
+        """Send a job's queued progress reports ahead of its terminal message.
+
+        Args:
+            progress_reporter: The job's ProgressReporter, or None.
+            channel: RTC data channel the reports are forwarded to.
+        """
+        if progress_reporter is None:
+            return
+        try:
+            await progress_reporter.flush_reports(channel)
+        except Exception as e:
+            logging.warning(f"Could not flush progress reports: {e}")
+
     async def execute_from_spec(
         self,
         channel,
@@ -986,13 +1000,18 @@ class JobExecutor:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=stderr_mode,
                 cwd=working_dir,
-                env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                env={**os.environ, **self.env, "PYTHONUNBUFFERED": "1"},
                 start_new_session=True,
             )
             self._running_process = process
 
             logging.info(f"[JOB {job_id}] Process started with PID: {process.pid}")
 
+            # A cancel that arrived while the process was being spawned
+            # (e.g. a parallel pipeline sibling failed) found nothing to kill.
+            if self._cancel_requested:
+                self.cancel_running_job()
+
             # Watchdog: log subprocess liveness every 30 s.  If a stop was
             # requested and ZMQ alone hasn't worked after one full cycle,
             # escalate to SIGINT so the pipeline doesn't hang indefinitely.
@@ -1058,84 +1077,62 @@ class JobExecutor:
                 "OOM",
                 "out of memory",
             )
+            # Coalesces log lines and CR:: updates (see output_batcher.py)
+            out = output_batcher(channel)
 
             async def _stream_stderr():
                 assert process.stderr is not None
-                buf = b""
                 try:
-                    while True:
-                        chunk = await process.stderr.read(512)
-                        if not chunk:
+                    async for text, kind in read_lines(process.stderr):
+                        if kind == LINE_OVERFLOW:
+                            # Runaway line without a separator; drop it
+                            continue
+                        if kind == LINE_EOF:
                             # EOF — flush any remaining buffered content
-                            if buf:
-                                line = buf.decode(errors="replace").rstrip()
-                                if line and not any(
-                                    line.startswith(pat) or pat in line
-                                    for pat in _TQDM_NOISE
-                                ):
-                                    if any(kw in line for kw in _FATAL_KEYWORDS):
-                                        logging.error(f"[JOB {job_id}] [stderr] {line}")
-                                        if channel.readyState == "open":
-                                            channel.send(f"[stderr] {line}\n")
-                                    else:
-                                        logging.warning(
-                                            f"[JOB {job_id}] [stderr] {line}"
-                                        )
-                            break
-
-                        buf += chunk
-
-                        while True:
-                            match = SEP.search(buf)
-                            if not match:
-                                if len(buf) > 64 * 1024:
-                                    buf = b""
-                                break
-
-                            sep = buf[match.start() : match.end()]
-                            payload = buf[: match.start()]
-                            buf = buf[match.end() :]
-
-                            text = payload.decode(errors="replace")
-                            if not text:
-                                continue
-
-                            if sep == b"\r":
-                                # tqdm batch-level update — forward as CR:: so
-                                # the client can overwrite the previous terminal
-                                # line and show a live progress bar.  Only rank 0
-                                # writes tqdm (Lightning disables TQDMProgressBar
-                                # on non-zero ranks), so no DDP duplication here.
-                                logging.debug(f"[JOB {job_id}] [stderr] {text}")
-                                if channel.readyState == "open":
-                                    channel.send(f"CR::{text}")
-                            else:  # \n
-                                line = text.rstrip()
-                                if not line:
-                                    continue
-                                if any(
-                                    line.startswith(pat) or pat in line
-                                    for pat in _TQDM_NOISE
-                                ):
-                                    logging.debug(f"[JOB {job_id}] [stderr] {line}")
-                                elif any(kw in line for kw in _FATAL_KEYWORDS):
+                            line = text.rstrip()
+                            if line and not any(
+                                line.startswith(pat) or pat in line
+                                for pat in _TQDM_NOISE
+                            ):
+                                if any(kw in line for kw in _FATAL_KEYWORDS):
                                     logging.error(f"[JOB {job_id}] [stderr] {line}")
                                     if channel.readyState == "open":
-                                        channel.send(f"[stderr] {line}\n")
+                                        out.send(f"[stderr] {line}\n")
                                 else:
-                                    # \n-terminated stderr lines come from Python
-                                    # logging and appear once per DDP rank.
-                                    # For track (inference) jobs, forward to channel
-                                    # since they're typically single-GPU and the
-                                    # dashboard needs to show inference progress.
                                     logging.warning(f"[JOB {job_id}] [stderr] {line}")
-                                    if (
-                                        job_type == "track"
-                                        and channel.readyState == "open"
-                                    ):
-                                        channel.send(
-                                            f"{MSG_JOB_LOG}{MSG_SEPARATOR}[stderr] {line}\n"
-                                        )
+                        elif kind == LINE_CR:
+                            # tqdm batch-level update — forward as CR:: so
+                            # the client can overwrite the previous terminal
+                            # line and show a live progress bar.  Only rank 0
+                            # writes tqdm (Lightning disables TQDMProgressBar
+                            # on non-zero ranks), so no DDP duplication here.
+                            logging.debug(f"[JOB {job_id}] [stderr] {text}")
+                            if channel.readyState == "open":
+                                out.send(f"CR::{text}")
+                        else:  # \n
+                            line = text.rstrip()
+                            if not line:
+                                continue
+                            if any(
+                                line.startswith(pat) or pat in line
+                                for pat in _TQDM_NOISE
+                            ):
+                                logging.debug(f"[JOB {job_id}] [stderr] {line}")
+                            elif any(kw in line for kw in _FATAL_KEYWORDS):
+                                logging.error(f"[JOB {job_id}] [stderr] {line}")
+                                if channel.readyState == "open":
+                                    out.send(f"[stderr] {line}\n")
+                            else:
+                                # \n-terminated stderr lines come from Python
+                                # logging and appear once per DDP rank.
+                                # For track (inference) jobs, forward to channel
+                                # since they're typically single-GPU and the
+                                # dashboard needs to show inference progress.
+                                logging.warning(f"[JOB {job_id}] [stderr] {line}")
+                                if job_type == "track" and channel.readyState == "open":
+                                    out.send(
+                                        f"{MSG_JOB_LOG}{MSG_SEPARATOR}[stderr] {line}\n"
+                                    )
                 except Exception as e:
                     logging.exception(f"[JOB {job_id}] Stderr stream error: {e}")
 
@@ -1202,7 +1199,6 @@ class JobExecutor:
             async def stream_logs_with_progress():
                 """Stream logs and extract progress information."""
                 nonlocal _captured_output_path
-                buf = b""
                 epoch_pattern = re.compile(r"Epoch\s+(\d+)")
                 # Match loss=, loss:, loss  (but not val/loss= or val_loss=)
                 loss_pattern = re.compile(r"(?<![/\w])loss[=:\s]+([0-9.]+)")
@@ -1215,9 +1211,8 @@ class JobExecutor:
 
                 pending_cr = ""
                 try:
-                    while True:
-                        chunk = await process.stdout.read(512)
-                        if not chunk:
+                    async for text, kind in read_lines(process.stdout):
+                        if kind == LINE_EOF:
                             # EOF — subprocess closed its stdout (process is done or pipe broke)
                             logging.info(
                                 f"[JOB {job_id}] EOF on stdout from PID {process.pid} — "
@@ -1225,124 +1220,102 @@ class JobExecutor:
                             )
                             if pending_cr and channel.readyState == "open":
                                 if job_type == "track":
-                                    channel.send(
+                                    out.send(
                                         f"{MSG_JOB_LOG}{MSG_SEPARATOR}{pending_cr}\n"
                                     )
                                 else:
-                                    channel.send(pending_cr + "\n")
-                            if buf:
-                                line = buf.decode(errors="replace")
+                                    out.send(pending_cr + "\n")
+                            if text:
+                                line = text
                                 logging.info(f"[JOB {job_id}] {line}")
                                 if channel.readyState == "open":
                                     if job_type == "track":
-                                        channel.send(
+                                        out.send(
                                             f"{MSG_JOB_LOG}{MSG_SEPARATOR}{line}\n"
                                         )
                                     else:
-                                        channel.send(line + "\n")
+                                        out.send(line + "\n")
                             break
+                        if kind == LINE_OVERFLOW:
+                            # Hold long lines as pending rather than flushing mid-line
+                            pending_cr = text
+                            continue
+
+                        # Log and send log line to client (debug only —
+                        # avoids flooding the terminal with every training
+                        # output line at INFO level)
+                        logging.debug(f"[JOB {job_id}] {text}")
+
+                        # Capture the actual output path printed by
+                        # sleap-nn ("Predictions output path: <path>").
+                        if job_type == "track" and "Predictions output path:" in text:
+                            _captured_output_path = text.split(
+                                "Predictions output path:", 1
+                            )[1].strip()
+                            logging.info(
+                                f"[JOB {job_id}] Captured output path: "
+                                f"{_captured_output_path}"
+                            )
 
-                        buf += chunk
-
-                        while True:
-                            match = SEP.search(buf)
-                            if not match:
-                                # Hold long lines as pending rather than flushing mid-line
-                                if len(buf) > 64 * 1024:
-                                    pending_cr = buf.decode(errors="replace")
-                                    buf = b""
-                                break
-
-                            sep = buf[match.start() : match.end()]
-                            payload = buf[: match.start()]
-                            buf = buf[match.end() :]
-
-                            text = payload.decode(errors="replace")
-                            if not text:
-                                continue
-
-                            # Log and send log line to client (debug only —
-                            # avoids flooding the terminal with every training
-                            # output line at INFO level)
-                            logging.debug(f"[JOB {job_id}] {text}")
-
-                            # Capture the actual output path printed by
-                            # sleap-nn ("Predictions output path: <path>").
-                            if (
-                                job_type == "track"
-                                and "Predictions output path:" in text
-                            ):
-                                _captured_output_path = text.split(
-                                    "Predictions output path:", 1
-                                )[1].strip()
-                                logging.info(
-                                    f"[JOB {job_id}] Captured output path: "
-                                    f"{_captured_output_path}"
-                                )
+                        if kind == LINE_LF:
+                            # \n supersedes any pending \r line (tqdm
+                            # emits \r...\n for each batch; discard the
+                            # \r version to avoid duplicate sends)
+                            pending_cr = ""
+                            if channel.readyState == "open":
+                                if job_type == "track":
+                                    # Wrap subprocess stdout in a typed
+                                    # protocol message so the client's
+                                    # response loop can route it via
+                                    # on_job_message (Task 9). Training
+                                    # keeps the legacy bare-string format
+                                    # that _run_training_async's on_log
+                                    # callback expects.
+                                    out.send(f"{MSG_JOB_LOG}{MSG_SEPARATOR}{text}")
+                                else:
+                                    out.send(text + "\n")
+                        else:  # \r — forward as CR:: for live progress display
+                            pending_cr = text
+                            if channel.readyState == "open":
+                                if job_type == "track":
+                                    out.send(f"{MSG_JOB_LOG}{MSG_SEPARATOR}CR::{text}")
+                                else:
+                                    out.send(f"CR::{text}")
+
+                        # Extract progress info for training jobs
+                        if job_type == "train":
+                            epoch_match = epoch_pattern.search(text)
+                            if epoch_match:
+                                current_epoch = int(epoch_match.group(1))
+
+                            loss_match = loss_pattern.search(text)
+                            if loss_match:
+                                current_loss = float(loss_match.group(1))
+
+                            val_loss_match = val_loss_pattern.search(text)
+                            if val_loss_match:
+                                current_val_loss = float(val_loss_match.group(1))
+
+                            # Send progress update if we have epoch info
+                            if current_epoch > 0:
+                                progress_data = {
+                                    "epoch": current_epoch,
+                                }
+                                if current_loss is not None:
+                                    progress_data["loss"] = current_loss
+                                if current_val_loss is not None:
+                                    progress_data["val_loss"] = current_val_loss
 
-                            if sep == b"\n":
-                                # \n supersedes any pending \r line (tqdm
-                                # emits \r...\n for each batch; discard the
-                                # \r version to avoid duplicate sends)
-                                pending_cr = ""
                                 if channel.readyState == "open":
-                                    if job_type == "track":
-                                        # Wrap subprocess stdout in a typed
-                                        # protocol message so the client's
-                                        # response loop can route it via
-                                        # on_job_message (Task 9). Training
-                                        # keeps the legacy bare-string format
-                                        # that _run_training_async's on_log
-                                        # callback expects.
-                                        channel.send(
-                                            f"{MSG_JOB_LOG}{MSG_SEPARATOR}{text}"
-                                        )
-                                    else:
-                                        channel.send(text + "\n")
-                            else:  # \r — forward as CR:: for live progress display
-                                pending_cr = text
-                                if channel.readyState == "open":
-                                    if job_type == "track":
-                                        channel.send(
-                                            f"{MSG_JOB_LOG}{MSG_SEPARATOR}CR::{text}"
-                                        )
-                                    else:
-                                        channel.send(f"CR::{text}")
-
-                            # Extract progress info for training jobs
-                            if job_type == "train":
-                                epoch_match = epoch_pattern.search(text)
-                                if epoch_match:
-                                    current_epoch = int(epoch_match.group(1))
-
-                                loss_match = loss_pattern.search(text)
-                                if loss_match:
-                                    current_loss = float(loss_match.group(1))
-
-                                val_loss_match = val_loss_pattern.search(text)
-                                if val_loss_match:
-                                    current_val_loss = float(val_loss_match.group(1))
-
-                                # Send progress update if we have epoch info
-                                if current_epoch > 0:
-                                    progress_data = {
-                                        "epoch": current_epoch,
-                                    }
-                                    if current_loss is not None:
-                                        progress_data["loss"] = current_loss
-                                    if current_val_loss is not None:
-                                        progress_data["val_loss"] = current_val_loss
+                                    import json
 
-                                    if channel.readyState == "open":
-                                        import json
-
-                                        progress_msg = f"{MSG_JOB_PROGRESS}{MSG_SEPARATOR}{json.dumps(progress_data)}"
-                                        channel.send(progress_msg)
+                                    progress_msg = f"{MSG_JOB_PROGRESS}{MSG_SEPARATOR}{json.dumps(progress_data)}"
+                                    out.send(progress_msg)
 
                 except Exception as e:
                     logging.exception(f"[JOB {job_id}] Log streaming error: {e}")
                     if channel.readyState == "open":
-                        channel.send(f"[log-stream error] {e}\n")
+                        out.send(f"[log-stream error] {e}\n")
 
             await stream_logs_with_progress()
             # Drain any remaining stderr — crash output (e.g. NCCL errors,
@@ -1352,6 +1325,8 @@ class JobExecutor:
                     await asyncio.wait_for(stderr_task, timeout=5.0)
                 except (asyncio.TimeoutError, asyncio.CancelledError):
                     stderr_task.cancel()
+            # Everything streamed so far goes out before JOB_COMPLETE/FAILED.
+            out.flush()
             watchdog_task.cancel()
             memory_monitor_task.cancel()
             _w = _read_rss_mb(worker_pid)
@@ -1386,6 +1361,9 @@ class JobExecutor:
                         "30 s — proceeding anyway"
                     )
 
+            # The trainer's last reports go out before JOB_COMPLETE/FAILED.
+            await self._flush_progress(progress_reporter, channel)
+
             duration_seconds = int(time.time() - start_time)
             logging.info(
                 f"[JOB {job_id}] Process PID {process.pid} exited "
@@ -1549,6 +1527,7 @@ class JobExecutor:
             import json
 
             logging.error(f"[JOB {job_id}] Execution error: {e}")
+            await self._flush_progress(progress_reporter, channel)
             error_data = {
                 "job_id": job_id,
                 "job_type": job_type,
@@ -0,0 +1,151 @@
+"""On-disk record of the jobs a worker has accepted but not finished.
+
+Each accepted job is written to ``<root>/<record>.json`` when it enters the
+queue and removed once it finishes, is cancelled or is dropped, so the queue
+survives a worker restart. Records look like::
+
+    {
+        "version": 1,
+        "job_id": "abc123",        # client job ID
+        "spec": "{...}",           # job spec JSON exactly as submitted
+        "state": "queued",         # "queued" or "running"
+        "pid": 4242,               # worker process that owns the record
+        "queued_at": 1700000000.0,
+    }
+
+After a restart, :meth:`JobQueueStore.recover` hands back the records of
+worker processes that are no longer alive: jobs that were still queued can be
+submitted again, jobs that were running when the worker died are reported as
+failed.
+"""
+
+import json
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+
+def default_job_queue_dir(name: Optional[str] = None) -> Path:
+    """Return the default queue location of a worker.
+
+    Args:
+        name: Worker name; named workers on one machine get their own queue.
+    """
+    return Path.home() / ".sleap-rtc" / "job-queue" / (name or "default")
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":  # os.kill would terminate the process on Windows
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobQueueStore:
+    """One JSON record per accepted job, kept until the job is done.
+
+    Attributes:
+        root: Directory holding the records.
+    """
+
+    VERSION = 1
+
+    def __init__(self, root: str):
+        """Initialize the store, creating ``root`` if needed.
+
+        Args:
+            root: Directory holding the records.
+        """
+        self.root = Path(root).expanduser()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def add(self, job_id: str, spec: str) -> str:
+        """Record a job that was just accepted.
+
+        Args:
+            job_id: Client job ID.
+            spec: Job spec JSON as submitted by the client.
+
+        Returns:
+            Record key to pass to :meth:`mark_running` and :meth:`remove`.
+        """
+        key = uuid.uuid4().hex
+        self._write(
+            key,
+            {
+                "version": self.VERSION,
+                "job_id": job_id,
+                "spec": spec,
+                "state": "queued",
+                "pid": os.getpid(),
+                "queued_at": time.time(),
+            },
+        )
+        return key
+
+    def mark_running(self, key: str) -> None:
+        """Note that a recorded job has left the queue and started."""
+        record = self._read(self.root / f"{key}.json")
+        if record is None:
+            return
+        record["state"] = "running"
+        try:
+            self._write(key, record)
+        except OSError as e:
+            logging.warning(f"Could not update job queue record {key}: {e}")
+
+    def remove(self, key: str) -> None:
+        """Forget a job that finished, was cancelled or was dropped."""
+        try:
+            (self.root / f"{key}.json").unlink(missing_ok=True)
+        except OSError as e:
+            logging.warning(f"Could not remove job queue record {key}: {e}")
+
+    def recover(self) -> List[dict]:
+        """Take over the records left behind by worker processes that died.
+
+        Records of live worker processes sharing the directory are left alone.
+
+        Returns:
+            The orphaned records, oldest first. They are removed from disk.
+        """
+        records = []
+        for path in self.root.glob("*.json"):
+            record = self._read(path)
+            if record is None:
+                path.unlink(missing_ok=True)
+                continue
+            pid = record.get("pid")
+            if pid == os.getpid() or (isinstance(pid, int) and _pid_alive(pid)):
+                continue
+            path.unlink(missing_ok=True)
+            records.append(record)
+        return sorted(records, key=lambda r: r.get("queued_at", 0))
+
+    def _read(self, path: Path) -> Optional[dict]:
+        try:
+            with open(path) as fh:
+                record = json.load(fh)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Dropping unreadable job queue record {path.name}: {e}")
+            return None
+        if not isinstance(record, dict) or "spec" not in record:
+            logging.warning(f"Dropping malformed job queue record {path.name}")
+            return None
+        return record
+
+    def _write(self, key: str, record: dict) -> None:
+        tmp = self.root / f".{key}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump(record, fh)
+        os.replace(tmp, self.root / f"{key}.json")
@@ -0,0 +1,474 @@
+"""Worker-local job queue that runs structured jobs concurrently across GPUs.
+
+A worker on a multi-GPU node can run one job per GPU group instead of turning
+everyone away while a single job runs. Each :class:`JobSlot` owns:
+
+- a disjoint set of CUDA devices, exposed to the job's subprocesses through
+  ``CUDA_VISIBLE_DEVICES``;
+- its own ZMQ controller/publish port pair, so progress and stop commands of
+  concurrent training jobs never cross;
+- its own :class:`JobExecutor`, so running-process handles and stop/cancel
+  flags are per job.
+
+Accepted jobs wait in a FIFO queue until a slot frees up. The queue belongs to
+the worker process rather than to a client connection, so jobs from several
+clients (or relay submissions) line up behind each other instead of being
+rejected. With a :class:`JobQueueStore`, the spec of every accepted job is also
+kept on disk until the job is done, so the queue survives a worker restart.
+
+With a single slot (the default), the slot runs on the worker's own
+``job_executor``, uses the default ZMQ ports and leaves ``CUDA_VISIBLE_DEVICES``
+alone, which is exactly the one-job-at-a-time behaviour.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from sleap_rtc.jobs.builder import DEFAULT_ZMQ_PORTS
+from sleap_rtc.protocol import (
+    MSG_JOB_COMPLETE,
+    MSG_JOB_FAILED,
+    MSG_JOB_LOG,
+    MSG_JOB_REJECTED,
+    MSG_SEPARATOR,
+)
+from sleap_rtc.worker.job_executor import JobExecutor
+from sleap_rtc.worker.job_queue_store import JobQueueStore
+
+
+def plan_device_groups(devices: List[str], max_jobs: int) -> List[List[str]]:
+    """Split GPU devices into one group per concurrent job.
+
+    Args:
+        devices: CUDA device identifiers visible to the worker.
+        max_jobs: Requested number of concurrent jobs; 0 means one per GPU.
+            Capped at the number of GPUs when there are any.
+
+    Returns:
+        One device list per slot. Groups differ in size by at most one device.
+        Without GPUs every group is empty (CPU jobs).
+    """
+    if max_jobs <= 0:
+        max_jobs = max(len(devices), 1)
+    if devices and max_jobs > len(devices):
+        logging.warning(
+            f"Requested {max_jobs} concurrent jobs but only {len(devices)} "
+            f"GPU(s) are visible; running {len(devices)}"
+        )
+        max_jobs = len(devices)
+    size, extra = divmod(len(devices), max_jobs)
+    groups = []
+    start = 0
+    for i in range(max_jobs):
+        end = start + size + (1 if i < extra else 0)
+        groups.append(devices[start:end])
+        start = end
+    return groups
+
+
+@dataclass
+class JobSlot:
+    """One unit of concurrent job execution.
+
+    Attributes:
+        index: Position of the slot on this worker.
+        devices: CUDA devices reserved for jobs in this slot.
+        zmq_ports: ``controller`` and ``publish`` ports for training progress.
+        executor: Executor owned by the slot, or None to use the worker's.
+        env: Extra environment for the slot's job subprocesses.
+        job_id: Client job ID currently running in the slot.
+        channel: Data channel of the client that submitted the running job.
+        pipeline: Executors of models training in parallel, while they run.
+    """
+
+    index: int
+    devices: List[str]
+    zmq_ports: Dict[str, int]
+    executor: Optional[JobExecutor] = None
+    env: Dict[str, str] = field(default_factory=dict)
+    job_id: Optional[str] = None
+    channel: Any = None
+    pipeline: Optional["ExecutorGroup"] = None
+
+
+class ExecutorGroup:
+    """Fan stop/cancel commands out to the executors of a parallel pipeline.
+
+    Offers the control surface of :class:`JobExecutor` that message handlers
+    use, so a client's stop or cancel reaches every model that is training.
+
+    Attributes:
+        executors: Executors of the models training concurrently.
+    """
+
+    def __init__(self, executors: List[JobExecutor]):
+        """Initialize group.
+
+        Args:
+            executors: Executors of the models training concurrently.
+        """
+        self.executors = executors
+
+    @property
+    def _progress_reporter(self):
+        for executor in self.executors:
+            if executor._progress_reporter is not None:
+                return executor._progress_reporter
+        return None
+
+    @property
+    def _cancel_requested(self) -> bool:
+        return any(e._cancel_requested for e in self.executors)
+
+    @_cancel_requested.setter
+    def _cancel_requested(self, value: bool) -> None:
+        for executor in self.executors:
+            executor._cancel_requested = value
+
+    def send_control_message(self, raw_zmq_message: str) -> None:
+        """Forward a raw ZMQ control message to every model's trainer."""
+        for executor in self.executors:
+            executor.send_control_message(raw_zmq_message)
+
+    def stop_running_job(self) -> None:
+        """Gracefully stop every model's process."""
+        for executor in self.executors:
+            executor.stop_running_job()
+
+    def cancel_running_job(self) -> None:
+        """Cancel every model's process."""
+        for executor in self.executors:
+            executor.cancel_running_job()
+
+
+class DetachedChannel:
+    """Stand-in for the data channel of a job whose client is gone.
+
+    Jobs recovered from the queue store after a restart run without a client;
+    what would have been sent to it is logged instead.
+
+    Attributes:
+        label: Channel label used in log messages.
+    """
+
+    readyState = "open"
+
+    def __init__(self, job_id: str):
+        """Initialize channel.
+
+        Args:
+            job_id: Client job ID of the recovered job.
+        """
+        self.label = f"recovered:{job_id}"
+
+    def send(self, message) -> None:
+        """Log a message meant for the departed client."""
+        if isinstance(message, str) and message.startswith(
+            (MSG_JOB_COMPLETE, MSG_JOB_FAILED, MSG_JOB_REJECTED)
+        ):
+            logging.info(f"[{self.label}] {message}")
+        else:
+            logging.debug(f"[{self.label}] {str(message)[:200]}")
+
+
+class JobScheduler:
+    """Queue accepted jobs and run them on free GPU slots.
+
+    Attributes:
+        worker: Parent RTCWorkerClient.
+        slots: Execution slots, one per concurrently running job.
+        on_change: Optional callback invoked whenever a job is queued, starts
+            or finishes; used to advertise queue depth and free GPUs.
+        max_queue: Number of jobs allowed to wait for a slot; 0 means no
+            limit.
+        store: Optional on-disk record of accepted jobs.
+    """
+
+    def __init__(
+        self,
+        worker,
+        device_groups: List[List[str]],
+        on_change: Optional[Callable[[], None]] = None,
+        max_queue: int = 0,
+        store: Optional[JobQueueStore] = None,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            worker: Parent RTCWorkerClient instance.
+            device_groups: CUDA devices of each slot (see
+                :func:`plan_device_groups`).
+            on_change: Optional callback invoked when the queue or the set of
+                running jobs changes.
+            max_queue: Number of jobs allowed to wait for a slot; 0 means no
+                limit.
+            store: Optional on-disk record of accepted jobs, so queued jobs
+                survive a restart.
+        """
+        self.worker = worker
+        self.on_change = on_change
+        self.max_queue = max_queue
+        self.store = store
+        self.slots: List[JobSlot] = []
+        shared = len(device_groups) <= 1
+        for i, devices in enumerate(device_groups or [[]]):
+            slot = JobSlot(
+                index=i,
+                devices=list(devices),
+                zmq_ports={
+                    "controller": DEFAULT_ZMQ_PORTS["controller"] + 2 * i,
+                    "publish": DEFAULT_ZMQ_PORTS["publish"] + 2 * i,
+                },
+            )
+            if not shared:
+                if devices:
+                    slot.env["CUDA_VISIBLE_DEVICES"] = ",".join(devices)
+                slot.executor = JobExecutor(
+                    worker=worker, capabilities=worker.capabilities
+                )
+                slot.executor.env = slot.env
+            self.slots.append(slot)
+
+        # (job_id, channel, future) of jobs waiting for a slot, oldest first
+        self._waiting: Deque[Tuple[str, Any, asyncio.Future]] = deque()
+
+    @property
+    def concurrent(self) -> bool:
+        """Whether this worker runs more than one job at a time."""
+        return len(self.slots) > 1
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of accepted jobs waiting for a slot."""
+        return sum(1 for _, _, f in self._waiting if not f.done())
+
+    @property
+    def has_capacity(self) -> bool:
+        """Whether another job can be accepted, to run now or to wait."""
+        if self._free_slot() is not None:
+            return True
+        return not self.max_queue or self.queue_depth < self.max_queue
+
+    @property
+    def running_jobs(self) -> List[str]:
+        """Client job IDs currently running."""
+        return [s.job_id for s in self.slots if s.job_id is not None]
+
+    @property
+    def free_gpus(self) -> List[str]:
+        """CUDA devices of slots that are not running a job."""
+        return [d for s in self.slots if s.job_id is None for d in s.devices]
+
+    def executor(self, slot: JobSlot) -> JobExecutor:
+        """Return the executor that runs jobs in a slot."""
+        return slot.executor or self.worker.job_executor
+
+    def model_zmq_ports(self, slot: JobSlot, model_index: int) -> Dict[str, int]:
+        """Return the ZMQ ports of one model of a parallel pipeline.
+
+        The first model uses the slot's own ports; the others use ports past
+        those of every slot, so no two trainers on the worker share a port.
+
+        Args:
+            slot: Slot running the pipeline.
+            model_index: Position of the model in the pipeline.
+
+        Returns:
+            ``controller`` and ``publish`` port numbers.
+        """
+        offset = 2 * (slot.index + model_index * len(self.slots))
+        return {
+            "controller": DEFAULT_ZMQ_PORTS["controller"] + offset,
+            "publish": DEFAULT_ZMQ_PORTS["publish"] + offset,
+        }
+
+    def slot_for(self, channel=None, job_id: Optional[str] = None) -> Optional[JobSlot]:
+        """Return the slot running a client's job.
+
+        Args:
+            channel: Data channel the job was submitted on.
+            job_id: Client job ID.
+
+        Returns:
+            The matching slot, or None if no such job is running.
+        """
+        for slot in self.slots:
+            if slot.job_id is None:
+                continue
+            if (job_id is not None and slot.job_id == job_id) or (
+                channel is not None and slot.channel is channel
+            ):
+                return slot
+        return None
+
+    def executor_for(self, channel=None, job_id: Optional[str] = None) -> JobExecutor:
+        """Return the executor running a client's job.
+
+        Used to route stop/cancel commands to the right process when several
+        jobs run at once.
+
+        Args:
+            channel: Data channel the job was submitted on.
+            job_id: Client job ID.
+
+        Returns:
+            The executor of the matching running job, or the worker's own
+            executor when no job matches.
+        """
+        slot = self.slot_for(channel=channel, job_id=job_id)
+        if slot is None:
+            return self.worker.job_executor
+        return slot.pipeline or self.executor(slot)
+
+    def to_metadata_dict(self) -> Dict[str, Any]:
+        """Return queue and GPU availability for worker metadata."""
+        return {
+            "job_slots": len(self.slots),
+            "running_jobs": len(self.running_jobs),
+            "queue_depth": self.queue_depth,
+            "free_gpus": self.free_gpus,
+        }
+
+    def cancel_queued(self, channel=None, job_id: Optional[str] = None) -> bool:
+        """Remove a job that is still waiting for a slot.
+
+        Args:
+            channel: Data channel the job was submitted on.
+            job_id: Client job ID.
+
+        Returns:
+            True if a queued job was cancelled; False if none matched (it may
+            already be running).
+        """
+        for waiting_id, waiting_channel, future in self._waiting:
+            if future.done():
+                continue
+            if (job_id is not None and waiting_id == job_id) or (
+                channel is not None and waiting_channel is channel
+            ):
+                future.set_result(None)
+                logging.info(f"[SCHEDULER] Cancelled queued job {waiting_id}")
+                self._notify()
+                return True
+        return False
+
+    async def run(
+        self,
+        job_id: str,
+        channel,
+        job: Callable[[JobSlot], Awaitable[Any]],
+        spec: Optional[str] = None,
+    ) -> Any:
+        """Wait for a free slot, then run a job in it.
+
+        If every slot is busy, the client is told its position in the queue.
+        A queued job that is cancelled, or whose channel has closed by the
+        time a slot frees up, is dropped without running.
+
+        Args:
+            job_id: Client job ID, used to route stop/cancel commands.
+            channel: Data channel of the submitting client.
+            job: Coroutine function that runs the job in the given slot.
+            spec: Job spec JSON as submitted, kept in :attr:`store` until the
+                job is done.
+
+        Returns:
+            The job's result, or None if it was dropped.
+        """
+        record = self._record(job_id, spec)
+        try:
+            slot = await self._acquire(job_id, channel)
+            if slot is None:
+                if channel.readyState == "open":
+                    error = {
+                        "job_id": job_id,
+                        "message": "Job cancelled before it started",
+                    }
+                    channel.send(f"{MSG_JOB_FAILED}{MSG_SEPARATOR}{json.dumps(error)}")
+                return None
+            try:
+                if channel.readyState != "open":
+                    logging.info(
+                        f"[SCHEDULER] Dropping {job_id}: client left the queue"
+                    )
+                    return None
+                if record is not None:
+                    self.store.mark_running(record)
+                logging.info(
+                    f"[SCHEDULER] Running {job_id} in slot {slot.index} "
+                    f"(devices={slot.devices or 'all'}, zmq={slot.zmq_ports})"
+                )
+                return await job(slot)
+            finally:
+                self._release(slot)
+        finally:
+            if record is not None:
+                self.store.remove(record)
+
+    def _record(self, job_id: str, spec: Optional[str]) -> Optional[str]:
+        if self.store is None or spec is None:
+            return None
+        try:
+            return self.store.add(job_id, spec)
+        except OSError as e:
+            logging.warning(f"[SCHEDULER] Could not persist {job_id}: {e}")
+            return None
+
+    async def _acquire(self, job_id: str, channel) -> Optional[JobSlot]:
+        slot = self._free_slot() if self.queue_depth == 0 else None
+        if slot is None:
+            future = asyncio.get_running_loop().create_future()
+            self._waiting.append((job_id, channel, future))
+            position = self.queue_depth
+            logging.info(f"[SCHEDULER] Queued {job_id} at position {position}")
+            self._notify()
+            if channel.readyState == "open":
+                channel.send(
+                    f"{MSG_JOB_LOG}{MSG_SEPARATOR}Queued at position {position}; "
+                    "waiting for a free GPU\n"
+                )
+            try:
+                slot = await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled() and future.result():
+                    # A slot was handed over just as we were cancelled.
+                    self._release(future.result())
+                else:
+                    self._notify()
+                raise
+            if slot is None:
+                return None
+        slot.job_id = job_id
+        slot.channel = channel
+        self._notify()
+        return slot
+
+    def _release(self, slot: JobSlot) -> None:
+        slot.job_id = None
+        slot.channel = None
+        while self._waiting:
+            _, _, future = self._waiting.popleft()
+            if not future.done():
+                # Mark the slot taken so a concurrent submit cannot grab it
+                # before the waiter resumes.
+                slot.job_id = ""
+                future.set_result(slot)
+                break
+        self._notify()
+
+    def _free_slot(self) -> Optional[JobSlot]:
+        for slot in self.slots:
+            if slot.job_id is None:
+                return slot
+        return None
+
+    def _notify(self) -> None:
+        if self.on_change is not None:
+            try:
+                self.on_change()
+            except Exception as e:
+                logging.warning(f"[SCHEDULER] Failed to publish queue state: {e}")
@@ -0,0 +1,114 @@
+"""Split subprocess output into ``\\r``/``\\n``-terminated lines.
+
+sleap-nn writes Python logging lines ending in ``\\n`` and tqdm progress bars
+that redraw with ``\\r``. On fast GPUs tqdm emits bursts of ``\\r`` updates, so
+the log streamers in :mod:`sleap_rtc.worker.job_executor` must frame lines
+cheaply. :class:`LineFramer` keeps unconsumed output in one ``bytearray``,
+scans it for separators in place and decodes each line straight from a
+``memoryview`` of the buffer. Consumed bytes are dropped once per fed chunk,
+so framing costs O(chunk) instead of re-copying the whole remaining buffer for
+every line.
+"""
+
+import asyncio
+import re
+from typing import AsyncIterator, List, Tuple
+
+# Bytes requested per read; asyncio returns whatever is available up to this,
+# so a large value costs no latency but saves loop iterations during bursts.
+LINE_READ_SIZE = 64 * 1024
+# A line longer than this without a separator is handed out as LINE_OVERFLOW.
+LINE_MAX_BYTES = 64 * 1024
+
+# Kinds of framed text
+LINE_LF = "\n"  # line ended with \n
+LINE_CR = "\r"  # line ended with \r (tqdm redraw)
+LINE_OVERFLOW = "overflow"  # LINE_MAX_BYTES without a separator
+LINE_EOF = "eof"  # unterminated tail at end of stream (possibly empty)
+
+_SEP = re.compile(rb"[\r\n]")
+
+
+class LineFramer:
+    """Incrementally frame a byte stream into lines.
+
+    Empty lines (including the ``\\n`` of a ``\\r\\n`` pair) are skipped.
+
+    Attributes:
+        max_line: Bytes buffered without a separator before they are handed
+            out as LINE_OVERFLOW.
+    """
+
+    def __init__(self, max_line: int = LINE_MAX_BYTES):
+        """Initialize framer.
+
+        Args:
+            max_line: Bytes buffered without a separator before they are
+                handed out as LINE_OVERFLOW.
+        """
+        self.max_line = max_line
+        self._buf = bytearray()
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, str]]:
+        """Add output and return the lines it completed.
+
+        Args:
+            chunk: Next bytes read from the stream.
+
+        Returns:
+            List of ``(text, kind)`` tuples, kind being LINE_LF, LINE_CR or
+            LINE_OVERFLOW.
+        """
+        buf = self._buf
+        buf += chunk
+        lines = []
+        pos = 0
+        with memoryview(buf) as view:
+            while True:
+                match = _SEP.search(buf, pos)
+                if match is None:
+                    break
+                start = match.start()
+                if start > pos:
+                    text = str(view[pos:start], "utf-8", "replace")
+                    lines.append((text, LINE_LF if buf[start] == 0x0A else LINE_CR))
+                pos = start + 1
+            if len(buf) - pos > self.max_line:
+                lines.append((str(view[pos:], "utf-8", "replace"), LINE_OVERFLOW))
+                pos = len(buf)
+        del buf[:pos]
+        return lines
+
+    def flush(self) -> str:
+        """Return and clear the unterminated tail of the stream."""
+        text = self._buf.decode(errors="replace")
+        self._buf.clear()
+        return text
+
+
+async def read_lines(
+    stream: asyncio.StreamReader,
+    read_size: int = LINE_READ_SIZE,
+    max_line: int = LINE_MAX_BYTES,
+) -> AsyncIterator[Tuple[str, str]]:
+    """Yield ``(text, kind)`` lines read from a subprocess stream.
+
+    The last item is always ``(tail, LINE_EOF)``, where ``tail`` is the
+    unterminated remainder of the stream (often empty).
+
+    Args:
+        stream: Stream to read, e.g. ``process.stdout``.
+        read_size: Bytes requested per read.
+        max_line: See :class:`LineFramer`.
+
+    Yields:
+        ``(text, kind)`` tuples; see :meth:`LineFramer.feed`.
+    """
+    framer = LineFramer(max_line)
+    while True:
+        chunk = await stream.read(read_size)
+        if not chunk:
+            break
+        for line in framer.feed(chunk):
+            yield line
+    yield framer.flush(), LINE_EOF
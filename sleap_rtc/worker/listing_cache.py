@@ -0,0 +1,145 @@
+"""Cached, sorted directory snapshots for paginated FS_LIST_DIR requests.
+
+``list_directory`` returns one page per request, but every page needs the
+whole directory listed and sorted (directories first, then by name). Doing
+that per page makes paging through a 200k-file frame directory quadratic, so
+the sorted listing is kept as a :class:`ListingSnapshot` and reused by later
+pages:
+
+- A snapshot is reused while the directory's mtime is unchanged, so adding
+  or removing an entry produces a fresh listing on the next request.
+- A page request may name the snapshot it continues (its *cursor*); that
+  snapshot is used even if the directory has changed since, so a client
+  paging through a busy directory sees neither duplicates nor gaps.
+- Snapshots expire ``ttl`` seconds after their last use and the least
+  recently used are evicted beyond ``max_snapshots``.
+
+Snapshots keep only names and types. Sizes and mtimes change without the
+directory's mtime changing (a file being appended to), so they are stat'ed
+afresh for every page.
+"""
+
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional
+
+from sleap_rtc.worker.fs_walk import entry_is_dir, scandir_sorted
+
+LISTING_CACHE_TTL = 120.0  # seconds
+LISTING_CACHE_MAX_SNAPSHOTS = 16
+
+
+class ListingEntry(NamedTuple):
+    """Name and type of one directory entry in a snapshot."""
+
+    name: str
+    is_dir: bool
+
+
+@dataclass
+class ListingSnapshot:
+    """Sorted listing of one directory at one point in time.
+
+    Attributes:
+        cursor: Identifier clients pass back to continue this listing.
+        path: Resolved directory path.
+        mtime_ns: Directory mtime when it was listed.
+        entries: Directory entries, directories first, then by name.
+        last_used: ``time.monotonic()`` of the last page served from it.
+    """
+
+    cursor: str
+    path: str
+    mtime_ns: int
+    entries: List[ListingEntry]
+    last_used: float
+
+
+class ListingCache:
+    """LRU/TTL cache of :class:`ListingSnapshot` objects, safe across threads.
+
+    Attributes:
+        ttl: Seconds a snapshot survives without being used.
+        max_snapshots: Maximum snapshots kept.
+    """
+
+    def __init__(
+        self,
+        ttl: float = LISTING_CACHE_TTL,
+        max_snapshots: int = LISTING_CACHE_MAX_SNAPSHOTS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a snapshot survives without being used.
+            max_snapshots: Maximum snapshots kept.
+        """
+        self.ttl = ttl
+        self.max_snapshots = max_snapshots
+        self._lock = threading.Lock()
+        # cursor → snapshot, least recently used first
+        self._snapshots: "OrderedDict[str, ListingSnapshot]" = OrderedDict()
+        self._ids = itertools.count(1)
+
+    def get(self, path: str, cursor: Optional[str] = None) -> ListingSnapshot:
+        """Return a snapshot of a directory, listing it only if necessary.
+
+        Args:
+            path: Resolved directory path.
+            cursor: Cursor of a previous page; its snapshot is returned if it
+                is still cached and belongs to ``path``.
+
+        Returns:
+            The snapshot to page through.
+
+        Raises:
+            OSError: If the directory cannot be stat'ed or listed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            snapshot = self._snapshots.get(cursor) if cursor else None
+            if snapshot is not None and snapshot.path == path:
+                return self._touch(snapshot, now)
+
+        mtime_ns = os.stat(path).st_mtime_ns
+        with self._lock:
+            for snapshot in reversed(self._snapshots.values()):
+                if snapshot.path == path and snapshot.mtime_ns == mtime_ns:
+                    return self._touch(snapshot, now)
+
+        entries = [ListingEntry(e.name, entry_is_dir(e)) for e in scandir_sorted(path)]
+        entries.sort(key=lambda e: (not e.is_dir, e.name.lower()))
+        snapshot = ListingSnapshot(
+            cursor=f"{os.getpid():x}-{next(self._ids):x}",
+            path=path,
+            mtime_ns=mtime_ns,
+            entries=entries,
+            last_used=now,
+        )
+        with self._lock:
+            self._snapshots[snapshot.cursor] = snapshot
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def _touch(self, snapshot: ListingSnapshot, now: float) -> ListingSnapshot:
+        snapshot.last_used = now
+        self._snapshots.move_to_end(snapshot.cursor)
+        return snapshot
+
+    def _expire(self, now: float) -> None:
+        while self._snapshots:
+            oldest = next(iter(self._snapshots.values()))
+            if now - oldest.last_used <= self.ttl:
+                break
+            self._snapshots.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of cached snapshots."""
+        with self._lock:
+            return len(self._snapshots)
@@ -256,12 +256,15 @@ class MeshCoordinator:
                         # aiortc's addIceCandidate expects an RTCIceCandidate object,
                         # so we parse the candidate string via aioice and convert.
                         candidate_data = data.get("candidate")
-                        if candidate_data and self.worker.pc:
+                        client_pc = self.worker._client_peer_connection(
+                            data.get("sender")
+                        )
+                        if candidate_data and client_pc:
                             cand_str = candidate_data.get("candidate", "")
                             if not cand_str or cand_str == "":
                                 # End-of-candidates signal
                                 logger.info("[ICE] Received end-of-candidates signal")
-                                await self.worker.pc.addIceCandidate(None)
+                                await client_pc.addIceCandidate(None)
                             else:
                                 try:
                                     # Strip leading "candidate:" prefix if present
@@ -281,7 +284,7 @@ class MeshCoordinator:
                                         "sdpMLineIndex"
                                     )
 
-                                    await self.worker.pc.addIceCandidate(rtc_cand)
+                                    await client_pc.addIceCandidate(rtc_cand)
                                     cand_type = (
                                         "relay"
                                         if "typ relay" in cand_str
@@ -421,7 +424,9 @@ class MeshCoordinator:
 
         # Build the protocol message: FS_LIST_DIR::path::offset
         proto_msg = f"{MSG_FS_LIST_DIR}{MSG_SEPARATOR}{path}{MSG_SEPARATOR}{offset}"
-        response = self.worker.handle_fs_message(proto_msg)
+        response = await self.worker.handle_fs_message_async(
+            proto_msg, f"relay:{session_id}"
+        )
 
         # Parse the protocol response into JSON for relay
         if response.startswith(f"{MSG_FS_LIST_RESPONSE}{MSG_SEPARATOR}"):
@@ -463,7 +468,10 @@ class MeshCoordinator:
 
         path = data.get("path", "")
         proto_msg = f"{MSG_USE_WORKER_PATH}{MSG_SEPARATOR}{path}"
-        response = self.worker.handle_worker_path_message(proto_msg)
+        client_id = f"relay:{session_id}"
+        response = await self.worker.run_fs_request(
+            client_id, self.worker.handle_worker_path_message, proto_msg
+        ) or (f"{MSG_WORKER_PATH_ERROR}{MSG_SEPARATOR}Path check timed out")
 
         if response.startswith(f"{MSG_WORKER_PATH_OK}{MSG_SEPARATOR}"):
             validated_path = response.split(MSG_SEPARATOR, 1)[1]
@@ -474,7 +482,9 @@ class MeshCoordinator:
             logger.info(f"[RELAY] Sent worker_path_ok for {validated_path}")
 
             # Check videos if SLP
-            video_response = self.worker._check_slp_videos_if_needed()
+            video_response = await self.worker.run_fs_request(
+                client_id, self.worker._check_slp_videos_if_needed, validated_path
+            )
             if video_response:
                 json_str = video_response.split(MSG_SEPARATOR, 1)[1]
                 result = json.loads(json_str)
@@ -501,7 +511,9 @@ class MeshCoordinator:
         """Handle explicit fs_check_videos request from dashboard."""
         from sleap_rtc.protocol import MSG_FS_CHECK_VIDEOS_RESPONSE, MSG_SEPARATOR
 
-        response = self.worker._check_slp_videos_if_needed()
+        response = await self.worker.run_fs_request(
+            f"relay:{session_id}", self.worker._check_slp_videos_if_needed
+        )
         if response:
             json_str = response.split(MSG_SEPARATOR, 1)[1]
             result = json.loads(json_str)
@@ -780,22 +792,27 @@ class MeshCoordinator:
         if not self.worker.job_executor:
             logger.warning(f"[RELAY] No job executor available to {mode} job {job_id}")
             return
+        scheduler = self.worker.job_scheduler
+        running = scheduler.slot_for(job_id=job_id) is not None
+        if not running and scheduler.cancel_queued(job_id=job_id):
+            return
+        executor = scheduler.executor_for(job_id=job_id)
 
-        if self.worker.job_executor._progress_reporter is not None:
+        if executor._progress_reporter is not None:
             # Send ZMQ "stop" to sleap-nn (it only handles "stop")
             stop_msg = jsonpickle.encode({"command": "stop"})
-            self.worker.job_executor.send_control_message(stop_msg)
+            executor.send_control_message(stop_msg)
 
             if mode == "cancel":
                 # Cancel: skip remaining models + inference
-                self.worker.job_executor._cancel_requested = True
+                executor._cancel_requested = True
                 logger.info(f"[RELAY] ZMQ stop + cancel flag set for job {job_id}")
             else:
                 # Stop Early: continue to next model + inference
                 logger.info(f"[RELAY] ZMQ stop (early) sent for job {job_id}")
         else:
             # No ZMQ reporter (inference job or reporter not started yet) — signal fallback
-            self.worker.job_executor.cancel_running_job()
+            executor.cancel_running_job()
             logger.info(
                 f"[RELAY] SIGTERM cancel sent for job {job_id} (no ZMQ reporter)"
             )
@@ -918,34 +935,35 @@ class MeshCoordinator:
         Args:
             data: Offer data from signaling server
         """
-        from aiortc import RTCSessionDescription
-
         sender = data.get("sender")
         sdp = data.get("sdp")
 
         logger.info(f"Admin handling client offer from {sender}")
 
-        # Check worker status before accepting
-        if self.worker.status in ["busy", "reserved"]:
-            logger.warning(
-                f"Rejecting client {sender} - worker is {self.worker.status}"
+        # Only accept clients the worker can take jobs from
+        if not self.worker._can_accept_client():
+            status = (
+                "busy" if self.worker.job_scheduler.concurrent else self.worker.status
             )
+            logger.warning(f"Rejecting client {sender} - worker is {status}")
             await self.websocket.send(
                 json.dumps(
                     {
                         "type": "error",
                         "target": sender,
                         "reason": "worker_busy",
-                        "message": f"Worker is currently {self.worker.status}",
-                        "current_status": self.worker.status,
+                        "message": f"Worker is currently {status}",
+                        "current_status": status,
                     }
                 )
             )
             return
 
-        # Update status to reserved
-        await self.worker.state_manager.update_status("reserved")
-        logger.info("Worker status updated to 'reserved'")
+        # A single-job worker reserves itself for this client; a multi-job
+        # worker keeps taking clients.
+        if not self.worker.job_scheduler.concurrent:
+            await self.worker.state_manager.update_status("reserved")
+            logger.info("Worker status updated to 'reserved'")
 
         # Store peer role so handle_channel_open can skip PSK challenge for
         # dashboard clients (role: "client"). Without this, the channel open
@@ -960,20 +978,18 @@ class MeshCoordinator:
             f"server (factory will add STUN fallback if 0)"
         )
 
-        # Create a fresh RTCPeerConnection with ICE servers so TURN relay is
-        # available. self.worker.pc was created before registered_auth delivered
-        # ICE server credentials, so it has no STUN/TURN config — reusing it
-        # causes ICE to stall at "checking" on firewalled networks (e.g. HPC).
-        self.worker.pc = self.worker._create_client_peer_connection()
+        # Create a fresh RTCPeerConnection for this client with ICE servers so
+        # TURN relay is available. The worker's initial pc was created before
+        # registered_auth delivered ICE server credentials, so it has no
+        # STUN/TURN config — reusing it causes ICE to stall at "checking" on
+        # firewalled networks (e.g. HPC).
+        pc = self.worker._create_client_peer_connection(sender)
 
         # Set remote description and create answer
-        await self.worker.pc.setRemoteDescription(
-            RTCSessionDescription(sdp=sdp, type="offer")
-        )
-        await self.worker.pc.setLocalDescription(await self.worker.pc.createAnswer())
+        await self.worker._answer_client_offer(sender, pc, sdp, role=data.get("role"))
 
         # Log the FINAL answer SDP candidates (after gathering is complete)
-        answer_sdp = self.worker.pc.localDescription.sdp
+        answer_sdp = pc.localDescription.sdp
         sdp_lines = answer_sdp.splitlines()
         candidates = [l for l in sdp_lines if l.startswith("a=candidate")]
         logger.info(
@@ -991,7 +1007,7 @@ class MeshCoordinator:
         await self.websocket.send(
             json.dumps(
                 {
-                    "type": self.worker.pc.localDescription.type,
+                    "type": pc.localDescription.type,
                     "sender": self.worker.peer_id,
                     "target": sender,
                     "sdp": answer_sdp,
@@ -1002,7 +1018,8 @@ class MeshCoordinator:
         logger.info(f"Admin sent answer to client {sender}")
 
         # Clear received files for new connection
-        self.worker.received_files.clear()
+        if len(self.worker.client_connections) == 1:
+            self.worker.received_files.clear()
 
     async def connect_to_admin(self, admin_peer_id: str) -> bool:
         """Connect to admin worker via signaling server.
@@ -1510,9 +1527,13 @@ class MeshCoordinator:
         """Handle incoming mesh signaling message.
 
         Args:
-            message: JSON string message
+            message: JSON string message, or a binary CRDT frame
             from_peer_id: peer_id of sender
         """
+        if isinstance(message, bytes):
+            await self.worker._handle_crdt_frame(message, from_peer_id)
+            return
+
         try:
             data = json.loads(message)
             msg_type = data.get("type")
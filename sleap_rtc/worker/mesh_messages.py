@@ -12,13 +12,21 @@ Message types:
 - worker_list: Admin responds with available workers
 - peer_joined: Notification that new peer joined room
 - peer_left: Notification that peer left room
+- swim_ping / swim_ping_req / swim_ack: SWIM failure detection probes
+  (see sleap_rtc.worker.swim), carrying piggybacked membership updates
+
+CRDT deltas travel as binary frames rather than JSON messages (see
+encode_crdt_frame):
+- update: Admin sends the CRDT changes a worker is missing
+- ack: Worker reports its CRDT state vector after applying a broadcast
+  (an empty state vector asks the admin for a full snapshot)
 """
 
 import json
 import logging
 import time
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -36,6 +44,9 @@ class MessageType(Enum):
     # Peer-to-Peer messages
     HEARTBEAT = "heartbeat"
     HEARTBEAT_RESPONSE = "heartbeat_response"
+    SWIM_PING = "swim_ping"
+    SWIM_PING_REQ = "swim_ping_req"
+    SWIM_ACK = "swim_ack"
 
     # Client-to-Admin messages
     QUERY_WORKERS = "query_workers"
@@ -58,6 +69,7 @@ class StatusUpdateMessage:
         timestamp: Unix timestamp of update
         status: Worker status (available, busy, reserved, maintenance)
         current_job: Current job info (optional)
+        properties: Extra worker properties, e.g. job queue depth (optional)
     """
 
     type: str = MessageType.STATUS_UPDATE.value
@@ -65,6 +77,7 @@ class StatusUpdateMessage:
     timestamp: Optional[float] = None
     status: Optional[str] = None
     current_job: Optional[Dict[str, Any]] = None
+    properties: Optional[Dict[str, Any]] = None
 
     def __post_init__(self):
         """Set default timestamp if not provided."""
@@ -105,12 +118,15 @@ class HeartbeatMessage:
         from_peer_id: Sender's peer_id
         timestamp: Unix timestamp of heartbeat
         sequence: Sequence number for tracking missed beats
+        swim: SWIM protocol version, if the sender probes with SWIM instead
+            of heartbeats
     """
 
     type: str = MessageType.HEARTBEAT.value
     from_peer_id: Optional[str] = None
     timestamp: Optional[float] = None
     sequence: Optional[int] = None
+    swim: Optional[int] = None
 
     def __post_init__(self):
         """Set default timestamp if not provided."""
@@ -142,6 +158,80 @@ class HeartbeatResponseMessage:
             self.timestamp = time.time()
 
 
+@dataclass
+class SwimPingMessage:
+    """SWIM probe; the receiver answers with a swim_ack.
+
+    Attributes:
+        type: Message type ("swim_ping")
+        from_peer_id: Prober's peer_id
+        timestamp: Unix timestamp of probe
+        sequence: Probe sequence number, echoed in the ack
+        updates: Piggybacked membership updates
+    """
+
+    type: str = MessageType.SWIM_PING.value
+    from_peer_id: Optional[str] = None
+    timestamp: Optional[float] = None
+    sequence: Optional[int] = None
+    updates: Optional[List[Dict[str, Any]]] = None
+
+    def __post_init__(self):
+        """Set default timestamp if not provided."""
+        if self.timestamp is None:
+            self.timestamp = time.time()
+
+
+@dataclass
+class SwimPingReqMessage:
+    """Request to probe a peer on the sender's behalf (indirect probe).
+
+    Attributes:
+        type: Message type ("swim_ping_req")
+        from_peer_id: Prober's peer_id
+        timestamp: Unix timestamp of request
+        sequence: Prober's sequence number, echoed in the forwarded ack
+        target_peer_id: Peer to probe
+        updates: Piggybacked membership updates
+    """
+
+    type: str = MessageType.SWIM_PING_REQ.value
+    from_peer_id: Optional[str] = None
+    timestamp: Optional[float] = None
+    sequence: Optional[int] = None
+    target_peer_id: Optional[str] = None
+    updates: Optional[List[Dict[str, Any]]] = None
+
+    def __post_init__(self):
+        """Set default timestamp if not provided."""
+        if self.timestamp is None:
+            self.timestamp = time.time()
+
+
+@dataclass
+class SwimAckMessage:
+    """Answer to a swim_ping, or a forwarded answer to a swim_ping_req.
+
+    Attributes:
+        type: Message type ("swim_ack")
+        from_peer_id: Responder's peer_id
+        timestamp: Unix timestamp of ack
+        sequence: Sequence number of the probe being answered
+        updates: Piggybacked membership updates
+    """
+
+    type: str = MessageType.SWIM_ACK.value
+    from_peer_id: Optional[str] = None
+    timestamp: Optional[float] = None
+    sequence: Optional[int] = None
+    updates: Optional[List[Dict[str, Any]]] = None
+
+    def __post_init__(self):
+        """Set default timestamp if not provided."""
+        if self.timestamp is None:
+            self.timestamp = time.time()
+
+
 @dataclass
 class QueryWorkersMessage:
     """Client requests worker list from admin.
@@ -244,6 +334,9 @@ MESSAGE_TYPE_MAP = {
     MessageType.STATE_BROADCAST.value: StateBroadcastMessage,
     MessageType.HEARTBEAT.value: HeartbeatMessage,
     MessageType.HEARTBEAT_RESPONSE.value: HeartbeatResponseMessage,
+    MessageType.SWIM_PING.value: SwimPingMessage,
+    MessageType.SWIM_PING_REQ.value: SwimPingReqMessage,
+    MessageType.SWIM_ACK.value: SwimAckMessage,
     MessageType.QUERY_WORKERS.value: QueryWorkersMessage,
     MessageType.WORKER_LIST.value: WorkerListMessage,
     MessageType.PEER_JOINED.value: PeerJoinedMessage,
@@ -266,8 +359,10 @@ def serialize_message(message: Any) -> str:
     if not hasattr(message, "type"):
         raise TypeError(f"Message must have 'type' attribute: {type(message)}")
 
+    # Unset (None) fields are omitted: receivers fall back to the None
+    # default, and older peers only see fields they don't know when set.
     try:
-        return json.dumps(asdict(message))
+        return json.dumps({k: v for k, v in asdict(message).items() if v is not None})
     except Exception as e:
         logger.error(f"Failed to serialize message: {e}")
         raise
@@ -299,8 +394,10 @@ def deserialize_message(json_str: str) -> Any:
     if not message_class:
         raise ValueError(f"Unknown message type: {msg_type}")
 
+    # Ignore fields added by newer peers so mixed-version rooms interoperate.
+    known = {f.name for f in fields(message_class)}
     try:
-        return message_class(**data)
+        return message_class(**{k: v for k, v in data.items() if k in known})
     except Exception as e:
         logger.error(f"Failed to deserialize message: {e}")
         raise ValueError(f"Invalid message format: {e}")
@@ -331,7 +428,10 @@ def validate_message(message: Any) -> bool:
 
 
 def create_status_update(
-    from_peer_id: str, status: str, current_job: Optional[Dict[str, Any]] = None
+    from_peer_id: str,
+    status: str,
+    current_job: Optional[Dict[str, Any]] = None,
+    properties: Optional[Dict[str, Any]] = None,
 ) -> StatusUpdateMessage:
     """Create status update message.
 
@@ -339,12 +439,16 @@ def create_status_update(
         from_peer_id: Sender's peer_id
         status: Worker status
         current_job: Current job info (optional)
+        properties: Extra worker properties (optional)
 
     Returns:
         StatusUpdateMessage instance
     """
     return StatusUpdateMessage(
-        from_peer_id=from_peer_id, status=status, current_job=current_job
+        from_peer_id=from_peer_id,
+        status=status,
+        current_job=current_job,
+        properties=properties,
     )
 
 
@@ -366,17 +470,20 @@ def create_state_broadcast(
     )
 
 
-def create_heartbeat(from_peer_id: str, sequence: int) -> HeartbeatMessage:
+def create_heartbeat(
+    from_peer_id: str, sequence: int, swim: Optional[int] = None
+) -> HeartbeatMessage:
     """Create heartbeat message.
 
     Args:
         from_peer_id: Sender's peer_id
         sequence: Sequence number
+        swim: SWIM protocol version supported by the sender (optional)
 
     Returns:
         HeartbeatMessage instance
     """
-    return HeartbeatMessage(from_peer_id=from_peer_id, sequence=sequence)
+    return HeartbeatMessage(from_peer_id=from_peer_id, sequence=sequence, swim=swim)
 
 
 def create_query_workers(
@@ -410,3 +517,37 @@ def create_worker_list(
     return WorkerListMessage(
         from_peer_id=from_peer_id, workers=workers, total_count=total_count
     )
+
+
+# Binary CRDT frames: CRDT_FRAME_MAGIC + one kind byte + payload
+CRDT_FRAME_MAGIC = b"CRDT"
+CRDT_FRAME_UPDATE = b"U"  # payload: binary CRDT update
+CRDT_FRAME_ACK = b"A"  # payload: CRDT state vector (empty: resync)
+
+
+def encode_crdt_frame(kind: bytes, payload: bytes) -> bytes:
+    """Encode a binary CRDT frame.
+
+    Args:
+        kind: CRDT_FRAME_UPDATE or CRDT_FRAME_ACK
+        payload: Update or state vector bytes
+
+    Returns:
+        Frame to send on a mesh data channel
+    """
+    return CRDT_FRAME_MAGIC + kind + payload
+
+
+def decode_crdt_frame(data: bytes) -> Optional[Tuple[bytes, bytes]]:
+    """Decode a binary CRDT frame.
+
+    Args:
+        data: Binary message received on a mesh data channel
+
+    Returns:
+        Tuple of (kind, payload), or None if data is not a CRDT frame
+    """
+    header = len(CRDT_FRAME_MAGIC) + 1
+    if len(data) < header or not data.startswith(CRDT_FRAME_MAGIC):
+        return None
+    return data[header - 1 : header], data[header:]
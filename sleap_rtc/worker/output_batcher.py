@@ -0,0 +1,191 @@
+"""Coalesce job output sent to a client into fewer data-channel messages.
+
+A training job on a fast GPU produces thousands of stdout lines, tqdm ``\\r``
+redraws (``CR::…``) and ZMQ ``batch_end`` progress events per second. Sending
+each as its own SCTP message competes with file transfers on the same
+connection, so job output goes through one :class:`OutputBatcher` per channel
+(see :func:`output_batcher`):
+
+- Messages are queued and flushed every ``flush_interval`` seconds, or as soon
+  as ``max_batch_bytes`` are queued.
+- A ``CR::`` update replaces the previous queued update from the same stream,
+  since the client would overwrite it anyway.
+- Clients that announced ``OUTPUT_BATCHING`` receive each flush as
+  ``OUTPUT_BATCH::[...]`` arrays; other clients get the surviving messages
+  one by one, unchanged.
+- When the channel's ``bufferedAmount`` exceeds ``high_water``, only the
+  newest ``batch_end`` progress event of a flush is kept. Log lines and all
+  other progress events are never dropped.
+
+Callers flush the batcher before sending a job's terminal message (e.g.
+JOB_COMPLETE) directly on the channel, so nothing queued is sent after it.
+"""
+
+import asyncio
+import json
+import logging
+import weakref
+from typing import Dict, List, Optional
+
+from sleap_rtc.protocol import MSG_JOB_LOG, MSG_OUTPUT_BATCH, MSG_SEPARATOR
+
+OUTPUT_FLUSH_INTERVAL = 0.05  # seconds
+OUTPUT_BATCH_MAX_BYTES = 16 * 1024
+OUTPUT_HIGH_WATER = 1024 * 1024  # bufferedAmount at which updates are sampled
+
+_CR = "CR::"
+_CR_PREFIXES = ("", MSG_JOB_LOG + MSG_SEPARATOR)
+_PROGRESS_PREFIX = "PROGRESS_REPORT::"
+
+
+def _cr_stream(message: str) -> Optional[str]:
+    """Return the stream a ``CR::`` update belongs to, or None."""
+    idx = message.find(_CR)
+    if idx < 0 or message[:idx] not in _CR_PREFIXES:
+        return None
+    return message[: idx + len(_CR)]
+
+
+def _is_batch_end(message: str) -> bool:
+    return message.startswith(_PROGRESS_PREFIX) and '"batch_end"' in message
+
+
+def _buffered_amount(channel) -> int:
+    amount = getattr(channel, "bufferedAmount", None)
+    return amount if isinstance(amount, int) else 0
+
+
+class OutputBatcher:
+    """Queue job output for a data channel and send it in coalesced flushes.
+
+    Attributes:
+        channel: Data channel the output is sent on.
+        framed: Whether the client unpacks OUTPUT_BATCH messages.
+        flush_interval: Seconds a message may wait before it is sent.
+        max_batch_bytes: Queued bytes that trigger an immediate flush; also the
+            size limit of one OUTPUT_BATCH message.
+        high_water: ``bufferedAmount`` above which progress events are sampled.
+        dropped: Number of messages superseded or shed so far.
+    """
+
+    def __init__(
+        self,
+        channel,
+        flush_interval: float = OUTPUT_FLUSH_INTERVAL,
+        max_batch_bytes: int = OUTPUT_BATCH_MAX_BYTES,
+        high_water: int = OUTPUT_HIGH_WATER,
+    ):
+        """Initialize batcher.
+
+        Args:
+            channel: Data channel the output is sent on.
+            flush_interval: Seconds a message may wait before it is sent.
+            max_batch_bytes: Queued bytes that trigger an immediate flush.
+            high_water: ``bufferedAmount`` above which progress events are
+                sampled.
+        """
+        self.channel = channel
+        self.framed = False
+        self.flush_interval = flush_interval
+        self.max_batch_bytes = max_batch_bytes
+        self.high_water = high_water
+        self.dropped = 0
+
+        # Superseded CR:: updates are replaced by None in place
+        self._queue: List[Optional[str]] = []
+        self._queued_bytes = 0
+        # CR stream prefix → index of its latest update in _queue
+        self._cr_index: Dict[str, int] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def send(self, message: str) -> None:
+        """Queue a string message for the next flush.
+
+        Must be called from the event loop thread.
+
+        Args:
+            message: Message exactly as it would be passed to ``channel.send``.
+        """
+        stream = _cr_stream(message)
+        if stream is not None:
+            idx = self._cr_index.get(stream)
+            if idx is not None:
+                self._queued_bytes -= len(self._queue[idx])
+                self._queue[idx] = None
+                self.dropped += 1
+            self._cr_index[stream] = len(self._queue)
+        self._queue.append(message)
+        self._queued_bytes += len(message)
+
+        if self._queued_bytes >= self.max_batch_bytes:
+            self.flush()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self) -> None:
+        """Send everything queued now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        messages = [m for m in self._queue if m is not None]
+        self._queue = []
+        self._queued_bytes = 0
+        self._cr_index = {}
+        if not messages or self.channel.readyState != "open":
+            return
+
+        if _buffered_amount(self.channel) > self.high_water:
+            messages = self._shed(messages)
+
+        try:
+            if self.framed:
+                for batch in self._batches(messages):
+                    if len(batch) == 1:
+                        self.channel.send(batch[0])
+                    else:
+                        payload = json.dumps(batch, ensure_ascii=False)
+                        self.channel.send(f"{MSG_OUTPUT_BATCH}{MSG_SEPARATOR}{payload}")
+            else:
+                for message in messages:
+                    self.channel.send(message)
+        except Exception as e:
+            logging.error(f"Failed to send job output: {e}")
+
+    def _shed(self, messages: List[str]) -> List[str]:
+        """Keep only the newest batch_end progress event of a flush."""
+        last = max(
+            (i for i, m in enumerate(messages) if _is_batch_end(m)), default=None
+        )
+        kept = [m for i, m in enumerate(messages) if i == last or not _is_batch_end(m)]
+        self.dropped += len(messages) - len(kept)
+        return kept
+
+    def _batches(self, messages: List[str]) -> List[List[str]]:
+        batches: List[List[str]] = [[]]
+        size = 0
+        for message in messages:
+            if batches[-1] and size + len(message) > self.max_batch_bytes:
+                batches.append([])
+                size = 0
+            batches[-1].append(message)
+            size += len(message)
+        return batches
+
+
+_batchers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def output_batcher(channel) -> OutputBatcher:
+    """Return the batcher shared by everything sending job output on a channel.
+
+    Args:
+        channel: Data channel to a client.
+
+    Returns:
+        The channel's :class:`OutputBatcher`, created on first use.
+    """
+    batcher = _batchers.get(channel)
+    if batcher is None:
+        batcher = _batchers[channel] = OutputBatcher(channel)
+    return batcher
@@ -5,12 +5,37 @@ including control socket management and progress listener forwarding.
 """
 
 import asyncio
+import json
 import logging
 from typing import Optional
 
 import zmq
+import zmq.asyncio
 from aiortc import RTCDataChannel
 
+from sleap_rtc.worker.output_batcher import output_batcher
+
+
+def tag_report(msg: str, what: str) -> str:
+    """Add a ``what`` field to a JSON progress report.
+
+    The LossViewer shows only reports whose ``what`` matches the model it
+    plots. The field is spliced in as the first key without parsing the
+    report; if the trainer already set ``what``, its later key wins.
+
+    Args:
+        msg: JSON object text as published by the trainer.
+        what: Model type, e.g. "centroid".
+
+    Returns:
+        The tagged report, or ``msg`` unchanged if it is not a JSON object.
+    """
+    if not msg.startswith("{"):
+        return msg
+    field = f'{{"what": {json.dumps(what)}'
+    rest = msg[1:]
+    return field + (rest if rest.lstrip().startswith("}") else ", " + rest)
+
 
 class ProgressReporter:
     """Manages ZMQ progress reporting for training jobs.
@@ -24,6 +49,7 @@ class ProgressReporter:
         progress_socket: ZMQ SUB socket for receiving progress updates.
         control_address: Address of ZMQ control socket.
         progress_address: Address of ZMQ progress socket.
+        what: Model type added to forwarded reports, or None.
         listener_task: Background task for progress listener.
     """
 
@@ -31,23 +57,28 @@ class ProgressReporter:
         self,
         control_address: str = "tcp://127.0.0.1:9000",
         progress_address: str = "tcp://127.0.0.1:9001",
+        what: Optional[str] = None,
     ):
         """Initialize progress reporter.
 
         Args:
             control_address: Address for ZMQ control PUB socket (default tcp://127.0.0.1:9000).
             progress_address: Address for ZMQ progress SUB socket (default tcp://127.0.0.1:9001).
+            what: Model type to tag forwarded reports with (their ``what``
+                field), for pipelines whose models train concurrently.
         """
         self.control_address = control_address
         self.progress_address = progress_address
+        self.what = what
 
         # ZMQ sockets
         self.ctrl_socket: Optional[zmq.Socket] = None
         self.progress_socket: Optional[zmq.Socket] = None
         self.context: Optional[zmq.Context] = None
 
-        # Progress listener task
+        # Progress listener task and the channel it forwards to
         self.listener_task: Optional[asyncio.Task] = None
+        self.channel: Optional[RTCDataChannel] = None
         self.running = False
 
     def start_control_socket(self):
@@ -97,47 +128,34 @@ class ProgressReporter:
         if self.context is None:
             self.context = zmq.Context()
 
-        self.progress_socket = self.context.socket(zmq.SUB)
-        logging.info(f"Binding ZMQ progress socket to: {self.progress_address}")
-        self.progress_socket.bind(self.progress_address)
-        self.progress_socket.setsockopt_string(zmq.SUBSCRIBE, "")
+        # A restarted listener keeps the bound socket
+        if self.progress_socket is None:
+            self.progress_socket = self.context.socket(zmq.SUB)
+            logging.info(f"Binding ZMQ progress socket to: {self.progress_address}")
+            self.progress_socket.bind(self.progress_address)
+            self.progress_socket.setsockopt_string(zmq.SUBSCRIBE, "")
+        self.channel = channel
 
-        self.running = True
-        loop = asyncio.get_event_loop()
-
-        def recv_all():
-            """Drain all buffered ZMQ messages and return them all.
-
-            Consuming the full queue every poll cycle prevents the backlog
-            from growing when sleap-nn publishes faster than we drain (e.g.
-            fast GPUs).  All messages are returned so the LossViewer receives
-            every batch_end event and every scatter dot is plotted correctly.
-
-            Returns:
-                List of message strings (possibly empty).
-            """
-            messages = []
-            try:
-                while True:
-                    messages.append(self.progress_socket.recv_string(flags=zmq.NOBLOCK))
-            except zmq.Again:
-                pass
-            return messages
+        # Awaitable view of the same socket: recv waits on the socket's file
+        # descriptor in the event loop, so messages are forwarded as they
+        # arrive and an idle trainer costs no wakeups.
+        async_socket = zmq.asyncio.Socket.from_socket(self.progress_socket)
 
-        while self.running:
-            # Drain the full ZMQ queue and forward every message so the
-            # LossViewer sees all batch_end scatter dots, not just the last.
-            msgs = await loop.run_in_executor(None, recv_all)
+        # Shared with the job's log streams; coalesces reports into batches
+        # and only samples batch_end events when the channel is congested.
+        out = output_batcher(channel)
 
-            for msg in msgs:
-                try:
-                    logging.debug(f"Sending progress report to client: {msg}")
-                    channel.send(f"PROGRESS_REPORT::{msg}")
-                except Exception as e:
-                    logging.error(f"Failed to send ZMQ progress: {e}")
-
-            # Polling interval
-            await asyncio.sleep(0.05)
+        self.running = True
+        while self.running:
+            # Forward every message so the LossViewer sees all batch_end
+            # scatter dots, not just the last. recv returns immediately while
+            # messages are queued, so a backlog (e.g. on fast GPUs) is drained
+            # in one pass without waiting between messages.
+            msg = await async_socket.recv_string()
+            logging.debug(f"Sending progress report to client: {msg}")
+            if self.what is not None:
+                msg = tag_report(msg, self.what)
+            out.send(f"PROGRESS_REPORT::{msg}")
 
     def start_progress_listener_task(self, channel: RTCDataChannel) -> asyncio.Task:
         """Start progress listener as a background task.
@@ -164,8 +182,8 @@ class ProgressReporter:
 
         Prefer ``async_cleanup()`` when called from an async context: this
         synchronous version cancels the listener task but cannot await its
-        termination, so ``context.term()`` may block the event loop briefly
-        if the executor thread is still in flight.
+        termination, so the socket may be closed while the listener is still
+        registered on the event loop.
         """
         logging.info("Cleaning up ZMQ progress reporter...")
 
@@ -199,14 +217,11 @@ class ProgressReporter:
         from the previous model leaking into the next model's LossViewer.
         The ZMQ sockets themselves stay open so ports remain bound.
         """
-        # Stop the current listener task and wait for it (and its
-        # run_in_executor thread) to finish accessing the socket.
-        if self.listener_task and not self.listener_task.done():
-            self.running = False
-            self.listener_task.cancel()
-            await asyncio.wait({self.listener_task}, timeout=2.0)
-        # Brief yield so the executor thread has time to return from recv_all.
-        await asyncio.sleep(0.1)
+        await self._stop_listener()
+
+        # Send the previous model's reports still queued in the channel's
+        # batcher now, before the caller announces the next model type.
+        output_batcher(channel).flush()
 
         # Drain and discard all messages still buffered in the ZMQ socket.
         if self.progress_socket is not None:
@@ -225,23 +240,61 @@ class ProgressReporter:
         # Start a fresh listener for the next model.
         self.start_progress_listener_task(channel)
 
-    async def async_cleanup(self) -> None:
-        """Clean up ZMQ sockets and context (async).
+    async def flush_reports(self, channel: RTCDataChannel) -> None:
+        """Stop the listener and send every report it has not forwarded yet.
 
-        Cancels and awaits the listener task before closing sockets so that
-        the executor thread has stopped using the ZMQ socket before
-        ``context.term()`` is called.  Use this from async contexts to avoid
-        blocking the asyncio event loop.
+        Call this before sending a job's terminal message (e.g. JOB_COMPLETE
+        or TRAIN_JOB_END) so no progress report reaches the client after it.
+        The sockets stay open; ``start_progress_listener_task`` resumes
+        forwarding.
+
+        Args:
+            channel: RTC data channel the reports are forwarded to.
         """
-        logging.info("Cleaning up ZMQ progress reporter (async)...")
+        await self._stop_listener()
+
+        out = output_batcher(channel)
+        if self.progress_socket is not None:
+            while True:
+                try:
+                    msg = self.progress_socket.recv_string(flags=zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                if self.what is not None:
+                    msg = tag_report(msg, self.what)
+                out.send(f"PROGRESS_REPORT::{msg}")
+        out.flush()
 
+    async def _stop_listener(self) -> None:
+        """Cancel the listener task and wait for it to stop awaiting the socket."""
         if self.listener_task and not self.listener_task.done():
             self.running = False
             self.listener_task.cancel()
-            # Wait up to 2 s for the task to acknowledge cancellation so the
-            # run_in_executor thread stops accessing the socket.
+            # Wait up to 2 s for the task to acknowledge cancellation.
             await asyncio.wait({self.listener_task}, timeout=2.0)
 
+    async def async_cleanup(self, channel: Optional[RTCDataChannel] = None) -> None:
+        """Clean up ZMQ sockets and context (async).
+
+        Stops the listener and forwards the reports still queued for the
+        client (see ``flush_reports``) before closing sockets, so that the
+        listener no longer waits on the ZMQ socket when ``context.term()`` is
+        called.  Use this from async contexts to avoid blocking the asyncio
+        event loop.
+
+        Args:
+            channel: Channel to forward the remaining reports to; defaults to
+                the one the listener was started with.
+        """
+        logging.info("Cleaning up ZMQ progress reporter (async)...")
+
+        if channel is None:
+            channel = self.channel
+        if channel is not None:
+            await self.flush_reports(channel)
+        else:
+            await self._stop_listener()
+
         if self.ctrl_socket:
             self.ctrl_socket.setsockopt(zmq.LINGER, 0)
             self.ctrl_socket.close()
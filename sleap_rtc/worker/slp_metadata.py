@@ -0,0 +1,311 @@
+"""Read and patch SLP metadata without loading the labels.
+
+An SLP file is an HDF5 container. Video references live in the
+``videos_json`` dataset, one JSON object per video, separate from the frame,
+instance and point tables and from the ``video<N>`` groups that hold the
+frames of a ``.pkg.slp``. Each object names its file in ``filename`` and
+again in ``backend.filename`` (``"."`` for frames embedded in the SLP
+itself); image sequences list every image in ``backend.filenames``, or in
+``backend.filename`` in files saved by some sleap-io versions.
+
+Listing the videos therefore needs only that one small dataset, not the
+labeled frames: :class:`SlpHeaderCache` reads it (and the provenance from the
+``metadata`` attributes) and keeps the result per ``(path, size, mtime_ns)``
+so repeated accessibility checks of an unchanged file cost one ``stat``.
+
+Changing where videos point likewise only needs that dataset to be
+rewritten. :func:`patch_video_paths` copies the file, reflinking it where the
+filesystem supports it so the copy shares blocks with the original, and
+rewrites ``videos_json`` in the copy. Frame payloads are never read or
+re-encoded, unlike a ``sio.load_file`` / ``Labels.save`` round trip.
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import h5py
+
+    H5PY_AVAILABLE = True
+except ImportError:
+    H5PY_AVAILABLE = False
+    h5py = None
+
+VIDEOS_DATASET = "videos_json"
+EMBEDDED_FILENAME = "."
+
+SLP_HEADER_CACHE_SIZE = 32
+EXISTS_CHECK_WORKERS = 16  # concurrent stat calls when checking video paths
+
+# Linux FICLONE ioctl (btrfs, XFS with reflink=1, bcachefs, ...)
+_FICLONE = 0x40049409
+
+
+def clone_file(src: Path, dst: Path) -> bool:
+    """Copy a file, sharing its blocks with the original when possible.
+
+    Args:
+        src: File to copy.
+        dst: Destination path; overwritten if it exists.
+
+    Returns:
+        True if the copy is a reflink, False if the data was copied.
+    """
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except (ImportError, OSError):
+        pass
+    shutil.copyfile(src, dst)
+    return False
+
+
+def is_slp_container(path: Path) -> bool:
+    """Return whether a file is an HDF5 SLP with a videos dataset."""
+    if not H5PY_AVAILABLE or not h5py.is_hdf5(path):
+        return False
+    with h5py.File(path, "r") as f:
+        return VIDEOS_DATASET in f
+
+
+@dataclass
+class SlpHeader:
+    """Video and provenance metadata of an SLP file.
+
+    Attributes:
+        videos: Parsed ``videos_json`` entries, in file order.
+        provenance: ``provenance`` from the file's metadata.
+    """
+
+    videos: List[dict]
+    provenance: dict
+
+
+def read_slp_header(path: Path) -> Optional[SlpHeader]:
+    """Read the videos and provenance of an SLP file without its labels.
+
+    Args:
+        path: SLP file to read.
+
+    Returns:
+        The header, or None if the file is not an HDF5 SLP.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the metadata cannot be parsed.
+    """
+    if not H5PY_AVAILABLE or not h5py.is_hdf5(path):
+        return None
+    with h5py.File(path, "r") as f:
+        if VIDEOS_DATASET not in f:
+            return None
+        videos = [json.loads(raw) for raw in f[VIDEOS_DATASET][:]]
+        provenance = {}
+        if "metadata" in f and "json" in f["metadata"].attrs:
+            metadata = json.loads(f["metadata"].attrs["json"])
+            provenance = metadata.get("provenance") or {}
+    return SlpHeader(videos=videos, provenance=provenance)
+
+
+def video_entry_path(entry: dict, slp_path: str) -> str:
+    """Return the file a ``videos_json`` entry refers to.
+
+    Args:
+        entry: One parsed ``videos_json`` entry.
+        slp_path: Path of the SLP file the entry came from.
+
+    Returns:
+        The filename a loaded ``Video`` would have (the first image of an
+        image sequence, ``slp_path`` for embedded frames).
+    """
+    backend = entry.get("backend") or {}
+    filenames = backend.get("filenames")
+    path = backend.get("filename", entry.get("filename"))
+    if isinstance(filenames, list):
+        path = filenames
+    if isinstance(path, list):
+        path = path[0] if path else ""
+    if path == EMBEDDED_FILENAME:
+        return slp_path
+    return path or ""
+
+
+def video_entry_embedded(entry: dict) -> bool:
+    """Return whether a ``videos_json`` entry's frames are stored in the SLP."""
+    return bool((entry.get("backend") or {}).get("has_embedded_images", False))
+
+
+class SlpHeaderCache:
+    """LRU cache of :class:`SlpHeader` objects, safe across threads.
+
+    Entries are keyed by ``(path, size, mtime_ns)``, so a file rewritten in
+    place is read again.
+
+    Attributes:
+        max_entries: Maximum headers kept.
+    """
+
+    def __init__(self, max_entries: int = SLP_HEADER_CACHE_SIZE):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum headers kept.
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # (path, size, mtime_ns) → header, least recently used first
+        self._headers: "OrderedDict[Tuple[str, int, int], SlpHeader]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def get(self, path: str) -> Optional[SlpHeader]:
+        """Return the header of an SLP file, reading it only if necessary.
+
+        Args:
+            path: SLP file.
+
+        Returns:
+            The header, or None if the file is not an HDF5 SLP.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read.
+            ValueError: If the metadata cannot be parsed.
+        """
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        with self._lock:
+            header = self._headers.get(key)
+            if header is not None:
+                self._headers.move_to_end(key)
+                return header
+
+        header = read_slp_header(Path(path))
+        if header is None:
+            return None
+        with self._lock:
+            self._headers[key] = header
+            while len(self._headers) > self.max_entries:
+                self._headers.popitem(last=False)
+        return header
+
+
+def paths_exist(
+    paths: Iterable[str], max_workers: int = EXISTS_CHECK_WORKERS
+) -> Dict[str, bool]:
+    """Check whether files exist, stat'ing them concurrently.
+
+    On network filesystems each ``stat`` is a round trip, so checking the
+    videos of a large project one after another adds up.
+
+    Args:
+        paths: Paths to check; duplicates are checked once.
+        max_workers: Maximum concurrent checks.
+
+    Returns:
+        Whether each path exists.
+    """
+    unique = list(dict.fromkeys(paths))
+    if len(unique) <= 1:
+        return {path: os.path.exists(path) for path in unique}
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(unique)),
+        thread_name_prefix="sleap-rtc-exists",
+    ) as executor:
+        return dict(zip(unique, executor.map(os.path.exists, unique)))
+
+
+def _remap_entry(entry: dict, mapping: Dict[Path, str]) -> bool:
+    """Apply a filename map to one ``videos_json`` entry in place.
+
+    Paths are matched the way ``Labels.replace_filenames`` matches them, on
+    the filename a loaded ``Video`` would have.
+
+    Returns:
+        True if the entry changed.
+    """
+    backend = entry.get("backend") or {}
+    filenames = backend.get("filenames")
+    path = backend.get("filename", entry.get("filename"))
+    if not isinstance(filenames, list) and isinstance(path, list):
+        # Written by sleap-io with the image list under "filename".
+        filenames = path
+    if isinstance(filenames, list):
+        new = [mapping.get(Path(name), name) for name in filenames]
+        if new == filenames:
+            return False
+        backend["filenames"] = new
+        backend["filename"] = new[0]
+        entry["filename"] = new if isinstance(entry.get("filename"), list) else new[0]
+        return True
+
+    if not isinstance(path, str) or path == EMBEDDED_FILENAME:
+        return False
+    new = mapping.get(Path(path))
+    if new is None:
+        return False
+    entry["filename"] = new
+    if "filename" in backend:
+        backend["filename"] = new
+    return True
+
+
+def patch_video_paths(
+    slp_path: Path, output_path: Path, filename_map: Dict[str, str]
+) -> Optional[int]:
+    """Write a copy of an SLP file with its video paths replaced.
+
+    Args:
+        slp_path: SLP file to copy.
+        output_path: Where to write the patched copy.
+        filename_map: Original video paths mapped to their replacements.
+
+    Returns:
+        Number of videos whose path changed, or None if the file is not an
+        HDF5 SLP or would be overwritten by its copy (nothing is written then).
+
+    Raises:
+        OSError: If the copy cannot be made.
+        ValueError: If ``videos_json`` cannot be parsed.
+    """
+    slp_path = Path(slp_path)
+    output_path = Path(output_path)
+    if output_path.exists() and output_path.samefile(slp_path):
+        return None
+    if not is_slp_container(slp_path):
+        return None
+
+    reflinked = clone_file(slp_path, output_path)
+    mapping = {Path(old): new for old, new in filename_map.items()}
+    try:
+        with h5py.File(output_path, "r+") as f:
+            entries: List[dict] = [json.loads(raw) for raw in f[VIDEOS_DATASET][:]]
+            updated = sum(_remap_entry(entry, mapping) for entry in entries)
+            if updated:
+                data = [
+                    json.dumps(entry, separators=(",", ":")).encode()
+                    for entry in entries
+                ]
+                # Fixed-length strings may be too short for the new paths.
+                del f[VIDEOS_DATASET]
+                f.create_dataset(VIDEOS_DATASET, data=data, maxshape=(None,))
+    except BaseException:
+        output_path.unlink(missing_ok=True)
+        raise
+
+    logging.info(
+        f"Patched {updated} video path(s) into {output_path.name} "
+        f"({'reflink' if reflinked else 'copy'} of {slp_path.name})"
+    )
+    return updated
@@ -0,0 +1,401 @@
+"""SWIM-style failure detection for the worker mesh.
+
+Every worker used to send a heartbeat to every other worker each interval and
+declare a peer dead after a fixed silence. That is O(N²) messages per
+interval across the room, and a single stalled link (a lossy TURN relay, a
+busy event loop) was enough to fail over the admin. :class:`SwimMembership`
+replaces it with the SWIM protocol:
+
+- Each round a worker probes *one* peer with ``swim_ping``. Peers are probed
+  in a shuffled round-robin order, so every peer is probed at least once
+  every N rounds and, room-wide, about once per round.
+- Without an ack within ``probe_timeout``, ``k`` other peers are asked to
+  probe it (``swim_ping_req``) and forward its ack. Only if no ack, direct or
+  indirect, arrives before the round ends is the peer *suspected* — a bad
+  link between two workers alone does not make either of them suspect.
+- A suspected peer that does not refute the suspicion within the suspicion
+  timeout (scaled with log N) is confirmed dead and reported through
+  ``on_failure``. A peer refutes by gossiping ``alive`` with a higher
+  incarnation number when it hears it is suspected.
+- Membership updates (alive, suspect, dead) are piggybacked on the probes
+  and acks that are sent anyway, each about ``retransmit_mult * log N``
+  times, so the whole room learns of a failure within a few rounds without
+  extra messages.
+
+Message load is one probe and one ack per worker per round, i.e. O(N) for
+the room, plus ``k`` indirect probes per failed direct probe.
+
+Peers only take part once they have shown they speak SWIM (by sending a SWIM
+message or a heartbeat advertising it, see ``mesh_messages.HeartbeatMessage``);
+the worker keeps exchanging plain heartbeats with older peers.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sleap_rtc.worker.mesh_messages import (
+    SwimAckMessage,
+    SwimPingMessage,
+    SwimPingReqMessage,
+)
+
+logger = logging.getLogger(__name__)
+
+SWIM_VERSION = 1
+SWIM_PROBE_INTERVAL = 1.0  # seconds per protocol round
+SWIM_PROBE_TIMEOUT = 0.5  # seconds before falling back to indirect probes
+SWIM_INDIRECT_PROBES = 3  # peers asked to probe an unresponsive peer
+SWIM_SUSPICION_MULT = 4  # suspicion timeout, in rounds times log10(N)
+SWIM_RETRANSMIT_MULT = 4  # piggyback transmissions per update times log10(N)
+SWIM_MAX_PIGGYBACK = 8  # updates per message
+
+# Member states
+ALIVE = "alive"
+SUSPECT = "suspect"
+DEAD = "dead"
+
+
+@dataclass
+class Member:
+    """A peer's state as known locally.
+
+    Attributes:
+        peer_id: Peer's peer_id.
+        state: ``alive``, ``suspect`` or ``dead``.
+        incarnation: Highest incarnation number heard for the peer.
+        suspected_at: ``time.monotonic()`` when the peer became suspect.
+    """
+
+    peer_id: str
+    state: str = ALIVE
+    incarnation: int = 0
+    suspected_at: Optional[float] = None
+
+
+class SwimMembership:
+    """SWIM failure detector and membership dissemination for one worker.
+
+    Attributes:
+        local_id: This worker's peer_id.
+        incarnation: This worker's incarnation number.
+        members: Peers taking part in SWIM, by peer_id. Dead peers stay
+            until removed so that stale gossip cannot revive them.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, Any], None],
+        on_failure: Callable[[str], Awaitable[None]],
+        local_id: Optional[str] = None,
+        probe_interval: float = SWIM_PROBE_INTERVAL,
+        probe_timeout: float = SWIM_PROBE_TIMEOUT,
+        indirect_probes: int = SWIM_INDIRECT_PROBES,
+        suspicion_mult: int = SWIM_SUSPICION_MULT,
+        retransmit_mult: int = SWIM_RETRANSMIT_MULT,
+    ):
+        """Initialize the membership.
+
+        Args:
+            send: Called with a peer_id and a mesh message to send to it.
+            on_failure: Awaited with the peer_id of a peer confirmed dead.
+            local_id: This worker's peer_id; may be set later.
+            probe_interval: Seconds per protocol round.
+            probe_timeout: Seconds to wait for a direct ack.
+            indirect_probes: Peers asked to probe an unresponsive peer.
+            suspicion_mult: Suspicion timeout in rounds, times log10(N).
+            retransmit_mult: Transmissions of each update, times log10(N).
+        """
+        self.send = send
+        self.on_failure = on_failure
+        self.local_id = local_id
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.indirect_probes = indirect_probes
+        self.suspicion_mult = suspicion_mult
+        self.retransmit_mult = retransmit_mult
+        self.incarnation = 0
+        self.members: Dict[str, Member] = {}
+        self._sequence = 0
+        self._acks: Dict[int, asyncio.Future] = {}
+        self._probe_order: List[str] = []
+        # peer_id → [update, transmissions]
+        self._updates: Dict[str, list] = {}
+        self._relays: set = set()
+
+    # ===== Membership =====
+
+    def is_member(self, peer_id: str) -> bool:
+        """Return whether a peer takes part in SWIM."""
+        return peer_id in self.members
+
+    def add_member(self, peer_id: str) -> bool:
+        """Start probing a peer that speaks SWIM.
+
+        A peer previously confirmed dead is only added back by this call,
+        i.e. when the worker connects to it again.
+
+        Args:
+            peer_id: Peer's peer_id.
+
+        Returns:
+            True if the peer was added (or revived), False if it was known.
+        """
+        if peer_id == self.local_id:
+            return False
+        member = self.members.get(peer_id)
+        if member is not None and member.state != DEAD:
+            return False
+        incarnation = member.incarnation if member else 0
+        self.members[peer_id] = Member(peer_id, incarnation=incarnation)
+        self._updates.pop(peer_id, None)
+        logger.info(f"SWIM member added: {peer_id}")
+        return True
+
+    def remove_member(self, peer_id: str) -> None:
+        """Forget a peer, e.g. after its connection closed."""
+        self.members.pop(peer_id, None)
+        self._updates.pop(peer_id, None)
+
+    def suspicion_timeout(self) -> float:
+        """Seconds a suspected peer has to refute before it is declared dead."""
+        scale = max(1.0, math.log10(len(self.members) + 1))
+        return self.suspicion_mult * scale * self.probe_interval
+
+    # ===== Probing =====
+
+    async def run(self) -> None:
+        """Run protocol rounds until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            try:
+                await self.probe_round()
+                await self.expire_suspicions()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in SWIM round: {e}")
+            elapsed = loop.time() - started
+            await asyncio.sleep(max(0.0, self.probe_interval - elapsed))
+
+    async def probe_round(self) -> Optional[bool]:
+        """Probe the next peer, suspecting it if neither it nor helpers answer.
+
+        Returns:
+            True if the peer answered, False if it is now suspected, None if
+            there was no peer to probe.
+        """
+        target = self._next_target()
+        if target is None:
+            return None
+        if await self._probe(target):
+            return True
+        self._suspect(target)
+        return False
+
+    async def expire_suspicions(self) -> None:
+        """Declare dead the suspected peers whose suspicion timed out."""
+        deadline = time.monotonic() - self.suspicion_timeout()
+        for member in list(self.members.values()):
+            if member.state == SUSPECT and member.suspected_at <= deadline:
+                await self._confirm_dead(member.peer_id, member.incarnation)
+
+    def _next_target(self) -> Optional[str]:
+        """Return the next peer of the shuffled round-robin probe order."""
+        for _ in range(2):
+            while self._probe_order:
+                peer_id = self._probe_order.pop()
+                member = self.members.get(peer_id)
+                if member is not None and member.state != DEAD:
+                    return peer_id
+            self._probe_order = [
+                m.peer_id for m in self.members.values() if m.state != DEAD
+            ]
+            random.shuffle(self._probe_order)
+        return None
+
+    async def _probe(self, target: str) -> bool:
+        """Probe a peer directly, then through other peers.
+
+        Args:
+            target: Peer to probe.
+
+        Returns:
+            Whether an ack arrived within the round.
+        """
+        sequence, ack = self._expect_ack()
+        try:
+            self._send(target, SwimPingMessage(sequence=sequence))
+            if await self._wait(ack, self.probe_timeout):
+                return True
+            helpers = [
+                m.peer_id
+                for m in self.members.values()
+                if m.state == ALIVE and m.peer_id != target
+            ]
+            helpers = random.sample(helpers, min(self.indirect_probes, len(helpers)))
+            logger.debug(f"No SWIM ack from {target}, asking {len(helpers)} peers")
+            for peer_id in helpers:
+                self._send(
+                    peer_id,
+                    SwimPingReqMessage(sequence=sequence, target_peer_id=target),
+                )
+            return await self._wait(ack, self.probe_interval - self.probe_timeout)
+        finally:
+            self._acks.pop(sequence, None)
+
+    def _expect_ack(self):
+        self._sequence += 1
+        ack = asyncio.get_running_loop().create_future()
+        self._acks[self._sequence] = ack
+        return self._sequence, ack
+
+    @staticmethod
+    async def _wait(ack: asyncio.Future, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(asyncio.shield(ack), max(0.0, timeout))
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _relay_probe(self, requester: str, sequence: int, target: str):
+        """Probe a peer for another peer and forward its ack."""
+        own_sequence, ack = self._expect_ack()
+        try:
+            self._send(target, SwimPingMessage(sequence=own_sequence))
+            if await self._wait(ack, self.probe_timeout):
+                self._send(requester, SwimAckMessage(sequence=sequence))
+        finally:
+            self._acks.pop(own_sequence, None)
+
+    # ===== Messages =====
+
+    async def handle_message(self, message, from_peer_id: str) -> None:
+        """Handle a swim_ping, swim_ping_req or swim_ack from a peer.
+
+        Args:
+            message: SWIM mesh message.
+            from_peer_id: Sender's peer_id.
+        """
+        if from_peer_id not in self.members:
+            self.add_member(from_peer_id)
+        for update in message.updates or []:
+            await self._apply(update)
+
+        if isinstance(message, SwimPingMessage):
+            self._send(from_peer_id, SwimAckMessage(sequence=message.sequence))
+        elif isinstance(message, SwimPingReqMessage):
+            if message.target_peer_id and message.target_peer_id != self.local_id:
+                task = asyncio.create_task(
+                    self._relay_probe(
+                        from_peer_id, message.sequence, message.target_peer_id
+                    )
+                )
+                self._relays.add(task)
+                task.add_done_callback(self._relays.discard)
+        elif isinstance(message, SwimAckMessage):
+            ack = self._acks.get(message.sequence)
+            if ack is not None and not ack.done():
+                ack.set_result(from_peer_id)
+
+    def _send(self, peer_id: str, message) -> None:
+        message.from_peer_id = self.local_id
+        message.updates = self._piggyback(peer_id)
+        self.send(peer_id, message)
+
+    # ===== Dissemination =====
+
+    def _queue(self, peer_id: str, state: str, incarnation: int) -> None:
+        update = {"peer_id": peer_id, "state": state, "incarnation": incarnation}
+        self._updates[peer_id] = [update, 0]
+
+    def _piggyback(self, peer_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Pick the updates to send with a message to a peer.
+
+        Updates sent the fewest times go first. A peer always gets an update
+        about itself, so that it can refute a suspicion.
+
+        Args:
+            peer_id: Recipient.
+
+        Returns:
+            Updates to send, or None if there are none.
+        """
+        limit = self.retransmit_mult * max(
+            1, math.ceil(math.log10(len(self.members) + 1))
+        )
+        queued = sorted(self._updates.items(), key=lambda item: item[1][1])
+        updates = []
+        for subject, pending in queued[:SWIM_MAX_PIGGYBACK]:
+            updates.append(pending[0])
+            pending[1] += 1
+            if pending[1] >= limit:
+                del self._updates[subject]
+        member = self.members.get(peer_id)
+        if member is not None and member.state != ALIVE:
+            about = {
+                "peer_id": peer_id,
+                "state": member.state,
+                "incarnation": member.incarnation,
+            }
+            if about not in updates:
+                updates.append(about)
+        return updates or None
+
+    async def _apply(self, update: Dict[str, Any]) -> None:
+        """Merge a membership update heard from a peer."""
+        peer_id = update.get("peer_id")
+        state = update.get("state")
+        incarnation = update.get("incarnation", 0)
+
+        if peer_id == self.local_id:
+            if state != ALIVE and incarnation >= self.incarnation:
+                # Refute: we are alive, with a newer incarnation than the rumour
+                self.incarnation = incarnation + 1
+                self._queue(self.local_id, ALIVE, self.incarnation)
+                logger.info(f"Refuting SWIM {state} rumour ({self.incarnation})")
+            return
+
+        member = self.members.get(peer_id)
+        if member is None or member.state == DEAD:
+            return
+        if state == ALIVE:
+            if incarnation > member.incarnation:
+                member.state = ALIVE
+                member.incarnation = incarnation
+                member.suspected_at = None
+                self._queue(peer_id, ALIVE, incarnation)
+        elif state == SUSPECT:
+            if incarnation > member.incarnation or (
+                incarnation == member.incarnation and member.state == ALIVE
+            ):
+                member.incarnation = incarnation
+                self._suspect(peer_id)
+        elif state == DEAD:
+            if incarnation >= member.incarnation:
+                await self._confirm_dead(peer_id, incarnation)
+
+    def _suspect(self, peer_id: str) -> None:
+        member = self.members.get(peer_id)
+        if member is None or member.state == DEAD:
+            return
+        if member.state != SUSPECT:
+            member.state = SUSPECT
+            member.suspected_at = time.monotonic()
+            logger.warning(f"SWIM suspects {peer_id}")
+        self._queue(peer_id, SUSPECT, member.incarnation)
+
+    async def _confirm_dead(self, peer_id: str, incarnation: int) -> None:
+        member = self.members.get(peer_id)
+        if member is None or member.state == DEAD:
+            return
+        member.state = DEAD
+        member.incarnation = incarnation
+        self._queue(peer_id, DEAD, incarnation)
+        logger.warning(f"SWIM confirmed {peer_id} dead")
+        await self.on_failure(peer_id)
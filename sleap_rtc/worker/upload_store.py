@@ -0,0 +1,253 @@
+"""Persistent content-addressed store for client uploads.
+
+Every completed upload is hard-linked (or copied, across filesystems) into
+``<root>/<sha256[:2]>/<sha256>`` and recorded in ``<root>/index.json``, so a
+worker that restarts — or another worker process on the same machine — can
+still answer FILE_UPLOAD_CHECK with a cache hit instead of making the client
+re-send the file.
+
+Index entries look like::
+
+    {
+        "size": 123,               # blob size in bytes
+        "mtime_ns": 1700000000,    # blob mtime when stored
+        "names": ["labels.slp"],   # original upload filenames
+        "paths": {"/mnt/data/labels.slp": 1700000000},  # placed copies → mtime
+        "last_access": 1700000000.0,
+    }
+
+A blob whose size or mtime no longer matches its entry was modified in place
+through one of its hard links and is dropped. When the blobs exceed the byte
+budget the least recently used ones are evicted; files already placed in a
+destination directory are untouched because they are separate links.
+"""
+
+import errno
+import json
+import logging
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: index updates are not serialised across processes
+    fcntl = None
+
+
+def default_upload_cache_dir() -> Path:
+    """Return the default store location, shared by all workers of a user."""
+    return Path.home() / ".sleap-rtc" / "upload-cache"
+
+
+class UploadStore:
+    """Content-addressed upload cache with a JSON index and LRU eviction.
+
+    Attributes:
+        root: Directory holding the blobs and the index.
+        max_bytes: Total blob size above which old entries are evicted.
+    """
+
+    INDEX_NAME = "index.json"
+    LOCK_NAME = ".lock"
+
+    def __init__(self, root: str, max_bytes: int):
+        """Initialize the store, creating ``root`` if needed.
+
+        Args:
+            root: Directory holding the blobs and the index.
+            max_bytes: Total blob size above which old entries are evicted.
+        """
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def blob_path(self, sha256: str) -> Path:
+        """Return where the blob for a content hash is stored."""
+        return self.root / sha256[:2] / sha256
+
+    # ------------------------------------------------------------------
+    # Index persistence
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _locked_index(self):
+        """Yield the index for read-modify-write under an inter-process lock.
+
+        The index is written back (atomically) when the block exits normally.
+        """
+        with open(self.root / self.LOCK_NAME, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                index = self._read_index()
+                yield index
+                self._write_index(index)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_index(self) -> Dict[str, dict]:
+        try:
+            with open(self.root / self.INDEX_NAME) as fh:
+                return json.load(fh)["entries"]
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Upload cache index unreadable, starting empty: {e}")
+            return {}
+
+    def _write_index(self, index: Dict[str, dict]) -> None:
+        tmp = self.root / f"{self.INDEX_NAME}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump({"version": 1, "entries": index}, fh)
+        os.replace(tmp, self.root / self.INDEX_NAME)
+
+    def _valid_entry(self, index: Dict[str, dict], sha256: str) -> Optional[dict]:
+        """Return the entry for ``sha256`` if its blob is intact, else drop it."""
+        entry = index.get(sha256)
+        if entry is None:
+            return None
+        try:
+            st = self.blob_path(sha256).stat()
+        except OSError:
+            st = None
+        if st is None or (st.st_size, st.st_mtime_ns) != (
+            entry["size"],
+            entry["mtime_ns"],
+        ):
+            logging.info(f"Dropping stale upload cache entry {sha256[:12]}…")
+            del index[sha256]
+            self.blob_path(sha256).unlink(missing_ok=True)
+            return None
+        return entry
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def contains(self, sha256: str) -> bool:
+        """Return True if an intact blob for ``sha256`` is stored."""
+        with self._locked_index() as index:
+            return self._valid_entry(index, sha256) is not None
+
+    def find_placed_path(self, sha256: str) -> Optional[str]:
+        """Return a previously placed copy of a blob that is still unmodified.
+
+        Args:
+            sha256: Content hash to look up.
+
+        Returns:
+            The most recently placed path whose size and mtime still match,
+            or None.
+        """
+        with self._locked_index() as index:
+            entry = self._valid_entry(index, sha256)
+            if entry is None:
+                return None
+            for path, mtime_ns in reversed(list(entry["paths"].items())):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    del entry["paths"][path]
+                    continue
+                if (st.st_size, st.st_mtime_ns) == (entry["size"], mtime_ns):
+                    entry["last_access"] = time.time()
+                    return path
+                del entry["paths"][path]
+            return None
+
+    def find_by_name(self, filename: str) -> List[str]:
+        """Return hashes of stored uploads with this filename, newest first."""
+        with self._locked_index() as index:
+            matches = [
+                (entry["last_access"], sha256)
+                for sha256, entry in index.items()
+                if filename in entry["names"]
+            ]
+        return [sha256 for _, sha256 in sorted(matches, reverse=True)]
+
+    # ------------------------------------------------------------------
+    # Mutations (blocking; run these in an executor)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _link_or_copy(src: Path, dest: Path) -> None:
+        """Atomically place ``src`` at ``dest`` as a hard link, or a copy."""
+        tmp = dest.with_name(f".{dest.name}.tmp")
+        tmp.unlink(missing_ok=True)
+        try:
+            os.link(src, tmp)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                raise
+            shutil.copy2(src, tmp)
+        os.replace(tmp, dest)
+
+    def add(self, sha256: str, path: Path, filename: str) -> None:
+        """Store a completed upload and remember where it was placed.
+
+        Args:
+            sha256: Content hash of the file.
+            path: Final location of the uploaded file.
+            filename: Original upload filename.
+        """
+        path = Path(path)
+        with self._locked_index() as index:
+            entry = self._valid_entry(index, sha256)
+            if entry is None:
+                blob = self.blob_path(sha256)
+                blob.parent.mkdir(exist_ok=True)
+                self._link_or_copy(path, blob)
+                st = blob.stat()
+                entry = index[sha256] = {
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "names": [],
+                    "paths": {},
+                }
+            if filename not in entry["names"]:
+                entry["names"].append(filename)
+            entry["paths"].pop(str(path), None)
+            entry["paths"][str(path)] = path.stat().st_mtime_ns
+            entry["last_access"] = time.time()
+            self._evict(index, keep=sha256)
+
+    def place(self, sha256: str, dest: Path) -> bool:
+        """Link a stored blob into a destination path.
+
+        Args:
+            sha256: Content hash to place.
+            dest: Destination file path (replaced if it exists).
+
+        Returns:
+            True if the blob was placed, False if it is not stored.
+        """
+        dest = Path(dest)
+        with self._locked_index() as index:
+            entry = self._valid_entry(index, sha256)
+            if entry is None:
+                return False
+            self._link_or_copy(self.blob_path(sha256), dest)
+            entry["paths"].pop(str(dest), None)
+            entry["paths"][str(dest)] = dest.stat().st_mtime_ns
+            entry["last_access"] = time.time()
+            return True
+
+    def _evict(self, index: Dict[str, dict], keep: str) -> None:
+        """Evict least recently used blobs until the store fits its budget."""
+        total = sum(entry["size"] for entry in index.values())
+        for sha256, entry in sorted(index.items(), key=lambda e: e[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            if sha256 == keep:
+                continue
+            self.blob_path(sha256).unlink(missing_ok=True)
+            del index[sha256]
+            total -= entry["size"]
+            logging.info(
+                f"Evicted {sha256[:12]}… ({entry['size']} bytes) from upload cache"
+            )
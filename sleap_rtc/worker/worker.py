@@ -8,6 +8,7 @@ import logging
 import shutil
 import os
 import zmq
+import zmq.asyncio
 
 from aiortc import (
     RTCPeerConnection,
@@ -81,36 +82,18 @@ async def start_progress_listener(
     socket.bind(zmq_address)
     socket.setsockopt_string(zmq.SUBSCRIBE, "")
 
-    loop = asyncio.get_event_loop()
-
-    def recv_msg():
-        """Receives a message from the ZMQ socket in a non-blocking way.
-
-        Returns:
-            The received message as a JSON object, or None if no message is available.
-        """
-        try:
-            # logging.info("Receiving message from ZMQ...")
-            return socket.recv_string(
-                flags=zmq.NOBLOCK
-            )  # or jsonpickle.decode(msg_str) if needed
-        except zmq.Again:
-            return None
+    # Await messages on the socket's file descriptor instead of polling.
+    socket = zmq.asyncio.Socket.from_socket(socket)
 
     while True:
         # Send progress as JSON string with prefix.
-        msg = await loop.run_in_executor(None, recv_msg)
-
-        if msg:
-            try:
-                logging.info(f"Sending progress report to client: {msg}")
-                channel.send(f"PROGRESS_REPORT::{msg}")
-                # logging.info("Progress report sent to client.")
-            except Exception as e:
-                logging.error(f"Failed to send ZMQ progress: {e}")
-
-        # Polling interval.
-        await asyncio.sleep(0.05)
+        msg = await socket.recv_string()
+
+        try:
+            logging.info(f"Sending progress report to client: {msg}")
+            channel.send(f"PROGRESS_REPORT::{msg}")
+        except Exception as e:
+            logging.error(f"Failed to send ZMQ progress: {e}")
 
 
 async def zip_results(file_name: str, dir_path: str = SAVE_DIR):
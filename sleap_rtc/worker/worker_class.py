@@ -37,6 +37,10 @@ from sleap_rtc.config import get_config, MountConfig
 from sleap_rtc.auth.psk import generate_nonce, verify_hmac
 from sleap_rtc.auth.secret_resolver import resolve_secret
 from sleap_rtc.filesystem import safe_mkdir
+from sleap_rtc.compression import choose_codec
+from sleap_rtc.rpc import RpcServer
+from sleap_rtc.striping import is_stripe_channel
+from sleap_rtc.tracing import MessageTracer, message_type
 from sleap_rtc.protocol import (
     parse_message,
     format_message,
@@ -46,12 +50,15 @@ from sleap_rtc.protocol import (
     MSG_FS_MOUNTS_RESPONSE,
     MSG_FS_RESOLVE,
     MSG_FS_RESOLVE_RESPONSE,
+    MSG_FS_REFRESH_INDEX,
+    MSG_FS_REFRESH_INDEX_RESPONSE,
     MSG_FS_LIST_DIR,
     MSG_FS_LIST_RESPONSE,
     MSG_FS_ERROR,
     MSG_SEPARATOR,
     FS_ERROR_ACCESS_DENIED,
     FS_ERROR_INVALID_REQUEST,
+    FS_ERROR_TIMEOUT,
     MSG_USE_WORKER_PATH,
     MSG_WORKER_PATH_OK,
     MSG_WORKER_PATH_ERROR,
@@ -84,10 +91,17 @@ from sleap_rtc.protocol import (
     # Client-to-worker file upload
     MSG_FILE_UPLOAD_CHECK,
     MSG_FILE_UPLOAD_START,
+    MSG_FILE_UPLOAD_RESUME,
+    MSG_FILE_UPLOAD_DELTA_REQUEST,
+    MSG_FILE_UPLOAD_DELTA_START,
+    MSG_FILE_UPLOAD_COPY,
+    MSG_FILE_UPLOAD_STRIPED,
     MSG_FILE_UPLOAD_END,
     MSG_FILE_UPLOAD_CACHE_HIT,
     MSG_FILE_UPLOAD_READY,
     MSG_FILE_UPLOAD_ERROR,
+    MSG_OUTPUT_BATCHING,
+    MSG_TRANSFER_CODECS,
 )
 from sleap_rtc.jobs import (
     TrainJobSpec,
@@ -96,17 +110,27 @@ from sleap_rtc.jobs import (
     JobValidator,
     ValidationError,
     CommandBuilder,
-    DEFAULT_ZMQ_PORTS,
 )
 from sleap_rtc.worker.capabilities import WorkerCapabilities
 from sleap_rtc.worker.job_executor import JobExecutor
+from sleap_rtc.worker.job_queue_store import JobQueueStore
+from sleap_rtc.worker.job_scheduler import (
+    DetachedChannel,
+    ExecutorGroup,
+    JobScheduler,
+    JobSlot,
+    plan_device_groups,
+)
 from sleap_rtc.worker.file_manager import FileManager
+from sleap_rtc.worker.fs_service import FSRequestCancelled, FSService
 from sleap_rtc.worker.job_coordinator import JobCoordinator
+from sleap_rtc.worker.output_batcher import output_batcher
 from sleap_rtc.worker.state_manager import StateManager
 from sleap_rtc.worker.progress_reporter import ProgressReporter
 from sleap_rtc.worker.crdt_state import RoomStateCRDT
 from sleap_rtc.worker.admin_controller import AdminController
 from sleap_rtc.worker.mesh_coordinator import MeshCoordinator
+from sleap_rtc.worker.swim import SWIM_VERSION, SwimMembership
 from sleap_rtc.worker.mesh_messages import (
     MessageType,
     deserialize_message,
@@ -183,6 +207,14 @@ class RTCWorkerClient:
         mounts: list = None,
         working_dir: str = None,
         name: str = None,
+        upload_cache_dir: str = None,
+        upload_cache_max_bytes: int = 0,
+        filename_index_dir: str = None,
+        filename_index_refresh: float = 0,
+        max_concurrent_jobs: int = 1,
+        parallel_pipelines: bool = False,
+        max_queued_jobs: int = 0,
+        job_queue_dir: str = None,
     ):
         # Use /app/shared_data in production, current dir + shared_data in dev
         self.save_dir = "."
@@ -209,17 +241,39 @@ class RTCWorkerClient:
             worker=self,
             capabilities=self.capabilities,
         )
+        # Queues accepted jobs and runs up to max_concurrent_jobs of them,
+        # each on its own GPUs and ZMQ ports. With job_queue_dir, accepted
+        # jobs are kept on disk until done so a restart does not lose them.
+        self.job_scheduler = JobScheduler(
+            self,
+            plan_device_groups(self.capabilities.gpu_devices, max_concurrent_jobs),
+            on_change=self._publish_job_queue,
+            max_queue=max_queued_jobs,
+            store=JobQueueStore(job_queue_dir) if job_queue_dir else None,
+        )
         self.file_manager = FileManager(
             chunk_size=chunk_size,
             mounts=self.mounts,
             working_dir=self.working_dir,
+            upload_cache_dir=upload_cache_dir,
+            upload_cache_max_bytes=upload_cache_max_bytes,
+            filename_index_dir=filename_index_dir,
+            filename_index_refresh=filename_index_refresh,
+            client_key=lambda channel: self._channel_peers.get(channel),
+        )
+        # Runs blocking FS_* / USE_WORKER_PATH handlers off the event loop.
+        self.fs_service = FSService()
+        self.rpc_server = RpcServer(
+            self.handle_fs_request, client_key=self._channel_key
         )
         self.job_coordinator = None  # Initialized in run_worker after authentication
         self.state_manager = None  # Initialized in run_worker after authentication
         self.progress_reporter = ProgressReporter()  # ZMQ progress reporting
         self.status = "available"  # "available", "busy", "reserved", "maintenance"
         self.current_job = None
-        self.max_concurrent_jobs = 1
+        self.max_concurrent_jobs = len(self.job_scheduler.slots)
+        # Train independent pipeline models concurrently on disjoint GPUs
+        self.parallel_pipelines = parallel_pipelines
         self.shutting_down = False
 
         # Expose capabilities as properties for backward compatibility
@@ -253,6 +307,8 @@ class RTCWorkerClient:
         self.room_state_crdt = None  # RoomStateCRDT instance
         self.worker_connections = {}  # peer_id -> RTCPeerConnection for workers
         self.client_connections = {}  # peer_id -> RTCPeerConnection for clients
+        self._client_roles = {}  # peer_id -> role sent with the client's offer
+        self._channel_peers = {}  # RTCDataChannel -> client peer_id
         self.data_channels = {}  # peer_id -> RTCDataChannel for mesh messaging
 
         # Signaling heartbeat watchdog
@@ -270,6 +326,13 @@ class RTCWorkerClient:
             15.0  # Seconds before peer is considered dead (3x interval)
         )
         self.last_heartbeat = {}  # peer_id -> last heartbeat timestamp
+        # SWIM failure detection for peers that support it; the heartbeats
+        # above are only exchanged with older peers
+        self.swim = SwimMembership(
+            send=self._send_mesh_message_to_peer,
+            on_failure=self._handle_peer_failure,
+        )
+        self.swim_task = None  # Background task running SWIM rounds
 
         # Network partition recovery attributes (Phase 5)
         self.partition_check_task = None  # Background task for partition detection
@@ -325,6 +388,8 @@ class RTCWorkerClient:
         logging.info("Closing WebRTC connection...")
         if self.pc:
             await self.pc.close()
+        for client_pc in list(self.client_connections.values()):
+            await client_pc.close()
 
         logging.info("Closing websocket connection...")
         if self.websocket:
@@ -334,6 +399,10 @@ class RTCWorkerClient:
         if self.progress_reporter:
             await self.progress_reporter.async_cleanup()
 
+        self.fs_service.shutdown()
+        if self.file_manager.filename_index is not None:
+            self.file_manager.filename_index.stop()
+
         if self.peer_id_for_cleanup and self.state_manager:
             self.state_manager.request_peer_room_deletion(self.peer_id_for_cleanup)
             self.peer_id_for_cleanup = None
@@ -356,7 +425,7 @@ class RTCWorkerClient:
             channel: The data channel that sent the response.
             message: The AUTH_RESPONSE message (format: AUTH_RESPONSE::{value}).
         """
-        channel_label = channel.label
+        channel_label = self._channel_key(channel)
 
         # Check if we're expecting a response from this channel
         if channel_label not in self._pending_auth:
@@ -423,7 +492,7 @@ class RTCWorkerClient:
         Args:
             channel: The authenticated channel.
         """
-        channel_label = channel.label
+        channel_label = self._channel_key(channel)
 
         # Clean up pending state
         if channel_label in self._pending_auth:
@@ -448,7 +517,7 @@ class RTCWorkerClient:
             channel: The channel that failed authentication.
             reason: Failure reason ("invalid", "timeout", "missing").
         """
-        channel_label = channel.label
+        channel_label = self._channel_key(channel)
 
         # Clean up pending state
         if channel_label in self._pending_auth:
@@ -552,17 +621,95 @@ class RTCWorkerClient:
 
         return pc
 
-    def _create_client_peer_connection(self) -> RTCPeerConnection:
+    def _create_client_peer_connection(
+        self, peer_id: Optional[str] = None
+    ) -> RTCPeerConnection:
         """Create RTCPeerConnection for client connections (STUN + TURN).
 
+        Args:
+            peer_id: Client the connection is for. Its channels are then
+                keyed by that client and, when the connection ends, only that
+                client's state is reset, so several clients can be connected
+                at once (see _answer_client_offer).
+
         Returns:
             RTCPeerConnection configured for client-worker communication.
         """
         pc = self._create_peer_connection(for_mesh=False)
-        pc.on("datachannel", self.on_datachannel)
-        pc.on("iceconnectionstatechange", self.on_iceconnectionstatechange)
+        if peer_id is None:
+            pc.on("datachannel", self.on_datachannel)
+            pc.on("iceconnectionstatechange", self.on_iceconnectionstatechange)
+            return pc
+
+        @pc.on("datachannel")
+        def on_datachannel(channel):
+            self._channel_peers[channel] = peer_id
+            self.on_datachannel(channel)
+            channel.on("close", lambda: self._forget_channel(channel))
+
+        @pc.on("iceconnectionstatechange")
+        async def on_iceconnectionstatechange():
+            await self.on_client_iceconnectionstatechange(peer_id, pc)
+
         return pc
 
+    def _channel_key(self, channel) -> str:
+        """Return the key of a client channel in per-channel state.
+
+        Clients open their channels with fixed labels, so channels of
+        connections made for a known client are keyed by that client too.
+        """
+        peer_id = self._channel_peers.get(channel)
+        if peer_id is None:
+            return channel.label
+        return f"{peer_id}/{channel.label}"
+
+    def _forget_channel(self, channel) -> None:
+        """Drop the per-channel state of a client channel that closed."""
+        self._authenticated_channels.discard(self._channel_key(channel))
+        self._channel_peers.pop(channel, None)
+
+    def _can_accept_client(self) -> bool:
+        """Whether a client offer should be answered.
+
+        A worker running several jobs at once takes new clients while a slot
+        is free or its queue has room; a single-job worker keeps serving one
+        client at a time.
+        """
+        if self.job_scheduler.concurrent:
+            return self.job_scheduler.has_capacity
+        return self.status not in ["busy", "reserved"]
+
+    async def _answer_client_offer(
+        self,
+        peer_id: str,
+        pc: RTCPeerConnection,
+        sdp: str,
+        role: Optional[str] = None,
+    ) -> None:
+        """Register a client's own connection and answer its offer on it.
+
+        Args:
+            peer_id: The client's peer ID.
+            pc: Connection from _create_client_peer_connection(peer_id).
+            sdp: The client's offer SDP.
+            role: Role the client registered with.
+        """
+        old_pc = self.client_connections.pop(peer_id, None)
+        if old_pc is not None:
+            # The client is reconnecting from scratch.
+            await old_pc.close()
+        self.client_connections[peer_id] = pc
+        self._client_roles[peer_id] = role
+        # Latest client connection, for code that predates per-client ones
+        self.pc = pc
+        await pc.setRemoteDescription(RTCSessionDescription(sdp=sdp, type="offer"))
+        await pc.setLocalDescription(await pc.createAnswer())
+
+    def _client_peer_connection(self, peer_id: Optional[str]):
+        """Return the connection of a client, or the latest one."""
+        return self.client_connections.get(peer_id) or self.pc
+
     def _create_mesh_peer_connection(self) -> RTCPeerConnection:
         """Create RTCPeerConnection for mesh connections (STUN only).
 
@@ -676,7 +823,12 @@ class RTCWorkerClient:
             )
 
     async def _handle_client_disconnect(self, peer_id: str):
-        """Handle client disconnect - existing behavior.
+        """Handle client disconnect - close its connection and reset its state.
+
+        The client's upload, stripe channels and download codec are dropped
+        right away; state shared by all clients is reset once the last client
+        has gone, after which the worker re-registers as available. Jobs the
+        client queued are dropped by the scheduler when their turn comes.
 
         Args:
             peer_id: Client's peer_id
@@ -684,12 +836,69 @@ class RTCWorkerClient:
         logging.info(f"Client disconnected: {peer_id}")
 
         # Remove from client connections
-        if peer_id in self.client_connections:
-            del self.client_connections[peer_id]
+        pc = self.client_connections.pop(peer_id, None)
+        self._client_roles.pop(peer_id, None)
+        if pc is not None:
+            await pc.close()
+        if self.pc is pc:
+            self.pc = next(iter(self.client_connections.values()), None)
+
+        # Its upload cannot complete; its stripes and codec go with it.
+        self.file_manager.forget_client(peer_id)
+
+        if self.client_connections:
+            logging.info(f"{len(self.client_connections)} client(s) still connected")
+            return
+
+        # Clear the job state
+        if self.job_coordinator:
+            self.job_coordinator.clear_current_job()
+        self.received_files.clear()
+        self.file_manager.forget_client()
+
+        # Re-register with signaling server so discovery lists us again
+        self.status = "available"
+        if self.state_manager:
+            self.state_manager.status = "available"
+            await self.state_manager.reregister_worker()
 
-        # TODO: Add existing cleanup logic for client jobs
-        # (update status, clean up files, etc.)
-        # This will be integrated when we refactor existing client connection code
+        logging.info("Ready for new client connection!")
+
+    async def on_client_iceconnectionstatechange(
+        self, peer_id: str, pc: RTCPeerConnection
+    ):
+        """Handle ICE connection state changes of one client's connection.
+
+        Counterpart of on_iceconnectionstatechange for connections made with
+        _create_client_peer_connection(peer_id): only the client whose
+        connection ended is dropped.
+
+        Args:
+            peer_id: The client's peer_id
+            pc: The client's RTCPeerConnection
+        """
+        ice_state = pc.iceConnectionState
+        logging.info(f"ICE connection state with client {peer_id} is now {ice_state}")
+
+        # Ignore connections that were replaced or already cleaned up
+        if self.shutting_down or self.client_connections.get(peer_id) is not pc:
+            return
+
+        if ice_state == "disconnected":
+            # Temporary network issue - wait up to 90 seconds for recovery
+            for _ in range(90):
+                await asyncio.sleep(1)
+                if pc.iceConnectionState in ["connected", "completed"]:
+                    logging.info(f"ICE reconnected with client {peer_id}")
+                    return
+                if pc.iceConnectionState in ["closed", "failed"]:
+                    break
+            logging.error(f"Reconnection with client {peer_id} timed out")
+        elif ice_state not in ["closed", "failed"]:
+            return
+
+        if self.client_connections.get(peer_id) is pc:
+            await self._handle_client_disconnect(peer_id)
 
     async def on_mesh_iceconnectionstatechange(
         self, peer_id: str, pc: RTCPeerConnection
@@ -741,6 +950,7 @@ class RTCWorkerClient:
             # Clean up heartbeat tracking
             if peer_id in self.last_heartbeat:
                 del self.last_heartbeat[peer_id]
+            self.swim.remove_member(peer_id)
 
     # ===== End Connection Registry Methods =====
 
@@ -775,6 +985,12 @@ class RTCWorkerClient:
                 await self._handle_heartbeat(message, from_peer_id)
             elif msg_type == MessageType.HEARTBEAT_RESPONSE.value:
                 await self._handle_heartbeat_response(message, from_peer_id)
+            elif msg_type in (
+                MessageType.SWIM_PING.value,
+                MessageType.SWIM_PING_REQ.value,
+                MessageType.SWIM_ACK.value,
+            ):
+                await self.swim.handle_message(message, from_peer_id)
             elif msg_type == MessageType.QUERY_WORKERS.value:
                 await self._handle_query_workers(message, from_peer_id)
             elif msg_type == MessageType.WORKER_LIST.value:
@@ -809,7 +1025,10 @@ class RTCWorkerClient:
             if worker:
                 # Update worker status in CRDT
                 self.room_state_crdt.update_worker_status(
-                    from_peer_id, message.status, message.current_job
+                    from_peer_id,
+                    message.status,
+                    message.current_job,
+                    properties=message.properties,
                 )
 
                 # Broadcast updated state to all workers
@@ -848,6 +1067,9 @@ class RTCWorkerClient:
                     crdt_binary = base64.b64decode(crdt_b64)
                     self.room_state_crdt.apply_update(crdt_binary)
                     logging.debug("CRDT binary update applied successfully")
+                    # Admins that send deltas want our state vector back
+                    if message.crdt_snapshot.get("_delta"):
+                        self._send_crdt_ack(from_peer_id)
                 else:
                     # Legacy: try to merge as dict (will fail, but log clearly)
                     logging.error(
@@ -864,6 +1086,69 @@ class RTCWorkerClient:
             except Exception as e:
                 logging.error(f"Failed to apply CRDT update: {e}")
 
+    async def _handle_crdt_frame(self, data: bytes, from_peer_id: str):
+        """Handle a binary CRDT frame from a mesh peer.
+
+        Workers apply delta updates from the admin and acknowledge them with
+        their new state vector; the admin records acknowledgements so its
+        next broadcast to that worker only carries newer changes.
+
+        Args:
+            data: Binary message received on the mesh data channel
+            from_peer_id: Sender's peer_id
+        """
+        from sleap_rtc.worker.mesh_messages import (
+            CRDT_FRAME_ACK,
+            CRDT_FRAME_UPDATE,
+            decode_crdt_frame,
+        )
+
+        frame = decode_crdt_frame(data)
+        if frame is None:
+            logging.warning(f"Ignoring unknown binary mesh message from {from_peer_id}")
+            return
+        kind, payload = frame
+
+        if kind == CRDT_FRAME_ACK:
+            if self.admin_controller and self.admin_controller.is_admin:
+                await self.admin_controller.on_state_ack(from_peer_id, payload)
+            return
+
+        if kind != CRDT_FRAME_UPDATE:
+            logging.warning(f"Unknown CRDT frame {kind!r} from {from_peer_id}")
+            return
+        if from_peer_id != self.admin_peer_id:
+            logging.warning(f"Received CRDT update from non-admin: {from_peer_id}")
+            return
+        if not self.room_state_crdt:
+            return
+
+        try:
+            self.room_state_crdt.apply_update(payload)
+        except Exception as e:
+            # Ask the admin to start over with a full snapshot
+            logging.error(f"Failed to apply CRDT delta: {e}")
+            self._send_crdt_ack(from_peer_id, resync=True)
+            return
+
+        self._send_crdt_ack(from_peer_id)
+        if self.admin_controller:
+            await self.admin_controller.on_state_update()
+
+    def _send_crdt_ack(self, admin_peer_id: str, resync: bool = False):
+        """Acknowledge a CRDT broadcast with this worker's state vector.
+
+        Args:
+            admin_peer_id: Admin's peer_id
+            resync: Send an empty state vector to request a full snapshot
+        """
+        from sleap_rtc.worker.mesh_messages import CRDT_FRAME_ACK, encode_crdt_frame
+
+        state_vector = b"" if resync else self.room_state_crdt.get_state_vector()
+        self._send_mesh_message_to_peer(
+            admin_peer_id, encode_crdt_frame(CRDT_FRAME_ACK, state_vector)
+        )
+
     async def _handle_heartbeat(self, message, from_peer_id: str):
         """Handle heartbeat from peer.
 
@@ -871,9 +1156,16 @@ class RTCWorkerClient:
             message: HeartbeatMessage
             from_peer_id: Sender's peer_id
         """
+        logging.debug(f"Heartbeat from {from_peer_id} (seq {message.sequence})")
+
+        # Peers that speak SWIM are probed by it instead of timed out here
+        if message.swim:
+            self.last_heartbeat.pop(from_peer_id, None)
+            self.swim.add_member(from_peer_id)
+            return
+
         # Update last heartbeat timestamp
         self.last_heartbeat[from_peer_id] = message.timestamp
-        logging.debug(f"Heartbeat from {from_peer_id} (seq {message.sequence})")
 
         # TODO: Send heartbeat response (optional, for RTT measurement)
 
@@ -974,7 +1266,7 @@ class RTCWorkerClient:
 
         Args:
             peer_id: Target peer_id
-            message: Message object to send
+            message: Message object to send, or a binary CRDT frame
         """
         # Check if we have data channel for peer
         if peer_id not in self.data_channels:
@@ -991,6 +1283,11 @@ class RTCWorkerClient:
             return
 
         try:
+            if isinstance(message, bytes):
+                # Binary CRDT frame (mesh_messages.encode_crdt_frame)
+                data_channel.send(message)
+                logging.debug(f"Sent {len(message)}-byte CRDT frame to {peer_id}")
+                return
             # Serialize and send message
             message_str = serialize_message(message)
             data_channel.send(message_str)
@@ -998,7 +1295,7 @@ class RTCWorkerClient:
         except Exception as e:
             logging.error(f"Failed to send message to {peer_id}: {e}")
 
-    async def send_status_update(self, status: str, current_job=None):
+    async def send_status_update(self, status: str, current_job=None, properties=None):
         """Send status update to admin.
 
         If partitioned, queues update for later (read-only mode).
@@ -1006,12 +1303,17 @@ class RTCWorkerClient:
         Args:
             status: New status (available, busy, reserved, maintenance)
             current_job: Current job info (optional)
+            properties: Extra worker properties to record (optional)
         """
         # Phase 5: Read-only mode during partition
         if self.is_partitioned:
             logging.warning(f"Partitioned: Queueing status update ({status}) for later")
             self.pending_status_updates.append(
-                {"status": status, "current_job": current_job}
+                {
+                    "status": status,
+                    "current_job": current_job,
+                    "properties": properties,
+                }
             )
             return
 
@@ -1021,10 +1323,32 @@ class RTCWorkerClient:
 
         from sleap_rtc.worker.mesh_messages import create_status_update
 
-        message = create_status_update(self.peer_id, status, current_job)
+        message = create_status_update(self.peer_id, status, current_job, properties)
         self._send_mesh_message_to_peer(self.admin_peer_id, message)
         logging.info(f"Sent status update to admin: {status}")
 
+    def _publish_job_queue(self) -> None:
+        """Advertise queue depth and free GPUs after the job queue changes.
+
+        Only workers that run several jobs at once advertise this, so
+        single-job workers keep sending the same messages as before.
+        """
+        if not self.job_scheduler.concurrent:
+            return
+        properties = self.job_scheduler.to_metadata_dict()
+        status = self.state_manager.status if self.state_manager else self.status
+        if self.state_manager:
+            asyncio.create_task(self.state_manager.update_status(status, **properties))
+        if self.admin_controller and self.admin_controller.is_admin:
+            # The admin records its own entry directly.
+            if self.room_state_crdt:
+                self.room_state_crdt.update_worker_status(
+                    self.peer_id, status, properties=properties
+                )
+                asyncio.create_task(self._broadcast_state())
+        elif self.admin_peer_id:
+            asyncio.create_task(self.send_status_update(status, properties=properties))
+
     # ===== End Mesh Message Handling =====
 
     # ===== Signaling Heartbeat Watchdog =====
@@ -1068,17 +1392,20 @@ class RTCWorkerClient:
     # ===== Heartbeat Mechanism (Phase 4) =====
 
     async def _heartbeat_loop(self):
-        """Send periodic heartbeats to all connected peers.
+        """Send periodic heartbeats to connected peers not probed by SWIM.
 
         Runs in background, sends heartbeat every heartbeat_interval seconds.
+        Heartbeats advertise SWIM support, so peers that support it move to
+        SWIM after the first exchange.
         """
         logging.info(f"Starting heartbeat loop (interval: {self.heartbeat_interval}s)")
 
         while not self.shutting_down:
             try:
-                # Send heartbeat to all connected workers
+                # Send heartbeat to connected workers that don't speak SWIM
                 for peer_id in list(self.worker_connections.keys()):
-                    await self._send_heartbeat(peer_id)
+                    if not self.swim.is_member(peer_id):
+                        await self._send_heartbeat(peer_id)
 
                 # Wait for next heartbeat
                 await asyncio.sleep(self.heartbeat_interval)
@@ -1099,7 +1426,9 @@ class RTCWorkerClient:
         from sleap_rtc.worker.mesh_messages import create_heartbeat
 
         self.heartbeat_sequence += 1
-        message = create_heartbeat(self.peer_id, self.heartbeat_sequence)
+        message = create_heartbeat(
+            self.peer_id, self.heartbeat_sequence, swim=SWIM_VERSION
+        )
         self._send_mesh_message_to_peer(peer_id, message)
         logging.debug(f"Sent heartbeat to {peer_id} (seq {self.heartbeat_sequence})")
 
@@ -1141,24 +1470,32 @@ class RTCWorkerClient:
                     f"Heartbeat timeout for {peer_id}: {time_since_beat:.1f}s since last beat"
                 )
 
-                # Determine connection type and handle appropriately
-                connection_type = self._get_connection_type(peer_id)
+                await self._handle_peer_failure(peer_id)
 
-                if connection_type == "admin":
-                    logging.warning(f"Admin heartbeat timeout: {peer_id}")
-                    await self._handle_admin_disconnect(peer_id)
-                elif connection_type == "worker":
-                    logging.warning(f"Worker heartbeat timeout: {peer_id}")
-                    await self._handle_worker_disconnect(peer_id)
+    async def _handle_peer_failure(self, peer_id: str):
+        """Handle a peer detected as failed by heartbeat timeout or SWIM.
 
-                # Remove from heartbeat tracking
-                if peer_id in self.last_heartbeat:
-                    del self.last_heartbeat[peer_id]
+        Args:
+            peer_id: Failed peer's peer_id
+        """
+        # Determine connection type and handle appropriately
+        connection_type = self._get_connection_type(peer_id)
+
+        if connection_type == "admin":
+            logging.warning(f"Admin failure detected: {peer_id}")
+            await self._handle_admin_disconnect(peer_id)
+        elif connection_type == "worker":
+            logging.warning(f"Worker failure detected: {peer_id}")
+            await self._handle_worker_disconnect(peer_id)
+
+        # Remove from heartbeat tracking
+        if peer_id in self.last_heartbeat:
+            del self.last_heartbeat[peer_id]
 
     def start_heartbeat_tasks(self):
         """Start background heartbeat tasks.
 
-        Starts both heartbeat sending and heartbeat checking tasks.
+        Starts heartbeat sending, heartbeat checking and SWIM probing tasks.
         """
         if self.heartbeat_task is None or self.heartbeat_task.done():
             self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
@@ -1170,6 +1507,11 @@ class RTCWorkerClient:
             )
             logging.info("Heartbeat checking task started")
 
+        if self.swim_task is None or self.swim_task.done():
+            self.swim.local_id = self.peer_id
+            self.swim_task = asyncio.create_task(self.swim.run())
+            logging.info("SWIM failure detection task started")
+
     async def stop_heartbeat_tasks(self):
         """Stop background heartbeat tasks."""
         if self.heartbeat_task:
@@ -1188,6 +1530,14 @@ class RTCWorkerClient:
                 pass
             logging.info("Heartbeat checking task stopped")
 
+        if self.swim_task:
+            self.swim_task.cancel()
+            try:
+                await self.swim_task
+            except asyncio.CancelledError:
+                pass
+            logging.info("SWIM failure detection task stopped")
+
     # ===== End Heartbeat Mechanism =====
 
     # ===== Partition Detection and Recovery (Phase 5) =====
@@ -1351,7 +1701,9 @@ class RTCWorkerClient:
         for update in self.pending_status_updates:
             try:
                 await self.send_status_update(
-                    update.get("status"), update.get("current_job")
+                    update.get("status"),
+                    update.get("current_job"),
+                    update.get("properties"),
                 )
             except Exception as e:
                 logging.error(f"Failed to send pending update: {e}")
@@ -1735,10 +2087,14 @@ class RTCWorkerClient:
                     # Store the peer's role so handle_channel_open can decide whether to skip PSK
                     self._pending_offer_role = data.get("role")
 
-                    # SAFEGUARD: Check worker status before accepting connection
-                    if self.status in ["busy", "reserved"]:
+                    # SAFEGUARD: Only accept clients we can take jobs from
+                    if not self._can_accept_client():
+                        # A multi-job worker is busy once its slots and queue are full
+                        status = (
+                            "busy" if self.job_scheduler.concurrent else self.status
+                        )
                         logging.warning(
-                            f"Rejecting connection from {target_pid} - worker is {self.status}"
+                            f"Rejecting connection from {target_pid} - worker is {status}"
                         )
 
                         # Send error response to client via signaling server
@@ -1748,8 +2104,8 @@ class RTCWorkerClient:
                                     "type": "error",
                                     "target": target_pid,
                                     "reason": "worker_busy",
-                                    "message": f"Worker is currently {self.status}. Please use --room to discover available workers.",
-                                    "current_status": self.status,
+                                    "message": f"Worker is currently {status}. Please use --room to discover available workers.",
+                                    "current_status": status,
                                 }
                             )
                         )
@@ -1757,31 +2113,32 @@ class RTCWorkerClient:
                         logging.info(f"Sent busy rejection to client {target_pid}")
                         continue  # Skip this offer, continue listening
 
-                    # Status is "available" - proceed with connection
+                    # Proceed with connection
                     logging.info(
                         f"Accepting connection from {target_pid} (status: {self.status})"
                     )
 
-                    # Update status to "reserved" to prevent race conditions
-                    await self.state_manager.update_status("reserved")
-                    logging.info("Worker status updated to 'reserved'")
-
-                    # Set worker peer's remote description to the client's offer based on sdp data
-                    await self.pc.setRemoteDescription(
-                        RTCSessionDescription(sdp=data.get("sdp"), type="offer")
+                    # A single-job worker reserves itself for this client to
+                    # prevent race conditions; a multi-job worker keeps taking
+                    # clients and advertises its queue instead.
+                    if not self.job_scheduler.concurrent:
+                        await self.state_manager.update_status("reserved")
+                        logging.info("Worker status updated to 'reserved'")
+
+                    # Answer the client's offer on a peer connection of its own
+                    client_pc = self._create_client_peer_connection(target_pid)
+                    await self._answer_client_offer(
+                        target_pid, client_pc, data.get("sdp"), role=data.get("role")
                     )
 
-                    # Generate worker's answer SDP and set it as the local description
-                    await self.pc.setLocalDescription(await self.pc.createAnswer())
-
                     # Send worker's answer SDP to client so they can set it as their remote description
                     await self.websocket.send(
                         json.dumps(
                             {
-                                "type": self.pc.localDescription.type,  # 'answer'
+                                "type": client_pc.localDescription.type,  # 'answer'
                                 "sender": peer_id,  # worker's peer ID
                                 "target": target_pid,  # client's peer ID
-                                "sdp": self.pc.localDescription.sdp,  # worker's answer SDP
+                                "sdp": client_pc.localDescription.sdp,  # worker's answer SDP
                             }
                         )
                     )
@@ -1789,7 +2146,8 @@ class RTCWorkerClient:
                     logging.info(f"Connection accepted - answer sent to {target_pid}")
 
                     # Reset received_files dictionary
-                    self.received_files.clear()
+                    if len(self.client_connections) == 1:
+                        self.received_files.clear()
 
                 elif msg_type == "registered_auth":
                     room_id = data.get("room_id")
@@ -1830,6 +2188,9 @@ class RTCWorkerClient:
                             f"Received {len(self.mesh_ice_servers)} ICE server(s) for mesh connections"
                         )
 
+                    # Pick up jobs left in the on-disk queue by a previous run
+                    self._recover_job_queue()
+
                     # Log discovery info
                     if discovered_admin:
                         logging.info(
@@ -1954,7 +2315,8 @@ class RTCWorkerClient:
                 elif msg_type == "candidate":
                     print("Received ICE candidate")
                     candidate = data.get("candidate")
-                    await pc.addIceCandidate(candidate)
+                    client_pc = self._client_peer_connection(data.get("sender")) or pc
+                    await client_pc.addIceCandidate(candidate)
 
                 elif msg_type == "error":
                     logging.error(f"Error received from server: {data.get('reason')}")
@@ -2009,6 +2371,143 @@ class RTCWorkerClient:
 
     # ===== Filesystem Browser Message Handling =====
 
+    async def run_fs_request(self, client_id: str, func, *args):
+        """Run a blocking filesystem handler on the FS thread pool.
+
+        Args:
+            client_id: Requesting client (data channel label or relay session),
+                used for per-client limits and cancellation.
+            func: Blocking handler, e.g. :meth:`handle_fs_message`.
+            *args: Arguments for ``func``.
+
+        Returns:
+            The handler's result, or None if the request was cancelled or
+            timed out.
+        """
+        try:
+            return await self.fs_service.run(client_id, func, *args)
+        except FSRequestCancelled:
+            logging.info(f"Filesystem request from {client_id} cancelled")
+        except asyncio.TimeoutError:
+            logging.warning(f"Filesystem request from {client_id} timed out")
+        return None
+
+    async def handle_fs_message_async(self, message: str, client_id: str) -> str:
+        """Handle an FS_* message without blocking the event loop.
+
+        Args:
+            message: The incoming FS_* message string.
+            client_id: Requesting client, see :meth:`run_fs_request`.
+
+        Returns:
+            Response message string; an FS_ERROR with code TIMEOUT if the
+            request did not complete.
+        """
+        response = await self.run_fs_request(client_id, self.handle_fs_message, message)
+        if response is None:
+            return (
+                f"{MSG_FS_ERROR}{MSG_SEPARATOR}{FS_ERROR_TIMEOUT}{MSG_SEPARATOR}"
+                "Filesystem request did not complete"
+            )
+        return response
+
+    async def stream_fs_listing(
+        self, message: str, channel: RTCDataChannel, client_id: str
+    ) -> None:
+        """Answer FS_LIST_DIR, streaming several pages if the client asked.
+
+        A request with a ``max_entries`` field gets consecutive
+        FS_LIST_RESPONSE pages of up to FileManager.LIST_PAGE_MAX entries until
+        ``max_entries`` entries were sent or the listing ends. Every page is a
+        separate filesystem request, so other clients' requests interleave.
+
+        Args:
+            message: The FS_LIST_DIR message.
+            channel: Channel to send the responses on.
+            client_id: Requesting client, see :meth:`run_fs_request`.
+        """
+        parts = message.split(MSG_SEPARATOR)
+        path = parts[1] if len(parts) > 1 else ""
+        try:
+            offset = int(parts[2]) if len(parts) > 2 and parts[2] else 0
+            remaining = int(parts[3]) if len(parts) > 3 and parts[3] else 0
+        except ValueError:
+            remaining = 0
+        cursor = parts[4] if len(parts) > 4 else ""
+
+        while True:
+            page_size = min(remaining, self.file_manager.LIST_PAGE_MAX)
+            page = MSG_SEPARATOR.join(
+                [MSG_FS_LIST_DIR, path, str(offset), str(page_size or ""), cursor]
+            )
+            response = await self.handle_fs_message_async(page, client_id)
+            if channel.readyState != "open":
+                return
+            channel.send(response)
+            if page_size <= 0 or not response.startswith(
+                f"{MSG_FS_LIST_RESPONSE}{MSG_SEPARATOR}"
+            ):
+                return
+            result = json.loads(response.split(MSG_SEPARATOR, 1)[1])
+            remaining -= result["next_offset"] - offset
+            if not result["has_more"] or remaining <= 0:
+                return
+            offset = result["next_offset"]
+            cursor = result["cursor"]
+
+    async def handle_fs_request(
+        self, channel: RTCDataChannel, message: str, client_id: str
+    ) -> bool:
+        """Answer a filesystem browser or worker path request.
+
+        Used for plain requests and, through :class:`~sleap_rtc.rpc.RpcServer`,
+        for requests with correlation IDs, where ``channel`` wraps every
+        response in a reply.
+
+        Args:
+            channel: Channel to send the responses on.
+            message: The FS_* or USE_WORKER_PATH message.
+            client_id: Requesting client, see :meth:`run_fs_request`.
+
+        Returns:
+            True if the message was such a request.
+        """
+        # Directory listings may be streamed as several pages
+        if message.startswith(f"{MSG_FS_LIST_DIR}{MSG_SEPARATOR}"):
+            await self.stream_fs_listing(message, channel, client_id)
+            return True
+
+        # Handle filesystem browser messages (FS_*)
+        if self._is_fs_message(message):
+            logging.info(f"Handling filesystem message: {message[:50]}...")
+            response = await self.handle_fs_message_async(message, client_id)
+            if channel.readyState == "open":
+                channel.send(response)
+            return True
+
+        # Handle worker path message (USE_WORKER_PATH)
+        if message.startswith(MSG_USE_WORKER_PATH):
+            logging.info(f"Handling worker path message: {message}")
+            response = await self.run_fs_request(
+                client_id, self.handle_worker_path_message, message
+            ) or (f"{MSG_WORKER_PATH_ERROR}{MSG_SEPARATOR}Path check timed out")
+            if channel.readyState == "open":
+                channel.send(response)
+
+                # If path was accepted and it's an SLP file, check video
+                # accessibility. The path comes from this request's response:
+                # concurrent requests overwrite worker_input_path.
+                if response.startswith(f"{MSG_WORKER_PATH_OK}{MSG_SEPARATOR}"):
+                    validated_path = response.split(MSG_SEPARATOR, 1)[1]
+                    video_check = await self.run_fs_request(
+                        client_id, self._check_slp_videos_if_needed, validated_path
+                    )
+                    if video_check is not None and channel.readyState == "open":
+                        channel.send(video_check)
+            return True
+
+        return False
+
     def handle_fs_message(self, message: str) -> str:
         """Handle filesystem browser messages from clients.
 
@@ -2061,16 +2560,28 @@ class RTCWorkerClient:
 
                 return f"{MSG_FS_RESOLVE_RESPONSE}{MSG_SEPARATOR}{json.dumps(result)}"
 
+            elif msg_type == MSG_FS_REFRESH_INDEX:
+                # Rescan the filename index now (e.g. after files were copied)
+                refreshing = self.file_manager.refresh_filename_index()
+                return (
+                    f"{MSG_FS_REFRESH_INDEX_RESPONSE}{MSG_SEPARATOR}"
+                    f"{json.dumps({'refreshing': refreshing})}"
+                )
+
             elif msg_type == MSG_FS_LIST_DIR:
-                # Directory listing
-                # Format: FS_LIST_DIR::path::offset
+                # Directory listing (first page only; see stream_fs_listing)
+                # Format: FS_LIST_DIR::path::offset[::max_entries[::cursor]]
                 path = parts[1] if len(parts) > 1 else ""
                 offset = int(parts[2]) if len(parts) > 2 and parts[2] else 0
+                max_entries = int(parts[3]) if len(parts) > 3 and parts[3] else None
+                cursor = parts[4] if len(parts) > 4 and parts[4] else None
 
                 if not path:
                     return f"{MSG_FS_ERROR}{MSG_SEPARATOR}{FS_ERROR_INVALID_REQUEST}{MSG_SEPARATOR}Path is required"
 
-                result = self.file_manager.list_directory(path=path, offset=offset)
+                result = self.file_manager.list_directory(
+                    path=path, offset=offset, limit=max_entries, cursor=cursor
+                )
 
                 # Check for errors in result
                 if "error_code" in result:
@@ -2247,28 +2758,35 @@ class RTCWorkerClient:
             logging.error(f"Error handling worker path message: {e}")
             return f"{MSG_WORKER_PATH_ERROR}{MSG_SEPARATOR}{str(e)}"
 
-    def _check_slp_videos_if_needed(self) -> str | None:
+    def _check_slp_videos_if_needed(self, slp_path: Optional[str] = None) -> str | None:
         """Check video accessibility if the worker input path is an SLP file.
 
         Called after WORKER_PATH_OK is sent. If the input file is an SLP and
         has missing video references, returns a FS_CHECK_VIDEOS_RESPONSE message.
 
+        Args:
+            slp_path: Path validated by the WORKER_PATH_OK being answered.
+                Callers that validated a path pass it here rather than rely
+                on ``worker_input_path``, which concurrent requests overwrite.
+                Defaults to ``worker_input_path``.
+
         Returns:
             FS_CHECK_VIDEOS_RESPONSE message if there are missing videos,
             or None if no check is needed or all videos are accessible.
         """
-        if not self.worker_input_path:
+        slp_path = slp_path or self.worker_input_path
+        if not slp_path:
             return None
 
         # Check if it's an SLP file
-        path = Path(self.worker_input_path)
+        path = Path(slp_path)
         if path.suffix.lower() not in (".slp", ".pkg.slp"):
             # Also check for .pkg.slp extension
             if not path.name.lower().endswith(".pkg.slp"):
                 return None
 
         # Check video accessibility
-        result = self.file_manager.check_video_accessibility(self.worker_input_path)
+        result = self.file_manager.check_video_accessibility(slp_path)
 
         import json
 
@@ -2462,179 +2980,37 @@ class RTCWorkerClient:
                     )
                     return
 
+                if not self.job_scheduler.has_capacity:
+                    error_response = json.dumps(
+                        {
+                            "errors": [
+                                {
+                                    "field": "queue",
+                                    "message": (
+                                        "Worker job queue is full "
+                                        f"({self.job_scheduler.max_queue} waiting)"
+                                    ),
+                                }
+                            ]
+                        }
+                    )
+                    logging.warning(f"Job {client_job_id} rejected: queue is full")
+                    channel.send(
+                        f"{MSG_JOB_REJECTED}{MSG_SEPARATOR}{client_job_id}{MSG_SEPARATOR}{error_response}"
+                    )
+                    return
+
                 # Generate job ID and send JOB_ACCEPTED
                 job_id = f"job_{uuid.uuid4().hex[:8]}"
                 logging.info(f"Job accepted: {job_id} (client ID: {client_job_id})")
                 channel.send(f"{MSG_JOB_ACCEPTED}{MSG_SEPARATOR}{job_id}")
 
-                # Build and execute commands using CommandBuilder
-                builder = CommandBuilder()
-                if isinstance(spec, TrainJobSpec):
-                    # Generate per-model run_names with a shared timestamp so
-                    # each training session produces a unique, human-readable
-                    # checkpoint directory (e.g. "centroid_20240115_123456").
-                    # A single timestamp is used for all models in the pipeline
-                    # so they sort together when browsing the models directory.
-                    _ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    _model_types = getattr(spec, "model_types", []) or []
-                    per_model_run_names = [
-                        spec.run_name
-                        or (
-                            f"{_model_types[i]}_{_ts}"
-                            if i < len(_model_types)
-                            else f"model_{i}_{_ts}"
-                        )
-                        for i in range(len(spec.config_paths))
-                    ]
-
-                    # Build one command per config, injecting the pre-generated
-                    # run_name so the checkpoint path is predictable.
-                    commands = [
-                        builder.build_train_command(
-                            spec,
-                            config_index=i,
-                            run_name_override=per_model_run_names[i],
-                        )
-                        for i in range(len(spec.config_paths))
-                    ]
-                    total_configs = len(commands)
-
-                    # Capture the already-resolved worker-side labels path so the
-                    # post-training inference step can reuse it without re-applying
-                    # path_mappings.
-                    worker_labels_path: Optional[str] = spec.labels_path
-
-                    # Accumulate trained checkpoint directories for inference.
-                    trained_model_paths: list[str] = []
-                    pipeline_cancelled = False
-                    pipeline_failed = False
-                    # Per-model outcomes for the end-of-pipeline summary.
-                    model_outcomes: list[tuple[str, dict]] = []
-
-                    # Create one ProgressReporter for the entire pipeline so ZMQ
-                    # ports stay bound between models — no context.term() between
-                    # models, mirroring local SLEAP's persistent-socket design.
-                    pipeline_reporter = ProgressReporter(
-                        control_address=f"tcp://127.0.0.1:{DEFAULT_ZMQ_PORTS['controller']}",
-                        progress_address=f"tcp://127.0.0.1:{DEFAULT_ZMQ_PORTS['publish']}",
-                    )
-                    pipeline_reporter.start_control_socket()
-                    pipeline_reporter.start_progress_listener_task(channel)
-                    try:
-                        for i, cmd in enumerate(commands):
-                            config_name = Path(spec.config_paths[i]).stem
-                            if total_configs > 1:
-                                logging.info(
-                                    f"Training model {i+1}/{total_configs}: {config_name}"
-                                )
-                                channel.send(
-                                    f"Training model {i+1}/{total_configs}: {config_name}\n"
-                                )
-
-                            # Send MODEL_TYPE:: so the client can switch LossViewer
-                            # Skip i=0: client already initialized with first model type
-                            if (
-                                i > 0
-                                and getattr(spec, "model_types", None)
-                                and i < len(spec.model_types)
-                            ):
-                                channel.send(f"MODEL_TYPE::{spec.model_types[i]}")
-
-                            model_job_id = (
-                                f"{job_id}_{i}" if total_configs > 1 else job_id
-                            )
-                            logging.info(
-                                f"[PIPELINE] Starting model {i+1}/{total_configs} "
-                                f"(job_id={model_job_id}, config={config_name!r})"
-                            )
-                            result = await self.job_executor.execute_from_spec(
-                                channel,
-                                cmd,
-                                model_job_id,
-                                job_type="train",
-                                zmq_ports=DEFAULT_ZMQ_PORTS,
-                                progress_reporter=pipeline_reporter,
-                                spec=spec,
-                            )
-                            model_outcomes.append(
-                                (per_model_run_names[i], result or {})
-                            )
-
-                            # Track per-model result for inference decision.
-                            if result and result.get("cancelled"):
-                                pipeline_cancelled = True
-                                break
-                            if result and not result.get("success"):
-                                pipeline_failed = True
-                                break
-
-                            # Derive checkpoint directory using the run_name
-                            # that was injected into the training command.
-                            ckpt_dir = _get_checkpoint_dir(
-                                spec.config_paths[i],
-                                run_name_override=per_model_run_names[i],
-                            )
-                            if ckpt_dir:
-                                trained_model_paths.append(ckpt_dir)
-                                logging.info(f"[PIPELINE] Checkpoint dir: {ckpt_dir}")
-                            else:
-                                logging.warning(
-                                    f"[PIPELINE] Could not determine checkpoint dir for model {i+1}"
-                                )
-
-                            # Flush buffered ZMQ messages from the finished model
-                            # before switching model type on the client. This prevents
-                            # stale messages from appearing in the next model's LossViewer.
-                            if i < total_configs - 1:
-                                await pipeline_reporter.restart_progress_listener(
-                                    channel
-                                )
-                    finally:
-                        logging.info(
-                            "[PIPELINE] All models finished — running pipeline_reporter.async_cleanup()"
-                        )
-                        await pipeline_reporter.async_cleanup()
-                        self.job_executor._progress_reporter = None
-
-                    # Post-training inference — mirrors SLEAP GUI's run_gui_inference().
-                    # Runs after ZMQ cleanup so ports are free; uses shared filesystem
-                    # so no file transfer is needed.
-                    inference_status = await self._run_post_training_inference(
-                        channel=channel,
-                        spec=spec,
-                        worker_labels_path=worker_labels_path,
-                        trained_model_paths=trained_model_paths,
-                        pipeline_cancelled=pipeline_cancelled,
-                        pipeline_failed=pipeline_failed,
-                        builder=builder,
-                    )
-
-                    # Print a summary banner after all ZMQ progress noise has
-                    # passed so the key outcomes are easy to find in the logs.
-                    sep = "─" * 56
-                    logging.info(f"[PIPELINE SUMMARY] {sep}")
-                    for idx, (run_name, res) in enumerate(model_outcomes):
-                        if res.get("cancelled"):
-                            status = "cancelled"
-                        elif res.get("stopped_early"):
-                            status = "stopped early (checkpoint saved)"
-                        elif res.get("success"):
-                            status = "success"
-                        else:
-                            exit_code = res.get("exit_code", "?")
-                            status = f"FAILED (exit {exit_code})"
-                        logging.info(
-                            f"[PIPELINE SUMMARY]   Model {idx+1}/{total_configs}"
-                            f" {run_name}: {status}"
-                        )
-                    logging.info(f"[PIPELINE SUMMARY]   Inference: {inference_status}")
-                    logging.info(f"[PIPELINE SUMMARY] {sep}")
-
-                elif isinstance(spec, TrackJobSpec):
-                    cmd = builder.build_track_command(spec)
-                    await self.job_executor.execute_from_spec(
-                        channel, cmd, job_id, job_type="track", spec=spec
-                    )
+                await self.job_scheduler.run(
+                    client_job_id,
+                    channel,
+                    lambda slot: self._execute_job(channel, spec, job_id, slot),
+                    spec=json_spec,
+                )
             finally:
                 # Clean up temp config files
                 for temp_path in temp_config_paths:
@@ -2670,6 +3046,407 @@ class RTCWorkerClient:
                     f"{MSG_JOB_REJECTED}{MSG_SEPARATOR}{client_job_id}{MSG_SEPARATOR}{error_response}"
                 )
 
+    def _recover_job_queue(self) -> None:
+        """Resubmit the jobs a previous run of this worker left on disk.
+
+        Jobs that were still queued are submitted again and run without a
+        client, leaving their outputs on the worker. Jobs that were running
+        when the worker stopped are reported as failed.
+        """
+        store = self.job_scheduler.store
+        if store is None:
+            return
+        for record in store.recover():
+            job_id = record.get("job_id", "unknown")
+            if record.get("state") == "running":
+                logging.error(
+                    f"Job {job_id} failed: the worker restarted while it was running"
+                )
+                continue
+            logging.info(f"Resubmitting job {job_id} queued before the restart")
+            message = f"{MSG_JOB_SUBMIT}{MSG_SEPARATOR}{job_id}{MSG_SEPARATOR}{record['spec']}"
+            asyncio.create_task(
+                self.handle_job_submit(DetachedChannel(job_id), message)
+            )
+
+    async def _execute_job(
+        self, channel: RTCDataChannel, spec, job_id: str, slot: JobSlot
+    ) -> None:
+        """Run an accepted job in the scheduler slot it was given.
+
+        Args:
+            channel: The data channel for communication with the Client.
+            spec: Validated TrainJobSpec or TrackJobSpec.
+            job_id: Worker-generated job ID sent in JOB_ACCEPTED.
+            slot: Slot providing the executor, GPUs and ZMQ ports.
+        """
+        executor = self.job_scheduler.executor(slot)
+
+        # Build and execute commands using CommandBuilder
+        builder = CommandBuilder()
+        if isinstance(spec, TrainJobSpec):
+            # Generate per-model run_names with a shared timestamp so
+            # each training session produces a unique, human-readable
+            # checkpoint directory (e.g. "centroid_20240115_123456").
+            # A single timestamp is used for all models in the pipeline
+            # so they sort together when browsing the models directory.
+            _ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            _model_types = getattr(spec, "model_types", []) or []
+            per_model_run_names = [
+                spec.run_name
+                or (
+                    f"{_model_types[i]}_{_ts}"
+                    if i < len(_model_types)
+                    else f"model_{i}_{_ts}"
+                )
+                for i in range(len(spec.config_paths))
+            ]
+
+            # Independent models train side by side on disjoint GPUs when the
+            # slot has enough of them; otherwise they train one after another.
+            total_configs = len(spec.config_paths)
+            device_groups = (
+                plan_device_groups(slot.devices, total_configs)
+                if self.parallel_pipelines and 1 < total_configs <= len(slot.devices)
+                else None
+            )
+
+            # Build one command per config, injecting the pre-generated
+            # run_name so the checkpoint path is predictable.
+            commands = [
+                builder.build_train_command(
+                    spec,
+                    zmq_ports=self.job_scheduler.model_zmq_ports(
+                        slot, i if device_groups else 0
+                    ),
+                    config_index=i,
+                    run_name_override=per_model_run_names[i],
+                )
+                for i in range(total_configs)
+            ]
+
+            # Capture the already-resolved worker-side labels path so the
+            # post-training inference step can reuse it without re-applying
+            # path_mappings.
+            worker_labels_path: Optional[str] = spec.labels_path
+
+            if device_groups:
+                outcome = await self._train_models_parallel(
+                    channel,
+                    spec,
+                    job_id,
+                    slot,
+                    commands,
+                    per_model_run_names,
+                    device_groups,
+                )
+            else:
+                outcome = await self._train_models_sequential(
+                    channel, spec, job_id, slot, commands, per_model_run_names
+                )
+            (
+                model_outcomes,
+                trained_model_paths,
+                pipeline_cancelled,
+                pipeline_failed,
+            ) = outcome
+
+            # Post-training inference — mirrors SLEAP GUI's run_gui_inference().
+            # Runs after ZMQ cleanup so ports are free; uses shared filesystem
+            # so no file transfer is needed.
+            inference_status = await self._run_post_training_inference(
+                channel=channel,
+                spec=spec,
+                worker_labels_path=worker_labels_path,
+                trained_model_paths=trained_model_paths,
+                pipeline_cancelled=pipeline_cancelled,
+                pipeline_failed=pipeline_failed,
+                builder=builder,
+                executor=executor,
+            )
+
+            # Print a summary banner after all ZMQ progress noise has
+            # passed so the key outcomes are easy to find in the logs.
+            sep = "─" * 56
+            logging.info(f"[PIPELINE SUMMARY] {sep}")
+            for idx, (run_name, res) in enumerate(model_outcomes):
+                if res.get("cancelled"):
+                    status = "cancelled"
+                elif res.get("stopped_early"):
+                    status = "stopped early (checkpoint saved)"
+                elif res.get("success"):
+                    status = "success"
+                else:
+                    exit_code = res.get("exit_code", "?")
+                    status = f"FAILED (exit {exit_code})"
+                logging.info(
+                    f"[PIPELINE SUMMARY]   Model {idx+1}/{total_configs}"
+                    f" {run_name}: {status}"
+                )
+            logging.info(f"[PIPELINE SUMMARY]   Inference: {inference_status}")
+            logging.info(f"[PIPELINE SUMMARY] {sep}")
+
+        elif isinstance(spec, TrackJobSpec):
+            cmd = builder.build_track_command(spec)
+            await executor.execute_from_spec(
+                channel, cmd, job_id, job_type="track", spec=spec
+            )
+
+    async def _train_models_sequential(
+        self,
+        channel: RTCDataChannel,
+        spec: TrainJobSpec,
+        job_id: str,
+        slot: JobSlot,
+        commands: list,
+        run_names: list,
+    ) -> tuple:
+        """Train the models of a pipeline one after another.
+
+        Args:
+            channel: The data channel for communication with the Client.
+            spec: Validated TrainJobSpec.
+            job_id: Worker-generated job ID sent in JOB_ACCEPTED.
+            slot: Slot providing the executor, GPUs and ZMQ ports.
+            commands: One train command per config.
+            run_names: Run name injected into each command.
+
+        Returns:
+            Tuple of per-model ``(run_name, result)`` outcomes, trained
+            checkpoint directories, and whether the pipeline was cancelled or
+            failed.
+        """
+        executor = self.job_scheduler.executor(slot)
+        total_configs = len(commands)
+
+        # Accumulate trained checkpoint directories for inference.
+        trained_model_paths: list[str] = []
+        pipeline_cancelled = False
+        pipeline_failed = False
+        # Per-model outcomes for the end-of-pipeline summary.
+        model_outcomes: list[tuple[str, dict]] = []
+
+        # Create one ProgressReporter for the entire pipeline so ZMQ
+        # ports stay bound between models — no context.term() between
+        # models, mirroring local SLEAP's persistent-socket design.
+        pipeline_reporter = ProgressReporter(
+            control_address=f"tcp://127.0.0.1:{slot.zmq_ports['controller']}",
+            progress_address=f"tcp://127.0.0.1:{slot.zmq_ports['publish']}",
+        )
+        pipeline_reporter.start_control_socket()
+        pipeline_reporter.start_progress_listener_task(channel)
+        try:
+            for i, cmd in enumerate(commands):
+                config_name = Path(spec.config_paths[i]).stem
+                if total_configs > 1:
+                    logging.info(f"Training model {i+1}/{total_configs}: {config_name}")
+                    channel.send(
+                        f"Training model {i+1}/{total_configs}: {config_name}\n"
+                    )
+
+                # Send MODEL_TYPE:: so the client can switch LossViewer
+                # Skip i=0: client already initialized with first model type
+                if (
+                    i > 0
+                    and getattr(spec, "model_types", None)
+                    and i < len(spec.model_types)
+                ):
+                    channel.send(f"MODEL_TYPE::{spec.model_types[i]}")
+
+                model_job_id = f"{job_id}_{i}" if total_configs > 1 else job_id
+                logging.info(
+                    f"[PIPELINE] Starting model {i+1}/{total_configs} "
+                    f"(job_id={model_job_id}, config={config_name!r})"
+                )
+                result = await executor.execute_from_spec(
+                    channel,
+                    cmd,
+                    model_job_id,
+                    job_type="train",
+                    zmq_ports=slot.zmq_ports,
+                    progress_reporter=pipeline_reporter,
+                    spec=spec,
+                )
+                model_outcomes.append((run_names[i], result or {}))
+
+                # Track per-model result for inference decision.
+                if result and result.get("cancelled"):
+                    pipeline_cancelled = True
+                    break
+                if result and not result.get("success"):
+                    pipeline_failed = True
+                    break
+
+                # Derive checkpoint directory using the run_name
+                # that was injected into the training command.
+                ckpt_dir = _get_checkpoint_dir(
+                    spec.config_paths[i],
+                    run_name_override=run_names[i],
+                )
+                if ckpt_dir:
+                    trained_model_paths.append(ckpt_dir)
+                    logging.info(f"[PIPELINE] Checkpoint dir: {ckpt_dir}")
+                else:
+                    logging.warning(
+                        f"[PIPELINE] Could not determine checkpoint dir for model {i+1}"
+                    )
+
+                # Flush buffered ZMQ messages from the finished model
+                # before switching model type on the client. This prevents
+                # stale messages from appearing in the next model's LossViewer.
+                if i < total_configs - 1:
+                    await pipeline_reporter.restart_progress_listener(channel)
+        finally:
+            logging.info(
+                "[PIPELINE] All models finished — running pipeline_reporter.async_cleanup()"
+            )
+            await pipeline_reporter.async_cleanup()
+            executor._progress_reporter = None
+
+        return (
+            model_outcomes,
+            trained_model_paths,
+            pipeline_cancelled,
+            pipeline_failed,
+        )
+
+    async def _train_models_parallel(
+        self,
+        channel: RTCDataChannel,
+        spec: TrainJobSpec,
+        job_id: str,
+        slot: JobSlot,
+        commands: list,
+        run_names: list,
+        device_groups: list,
+    ) -> tuple:
+        """Train independent pipeline models at the same time on disjoint GPUs.
+
+        Each model gets its own executor, GPUs and ZMQ port pair, plus a
+        ProgressReporter that tags its reports with the model type, so the
+        client's LossViewer can tell the interleaved streams apart. The client
+        follows one model at a time: when the model it shows finishes, it is
+        switched with MODEL_TYPE:: to one that is still training.
+
+        Args:
+            channel: The data channel for communication with the Client.
+            spec: Validated TrainJobSpec.
+            job_id: Worker-generated job ID sent in JOB_ACCEPTED.
+            slot: Slot providing the GPUs and ZMQ ports.
+            commands: One train command per config, built with
+                ``JobScheduler.model_zmq_ports`` ports.
+            run_names: Run name injected into each command.
+            device_groups: CUDA devices of each model.
+
+        Returns:
+            Tuple of per-model ``(run_name, result)`` outcomes, trained
+            checkpoint directories (in pipeline order), and whether the
+            pipeline was cancelled or failed.
+        """
+        total_configs = len(commands)
+        model_types = getattr(spec, "model_types", None) or []
+        names = [Path(p).stem for p in spec.config_paths]
+        logging.info(
+            f"[PIPELINE] Training {total_configs} models in parallel: "
+            + ", ".join(
+                f"{n} on GPU {','.join(d)}" for n, d in zip(names, device_groups)
+            )
+        )
+        channel.send(
+            f"Training {total_configs} models in parallel: {', '.join(names)}\n"
+        )
+
+        executors = []
+        reporters = []
+        for i, devices in enumerate(device_groups):
+            executor = JobExecutor(worker=self, capabilities=self.capabilities)
+            executor.env = {**slot.env, "CUDA_VISIBLE_DEVICES": ",".join(devices)}
+            ports = self.job_scheduler.model_zmq_ports(slot, i)
+            reporter = ProgressReporter(
+                control_address=f"tcp://127.0.0.1:{ports['controller']}",
+                progress_address=f"tcp://127.0.0.1:{ports['publish']}",
+                what=model_types[i] if i < len(model_types) else None,
+            )
+            reporter.start_control_socket()
+            reporter.start_progress_listener_task(channel)
+            executors.append(executor)
+            reporters.append(reporter)
+        # Route the client's stop/cancel commands to every model.
+        slot.pipeline = ExecutorGroup(executors)
+
+        finished = [False] * total_configs
+        shown = 0  # Model the client's LossViewer currently follows
+        aborted = None  # Result of the model whose failure or cancel ended the run
+
+        async def train(i: int) -> dict:
+            nonlocal shown, aborted
+            result = await executors[i].execute_from_spec(
+                channel,
+                commands[i],
+                f"{job_id}_{i}",
+                job_type="train",
+                zmq_ports=self.job_scheduler.model_zmq_ports(slot, i),
+                progress_reporter=reporters[i],
+                spec=spec,
+            )
+            result = result or {}
+            finished[i] = True
+            running = [j for j in range(total_configs) if not finished[j]]
+            if aborted is None and not result.get("success") and running:
+                # Inference needs every model, so the others would train for
+                # nothing while holding GPUs queued jobs are waiting for.
+                aborted = result
+                logging.info(
+                    f"[PIPELINE] {names[i]} did not finish; cancelling "
+                    + ", ".join(names[j] for j in running)
+                )
+                for j in running:
+                    executors[j]._cancel_requested = True
+                    executors[j].cancel_running_job()
+                return result
+            if i == shown and running:
+                shown = running[0]
+                if shown < len(model_types):
+                    channel.send(f"MODEL_TYPE::{model_types[shown]}")
+            return result
+
+        try:
+            results = await asyncio.gather(*(train(i) for i in range(total_configs)))
+        finally:
+            slot.pipeline = None
+            for reporter in reporters:
+                await reporter.async_cleanup()
+
+        model_outcomes = list(zip(run_names, results))
+        if aborted is not None:
+            # Siblings report the cancel we issued; the first outcome decides
+            pipeline_cancelled = bool(aborted.get("cancelled"))
+            pipeline_failed = not pipeline_cancelled
+        else:
+            pipeline_cancelled = any(r.get("cancelled") for r in results)
+            pipeline_failed = not pipeline_cancelled and not all(
+                r.get("success") for r in results
+            )
+        trained_model_paths = []
+        if not (pipeline_cancelled or pipeline_failed):
+            for i in range(total_configs):
+                ckpt_dir = _get_checkpoint_dir(
+                    spec.config_paths[i], run_name_override=run_names[i]
+                )
+                if ckpt_dir:
+                    trained_model_paths.append(ckpt_dir)
+                    logging.info(f"[PIPELINE] Checkpoint dir: {ckpt_dir}")
+                else:
+                    logging.warning(
+                        f"[PIPELINE] Could not determine checkpoint dir for model {i+1}"
+                    )
+        return (
+            model_outcomes,
+            trained_model_paths,
+            pipeline_cancelled,
+            pipeline_failed,
+        )
+
     async def _run_post_training_inference(
         self,
         channel,
@@ -2679,6 +3456,7 @@ class RTCWorkerClient:
         pipeline_cancelled: bool,
         pipeline_failed: bool,
         builder: "CommandBuilder",
+        executor: Optional[JobExecutor] = None,
     ):
         """Run inference automatically after all pipeline models finish training.
 
@@ -2700,6 +3478,7 @@ class RTCWorkerClient:
             pipeline_failed: True if any model failed to train (incomplete
                 model set; inference should be skipped).
             builder: CommandBuilder instance for constructing the track command.
+            executor: Executor to run inference on; defaults to the worker's.
         """
         # --- Skip conditions ---
         if pipeline_cancelled:
@@ -2780,7 +3559,7 @@ class RTCWorkerClient:
             channel.send("INFERENCE_BEGIN::{}")
 
         # Run inference subprocess, forwarding progress to client.
-        await self.job_executor.run_inference(
+        await (executor or self.job_executor).run_inference(
             channel=channel,
             cmd=track_cmd,
             predictions_path=str(predictions_path),
@@ -2868,6 +3647,33 @@ class RTCWorkerClient:
             "channel(%s) %s" % (channel.label, "created by remote party & received.")
         )
 
+        # Filesystem requests still queued for a client are pointless once
+        # its channel has gone.
+        if not is_stripe_channel(channel):
+            tracer = MessageTracer.from_config("Worker", level=logging.INFO)
+
+            @channel.on("close")
+            def on_channel_close():
+                self.fs_service.cancel_client(self._channel_key(channel))
+                self.rpc_server.cancel_channel(self._channel_key(channel))
+                logging.info(f"channel({channel.label}) received: {tracer.summary()}")
+
+        # Stripe channels only carry bulk file frames (see striping.py); they
+        # are used by upload/download sessions started on the control channel.
+        if is_stripe_channel(channel):
+            self.file_manager.add_stripe_channel(channel)
+
+            @channel.on("message")
+            def on_stripe_frame(message):
+                if isinstance(message, bytes):
+                    self.file_manager.receive_stripe_frame(message, channel)
+
+            @channel.on("close")
+            def on_stripe_close():
+                self.file_manager.remove_stripe_channel(channel)
+
+            return
+
         async def send_worker_file(file_path: str):
             """Handles direct, one-way file transfer from client to be sent to client peer.
 
@@ -2894,13 +3700,20 @@ class RTCWorkerClient:
             """
             asyncio.create_task(self.keep_ice_alive(channel))
             logging.info(f"{channel.label} channel is open")
+            channel_key = self._channel_key(channel)
 
             # Skip PSK challenge for dashboard clients (role: "client").
             # The signaling server validates JWT and room membership on their behalf.
-            if self._pending_offer_role == "client":
-                self._authenticated_channels.add(channel.label)
+            peer_id = self._channel_peers.get(channel)
+            role = (
+                self._client_roles.get(peer_id)
+                if peer_id is not None
+                else self._pending_offer_role
+            )
+            if role == "client":
+                self._authenticated_channels.add(channel_key)
                 logging.warning(
-                    f"PSK challenge skipped for {channel.label} (peer role: client) — "
+                    f"PSK challenge skipped for {channel_key} (peer role: client) — "
                     "trusting signaling server JWT admission. "
                     "Revisit when per-peer authorization is hardened."
                 )
@@ -2908,27 +3721,25 @@ class RTCWorkerClient:
 
             # Send AUTH_CHALLENGE — worker verifies response with PSK or Ed25519
             nonce = generate_nonce()
-            self._pending_auth[channel.label] = nonce
+            self._pending_auth[channel_key] = nonce
             challenge_msg = format_message(MSG_AUTH_CHALLENGE, nonce)
             channel.send(challenge_msg)
-            logging.info(f"Sent AUTH_CHALLENGE to {channel.label}")
+            logging.info(f"Sent AUTH_CHALLENGE to {channel_key}")
 
             # Start timeout task (10 seconds)
             async def auth_timeout():
                 await asyncio.sleep(10.0)
-                if channel.label in self._pending_auth:
-                    logging.warning(f"Auth timeout for {channel.label}")
-                    del self._pending_auth[channel.label]
-                    if channel.label in self._auth_timeout_tasks:
-                        del self._auth_timeout_tasks[channel.label]
+                if channel_key in self._pending_auth:
+                    logging.warning(f"Auth timeout for {channel_key}")
+                    del self._pending_auth[channel_key]
+                    if channel_key in self._auth_timeout_tasks:
+                        del self._auth_timeout_tasks[channel_key]
                     # Send failure and close
                     if channel.readyState == "open":
                         channel.send(format_message(MSG_AUTH_FAILURE, "timeout"))
                         # Note: aiortc doesn't have channel.close(), connection will be reset
 
-            self._auth_timeout_tasks[channel.label] = asyncio.create_task(
-                auth_timeout()
-            )
+            self._auth_timeout_tasks[channel_key] = asyncio.create_task(auth_timeout())
 
         # Register handler for future open events
         @channel.on("open")
@@ -2950,9 +3761,7 @@ class RTCWorkerClient:
             Returns:
                 None
             """
-            # Log Client's message (truncate for readability)
-            log_msg = message if len(str(message)) < 100 else f"{str(message)[:100]}..."
-            logging.info(f"Worker received: {log_msg}")
+            tracer.trace(message)
 
             if isinstance(message, str):
                 if message == b"KEEP_ALIVE":
@@ -2967,34 +3776,23 @@ class RTCWorkerClient:
                 # Block commands if PSK authentication is required but not completed
                 if (
                     self._room_secret
-                    and channel.label not in self._authenticated_channels
+                    and self._channel_key(channel) not in self._authenticated_channels
                 ):
                     logging.warning(
-                        f"Rejected command from unauthenticated channel {channel.label}: {log_msg}"
+                        f"Rejected {message_type(message)} from unauthenticated "
+                        f"channel {channel.label}"
                     )
                     # Don't send error to avoid leaking info - just ignore
                     return
 
-                # Handle filesystem browser messages (FS_*)
-                if self._is_fs_message(message):
-                    logging.info(f"Handling filesystem message: {message[:50]}...")
-                    response = self.handle_fs_message(message)
-                    if channel.readyState == "open":
-                        channel.send(response)
+                # Requests with correlation IDs, each answered in its own task
+                if self.rpc_server.handle(channel, message):
                     return
 
-                # Handle worker path message (USE_WORKER_PATH)
-                if message.startswith(MSG_USE_WORKER_PATH):
-                    logging.info(f"Handling worker path message: {message}")
-                    response = self.handle_worker_path_message(message)
-                    if channel.readyState == "open":
-                        channel.send(response)
-
-                        # If path was accepted and it's an SLP file, check video accessibility
-                        if response.startswith(MSG_WORKER_PATH_OK):
-                            video_check = self._check_slp_videos_if_needed()
-                            if video_check is not None:
-                                channel.send(video_check)
+                # Filesystem browser and worker path requests
+                if await self.handle_fs_request(
+                    channel, message, self._channel_key(channel)
+                ):
                     return
 
                 # Handle structured job submission (JOB_SUBMIT)
@@ -3008,7 +3806,8 @@ class RTCWorkerClient:
                 if message.startswith(f"{MSG_CONTROL_COMMAND}{MSG_SEPARATOR}"):
                     # split(1) intentional: raw ZMQ payload may contain "::"
                     raw_zmq = message.split(MSG_SEPARATOR, 1)[1]
-                    reporter = self.job_executor._progress_reporter
+                    executor = self.job_scheduler.executor_for(channel=channel)
+                    reporter = executor._progress_reporter
                     reporter_state = (
                         f"active (control={reporter.control_address!r}, "
                         f"socket={'bound' if reporter.ctrl_socket is not None else 'NOT bound'})"
@@ -3019,18 +3818,22 @@ class RTCWorkerClient:
                         f"Received CONTROL_COMMAND — reporter={reporter_state} "
                         f"— payload={raw_zmq!r}"
                     )
-                    self.job_executor.send_control_message(raw_zmq)
+                    executor.send_control_message(raw_zmq)
                     return
 
                 # Handle job stop/cancel commands
                 # MSG_JOB_STOP kept as fallback (SIGINT) for older clients
                 if message == MSG_JOB_STOP:
                     logging.info("Received JOB_STOP — sending SIGINT to process")
-                    self.job_executor.stop_running_job()
+                    self.job_scheduler.executor_for(channel=channel).stop_running_job()
                     return
                 if message == MSG_JOB_CANCEL:
+                    scheduler = self.job_scheduler
+                    running = scheduler.slot_for(channel=channel) is not None
+                    if not running and scheduler.cancel_queued(channel=channel):
+                        return
                     logging.info("Received JOB_CANCEL — sending SIGTERM to process")
-                    self.job_executor.cancel_running_job()
+                    scheduler.executor_for(channel=channel).cancel_running_job()
                     return
 
                 # Detect package type (track or train)
@@ -3047,7 +3850,15 @@ class RTCWorkerClient:
                 if message.startswith(MSG_FILE_UPLOAD_CHECK + MSG_SEPARATOR):
                     parts = message.split(MSG_SEPARATOR)
                     sha256, filename = parts[1], parts[2]
-                    cached = self.file_manager.check_upload_cache(sha256, filename)
+                    # The upload store index is read under a file lock
+                    cached = await asyncio.get_running_loop().run_in_executor(
+                        None, self.file_manager.check_upload_cache, sha256, filename
+                    )
+                    if not cached and len(parts) >= 5:
+                        # FILE_UPLOAD_CHECK::{sha256}::{filename}::{dest_dir}::{create_subdir}
+                        cached = await self.file_manager.place_cached_upload(
+                            sha256, filename, parts[3], parts[4]
+                        )
                     if cached:
                         channel.send(
                             f"{MSG_FILE_UPLOAD_CACHE_HIT}{MSG_SEPARATOR}{cached}"
@@ -3059,13 +3870,99 @@ class RTCWorkerClient:
 
                 if message.startswith(MSG_FILE_UPLOAD_START + MSG_SEPARATOR):
                     parts = message.split(MSG_SEPARATOR)
-                    # FILE_UPLOAD_START::{filename}::{total_bytes}::{dest_dir}::{create_subdir}
+                    # FILE_UPLOAD_START::{filename}::{total_bytes}::{dest_dir}::{create_subdir}[::{codecs}]
                     _, filename, total_bytes_str, dest_dir, create_subdir = parts[:5]
                     await self.file_manager.start_upload_session(
+                        channel,
+                        filename,
+                        int(total_bytes_str),
+                        dest_dir,
+                        create_subdir,
+                        codecs=parts[5] if len(parts) > 5 else "",
+                    )
+                    return
+
+                if message.startswith(MSG_FILE_UPLOAD_RESUME + MSG_SEPARATOR):
+                    parts = message.split(MSG_SEPARATOR)
+                    # FILE_UPLOAD_RESUME::{sha256}::{filename}::{total_bytes}::{dest_dir}::{create_subdir}[::{codecs}]
+                    _, sha256, filename, total_bytes_str, dest_dir, create_subdir = (
+                        parts[:6]
+                    )
+                    await self.file_manager.start_resumable_upload_session(
+                        channel,
+                        sha256,
+                        filename,
+                        int(total_bytes_str),
+                        dest_dir,
+                        create_subdir,
+                        codecs=parts[6] if len(parts) > 6 else "",
+                    )
+                    return
+
+                if message.startswith(MSG_FILE_UPLOAD_DELTA_REQUEST + MSG_SEPARATOR):
+                    filename = message.split(MSG_SEPARATOR)[1]
+                    await self.file_manager.send_upload_signature(channel, filename)
+                    return
+
+                if message.startswith(MSG_FILE_UPLOAD_DELTA_START + MSG_SEPARATOR):
+                    parts = message.split(MSG_SEPARATOR)
+                    # FILE_UPLOAD_DELTA_START::{sha256}::{filename}::{total_bytes}::{dest_dir}::{create_subdir}::{basis_sha256}[::{codecs}]
+                    (
+                        _,
+                        sha256,
+                        filename,
+                        total_bytes_str,
+                        dest_dir,
+                        create_subdir,
+                        basis_sha256,
+                    ) = parts[:7]
+                    await self.file_manager.start_delta_upload_session(
+                        channel,
+                        sha256,
+                        filename,
+                        int(total_bytes_str),
+                        dest_dir,
+                        create_subdir,
+                        basis_sha256,
+                        codecs=parts[7] if len(parts) > 7 else "",
+                    )
+                    return
+
+                if message.startswith(MSG_FILE_UPLOAD_STRIPED + MSG_SEPARATOR):
+                    parts = message.split(MSG_SEPARATOR)
+                    # FILE_UPLOAD_STRIPED::{filename}::{total_bytes}::{dest_dir}::{create_subdir}
+                    _, filename, total_bytes_str, dest_dir, create_subdir = parts[:5]
+                    await self.file_manager.start_striped_upload_session(
                         channel, filename, int(total_bytes_str), dest_dir, create_subdir
                     )
                     return
 
+                if message.startswith(MSG_FILE_UPLOAD_COPY + MSG_SEPARATOR):
+                    _, first_block, block_count = message.split(MSG_SEPARATOR)[:3]
+                    self.file_manager.receive_upload_copy(
+                        int(first_block), int(block_count), channel
+                    )
+                    return
+
+                if message.startswith(MSG_TRANSFER_CODECS + MSG_SEPARATOR):
+                    offer = message.split(MSG_SEPARATOR, 1)[1]
+                    codec = choose_codec(offer)
+                    self.file_manager.set_download_codec(channel, codec)
+                    logging.info(
+                        f"Client accepts {offer or 'no'} compression; sending files "
+                        f"with {codec or 'no compression'}"
+                    )
+                    return
+
+                if message.startswith(MSG_OUTPUT_BATCHING + MSG_SEPARATOR):
+                    enabled = message.split(MSG_SEPARATOR, 1)[1] == "1"
+                    output_batcher(channel).framed = enabled
+                    logging.info(
+                        f"Client {'accepts' if enabled else 'declines'} batched "
+                        "job output"
+                    )
+                    return
+
                 if message == MSG_FILE_UPLOAD_END:
                     await self.file_manager.finish_upload_session(channel)
                     return
@@ -3162,7 +4059,7 @@ class RTCWorkerClient:
                                 # Finish training.
                                 logging.info("Training completed successfully.")
                                 if progress_listener_task:
-                                    progress_listener_task.cancel()
+                                    self.progress_reporter.stop_progress_listener()
 
                                 # Zip the results.
                                 logging.info("Zipping results...")
@@ -3227,7 +4124,9 @@ class RTCWorkerClient:
                     # Route through job_executor.send_control_message() so
                     # _stop_requested / _cancel_requested flags are set correctly.
                     # This ensures "Cancel Training" skips post-training inference.
-                    self.job_executor.send_control_message(zmq_msg)
+                    self.job_scheduler.executor_for(
+                        channel=channel
+                    ).send_control_message(zmq_msg)
                 else:
                     logging.info(f"Client sent: {message}")
                     # await self.send_worker_messages(self.pc, channel)
@@ -3239,8 +4138,8 @@ class RTCWorkerClient:
 
                 # Route binary data to the upload session when one is active;
                 # otherwise fall through to the legacy FILE_META accumulator.
-                if self.file_manager._upload_session is not None:
-                    self.file_manager.receive_upload_chunk(message)
+                if self.file_manager.has_upload_session(channel):
+                    self.file_manager.receive_upload_chunk(message, channel)
                     return
 
                 file_name = list(self.received_files.keys())[0]
@@ -3295,6 +4194,7 @@ class RTCWorkerClient:
             if self.job_coordinator:
                 self.job_coordinator.clear_current_job()
             self.received_files.clear()
+            self.file_manager.forget_client()
 
             # Re-register with signaling server (not just update metadata)
             # This ensures the worker appears in discovery queries again
@@ -3327,6 +4227,7 @@ class RTCWorkerClient:
             if self.job_coordinator:
                 self.job_coordinator.clear_current_job()
             self.received_files.clear()
+            self.file_manager.forget_client()
 
             # Re-register with signaling server (not just update metadata)
             self.status = "available"
@@ -3349,6 +4250,7 @@ class RTCWorkerClient:
             if self.job_coordinator:
                 self.job_coordinator.clear_current_job()
             self.received_files.clear()
+            self.file_manager.forget_client()
 
             # Re-register with signaling server (not just update metadata)
             self.status = "available"
@@ -2482,3 +2482,217 @@ class TestRunInferenceDelegatesToBatch:
         annotation = str(sig.return_annotation)
         assert "list" not in annotation.lower()
         assert "List" not in annotation
+
+
+class TestStreamedFileReceiverStriped:
+    """FILE_META_STRIPED transfers whose data arrives on stripe channels."""
+
+    def test_frames_reassembled_out_of_order(self):
+        from sleap_rtc.api import _StreamedFileReceiver
+        from sleap_rtc.striping import pack_frame
+
+        receiver = _StreamedFileReceiver()
+        assert receiver.handle_string("FILE_META_STRIPED::predictions.slp:6:/w")
+        receiver.handle_stripe_frame(pack_frame(3, b"def"))
+        receiver.handle_stripe_frame(pack_frame(0, b"abc"))
+        receiver.handle_string("END_OF_FILE")
+
+        local_path = receiver.take_predictions_path()
+        with open(local_path, "rb") as f:
+            assert f.read() == b"abcdef"
+        os.unlink(local_path)
+
+    @pytest.mark.asyncio
+    async def test_end_of_file_before_last_frame(self):
+        import asyncio
+
+        from sleap_rtc.api import _StreamedFileReceiver
+        from sleap_rtc.striping import pack_frame
+
+        receiver = _StreamedFileReceiver()
+        receiver.handle_string("FILE_META_STRIPED::predictions.slp:6:/w")
+        receiver.handle_stripe_frame(pack_frame(0, b"abc"))
+        receiver.handle_string("END_OF_FILE")
+        assert receiver.take_predictions_path() is None
+
+        waiter = asyncio.create_task(receiver.wait_for_stripes())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        receiver.handle_stripe_frame(pack_frame(3, b"def"))
+        await waiter
+
+        local_path = receiver.take_predictions_path()
+        with open(local_path, "rb") as f:
+            assert f.read() == b"abcdef"
+        os.unlink(local_path)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_stripes_is_noop_without_transfer(self):
+        from sleap_rtc.api import _StreamedFileReceiver
+
+        await _StreamedFileReceiver().wait_for_stripes()
+
+    def test_bad_frame_latches_error(self):
+        from sleap_rtc.api import _StreamedFileReceiver
+        from sleap_rtc.striping import pack_frame
+
+        receiver = _StreamedFileReceiver()
+        receiver.handle_string("FILE_META_STRIPED::predictions.slp:2:/w")
+        receiver.handle_stripe_frame(pack_frame(0, b"abc"))
+
+        assert receiver._pending is None
+        assert "write failed" in receiver.take_transfer_error()
+
+
+class TestStreamedFileReceiverCompressed:
+    def test_compressed_chunks_are_decoded(self):
+        from sleap_rtc.api import _StreamedFileReceiver
+        from sleap_rtc.compression import ChunkEncoder
+
+        data = b"instance,score\n" * 5000
+        encoder = ChunkEncoder("zlib")
+        receiver = _StreamedFileReceiver()
+
+        assert receiver.handle_string(
+            f"FILE_META_COMPRESSED::labels.predictions.slp:{len(data)}:out:zlib"
+        )
+        receiver.handle_bytes(encoder.encode(data[:40000]))
+        receiver.handle_bytes(encoder.encode(data[40000:]))
+        assert receiver.handle_string("END_OF_FILE")
+
+        path = receiver.take_predictions_path()
+        try:
+            with open(path, "rb") as fh:
+                assert fh.read() == data
+        finally:
+            os.unlink(path)
+
+    def test_corrupt_chunk_fails_transfer(self):
+        from sleap_rtc.api import _StreamedFileReceiver
+
+        receiver = _StreamedFileReceiver()
+        receiver.handle_string("FILE_META_COMPRESSED::x.predictions.slp:10:out:zlib")
+        receiver.handle_bytes(b"\x01garbage")
+        receiver.handle_string("END_OF_FILE")
+
+        assert receiver.take_predictions_path() is None
+        assert "write failed" in receiver.take_transfer_error()
+
+
+# =============================================================================
+# Distributed run_inference_batch dispatch
+# =============================================================================
+
+
+class TestDispatchInferenceSpecs:
+    """Verify the shared work queue behind distributed run_inference_batch."""
+
+    @staticmethod
+    def _connections(*worker_ids):
+        from sleap_rtc.api import _InferenceConnection
+
+        return [
+            _InferenceConnection(w, MagicMock(), MagicMock(), None, None)
+            for w in worker_ids
+        ]
+
+    @staticmethod
+    async def _dispatch(specs, connections, fail=lambda worker, index: False, **kw):
+        """Run the dispatcher with a fake per-spec runner; return (results, runs)."""
+        import asyncio as _asyncio
+
+        from sleap_rtc import api as api_mod
+
+        runs = []
+        worker_of = {id(c.data_channel): c.worker_id for c in connections}
+
+        async def fake_run(spec, job_id, data_channel, **_kwargs):
+            worker = worker_of[id(data_channel)]
+            index = int(job_id.split("-")[1])
+            runs.append((worker, index))
+            # Larger specs take longer so workers interleave.
+            await _asyncio.sleep(0.001 * len(spec.model_paths))
+            return api_mod.InferenceResult(
+                job_id=job_id, success=not fail(worker, index)
+            )
+
+        with patch.object(api_mod, "_run_single_spec_async", fake_run):
+            results = await api_mod._dispatch_inference_specs(
+                specs, connections, "b", timeout=10.0, **kw
+            )
+        return results, runs
+
+    @staticmethod
+    def _specs(n):
+        from sleap_rtc.jobs.spec import TrackJobSpec
+
+        return [
+            TrackJobSpec(data_path=f"/v{i}.slp", model_paths=["/m"] * (i + 1))
+            for i in range(n)
+        ]
+
+    async def test_specs_spread_across_workers(self):
+        completed = []
+
+        results, runs = await self._dispatch(
+            self._specs(6),
+            self._connections("w1", "w2"),
+            on_spec_complete=completed.append,
+        )
+
+        assert [r.spec_index for r in results] == list(range(6))
+        assert all(r.success for r in results)
+        assert {worker for worker, _ in runs} == {"w1", "w2"}
+        assert sorted(r.spec_index for r in completed) == list(range(6))
+
+    async def test_failed_spec_retried_on_other_worker(self):
+        results, runs = await self._dispatch(
+            self._specs(3),
+            self._connections("w1", "w2"),
+            fail=lambda worker, index: worker == "w1" and index == 0,
+            on_failure="retry",
+        )
+
+        assert [r.success for r in results] == [True, True, True]
+        assert results[0].worker_id == "w2"
+        assert ("w1", 0) in runs
+
+    async def test_stop_policy_dispatches_no_more_specs(self):
+        results, runs = await self._dispatch(
+            self._specs(4),
+            self._connections("w1"),
+            fail=lambda worker, index: index == 1,
+        )
+
+        assert [r.success for r in results] == [True, False]
+        assert runs == [("w1", 0), ("w1", 1)]
+
+    async def test_continue_policy_runs_everything(self):
+        results, _ = await self._dispatch(
+            self._specs(3),
+            self._connections("w1"),
+            fail=lambda worker, index: index == 0,
+            on_failure="continue",
+        )
+
+        assert [r.success for r in results] == [False, True, True]
+
+    async def test_largest_first_order(self):
+        from sleap_rtc.jobs.spec import TrackJobSpec
+        from sleap_rtc.api import _order_batch_specs
+
+        specs = [
+            TrackJobSpec(data_path="/a.slp", frames="0-9"),
+            TrackJobSpec(data_path="/b.slp"),
+            TrackJobSpec(data_path="/c.slp", frames="0-99,200-299"),
+        ]
+
+        assert _order_batch_specs(specs, "submitted") == [0, 1, 2]
+        assert _order_batch_specs(specs, "largest_first") == [1, 2, 0]
+        assert _order_batch_specs(specs, lambda s: -len(s.data_path)) == [0, 1, 2]
+
+    def test_unknown_policy_rejected(self):
+        from sleap_rtc.api import run_inference_batch
+
+        with pytest.raises(ValueError):
+            run_inference_batch([], "room", on_failure="sometimes")
@@ -0,0 +1,75 @@
+"""Tests for negotiated per-chunk transfer compression."""
+
+import os
+import zlib
+
+import pytest
+
+from sleap_rtc import compression
+from sleap_rtc.compression import (
+    CODEC_ZLIB,
+    ChunkEncoder,
+    choose_codec,
+    codec_offer,
+    decode_chunk,
+)
+
+
+class TestNegotiation:
+    def test_offer_lists_zlib(self):
+        assert CODEC_ZLIB in codec_offer().split(",")
+
+    def test_choose_from_offer(self):
+        assert choose_codec("brotli,zlib") == CODEC_ZLIB
+
+    def test_no_common_codec(self):
+        assert choose_codec("") is None
+        assert choose_codec("brotli") is None
+
+
+class TestChunkEncoder:
+    def test_round_trip(self):
+        encoder = ChunkEncoder(CODEC_ZLIB)
+        chunk = b"epoch=1 loss=0.123\n" * 2000
+
+        wire = encoder.encode(chunk)
+
+        assert len(wire) < len(chunk) / 10
+        assert decode_chunk(CODEC_ZLIB, wire) == chunk
+
+    def test_incompressible_sample_bypasses(self):
+        encoder = ChunkEncoder(CODEC_ZLIB, sample_chunks=2)
+        chunks = [os.urandom(4096) for _ in range(4)]
+
+        wire = [encoder.encode(c) for c in chunks]
+
+        assert encoder.bypassed
+        assert wire[3] == b"\x00" + chunks[3]
+        assert [decode_chunk(CODEC_ZLIB, w) for w in wire] == chunks
+
+    def test_compressible_sample_keeps_compressing(self):
+        encoder = ChunkEncoder(CODEC_ZLIB, sample_chunks=2)
+        for _ in range(4):
+            encoder.encode(b"\0" * 4096)
+
+        assert not encoder.bypassed
+        assert encoder.bytes_out < encoder.bytes_in / 10
+
+    def test_unsupported_codec(self):
+        with pytest.raises(ValueError):
+            ChunkEncoder("brotli")
+
+
+class TestDecodeChunk:
+    def test_unknown_flag(self):
+        with pytest.raises(ValueError):
+            decode_chunk(CODEC_ZLIB, b"\x07data")
+
+    def test_corrupt_payload(self):
+        with pytest.raises(ValueError):
+            decode_chunk(CODEC_ZLIB, b"\x01not zlib")
+
+    def test_oversized_output_rejected(self, monkeypatch):
+        monkeypatch.setattr(compression, "MAX_DECODED_CHUNK", 1024)
+        with pytest.raises(ValueError):
+            decode_chunk(CODEC_ZLIB, b"\x01" + zlib.compress(b"\0" * 4096))
@@ -76,6 +76,27 @@ class TestWorkerIOConfig:
         config = WorkerIOConfig.from_dict(data)
         assert config.working_dir == "/mnt/work"
 
+    def test_from_dict_upload_cache(self):
+        """Test upload cache settings and their defaults."""
+        assert WorkerIOConfig.from_dict({}).upload_cache_max_gb == 50.0
+        data = {"upload_cache_dir": "/scratch/cache", "upload_cache_max_gb": 0}
+        config = WorkerIOConfig.from_dict(data)
+        assert config.upload_cache_dir == "/scratch/cache"
+        assert config.upload_cache_max_gb == 0
+
+    def test_from_dict_filename_index(self):
+        """Test filename index settings and their defaults."""
+        default = WorkerIOConfig.from_dict({})
+        assert default.filename_index_dir is None
+        assert default.filename_index_refresh_minutes == 30.0
+        data = {
+            "filename_index_dir": "/scratch/idx",
+            "filename_index_refresh_minutes": 0,
+        }
+        config = WorkerIOConfig.from_dict(data)
+        assert config.filename_index_dir == "/scratch/idx"
+        assert config.filename_index_refresh_minutes == 0
+
     def test_from_dict_skips_invalid_mounts(self):
         """Test that invalid mount entries are skipped."""
         data = {
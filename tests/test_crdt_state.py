@@ -0,0 +1,106 @@
+"""Tests for the room state CRDT."""
+
+import json
+
+import pytest
+from pycrdt import Map
+
+from sleap_rtc.worker.crdt_state import RoomStateCRDT
+
+
+@pytest.fixture
+def room():
+    crdt = RoomStateCRDT.create("room", "w0")
+    crdt.add_worker("w0", {"tags": ["gpu"], "properties": {"gpu_memory_mb": 8000}})
+    crdt.add_worker("w1", {"tags": [], "properties": {"status": "available"}})
+    return crdt
+
+
+def properties(crdt, peer_id):
+    return crdt.get_worker(peer_id)["metadata"]["properties"]
+
+
+class TestRoomStateCRDT:
+    def test_workers_stored_as_nested_maps(self, room):
+        stored = room.doc.get("state", type=Map)["workers"]["w0"]
+
+        assert isinstance(stored, Map)
+        assert isinstance(stored["metadata"]["properties"], Map)
+
+    def test_numbers_round_trip_as_ints(self, room):
+        props = properties(room, "w0")
+
+        assert props["gpu_memory_mb"] == 8000
+        assert isinstance(props["gpu_memory_mb"], int)
+        assert isinstance(props["last_heartbeat"], int)
+        assert isinstance(room.get_version(), int)
+
+    def test_reads_are_cached_until_worker_changes(self, room):
+        w0, w1 = room.get_worker("w0"), room.get_worker("w1")
+        assert room.get_worker("w0") is w0
+
+        room.update_worker_status("w1", "busy", "job-1")
+
+        assert room.get_worker("w0") is w0
+        assert room.get_worker("w1") is not w1
+        assert properties(room, "w1")["status"] == "busy"
+        assert w1["metadata"]["properties"]["status"] == "available"
+
+    def test_cache_follows_applied_updates(self, room):
+        replica = RoomStateCRDT.deserialize(room.serialize())
+        assert properties(replica, "w1")["status"] == "available"
+
+        room.update_worker_status("w1", "busy")
+        room.remove_worker("w0")
+        replica.apply_update(room.get_update_since(replica.get_state_vector()))
+
+        assert properties(replica, "w1")["status"] == "busy"
+        assert set(replica.get_all_workers()) == {"w1"}
+
+    def test_concurrent_field_updates_merge(self, room):
+        a = RoomStateCRDT.deserialize(room.serialize())
+        b = RoomStateCRDT.deserialize(room.serialize())
+
+        a.update_worker_status("w1", "busy", "job-1")
+        b.set_admin("w1")
+        a.apply_update(b.get_update_since(a.get_state_vector()))
+
+        props = properties(a, "w1")
+        assert props["status"] == "busy"
+        assert props["is_admin"] is True
+
+    def test_legacy_json_records_read_and_upgraded(self, room):
+        legacy = {
+            "peer_id": "old",
+            "role": "worker",
+            "metadata": {"tags": [], "properties": {"status": "available"}},
+        }
+        room.doc.get("state", type=Map)["workers"]["old"] = json.dumps(legacy)
+
+        assert room.get_worker("old") == legacy
+        assert "old" in room.get_available_workers()
+
+        room.update_worker_heartbeat("old")
+
+        stored = room.doc.get("state", type=Map)["workers"]["old"]
+        assert isinstance(stored, Map)
+        assert properties(room, "old")["status"] == "available"
+        assert "last_heartbeat" in properties(room, "old")
+
+    def test_get_state(self, room):
+        state = room.get_state()
+
+        assert state["room_id"] == "room"
+        assert state["admin_peer_id"] == "w0"
+        assert set(state["workers"]) == {"w0", "w1"}
+        assert state["version"] == 2
+
+    def test_status_update_sets_extra_properties(self, room):
+        room.update_worker_status(
+            "w0", "available", properties={"queue_depth": 3, "free_gpus": ["1"]}
+        )
+
+        props = properties(room, "w0")
+        assert props["queue_depth"] == 3
+        assert props["free_gpus"] == ["1"]
+        assert props["gpu_memory_mb"] == 8000
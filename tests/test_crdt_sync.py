@@ -0,0 +1,151 @@
+"""Tests for delta-encoded CRDT state broadcasts between admin and workers."""
+
+import json
+
+import pytest
+from pycrdt import Doc
+
+from sleap_rtc.worker.admin_controller import AdminController
+from sleap_rtc.worker.crdt_state import RoomStateCRDT
+from sleap_rtc.worker.mesh_messages import (
+    CRDT_FRAME_ACK,
+    CRDT_FRAME_UPDATE,
+    decode_crdt_frame,
+    deserialize_message,
+    encode_crdt_frame,
+)
+from sleap_rtc.worker.worker_class import RTCWorkerClient
+
+
+class FakeChannel:
+    readyState = "open"
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+def make_worker(tmp_path, peer_id, crdt, admin_peer_id):
+    worker = RTCWorkerClient(working_dir=str(tmp_path))
+    worker.peer_id = peer_id
+    worker.room_state_crdt = crdt
+    worker.admin_peer_id = admin_peer_id
+    worker.admin_controller = AdminController(worker, crdt)
+    worker.admin_controller.is_admin = peer_id == admin_peer_id
+    worker.admin_controller.admin_peer_id = admin_peer_id
+    return worker
+
+
+@pytest.fixture
+def mesh(tmp_path):
+    admin_crdt = RoomStateCRDT.create("room", "admin")
+    admin_crdt.add_worker("admin", {"properties": {"gpu_memory_mb": 2}}, True)
+    for i in range(10):
+        admin_crdt.add_worker(f"w{i}", {"properties": {"gpu_memory_mb": 1}})
+    admin = make_worker(tmp_path, "admin", admin_crdt, "admin")
+    member = make_worker(tmp_path, "w0", RoomStateCRDT("room", Doc()), "admin")
+
+    to_member, to_admin = FakeChannel(), FakeChannel()
+    admin.data_channels["w0"] = to_member
+    admin.worker_connections["w0"] = object()
+    member.data_channels["admin"] = to_admin
+    # Election is not under test; keep the roles fixed.
+    member.admin_controller.on_state_update = _noop
+    return admin, member, to_member, to_admin
+
+
+async def _noop():
+    pass
+
+
+async def deliver(channel, receiver, from_peer_id):
+    """Hand everything sent on a channel to the receiving worker."""
+    messages, channel.sent = channel.sent, []
+    for message in messages:
+        if isinstance(message, bytes):
+            await receiver._handle_crdt_frame(message, from_peer_id)
+        else:
+            await receiver._handle_state_broadcast(
+                deserialize_message(message), from_peer_id
+            )
+    return messages
+
+
+class TestDeltaBroadcast:
+    async def test_first_sync_is_full_snapshot_then_deltas(self, mesh):
+        admin, member, to_member, to_admin = mesh
+
+        await admin.admin_controller.broadcast_state_update()
+        (snapshot,) = await deliver(to_member, member, "admin")
+        assert json.loads(snapshot)["crdt_snapshot"]["_delta"] is True
+        assert len(member.room_state_crdt.get_all_workers()) == 11
+
+        (ack,) = await deliver(to_admin, admin, "w0")
+        assert decode_crdt_frame(ack)[0] == CRDT_FRAME_ACK
+
+        admin.room_state_crdt.update_worker_status("w3", "busy")
+        await admin.admin_controller.broadcast_state_update()
+        (delta,) = await deliver(to_member, member, "admin")
+
+        assert decode_crdt_frame(delta)[0] == CRDT_FRAME_UPDATE
+        assert len(delta) < len(admin.room_state_crdt.serialize()) / 4
+        status = member.room_state_crdt.get_worker("w3")["metadata"]["properties"]
+        assert status["status"] == "busy"
+        assert member.room_state_crdt.get_version() == (
+            admin.room_state_crdt.get_version()
+        )
+
+    async def test_resync_request_sends_full_snapshot(self, mesh):
+        admin, member, to_member, to_admin = mesh
+        await admin.admin_controller.broadcast_state_update()
+        await deliver(to_member, member, "admin")
+        await deliver(to_admin, admin, "w0")
+
+        await admin._handle_crdt_frame(encode_crdt_frame(CRDT_FRAME_ACK, b""), "w0")
+
+        (message,) = to_member.sent
+        assert isinstance(message, str)
+        assert "_crdt_b64" in message
+
+    async def test_undecodable_state_vector_falls_back_to_snapshot(self, mesh):
+        admin, _, to_member, _ = mesh
+        await admin.admin_controller.on_state_ack("w0", b"\xffgarbage")
+
+        await admin.admin_controller.broadcast_state_update()
+
+        (message,) = to_member.sent
+        assert isinstance(message, str)
+        assert "w0" not in admin.admin_controller._peer_state_vectors
+
+    async def test_update_from_non_admin_ignored(self, mesh):
+        _, member, _, to_admin = mesh
+        other = RoomStateCRDT.create("room")
+        other.add_worker("rogue", {})
+
+        await member._handle_crdt_frame(
+            encode_crdt_frame(CRDT_FRAME_UPDATE, other.serialize()), "w5"
+        )
+
+        assert member.room_state_crdt.get_worker("rogue") is None
+        assert to_admin.sent == []
+
+    async def test_departure_forgets_state_vector(self, mesh):
+        admin, _, _, _ = mesh
+        await admin.admin_controller.on_state_ack("w0", b"\x00")
+
+        await admin.admin_controller.handle_worker_departure("w0")
+
+        assert admin.admin_controller._peer_state_vectors == {}
+
+
+class TestCrdtFrames:
+    def test_round_trip(self):
+        frame = encode_crdt_frame(CRDT_FRAME_UPDATE, b"\x01\x02")
+
+        assert decode_crdt_frame(frame) == (CRDT_FRAME_UPDATE, b"\x01\x02")
+
+    def test_other_binary_is_not_a_frame(self):
+        assert decode_crdt_frame(b"KEEP_ALIVE") is None
+        assert decode_crdt_frame(b"CRDT") is None
@@ -0,0 +1,116 @@
+"""Tests for rsync-style delta encoding used by delta uploads."""
+
+import os
+import zlib
+
+import pytest
+
+from sleap_rtc.delta_sync import (
+    MIN_DELTA_BLOCK_SIZE,
+    MAX_DELTA_BLOCKS,
+    choose_block_size,
+    compute_delta,
+    compute_signature,
+    delta_literal_bytes,
+)
+
+BLOCK = 1024
+
+
+def apply_delta(basis: bytes, new: bytes, ops, block_size: int) -> bytes:
+    """Rebuild a file from ops the way the worker does."""
+    out = bytearray()
+    for op in ops:
+        if op[0] == "copy":
+            out += basis[op[1] * block_size : (op[1] + op[2]) * block_size]
+        else:
+            out += new[op[1] : op[1] + op[2]]
+    return bytes(out)
+
+
+def delta_for(tmp_path, basis: bytes, new: bytes, **kwargs):
+    basis_path = tmp_path / "basis.slp"
+    new_path = tmp_path / "new.slp"
+    basis_path.write_bytes(basis)
+    new_path.write_bytes(new)
+    signature = compute_signature(str(basis_path), BLOCK)
+    return compute_delta(str(new_path), BLOCK, signature, **kwargs)
+
+
+class TestChooseBlockSize:
+    def test_small_file_uses_minimum(self):
+        assert choose_block_size(10) == MIN_DELTA_BLOCK_SIZE
+
+    def test_large_file_bounded_block_count(self):
+        size = 8 * 1024**3
+        block_size = choose_block_size(size)
+        assert size / block_size <= MAX_DELTA_BLOCKS
+        assert block_size & (block_size - 1) == 0
+
+
+class TestComputeSignature:
+    def test_trailing_partial_block_excluded(self, tmp_path):
+        data = os.urandom(BLOCK * 3 + 10)
+        f = tmp_path / "f"
+        f.write_bytes(data)
+
+        sig = compute_signature(str(f), BLOCK)
+
+        assert len(sig) == 3
+        assert sig[1][0] == zlib.adler32(data[BLOCK : 2 * BLOCK])
+
+
+class TestComputeDelta:
+    def test_identical_file_is_all_copies(self, tmp_path):
+        basis = os.urandom(BLOCK * 8)
+
+        ops = delta_for(tmp_path, basis, basis)
+
+        assert ops == [("copy", 0, 8)]
+
+    def test_in_place_change(self, tmp_path):
+        basis = os.urandom(BLOCK * 8)
+        new = bytearray(basis)
+        new[BLOCK * 5 + 3] ^= 0xFF
+        new = bytes(new)
+
+        ops = delta_for(tmp_path, basis, new)
+
+        assert apply_delta(basis, new, ops, BLOCK) == new
+        assert delta_literal_bytes(ops) == BLOCK
+
+    def test_insertion_resynchronises(self, tmp_path):
+        basis = os.urandom(BLOCK * 16)
+        new = basis[: BLOCK * 4 + 100] + os.urandom(333) + basis[BLOCK * 4 + 100 :]
+
+        ops = delta_for(tmp_path, basis, new)
+
+        assert apply_delta(basis, new, ops, BLOCK) == new
+        # Only the block containing the insertion (plus the insert) is literal.
+        assert delta_literal_bytes(ops) <= BLOCK + 333
+
+    def test_unrelated_file_is_all_literal(self, tmp_path):
+        basis = os.urandom(BLOCK * 4)
+        new = os.urandom(BLOCK * 4 + 7)
+
+        ops = delta_for(tmp_path, basis, new)
+
+        assert apply_delta(basis, new, ops, BLOCK) == new
+        assert delta_literal_bytes(ops) == len(new)
+
+    def test_roll_budget_exhausted_still_correct(self, tmp_path):
+        basis = os.urandom(BLOCK * 16)
+        new = basis[:50] + basis[60:]
+
+        ops = delta_for(tmp_path, basis, new, roll_budget=0)
+
+        assert apply_delta(basis, new, ops, BLOCK) == new
+
+    @pytest.mark.parametrize("size", [0, 10])
+    def test_tiny_files(self, tmp_path, size):
+        basis = os.urandom(BLOCK * 2)
+        new = os.urandom(size)
+
+        ops = delta_for(tmp_path, basis, new)
+
+        assert apply_delta(basis, new, ops, BLOCK) == new
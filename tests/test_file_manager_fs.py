@@ -227,6 +227,53 @@ class TestDirectoryListing:
         for i in range(first_file_idx):
             assert entries[i]["type"] == "directory"
 
+    def test_list_directory_limit_and_next_offset(self, file_manager, temp_mount):
+        """Test page size and where the next page starts."""
+        result = file_manager.list_directory(str(temp_mount), offset=1, limit=2)
+
+        assert len(result["entries"]) == 2
+        assert result["offset"] == 1
+        assert result["next_offset"] == 3
+        assert result["has_more"] is True
+
+    def test_list_directory_cursor_keeps_snapshot(self, file_manager, temp_mount):
+        """Test that a cursor pages through the listing it came from."""
+        first = file_manager.list_directory(str(temp_mount), limit=1)
+        (temp_mount / "aaa_new.slp").write_text("new")
+        st = os.stat(temp_mount)
+        os.utime(temp_mount, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        same = file_manager.list_directory(
+            str(temp_mount), offset=1, cursor=first["cursor"]
+        )
+        fresh = file_manager.list_directory(str(temp_mount))
+
+        assert same["total_count"] == first["total_count"]
+        assert fresh["total_count"] == first["total_count"] + 1
+
+    def test_list_directory_reports_current_file_size(self, file_manager, temp_mount):
+        """Test that a reused snapshot still reports files' current sizes."""
+        path = temp_mount / "growing.log"
+        path.write_text("x")
+        dir_mtime = os.stat(temp_mount).st_mtime_ns
+
+        def size():
+            result = file_manager.list_directory(str(temp_mount))
+            (entry,) = [e for e in result["entries"] if e["name"] == "growing.log"]
+            return entry["size"]
+
+        assert size() == 1
+        with open(path, "a") as fh:
+            fh.write("x" * 1000)
+        assert os.stat(temp_mount).st_mtime_ns == dir_mtime
+        assert size() == 1001
+
+    def test_list_directory_reports_mtime(self, file_manager, temp_mount):
+        """Test that listings carry the directory mtime for client caches."""
+        result = file_manager.list_directory(str(temp_mount))
+
+        assert result["mtime_ns"] == os.stat(temp_mount).st_mtime_ns
+
     def test_list_directory_outside_mounts_denied(self, file_manager):
         """Test that paths outside mounts are denied."""
         result = file_manager.list_directory("/etc")
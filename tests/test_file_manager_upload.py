@@ -1,6 +1,8 @@
 """Tests for FileManager client-to-worker upload methods."""
 
 import hashlib
+import os
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -11,13 +13,15 @@ from sleap_rtc.protocol import (
     MSG_FILE_UPLOAD_CACHE_HIT,
     MSG_FILE_UPLOAD_COMPLETE,
     MSG_FILE_UPLOAD_ERROR,
+    MSG_FILE_UPLOAD_OFFSET,
     MSG_FILE_UPLOAD_PROGRESS,
     MSG_FILE_UPLOAD_READY,
+    MSG_FILE_UPLOAD_SIGNATURE,
     MSG_SEPARATOR,
 )
+from sleap_rtc.striping import pack_frame, unpack_frame
 from sleap_rtc.worker.file_manager import FileManager
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -84,10 +88,10 @@ class TestStartUploadSession:
         await fm.start_upload_session(ch, "labels.pkg.slp", 100, str(tmp_path), "0")
 
         ch.send.assert_called_once_with(MSG_FILE_UPLOAD_READY)
-        assert fm._upload_session is not None
-        assert fm._upload_session["filename"] == "labels.pkg.slp"
-        assert fm._upload_session["total_bytes"] == 100
-        assert fm._upload_session["file_path"] == tmp_path / "labels.pkg.slp"
+        assert None in fm._upload_sessions
+        assert fm._upload_sessions[None]["filename"] == "labels.pkg.slp"
+        assert fm._upload_sessions[None]["total_bytes"] == 100
+        assert fm._upload_sessions[None]["file_path"] == tmp_path / "labels.pkg.slp"
 
     @pytest.mark.asyncio
     async def test_success_creates_subdir(self, tmp_path):
@@ -98,7 +102,7 @@ class TestStartUploadSession:
 
         ch.send.assert_called_once_with(MSG_FILE_UPLOAD_READY)
         expected_path = tmp_path / "sleap_rtc_downloads" / "labels.pkg.slp"
-        assert fm._upload_session["file_path"] == expected_path
+        assert fm._upload_sessions[None]["file_path"] == expected_path
         assert expected_path.parent.is_dir()
 
     @pytest.mark.asyncio
@@ -112,7 +116,7 @@ class TestStartUploadSession:
         sent = ch.send.call_args[0][0]
         assert sent.startswith(MSG_FILE_UPLOAD_ERROR)
         assert "outside configured mounts" in sent
-        assert fm._upload_session is None
+        assert None not in fm._upload_sessions
 
 
 # ---------------------------------------------------------------------------
@@ -130,7 +134,7 @@ class TestReceiveUploadChunk:
 
         fm.receive_upload_chunk(b"hello")
 
-        assert fm._upload_session["bytes_received"] == 5
+        assert fm._upload_sessions[None]["bytes_received"] == 5
 
     @pytest.mark.asyncio
     async def test_progress_sent_after_500ms(self, tmp_path):
@@ -138,7 +142,7 @@ class TestReceiveUploadChunk:
         ch = fake_channel()
         await fm.start_upload_session(ch, "f.pkg.slp", 5, str(tmp_path), "0")
         # Force last_progress_time into the past so progress fires immediately.
-        fm._upload_session["last_progress_time"] = 0.0
+        fm._upload_sessions[None]["last_progress_time"] = 0.0
         ch.reset_mock()
 
         fm.receive_upload_chunk(b"hello")
@@ -155,7 +159,7 @@ class TestReceiveUploadChunk:
         ch.reset_mock()
 
         # Simulate an I/O error on write
-        fm._upload_session["file_handle"].write = MagicMock(
+        fm._upload_sessions[None]["file_handle"].write = MagicMock(
             side_effect=OSError("disk full")
         )
 
@@ -164,7 +168,7 @@ class TestReceiveUploadChunk:
         sent = ch.send.call_args[0][0]
         assert sent.startswith(MSG_FILE_UPLOAD_ERROR)
         assert "disk full" in sent
-        assert fm._upload_session is None
+        assert None not in fm._upload_sessions
 
 
 # ---------------------------------------------------------------------------
@@ -224,3 +228,647 @@ class TestFinishUploadSession:
         ch = fake_channel()
         await fm.finish_upload_session(ch)  # should not raise
         ch.send.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Resumable uploads
+# ---------------------------------------------------------------------------
+
+
+def make_resumable_fm(tmp_path: Path) -> FileManager:
+    """Return a FileManager with a tiny checkpoint block for easy testing."""
+    fm = make_fm(tmp_path)
+    fm.UPLOAD_BLOCK_SIZE = 4
+    return fm
+
+
+class TestResumableUpload:
+    @pytest.mark.asyncio
+    async def test_fresh_session_reports_zero_offset(self, tmp_path):
+        payload = b"abcdefghij"
+        fm = make_resumable_fm(tmp_path)
+        ch = fake_channel()
+
+        await fm.start_resumable_upload_session(
+            ch, sha256_of(payload), "f.pkg.slp", len(payload), str(tmp_path), "0"
+        )
+
+        ch.send.assert_called_once_with(f"{MSG_FILE_UPLOAD_OFFSET}{MSG_SEPARATOR}0")
+        assert (tmp_path / "f.pkg.slp.part").exists()
+        assert (tmp_path / "f.pkg.slp.part.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_resume_after_interruption(self, tmp_path):
+        payload = b"abcdefghij"
+        sha = sha256_of(payload)
+        fm = make_resumable_fm(tmp_path)
+        ch = fake_channel()
+
+        await fm.start_resumable_upload_session(
+            ch, sha, "f.pkg.slp", len(payload), str(tmp_path), "0"
+        )
+        # Two full blocks plus one byte of the third, then the channel drops.
+        fm.receive_upload_chunk(payload[:9])
+        fm.abandon_upload_session()
+
+        ch.reset_mock()
+        fm2 = make_resumable_fm(tmp_path)  # e.g. after a worker restart
+        await fm2.start_resumable_upload_session(
+            ch, sha, "f.pkg.slp", len(payload), str(tmp_path), "0"
+        )
+        ch.send.assert_called_once_with(f"{MSG_FILE_UPLOAD_OFFSET}{MSG_SEPARATOR}8")
+
+        ch.reset_mock()
+        fm2.receive_upload_chunk(payload[8:])
+        await fm2.finish_upload_session(ch)
+
+        sent = ch.send.call_args[0][0]
+        assert sent.startswith(MSG_FILE_UPLOAD_COMPLETE)
+        assert (tmp_path / "f.pkg.slp").read_bytes() == payload
+        assert not (tmp_path / "f.pkg.slp.part").exists()
+        assert not (tmp_path / "f.pkg.slp.part.json").exists()
+        assert fm2._upload_cache[sha] == str(tmp_path / "f.pkg.slp")
+
+    @pytest.mark.asyncio
+    async def test_different_hash_restarts_from_zero(self, tmp_path):
+        payload = b"abcdefghij"
+        fm = make_resumable_fm(tmp_path)
+        ch = fake_channel()
+        await fm.start_resumable_upload_session(
+            ch, sha256_of(payload), "f.pkg.slp", len(payload), str(tmp_path), "0"
+        )
+        fm.receive_upload_chunk(payload[:8])
+        fm.abandon_upload_session()
+
+        ch.reset_mock()
+        other = b"0123456789"
+        await fm.start_resumable_upload_session(
+            ch, sha256_of(other), "f.pkg.slp", len(other), str(tmp_path), "0"
+        )
+        ch.send.assert_called_once_with(f"{MSG_FILE_UPLOAD_OFFSET}{MSG_SEPARATOR}0")
+
+    @pytest.mark.asyncio
+    async def test_corrupt_block_truncates_offset(self, tmp_path):
+        payload = b"abcdefghijkl"
+        sha = sha256_of(payload)
+        fm = make_resumable_fm(tmp_path)
+        ch = fake_channel()
+        await fm.start_resumable_upload_session(
+            ch, sha, "f.pkg.slp", len(payload), str(tmp_path), "0"
+        )
+        fm.receive_upload_chunk(payload[:12])
+        fm.abandon_upload_session()
+
+        # Flip a byte inside the second block on disk.
+        part = tmp_path / "f.pkg.slp.part"
+        data = bytearray(part.read_bytes())
+        data[5] ^= 0xFF
+        part.write_bytes(bytes(data))
+
+        ch.reset_mock()
+        await fm.start_resumable_upload_session(
+            ch, sha, "f.pkg.slp", len(payload), str(tmp_path), "0"
+        )
+        ch.send.assert_called_once_with(f"{MSG_FILE_UPLOAD_OFFSET}{MSG_SEPARATOR}4")
+
+    @pytest.mark.asyncio
+    async def test_checksum_mismatch_rejected(self, tmp_path):
+        payload = b"abcdefgh"
+        fm = make_resumable_fm(tmp_path)
+        ch = fake_channel()
+        await fm.start_resumable_upload_session(
+            ch, sha256_of(payload), "f.pkg.slp", len(payload), str(tmp_path), "0"
+        )
+        ch.reset_mock()
+        fm.receive_upload_chunk(b"ABCDEFGH")
+        await fm.finish_upload_session(ch)
+
+        sent = ch.send.call_args[0][0]
+        assert sent.startswith(MSG_FILE_UPLOAD_ERROR)
+        assert "Checksum mismatch" in sent
+        assert not (tmp_path / "f.pkg.slp").exists()
+        assert not (tmp_path / "f.pkg.slp.part").exists()
+
+    @pytest.mark.asyncio
+    async def test_short_upload_keeps_partial_for_resume(self, tmp_path):
+        payload = b"abcdefghij"
+        fm = make_resumable_fm(tmp_path)
+        ch = fake_channel()
+        await fm.start_resumable_upload_session(
+            ch, sha256_of(payload), "f.pkg.slp", len(payload), str(tmp_path), "0"
+        )
+        ch.reset_mock()
+        fm.receive_upload_chunk(payload[:4])
+        await fm.finish_upload_session(ch)
+
+        sent = ch.send.call_args[0][0]
+        assert "mismatch" in sent
+        assert (tmp_path / "f.pkg.slp.part").exists()
+        assert (tmp_path / "f.pkg.slp.part.json").exists()
+
+
+class TestAbandonUploadSession:
+    @pytest.mark.asyncio
+    async def test_plain_session_partial_removed(self, tmp_path):
+        fm = make_fm(tmp_path)
+        ch = fake_channel()
+        await fm.start_upload_session(ch, "f.pkg.slp", 100, str(tmp_path), "0")
+        fm.receive_upload_chunk(b"hello")
+
+        fm.abandon_upload_session()
+
+        assert None not in fm._upload_sessions
+        assert not (tmp_path / "f.pkg.slp").exists()
+
+    def test_no_active_session_is_noop(self, tmp_path):
+        fm = make_fm(tmp_path)
+        fm.abandon_upload_session()  # should not raise
+
+
+# ---------------------------------------------------------------------------
+# Delta uploads
+# ---------------------------------------------------------------------------
+
+
+class TestDeltaUpload:
+    @staticmethod
+    def _signature_pages(ch) -> list:
+        import json
+
+        return [
+            json.loads(c[0][0].split(MSG_SEPARATOR, 1)[1])
+            for c in ch.send.call_args_list
+            if c[0][0].startswith(MSG_FILE_UPLOAD_SIGNATURE)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_no_basis_advertised(self, tmp_path):
+        fm = make_fm(tmp_path)
+        ch = fake_channel()
+
+        await fm.send_upload_signature(ch, "labels.pkg.slp")
+
+        (page,) = self._signature_pages(ch)
+        assert page["basis"] is None
+
+    @pytest.mark.asyncio
+    async def test_signature_paged(self, tmp_path):
+        basis = tmp_path / "labels.pkg.slp"
+        basis.write_bytes(b"\0" * (64 * 1024 * 5))
+        fm = make_fm(tmp_path)
+        fm.DELTA_SIGNATURE_PAGE = 2
+        fm._upload_cache["basis-sha"] = str(basis)
+        ch = fake_channel()
+
+        await fm.send_upload_signature(ch, "labels.pkg.slp")
+
+        pages = self._signature_pages(ch)
+        assert [p["start"] for p in pages] == [0, 2, 4]
+        assert all(p["basis"] == "basis-sha" and p["total_blocks"] == 5 for p in pages)
+
+    @pytest.mark.asyncio
+    async def test_round_trip_replaces_basis(self, tmp_path):
+        from sleap_rtc.delta_sync import compute_delta
+
+        block = 64 * 1024
+        old = os.urandom(block * 4)
+        new = old[: block * 2] + b"new frames" + old[block * 2 :]
+        basis = tmp_path / "labels.pkg.slp"
+        basis.write_bytes(old)
+        local = tmp_path / "local.pkg.slp"
+        local.write_bytes(new)
+
+        fm = make_fm(tmp_path)
+        fm._upload_cache[sha256_of(old)] = str(basis)
+        ch = fake_channel()
+        await fm.send_upload_signature(ch, "labels.pkg.slp")
+        (page,) = self._signature_pages(ch)
+
+        ch.reset_mock()
+        await fm.start_delta_upload_session(
+            ch,
+            sha256_of(new),
+            "labels.pkg.slp",
+            len(new),
+            str(tmp_path),
+            "0",
+            page["basis"],
+        )
+        ch.send.assert_called_once_with(MSG_FILE_UPLOAD_READY)
+
+        for op in compute_delta(str(local), page["block_size"], page["blocks"]):
+            if op[0] == "copy":
+                fm.receive_upload_copy(op[1], op[2])
+            else:
+                fm.receive_upload_chunk(new[op[1] : op[1] + op[2]])
+        ch.reset_mock()
+        await fm.finish_upload_session(ch)
+
+        sent = ch.send.call_args[0][0]
+        assert sent.startswith(MSG_FILE_UPLOAD_COMPLETE)
+        assert basis.read_bytes() == new
+        assert fm._upload_cache == {sha256_of(new): str(basis)}
+
+    @pytest.mark.asyncio
+    async def test_unknown_basis_rejected(self, tmp_path):
+        fm = make_fm(tmp_path)
+        ch = fake_channel()
+
+        await fm.start_delta_upload_session(
+            ch, "sha", "f.pkg.slp", 10, str(tmp_path), "0", "missing"
+        )
+
+        sent = ch.send.call_args[0][0]
+        assert sent.startswith(MSG_FILE_UPLOAD_ERROR)
+        assert None not in fm._upload_sessions
+
+    @pytest.mark.asyncio
+    async def test_copy_outside_basis_rejected(self, tmp_path):
+        basis = tmp_path / "f.pkg.slp"
+        basis.write_bytes(b"\0" * 64 * 1024)
+        fm = make_fm(tmp_path)
+        fm._upload_cache["basis-sha"] = str(basis)
+        ch = fake_channel()
+        await fm.send_upload_signature(ch, "f.pkg.slp")
+        await fm.start_delta_upload_session(
+            ch, "sha", "f.pkg.slp", 10, str(tmp_path), "0", "basis-sha"
+        )
+        ch.reset_mock()
+
+        fm.receive_upload_copy(0, 2)
+
+        sent = ch.send.call_args[0][0]
+        assert sent.startswith(MSG_FILE_UPLOAD_ERROR)
+        assert None not in fm._upload_sessions
+        assert not (tmp_path / "f.pkg.slp.part").exists()
+
+
+# ---------------------------------------------------------------------------
+# Striped uploads
+# ---------------------------------------------------------------------------
+
+
+class TestStripedUpload:
+    @staticmethod
+    def _fm_with_stripes(tmp_path: Path) -> FileManager:
+        fm = make_fm(tmp_path)
+        for _ in range(2):
+            fm.add_stripe_channel(fake_channel())
+        return fm
+
+    @pytest.mark.asyncio
+    async def test_requires_open_stripes(self, tmp_path):
+        fm = make_fm(tmp_path)
+        ch = fake_channel()
+
+        await fm.start_striped_upload_session(ch, "f.pkg.slp", 3, str(tmp_path), "0")
+
+        assert ch.send.call_args[0][0].startswith(MSG_FILE_UPLOAD_ERROR)
+        assert None not in fm._upload_sessions
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_frames_assembled(self, tmp_path):
+        data = os.urandom(300)
+        fm = self._fm_with_stripes(tmp_path)
+        ch = fake_channel()
+        await fm.start_striped_upload_session(
+            ch, "f.pkg.slp", len(data), str(tmp_path), "0"
+        )
+        ch.send.assert_called_once_with(MSG_FILE_UPLOAD_READY)
+
+        fm.receive_stripe_frame(pack_frame(200, data[200:]))
+        fm.receive_stripe_frame(pack_frame(0, data[:200]))
+        ch.reset_mock()
+        await fm.finish_upload_session(ch)
+
+        assert ch.send.call_args[0][0].startswith(MSG_FILE_UPLOAD_COMPLETE)
+        assert (tmp_path / "f.pkg.slp").read_bytes() == data
+        assert fm._upload_cache[sha256_of(data)] == str(tmp_path / "f.pkg.slp")
+
+    @pytest.mark.asyncio
+    async def test_end_waits_for_in_flight_frames(self, tmp_path):
+        import asyncio
+
+        fm = self._fm_with_stripes(tmp_path)
+        ch = fake_channel()
+        await fm.start_striped_upload_session(ch, "f.pkg.slp", 4, str(tmp_path), "0")
+        ch.reset_mock()
+
+        finish = asyncio.create_task(fm.finish_upload_session(ch))
+        await asyncio.sleep(0)
+        assert not finish.done()
+        fm.receive_stripe_frame(pack_frame(0, b"late"))
+        await finish
+
+        assert ch.send.call_args[0][0].startswith(MSG_FILE_UPLOAD_COMPLETE)
+
+    @pytest.mark.asyncio
+    async def test_drain_timeout(self, tmp_path):
+        fm = self._fm_with_stripes(tmp_path)
+        ch = fake_channel()
+        await fm.start_striped_upload_session(ch, "f.pkg.slp", 4, str(tmp_path), "0")
+        ch.reset_mock()
+
+        with patch("sleap_rtc.worker.file_manager.STRIPE_DRAIN_TIMEOUT", 0.01):
+            await fm.finish_upload_session(ch)
+
+        assert "Timed out" in ch.send.call_args[0][0]
+        assert not (tmp_path / "f.pkg.slp").exists()
+
+    @pytest.mark.asyncio
+    async def test_bad_frame_fails_session(self, tmp_path):
+        fm = self._fm_with_stripes(tmp_path)
+        ch = fake_channel()
+        await fm.start_striped_upload_session(ch, "f.pkg.slp", 4, str(tmp_path), "0")
+
+        fm.receive_stripe_frame(pack_frame(2, b"too long"))
+
+        assert ch.send.call_args[0][0].startswith(MSG_FILE_UPLOAD_ERROR)
+        assert None not in fm._upload_sessions
+        assert not (tmp_path / "f.pkg.slp").exists()
+
+
+class TestSendFileStriped:
+    @pytest.mark.asyncio
+    async def test_uses_open_stripes(self, tmp_path):
+        data = os.urandom(100 * 1024)
+        src = tmp_path / "predictions.slp"
+        src.write_bytes(data)
+        fm = make_fm(tmp_path)
+        stripes = [fake_channel(), fake_channel()]
+        for s in stripes:
+            s.bufferedAmount = 0
+        for s in stripes:
+            fm.add_stripe_channel(s)
+        ch = fake_channel()
+
+        await fm.send_file(ch, str(src), "out")
+
+        control = [c[0][0] for c in ch.send.call_args_list]
+        assert control == [
+            f"FILE_META_STRIPED::predictions.slp:{len(data)}:out",
+            "END_OF_FILE",
+        ]
+        rebuilt = bytearray(len(data))
+        for s in stripes:
+            for c in s.send.call_args_list:
+                offset, payload = unpack_frame(c[0][0])
+                rebuilt[offset : offset + len(payload)] = payload
+        assert bytes(rebuilt) == data
+
+    @pytest.mark.asyncio
+    async def test_closed_stripes_fall_back_to_control_channel(self, tmp_path):
+        src = tmp_path / "predictions.slp"
+        src.write_bytes(b"data")
+        fm = make_fm(tmp_path)
+        stripe = fake_channel()
+        stripe.readyState = "closed"
+        fm.add_stripe_channel(stripe)
+        ch = fake_channel()
+        ch.bufferedAmount = 0
+
+        await fm.send_file(ch, str(src))
+
+        assert ch.send.call_args_list[0][0][0].startswith("FILE_META::")
+        stripe.send.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Persistent upload store
+# ---------------------------------------------------------------------------
+
+
+def make_persistent_fm(tmp_path: Path) -> FileManager:
+    mount = MountConfig(path=str(tmp_path), label="Test")
+    return FileManager(
+        mounts=[mount],
+        upload_cache_dir=str(tmp_path / ".cache"),
+        upload_cache_max_bytes=1024 * 1024,
+    )
+
+
+async def plain_upload(fm: FileManager, tmp_path: Path, name: str, data: bytes):
+    ch = fake_channel()
+    await fm.start_upload_session(ch, name, len(data), str(tmp_path), "0")
+    fm.receive_upload_chunk(data)
+    await fm.finish_upload_session(ch)
+    return ch
+
+
+class TestPersistentUploadCache:
+    def test_disabled_without_budget(self, tmp_path):
+        fm = FileManager(upload_cache_dir=str(tmp_path / ".cache"))
+        assert fm.upload_store is None
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_survives_restart(self, tmp_path):
+        fm = make_persistent_fm(tmp_path)
+        await plain_upload(fm, tmp_path, "labels.pkg.slp", b"payload")
+
+        restarted = make_persistent_fm(tmp_path)
+
+        assert restarted.check_upload_cache(
+            sha256_of(b"payload"), "labels.pkg.slp"
+        ) == str(tmp_path / "labels.pkg.slp")
+
+    @pytest.mark.asyncio
+    async def test_place_into_requested_dest(self, tmp_path):
+        fm = make_persistent_fm(tmp_path)
+        await plain_upload(fm, tmp_path, "labels.pkg.slp", b"payload")
+        (tmp_path / "labels.pkg.slp").unlink()
+        restarted = make_persistent_fm(tmp_path)
+        sha = sha256_of(b"payload")
+        assert restarted.check_upload_cache(sha, "labels.pkg.slp") is None
+
+        placed = await restarted.place_cached_upload(
+            sha, "labels.pkg.slp", str(tmp_path), "1"
+        )
+
+        expected = tmp_path / "sleap_rtc_downloads" / "labels.pkg.slp"
+        assert placed == str(expected)
+        assert expected.read_bytes() == b"payload"
+        assert restarted.check_upload_cache(sha, "labels.pkg.slp") == placed
+
+    @pytest.mark.asyncio
+    async def test_place_outside_mounts_refused(self, tmp_path):
+        (tmp_path / "mount").mkdir()
+        fm = make_persistent_fm(tmp_path / "mount")
+        await plain_upload(fm, tmp_path / "mount", "f.slp", b"payload")
+
+        placed = await fm.place_cached_upload(
+            sha256_of(b"payload"), "f.slp", str(tmp_path / "outside"), "0"
+        )
+
+        assert placed is None
+
+    @pytest.mark.asyncio
+    async def test_overwrite_does_not_corrupt_store(self, tmp_path):
+        fm = make_persistent_fm(tmp_path)
+        await plain_upload(fm, tmp_path, "labels.pkg.slp", b"version one")
+        await plain_upload(fm, tmp_path, "labels.pkg.slp", b"version two")
+        (tmp_path / "elsewhere").mkdir()
+
+        placed = await fm.place_cached_upload(
+            sha256_of(b"version one"), "old.pkg.slp", str(tmp_path / "elsewhere"), "0"
+        )
+
+        assert Path(placed).read_bytes() == b"version one"
+        assert (tmp_path / "labels.pkg.slp").read_bytes() == b"version two"
+
+    @pytest.mark.asyncio
+    async def test_delta_basis_found_after_restart(self, tmp_path):
+        fm = make_persistent_fm(tmp_path)
+        await plain_upload(fm, tmp_path, "labels.pkg.slp", b"payload")
+
+        restarted = make_persistent_fm(tmp_path)
+
+        assert restarted.find_delta_basis("labels.pkg.slp") == (
+            sha256_of(b"payload"),
+            str(tmp_path / "labels.pkg.slp"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_store_index_read_off_event_loop(self, tmp_path):
+        fm = make_persistent_fm(tmp_path)
+        threads = []
+        find_by_name = fm.upload_store.find_by_name
+        fm.upload_store.find_by_name = lambda name: (
+            threads.append(threading.get_ident()) or find_by_name(name)
+        )
+
+        await fm.send_upload_signature(fake_channel(), "labels.pkg.slp")
+
+        assert threads and threading.get_ident() not in threads
+
+
+# ---------------------------------------------------------------------------
+# Compressed transfers
+# ---------------------------------------------------------------------------
+
+
+class TestCompressedUpload:
+    @pytest.mark.asyncio
+    async def test_offered_codec_is_accepted_and_decoded(self, tmp_path):
+        from sleap_rtc.compression import ChunkEncoder
+
+        fm = make_fm(tmp_path)
+        ch = fake_channel()
+        data = b"frame_idx,x,y\n" * 10000
+        await fm.start_upload_session(
+            ch, "labels.csv", len(data), str(tmp_path), "0", codecs="brotli,zlib"
+        )
+        assert ch.send.call_args[0][0] == f"{MSG_FILE_UPLOAD_READY}{MSG_SEPARATOR}zlib"
+
+        encoder = ChunkEncoder("zlib")
+        for i in range(0, len(data), 64 * 1024):
+            fm.receive_upload_chunk(encoder.encode(data[i : i + 64 * 1024]))
+        await fm.finish_upload_session(ch)
+
+        assert (tmp_path / "labels.csv").read_bytes() == data
+        assert ch.send.call_args[0][0].startswith(MSG_FILE_UPLOAD_COMPLETE)
+
+    @pytest.mark.asyncio
+    async def test_no_offer_replies_plain_ready(self, tmp_path):
+        fm = make_fm(tmp_path)
+        ch = fake_channel()
+        await fm.start_upload_session(ch, "labels.csv", 4, str(tmp_path), "0")
+        assert ch.send.call_args[0][0] == MSG_FILE_UPLOAD_READY
+
+    @pytest.mark.asyncio
+    async def test_resumable_offset_reply_names_codec(self, tmp_path):
+        fm = make_fm(tmp_path)
+        ch = fake_channel()
+        await fm.start_resumable_upload_session(
+            ch, "a" * 64, "labels.slp", 4, str(tmp_path), "0", codecs="zlib"
+        )
+        assert ch.send.call_args[0][0] == (
+            f"{MSG_FILE_UPLOAD_OFFSET}{MSG_SEPARATOR}0{MSG_SEPARATOR}zlib"
+        )
+
+    @pytest.mark.asyncio
+    async def test_corrupt_chunk_aborts_upload(self, tmp_path):
+        fm = make_fm(tmp_path)
+        ch = fake_channel()
+        await fm.start_upload_session(
+            ch, "labels.csv", 4, str(tmp_path), "0", codecs="zlib"
+        )
+
+        fm.receive_upload_chunk(b"\x01garbage")
+
+        assert ch.send.call_args[0][0].startswith(MSG_FILE_UPLOAD_ERROR)
+        assert None not in fm._upload_sessions
+        assert not (tmp_path / "labels.csv").exists()
+
+
+class TestSendFileCompressed:
+    @pytest.mark.asyncio
+    async def test_announced_codec_compresses_chunks(self, tmp_path):
+        from sleap_rtc.compression import decode_chunk
+
+        data = b'{"epochs": 100}\n' * 8000
+        src = tmp_path / "training_config.json"
+        src.write_bytes(data)
+        fm = make_fm(tmp_path)
+        ch = fake_channel()
+        fm.set_download_codec(ch, "zlib")
+        ch.bufferedAmount = 0
+
+        await fm.send_file(ch, str(src), "out")
+
+        sent = [c[0][0] for c in ch.send.call_args_list]
+        assert (
+            sent[0]
+            == f"FILE_META_COMPRESSED::training_config.json:{len(data)}:out:zlib"
+        )
+        assert sent[-1] == "END_OF_FILE"
+        chunks = sent[1:-1]
+        assert sum(len(c) for c in chunks) < len(data) / 10
+        assert b"".join(decode_chunk("zlib", c) for c in chunks) == data
+
+
+class TestConcurrentClients:
+    @pytest.mark.asyncio
+    async def test_clients_upload_and_download_independently(self, tmp_path):
+        fm = make_fm(tmp_path)
+        a, a_stripe, b = fake_channel(), fake_channel(), fake_channel()
+        for ch in (a, a_stripe, b):
+            ch.bufferedAmount = 0
+        fm.client_key = {a: "A", a_stripe: "A", b: "B"}.get
+        fm.add_stripe_channel(a_stripe)
+        fm.set_download_codec(a, "zlib")
+
+        # B starting an upload must not cancel A's
+        await fm.start_upload_session(a, "a.bin", 10, str(tmp_path), "0")
+        await fm.start_striped_upload_session(b, "b.bin", 4, str(tmp_path), "0")
+        assert b.send.call_args[0][0].startswith(MSG_FILE_UPLOAD_ERROR)
+        await fm.start_upload_session(b, "b.bin", 4, str(tmp_path), "0")
+
+        fm.receive_upload_chunk(b"hello", a)
+        fm.receive_upload_chunk(b"data", b)
+        fm.receive_upload_chunk(b"world", a)
+        fm.receive_upload_chunk(b"nope", a_stripe)  # wrong channel
+        await fm.finish_upload_session(b)
+        await fm.finish_upload_session(a)
+
+        assert (tmp_path / "a.bin").read_bytes() == b"helloworld"
+        assert (tmp_path / "b.bin").read_bytes() == b"data"
+        assert a.send.call_args[0][0].startswith(MSG_FILE_UPLOAD_COMPLETE)
+        assert b.send.call_args[0][0].startswith(MSG_FILE_UPLOAD_COMPLETE)
+
+        # Downloads use the requesting client's stripes and codec only
+        src = tmp_path / "predictions.slp"
+        src.write_bytes(b"x" * 1000)
+        a.reset_mock()
+        b.reset_mock()
+        await fm.send_file(a, str(src), "out")
+        await fm.send_file(b, str(src), "out")
+
+        assert a.send.call_args_list[0][0][0].startswith("FILE_META_STRIPED::")
+        assert a_stripe.send.called
+        assert b.send.call_args_list[0][0][0] == "FILE_META::predictions.slp:1000:out"
+
+        fm.forget_client("A")
+        b.reset_mock()
+        await fm.start_upload_session(b, "c.bin", 1, str(tmp_path), "0")
+        assert fm.has_upload_session(b)
+        assert not fm.has_upload_session(a)
@@ -2,6 +2,8 @@
 
 import asyncio
 import hashlib
+import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -12,11 +14,18 @@ from sleap_rtc.protocol import (
     MSG_FILE_UPLOAD_CACHE_HIT,
     MSG_FILE_UPLOAD_CHECK,
     MSG_FILE_UPLOAD_COMPLETE,
+    MSG_FILE_UPLOAD_COPY,
+    MSG_FILE_UPLOAD_DELTA_REQUEST,
+    MSG_FILE_UPLOAD_DELTA_START,
     MSG_FILE_UPLOAD_END,
     MSG_FILE_UPLOAD_ERROR,
+    MSG_FILE_UPLOAD_OFFSET,
     MSG_FILE_UPLOAD_PROGRESS,
     MSG_FILE_UPLOAD_READY,
+    MSG_FILE_UPLOAD_RESUME,
+    MSG_FILE_UPLOAD_SIGNATURE,
     MSG_FILE_UPLOAD_START,
+    MSG_FILE_UPLOAD_STRIPED,
     MSG_SEPARATOR,
 )
 
@@ -26,6 +35,15 @@ from sleap_rtc.protocol import (
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def isolated_hash_cache(tmp_path, monkeypatch):
+    """Keep upload_file's digest cache out of the real home directory."""
+    monkeypatch.setattr(
+        "sleap_rtc.client.hash_cache.default_hash_cache_path",
+        lambda: tmp_path / "hash-cache.json",
+    )
+
+
 def make_channel() -> MagicMock:
     ch = MagicMock()
     ch.readyState = "open"
@@ -228,3 +246,261 @@ class TestUploadFileProgress:
         )
 
         assert calls == [(1, 4), (2, 4), (4, 4)]
+
+
+# ---------------------------------------------------------------------------
+# Resumable mode
+# ---------------------------------------------------------------------------
+
+
+class TestUploadFileResumable:
+    @pytest.mark.asyncio
+    async def test_resume_sends_only_missing_tail(self, tmp_path):
+        payload = b"x" * UPLOAD_CHUNK_SIZE + b"tail"
+        f = tmp_path / "labels.pkg.slp"
+        f.write_bytes(payload)
+
+        ch = make_channel()
+        q: asyncio.Queue = asyncio.Queue()
+        await q.put(MSG_FILE_UPLOAD_READY)  # answer to CHECK
+        await q.put(f"{MSG_FILE_UPLOAD_OFFSET}{MSG_SEPARATOR}{UPLOAD_CHUNK_SIZE}")
+        await q.put(f"{MSG_FILE_UPLOAD_COMPLETE}{MSG_SEPARATOR}/remote/labels.pkg.slp")
+
+        result = await upload_file(ch, q, str(f), "/remote", "0", resumable=True)
+
+        assert result == "/remote/labels.pkg.slp"
+        resume_call = ch.send.call_args_list[1][0][0]
+        assert resume_call.startswith(MSG_FILE_UPLOAD_RESUME + MSG_SEPARATOR)
+        assert sha256_of(payload) in resume_call
+
+        binary_sends = [
+            c[0][0] for c in ch.send.call_args_list if isinstance(c[0][0], bytes)
+        ]
+        assert binary_sends == [b"tail"]
+
+    @pytest.mark.asyncio
+    async def test_unexpected_resume_response_raises(self, tmp_path):
+        f = tmp_path / "labels.pkg.slp"
+        f.write_bytes(b"data")
+
+        ch = make_channel()
+        q: asyncio.Queue = asyncio.Queue()
+        await q.put(MSG_FILE_UPLOAD_READY)
+        await q.put(MSG_FILE_UPLOAD_READY)
+
+        with pytest.raises(
+            RuntimeError, match="Unexpected response to FILE_UPLOAD_RESUME"
+        ):
+            await upload_file(ch, q, str(f), "/remote", "0", resumable=True)
+
+
+# ---------------------------------------------------------------------------
+# Delta mode
+# ---------------------------------------------------------------------------
+
+
+class TestUploadFileDelta:
+    @pytest.mark.asyncio
+    async def test_no_basis_falls_back_to_full_upload(self, tmp_path):
+        f = tmp_path / "labels.pkg.slp"
+        f.write_bytes(b"data")
+
+        ch = make_channel()
+        q: asyncio.Queue = asyncio.Queue()
+        no_basis = {
+            "basis": None,
+            "block_size": 0,
+            "total_blocks": 0,
+            "start": 0,
+            "blocks": [],
+        }
+        await q.put(MSG_FILE_UPLOAD_READY)  # CHECK
+        await q.put(f"{MSG_FILE_UPLOAD_SIGNATURE}{MSG_SEPARATOR}{json.dumps(no_basis)}")
+        await q.put(MSG_FILE_UPLOAD_READY)  # START
+        await q.put(f"{MSG_FILE_UPLOAD_COMPLETE}{MSG_SEPARATOR}/remote/labels.pkg.slp")
+
+        await upload_file(ch, q, str(f), "/remote", "0", delta=True)
+
+        calls = [c[0][0] for c in ch.send.call_args_list]
+        assert (
+            calls[1] == f"{MSG_FILE_UPLOAD_DELTA_REQUEST}{MSG_SEPARATOR}labels.pkg.slp"
+        )
+        assert calls[2].startswith(MSG_FILE_UPLOAD_START + MSG_SEPARATOR)
+        assert b"data" in calls
+
+    @pytest.mark.asyncio
+    async def test_sends_copies_and_changed_bytes_only(self, tmp_path):
+        from sleap_rtc.delta_sync import compute_signature
+
+        block = 64 * 1024
+        old = os.urandom(block * 3)
+        basis = tmp_path / "basis"
+        basis.write_bytes(old)
+        new = old + b"appended"
+        f = tmp_path / "labels.pkg.slp"
+        f.write_bytes(new)
+
+        sig = [list(b) for b in compute_signature(str(basis), block)]
+        page = {
+            "basis": "b" * 64,
+            "block_size": block,
+            "total_blocks": 3,
+            "start": 0,
+            "blocks": sig,
+        }
+        ch = make_channel()
+        q: asyncio.Queue = asyncio.Queue()
+        await q.put(MSG_FILE_UPLOAD_READY)  # CHECK
+        await q.put(f"{MSG_FILE_UPLOAD_SIGNATURE}{MSG_SEPARATOR}{json.dumps(page)}")
+        await q.put(MSG_FILE_UPLOAD_READY)  # DELTA_START
+        await q.put(f"{MSG_FILE_UPLOAD_COMPLETE}{MSG_SEPARATOR}/remote/labels.pkg.slp")
+
+        await upload_file(ch, q, str(f), "/remote", "0", delta=True)
+
+        calls = [c[0][0] for c in ch.send.call_args_list]
+        start = calls[2]
+        assert start.startswith(MSG_FILE_UPLOAD_DELTA_START + MSG_SEPARATOR)
+        assert start.split(MSG_SEPARATOR)[6] == "b" * 64
+        assert calls[3] == f"{MSG_FILE_UPLOAD_COPY}{MSG_SEPARATOR}0{MSG_SEPARATOR}3"
+        assert [c for c in calls if isinstance(c, bytes)] == [b"appended"]
+        assert calls[-1] == MSG_FILE_UPLOAD_END
+
+
+# ---------------------------------------------------------------------------
+# Striped mode
+# ---------------------------------------------------------------------------
+
+
+class TestUploadFileStriped:
+    @pytest.mark.asyncio
+    async def test_data_goes_to_stripes(self, tmp_path):
+        from sleap_rtc.striping import unpack_frame
+
+        data = os.urandom(200 * 1024)
+        f = tmp_path / "labels.pkg.slp"
+        f.write_bytes(data)
+        ch = make_channel()
+        stripes = [make_channel(), make_channel()]
+        q: asyncio.Queue = asyncio.Queue()
+        await q.put(MSG_FILE_UPLOAD_READY)  # CHECK
+        await q.put(MSG_FILE_UPLOAD_READY)  # STRIPED
+        await q.put(f"{MSG_FILE_UPLOAD_COMPLETE}{MSG_SEPARATOR}/remote/labels.pkg.slp")
+
+        result = await upload_file(
+            ch, q, str(f), "/remote", "0", stripe_channels=stripes
+        )
+
+        assert result == "/remote/labels.pkg.slp"
+        calls = [c[0][0] for c in ch.send.call_args_list]
+        assert calls[1] == (
+            f"{MSG_FILE_UPLOAD_STRIPED}{MSG_SEPARATOR}labels.pkg.slp{MSG_SEPARATOR}"
+            f"{len(data)}{MSG_SEPARATOR}/remote{MSG_SEPARATOR}0"
+        )
+        assert calls[2:] == [MSG_FILE_UPLOAD_END]
+        rebuilt = bytearray(len(data))
+        for s in stripes:
+            for c in s.send.call_args_list:
+                offset, payload = unpack_frame(c[0][0])
+                rebuilt[offset : offset + len(payload)] = payload
+        assert bytes(rebuilt) == data
+
+    @pytest.mark.asyncio
+    async def test_resumable_ignores_stripes(self, tmp_path):
+        f = tmp_path / "labels.pkg.slp"
+        f.write_bytes(b"data")
+        ch = make_channel()
+        stripe = make_channel()
+        q: asyncio.Queue = asyncio.Queue()
+        await q.put(MSG_FILE_UPLOAD_READY)
+        await q.put(f"{MSG_FILE_UPLOAD_OFFSET}{MSG_SEPARATOR}0")
+        await q.put(f"{MSG_FILE_UPLOAD_COMPLETE}{MSG_SEPARATOR}/remote/labels.pkg.slp")
+
+        await upload_file(
+            ch, q, str(f), "/remote", "0", resumable=True, stripe_channels=[stripe]
+        )
+
+        stripe.send.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Hash cache
+# ---------------------------------------------------------------------------
+
+
+class TestUploadFileHashCache:
+    @pytest.mark.asyncio
+    async def test_unchanged_file_uses_cached_digest(self, tmp_path):
+        from sleap_rtc.client.hash_cache import HashCache
+
+        f = tmp_path / "labels.pkg.slp"
+        f.write_bytes(b"data")
+        cache = HashCache(tmp_path / "cache.json")
+        cache.store(str(f), os.stat(f), "cafe" * 16)
+
+        ch = make_channel()
+        q: asyncio.Queue = asyncio.Queue()
+        await q.put(f"{MSG_FILE_UPLOAD_CACHE_HIT}{MSG_SEPARATOR}/remote/x")
+
+        await upload_file(ch, q, str(f), "/remote", "0", hash_cache=cache)
+
+        check = ch.send.call_args_list[0][0][0]
+        assert check.startswith(f"{MSG_FILE_UPLOAD_CHECK}{MSG_SEPARATOR}{'cafe' * 16}")
+
+
+# ---------------------------------------------------------------------------
+# Compression
+# ---------------------------------------------------------------------------
+
+
+class TestUploadFileCompressed:
+    @pytest.mark.asyncio
+    async def test_accepted_codec_compresses_chunks(self, tmp_path):
+        from sleap_rtc.compression import decode_chunk
+
+        data = b"epoch,loss\n" * 20000
+        f = tmp_path / "log.csv"
+        f.write_bytes(data)
+        ch = make_channel()
+        q: asyncio.Queue = asyncio.Queue()
+        await q.put(MSG_FILE_UPLOAD_READY)  # CHECK
+        await q.put(f"{MSG_FILE_UPLOAD_READY}{MSG_SEPARATOR}zlib")  # START
+        await q.put(f"{MSG_FILE_UPLOAD_COMPLETE}{MSG_SEPARATOR}/remote/log.csv")
+
+        await upload_file(ch, q, str(f), "/remote", "0")
+
+        calls = [c[0][0] for c in ch.send.call_args_list]
+        assert calls[1].split(MSG_SEPARATOR)[5].split(",")[-1] == "zlib"
+        chunks = [c for c in calls if isinstance(c, bytes)]
+        assert sum(len(c) for c in chunks) < len(data) / 10
+        assert b"".join(decode_chunk("zlib", c) for c in chunks) == data
+
+    @pytest.mark.asyncio
+    async def test_compress_false_sends_no_offer(self, tmp_path):
+        f = tmp_path / "log.csv"
+        f.write_bytes(b"data")
+        ch = make_channel()
+        q: asyncio.Queue = asyncio.Queue()
+        await q.put(MSG_FILE_UPLOAD_READY)
+        await q.put(MSG_FILE_UPLOAD_READY)
+        await q.put(f"{MSG_FILE_UPLOAD_COMPLETE}{MSG_SEPARATOR}/remote/log.csv")
+
+        await upload_file(ch, q, str(f), "/remote", "0", compress=False)
+
+        calls = [c[0][0] for c in ch.send.call_args_list]
+        assert calls[1] == (
+            f"{MSG_FILE_UPLOAD_START}{MSG_SEPARATOR}log.csv{MSG_SEPARATOR}4"
+            f"{MSG_SEPARATOR}/remote{MSG_SEPARATOR}0"
+        )
+        assert calls[2] == b"data"
+
+    @pytest.mark.asyncio
+    async def test_unoffered_codec_rejected(self, tmp_path):
+        f = tmp_path / "log.csv"
+        f.write_bytes(b"data")
+        ch = make_channel()
+        q: asyncio.Queue = asyncio.Queue()
+        await q.put(MSG_FILE_UPLOAD_READY)
+        await q.put(f"{MSG_FILE_UPLOAD_READY}{MSG_SEPARATOR}brotli")
+
+        with pytest.raises(RuntimeError, match="brotli"):
+            await upload_file(ch, q, str(f), "/remote", "0")
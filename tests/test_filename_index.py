@@ -0,0 +1,234 @@
+"""Tests for the worker's background filename index of mounts."""
+
+import os
+import time
+
+import pytest
+
+from sleap_rtc.config import MountConfig
+from sleap_rtc.worker.file_manager import FileManager
+from sleap_rtc.worker.filename_index import FilenameIndex, MountIndex
+
+
+@pytest.fixture
+def mount(tmp_path):
+    root = tmp_path / "mount"
+    (root / "day1" / "cam").mkdir(parents=True)
+    (root / "day2").mkdir()
+    (root / "fly.mp4").write_bytes(b"x" * 10)
+    (root / "day1" / "cam" / "fly.mp4").write_bytes(b"x" * 20)
+    (root / "day2" / "Mouse.MP4").write_bytes(b"x" * 30)
+    return root
+
+
+def touch_dir(path, offset=10):
+    """Move a directory's mtime so a rescan sees it as changed."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + offset * 10**9))
+
+
+def exact(pattern):
+    return lambda name: "exact" if name == pattern else None
+
+
+class TestMountIndex:
+    def test_search_finds_files_with_depth(self, mount):
+        index = MountIndex(str(mount))
+        assert not index.ready
+        index.refresh()
+
+        found = sorted(
+            (p, size, depth) for _, p, size, _, depth in index.search(exact("fly.mp4"))
+        )
+
+        assert index.ready
+        assert found == [
+            (str(mount / "day1" / "cam" / "fly.mp4"), 20, 2),
+            (str(mount / "fly.mp4"), 10, 0),
+        ]
+
+    def test_search_is_case_insensitive(self, mount):
+        index = MountIndex(str(mount))
+        index.refresh()
+
+        assert [r[1] for r in index.search(exact("mouse.mp4"))] == [
+            str(mount / "day2" / "Mouse.MP4")
+        ]
+
+    def test_rescan_rereads_only_changed_directories(self, mount, monkeypatch):
+        index = MountIndex(str(mount))
+        index.refresh()
+        (mount / "day2" / "new.mp4").write_bytes(b"")
+        touch_dir(mount / "day2")
+
+        reread = []
+        read_dir = MountIndex._read_dir
+        monkeypatch.setattr(
+            MountIndex,
+            "_read_dir",
+            staticmethod(
+                lambda path, mtime_ns: reread.append(path) or read_dir(path, mtime_ns)
+            ),
+        )
+        index.refresh()
+
+        assert reread == [str(mount / "day2")]
+        assert index.search(exact("new.mp4"))
+
+    def test_listing_rejected_after_directory_changes(self, mount):
+        index = MountIndex(str(mount))
+        index.refresh()
+
+        assert "fly.mp4" in index.listing(str(mount))[1]
+        (mount / "other.mp4").write_bytes(b"")
+        touch_dir(mount)
+        assert index.listing(str(mount)) is None
+
+    def test_saved_index_is_ready_on_load(self, mount, tmp_path):
+        cache_file = tmp_path / "idx" / "mount.json.gz"
+        MountIndex(str(mount), cache_file).refresh()
+
+        loaded = MountIndex(str(mount), cache_file)
+
+        assert loaded.ready
+        assert len(loaded.search(exact("fly.mp4"))) == 2
+
+    def test_corrupt_saved_index_ignored(self, mount, tmp_path):
+        cache_file = tmp_path / "mount.json.gz"
+        cache_file.write_bytes(b"not gzip")
+
+        assert not MountIndex(str(mount), cache_file).ready
+
+    def test_stop_aborts_scan(self, mount):
+        import threading
+
+        stop = threading.Event()
+        stop.set()
+        index = MountIndex(str(mount))
+
+        assert index.refresh(stop) is False
+        assert not index.ready
+
+
+class TestFilenameIndex:
+    def test_for_path_picks_containing_mount(self, mount, tmp_path):
+        other = tmp_path / "mount2"
+        other.mkdir()
+        index = FilenameIndex([str(mount), str(other)])
+        index.refresh_all()
+
+        assert index.for_path(str(mount / "day1")).root == str(mount)
+        assert index.for_path(str(tmp_path / "mount2x")) is None
+
+    def test_set_mounts_keeps_existing_indexes(self, mount, tmp_path):
+        index = FilenameIndex([str(mount)])
+        index.refresh_all()
+        index.set_mounts([str(mount), str(tmp_path)])
+
+        assert index.get(str(mount)) is not None
+        assert index.get(str(tmp_path)) is None
+
+    def test_request_refresh_rescans_before_interval(self, mount):
+        index = FilenameIndex([str(mount)], refresh_interval=3600)
+        index.start()
+        try:
+            for _ in range(200):
+                if index.get(str(mount)) is not None:
+                    break
+                time.sleep(0.01)
+            (mount / "day2" / "new.mp4").write_bytes(b"")
+            touch_dir(mount / "day2")
+            index.request_refresh()
+
+            for _ in range(200):
+                if index.get(str(mount)).search(exact("new.mp4")):
+                    break
+                time.sleep(0.01)
+            assert index.get(str(mount)).search(exact("new.mp4"))
+        finally:
+            index.stop()
+
+
+@pytest.fixture
+def indexed_manager(mount):
+    fm = FileManager(mounts=[MountConfig(path=str(mount), label="Data")])
+    fm.filename_index = FilenameIndex([str(mount)])
+    fm.filename_index.refresh_all()
+    return fm
+
+
+class TestFileManagerWithIndex:
+    def test_resolve_ranks_across_whole_mount(self, indexed_manager, mount):
+        result = indexed_manager.resolve_path("fly.mp4", file_size=20)
+
+        assert [c["path"] for c in result["candidates"]] == [
+            str(mount / "day1" / "cam" / "fly.mp4"),
+            str(mount / "fly.mp4"),
+        ]
+        assert result["candidates"][0]["match_type"] == "exact"
+
+    def test_resolve_respects_max_depth(self, indexed_manager, mount):
+        result = indexed_manager.resolve_path("fly.mp4", max_depth=1)
+
+        assert [c["path"] for c in result["candidates"]] == [str(mount / "fly.mp4")]
+
+    def test_resolve_drops_deleted_files(self, indexed_manager, mount):
+        (mount / "fly.mp4").unlink()
+
+        result = indexed_manager.resolve_path("fly.mp4")
+
+        assert [c["path"] for c in result["candidates"]] == [
+            str(mount / "day1" / "cam" / "fly.mp4")
+        ]
+
+    def test_resolve_reports_truncation(self, indexed_manager, mount):
+        for i in range(FileManager.MAX_RESULTS + 5):
+            (mount / "day2" / f"clip{i}.mp4").write_bytes(b"")
+        touch_dir(mount / "day2")
+        indexed_manager.filename_index.refresh_all()
+
+        result = indexed_manager.resolve_path("clip")
+
+        assert len(result["candidates"]) == FileManager.MAX_RESULTS
+        assert result["truncated"] is True
+
+    def test_resolve_finds_files_created_since_scan(self, indexed_manager, mount):
+        (mount / "day2" / "copied.mp4").write_bytes(b"x")
+        requested = []
+        indexed_manager.filename_index.request_refresh = lambda: requested.append(1)
+
+        result = indexed_manager.resolve_path("copied.mp4")
+
+        assert [c["path"] for c in result["candidates"]] == [
+            str(mount / "day2" / "copied.mp4")
+        ]
+        assert requested == [1]
+
+    def test_scan_directory_uses_current_listing(self, indexed_manager, mount):
+        result = indexed_manager.scan_directory_for_filenames(
+            str(mount / "day1" / "cam"), ["fly.mp4", "missing.mp4"]
+        )
+        assert result["found"] == {
+            "fly.mp4": str(mount / "day1" / "cam" / "fly.mp4"),
+            "missing.mp4": None,
+        }
+
+        (mount / "day1" / "cam" / "missing.mp4").write_bytes(b"")
+        touch_dir(mount / "day1" / "cam")
+        result = indexed_manager.scan_directory_for_filenames(
+            str(mount / "day1" / "cam"), ["missing.mp4"]
+        )
+        assert result["found"]["missing.mp4"] is not None
+
+    def test_prefix_resolution_checks_index(self, indexed_manager, mount):
+        result = indexed_manager.compute_prefix_resolution(
+            "/old/day1/cam/fly.mp4",
+            str(mount / "day1" / "cam" / "fly.mp4"),
+            ["/old/fly.mp4", "/old/day2/gone.mp4", "/old/day1"],
+        )
+
+        assert [r["original"] for r in result["would_resolve"]] == [
+            "/old/fly.mp4",
+            "/old/day1",
+        ]
+        assert result["would_not_resolve"] == ["/old/day2/gone.mp4"]
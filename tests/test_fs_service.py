@@ -0,0 +1,115 @@
+"""Tests for the worker's off-loop filesystem request service."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from sleap_rtc.worker.fs_service import FSRequestCancelled, FSService
+
+
+@pytest.fixture
+def service():
+    svc = FSService(max_workers=2, per_client_limit=1, timeout=5.0)
+    yield svc
+    svc.shutdown()
+
+
+class TestFSService:
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self, service):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        tick_task = asyncio.create_task(ticker())
+        result = await service.run("a", lambda: time.sleep(0.2) or "done")
+        tick_task.cancel()
+
+        assert result == "done"
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_per_client_limit(self, service):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(service.run("a", work) for _ in range(3)))
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_global_limit(self, service):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(service.run(f"c{i}", work) for i in range(4)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_client_drops_queued_requests(self, service):
+        release = threading.Event()
+        ran = []
+
+        first = asyncio.ensure_future(service.run("a", release.wait))
+        queued = asyncio.ensure_future(service.run("a", ran.append, "queued"))
+        await asyncio.sleep(0.05)
+
+        assert service.pending("a") == 2
+        assert service.cancel_client("a") == 2
+        release.set()
+
+        for request in (first, queued):
+            with pytest.raises(FSRequestCancelled):
+                await request
+        assert ran == []
+        assert service.pending("a") == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_leaves_other_clients_alone(self, service):
+        release = threading.Event()
+        mine = asyncio.ensure_future(service.run("a", release.wait, 1))
+        other = asyncio.ensure_future(service.run("b", lambda: "ok"))
+        await asyncio.sleep(0.05)
+
+        service.cancel_client("a")
+        release.set()
+
+        assert await other == "ok"
+        with pytest.raises(FSRequestCancelled):
+            await mine
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        svc = FSService(timeout=0.05)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await svc.run("a", time.sleep, 0.3)
+        finally:
+            svc.shutdown()
@@ -0,0 +1,77 @@
+"""Tests for the parallel scandir directory walker."""
+
+import os
+import time
+
+import pytest
+
+from sleap_rtc.worker.fs_walk import scandir_sorted, walk
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for d in ["b", "a", "a/deep", "c"]:
+        (tmp_path / d).mkdir()
+    for f in ["z.txt", "a/2.txt", "a/1.txt", "a/deep/x.txt", "b/y.txt", "c/w.txt"]:
+        (tmp_path / f).write_text(f)
+    return tmp_path
+
+
+def rel(root):
+    return lambda entry, depth: (os.path.relpath(entry.path, root), depth)
+
+
+class TestWalk:
+    def test_breadth_first_deterministic_order(self, tree):
+        results, timed_out = walk(str(tree), rel(tree), max_depth=5, max_workers=4)
+
+        assert timed_out is False
+        assert results == [
+            ("z.txt", 0),
+            ("a/1.txt", 1),
+            ("a/2.txt", 1),
+            ("b/y.txt", 1),
+            ("c/w.txt", 1),
+            ("a/deep/x.txt", 2),
+        ]
+
+    def test_max_depth(self, tree):
+        results, _ = walk(str(tree), rel(tree), max_depth=0)
+
+        assert results == [("z.txt", 0)]
+
+    def test_visit_filters_and_limit_stops_early(self, tree):
+        def txt_in_a(entry, depth):
+            return entry.name if "/a/" in entry.path else None
+
+        results, timed_out = walk(str(tree), txt_in_a, max_depth=5, limit=1)
+
+        assert results == ["1.txt"]
+        assert timed_out is False
+
+    def test_deadline_reports_timeout(self, tree):
+        def slow(entry, depth):
+            time.sleep(0.5)
+            return entry.name
+
+        results, timed_out = walk(
+            str(tree), slow, max_depth=5, deadline=time.monotonic() + 0.05
+        )
+
+        assert timed_out is True
+        assert results == []
+
+    def test_unreadable_root_yields_nothing(self, tmp_path):
+        results, timed_out = walk(str(tmp_path / "missing"), rel(tmp_path), 5)
+
+        assert results == []
+        assert timed_out is False
+
+
+class TestScandirSorted:
+    def test_sorted_by_name(self, tree):
+        assert [e.name for e in scandir_sorted(str(tree))] == ["a", "b", "c", "z.txt"]
+
+    def test_missing_directory_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            scandir_sorted(str(tmp_path / "missing"))
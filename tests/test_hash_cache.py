@@ -0,0 +1,92 @@
+"""Tests for the client-side persistent file hash cache."""
+
+import hashlib
+import os
+
+import pytest
+
+from sleap_rtc.client.hash_cache import (
+    HASH_CACHE_MAX_ENTRIES,
+    HashCache,
+    sha256_file_cached,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HashCache(tmp_path / "hash-cache.json")
+
+
+class TestSha256FileCached:
+    def test_miss_hashes_and_stores(self, tmp_path, cache):
+        f = tmp_path / "labels.slp"
+        f.write_bytes(b"payload")
+
+        digest = sha256_file_cached(str(f), cache)
+
+        assert digest == hashlib.sha256(b"payload").hexdigest()
+        assert cache.lookup(str(f), os.stat(f)) == digest
+
+    def test_hit_skips_hashing(self, tmp_path, cache, monkeypatch):
+        f = tmp_path / "labels.slp"
+        f.write_bytes(b"payload")
+        expected = sha256_file_cached(str(f), cache)
+
+        class NoHashlib:
+            def sha256(self):
+                raise AssertionError("file was re-hashed")
+
+        monkeypatch.setattr("sleap_rtc.client.hash_cache.hashlib", NoHashlib())
+        assert sha256_file_cached(str(f), cache) == expected
+
+    def test_modified_file_is_rehashed(self, tmp_path, cache):
+        f = tmp_path / "labels.slp"
+        f.write_bytes(b"payload")
+        sha256_file_cached(str(f), cache)
+        f.write_bytes(b"changed!")
+        st = os.stat(f)
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert (
+            sha256_file_cached(str(f), cache) == hashlib.sha256(b"changed!").hexdigest()
+        )
+
+    def test_replaced_file_is_rehashed(self, tmp_path, cache):
+        f = tmp_path / "labels.slp"
+        f.write_bytes(b"payload")
+        sha256_file_cached(str(f), cache)
+        st = os.stat(f)
+        replacement = tmp_path / "new.slp"
+        replacement.write_bytes(b"PAYLOAD")
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, f)
+
+        assert (
+            sha256_file_cached(str(f), cache) == hashlib.sha256(b"PAYLOAD").hexdigest()
+        )
+
+
+class TestHashCache:
+    def test_persists_across_instances(self, tmp_path, cache):
+        f = tmp_path / "labels.slp"
+        f.write_bytes(b"payload")
+        cache.store(str(f), os.stat(f), "abc")
+
+        assert HashCache(cache.path).lookup(str(f), os.stat(f)) == "abc"
+
+    def test_corrupt_file_is_a_miss(self, tmp_path, cache):
+        f = tmp_path / "labels.slp"
+        f.write_bytes(b"payload")
+        cache.path.write_text("{oops")
+
+        assert cache.lookup(str(f), os.stat(f)) is None
+
+    def test_oldest_entries_pruned(self, tmp_path, cache, monkeypatch):
+        monkeypatch.setattr("sleap_rtc.client.hash_cache.HASH_CACHE_MAX_ENTRIES", 2)
+        st = os.stat(tmp_path)
+        for name in ("a", "b", "c"):
+            cache.store(str(tmp_path / name), st, name)
+
+        assert cache.lookup(str(tmp_path / "a"), st) is None
+        assert cache.lookup(str(tmp_path / "c"), st) == "c"
+        assert HASH_CACHE_MAX_ENTRIES > 2
@@ -0,0 +1,458 @@
+"""Tests for the worker-local job queue."""
+
+import asyncio
+import json
+import subprocess
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sleap_rtc.worker.job_queue_store import JobQueueStore
+from sleap_rtc.worker.job_scheduler import (
+    DetachedChannel,
+    ExecutorGroup,
+    JobScheduler,
+    plan_device_groups,
+)
+from sleap_rtc.worker.mesh_messages import (
+    create_status_update,
+    deserialize_message,
+    serialize_message,
+)
+
+
+def make_channel():
+    channel = MagicMock()
+    channel.readyState = "open"
+    return channel
+
+
+def sent(channel):
+    return [c.args[0] for c in channel.send.call_args_list]
+
+
+def make_scheduler(device_groups, on_change=None, **kwargs):
+    worker = SimpleNamespace(job_executor=MagicMock(), capabilities=MagicMock())
+    return JobScheduler(worker, device_groups, on_change=on_change, **kwargs)
+
+
+class Job:
+    """Job body that runs until released by the test."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.finish = asyncio.Event()
+        self.slot = None
+
+    async def __call__(self, slot):
+        self.slot = slot
+        self.started.set()
+        await self.finish.wait()
+        return slot.index
+
+
+class TestPlanDeviceGroups:
+    def test_one_job_per_gpu(self):
+        assert plan_device_groups(["0", "1", "2"], 0) == [["0"], ["1"], ["2"]]
+
+    def test_uneven_split(self):
+        devices = [str(i) for i in range(8)]
+
+        groups = plan_device_groups(devices, 3)
+
+        assert [len(g) for g in groups] == [3, 3, 2]
+        assert sum(groups, []) == devices
+
+    def test_capped_at_gpu_count(self):
+        assert plan_device_groups(["4", "5"], 8) == [["4"], ["5"]]
+
+    def test_cpu_only(self):
+        assert plan_device_groups([], 1) == [[]]
+        assert plan_device_groups([], 2) == [[], []]
+
+
+class TestJobScheduler:
+    def test_single_slot_uses_worker_executor(self):
+        scheduler = make_scheduler([["0", "1"]])
+        (slot,) = scheduler.slots
+
+        assert not scheduler.concurrent
+        assert scheduler.executor(slot) is scheduler.worker.job_executor
+        assert slot.env == {}
+        assert slot.zmq_ports == {"controller": 9000, "publish": 9001}
+
+    def test_slots_get_own_devices_ports_and_executors(self):
+        scheduler = make_scheduler([["0"], ["1", "2"]])
+        a, b = scheduler.slots
+
+        assert scheduler.executor(a) is not scheduler.executor(b)
+        assert scheduler.executor(b).env == {"CUDA_VISIBLE_DEVICES": "1,2"}
+        assert b.zmq_ports == {"controller": 9002, "publish": 9003}
+
+    async def test_jobs_run_concurrently_then_queue_in_order(self):
+        changes = []
+        scheduler = make_scheduler(
+            [["0"], ["1"]], on_change=lambda: changes.append(scheduler.queue_depth)
+        )
+        jobs = [Job() for _ in range(4)]
+        channels = [make_channel() for _ in jobs]
+        tasks = [
+            asyncio.create_task(scheduler.run(f"j{i}", channels[i], jobs[i]))
+            for i in range(4)
+        ]
+        await asyncio.wait_for(jobs[1].started.wait(), 1)
+        await asyncio.sleep(0)
+
+        assert scheduler.running_jobs == ["j0", "j1"]
+        assert scheduler.queue_depth == 2
+        assert scheduler.free_gpus == []
+        assert "position 2" in sent(channels[3])[0]
+
+        jobs[1].finish.set()
+        await asyncio.wait_for(jobs[2].started.wait(), 1)
+        assert not jobs[3].started.is_set()
+        assert jobs[2].slot.devices == ["1"]
+
+        for job in jobs:
+            job.finish.set()
+        assert await asyncio.gather(*tasks) == [0, 1, 1, 0]
+        assert scheduler.free_gpus == ["0", "1"]
+        assert changes[-1] == 0
+
+    async def test_cancel_queued_job(self):
+        scheduler = make_scheduler([["0"]])
+        running, queued = Job(), Job()
+        channel = make_channel()
+        first = asyncio.create_task(scheduler.run("a", make_channel(), running))
+        await running.started.wait()
+        second = asyncio.create_task(scheduler.run("b", channel, queued))
+        await asyncio.sleep(0)
+
+        assert scheduler.slot_for(job_id="b") is None
+        assert scheduler.cancel_queued(job_id="b")
+        assert await second is None
+
+        assert not queued.started.is_set()
+        failed = sent(channel)[-1]
+        assert failed.startswith("JOB_FAILED::")
+        assert json.loads(failed.split("::", 1)[1])["job_id"] == "b"
+        running.finish.set()
+        await first
+
+    async def test_queued_job_dropped_when_client_leaves(self):
+        scheduler = make_scheduler([["0"]])
+        running, queued = Job(), Job()
+        channel = make_channel()
+        first = asyncio.create_task(scheduler.run("a", make_channel(), running))
+        await running.started.wait()
+        second = asyncio.create_task(scheduler.run("b", channel, queued))
+        await asyncio.sleep(0)
+
+        channel.readyState = "closed"
+        running.finish.set()
+
+        assert await second is None
+        assert not queued.started.is_set()
+        assert scheduler.free_gpus == ["0"]
+        await first
+
+    async def test_commands_routed_to_running_job(self):
+        scheduler = make_scheduler([["0"], ["1"]])
+        jobs = [Job(), Job()]
+        channels = [make_channel(), make_channel()]
+        tasks = [
+            asyncio.create_task(scheduler.run(f"j{i}", channels[i], jobs[i]))
+            for i in range(2)
+        ]
+        await jobs[1].started.wait()
+
+        second = scheduler.executor(scheduler.slots[1])
+        assert scheduler.executor_for(channel=channels[1]) is second
+        assert scheduler.executor_for(job_id="j1") is second
+        assert scheduler.executor_for(job_id="nope") is scheduler.worker.job_executor
+
+        for job in jobs:
+            job.finish.set()
+        await asyncio.gather(*tasks)
+
+    def test_pipeline_model_ports_do_not_collide(self):
+        scheduler = make_scheduler([["0", "1"], ["2", "3"]])
+
+        ports = [
+            scheduler.model_zmq_ports(slot, i)["controller"]
+            for slot in scheduler.slots
+            for i in range(2)
+        ]
+
+        assert ports[0] == scheduler.slots[0].zmq_ports["controller"]
+        assert sorted(ports) == [9000, 9002, 9004, 9006]
+
+    async def test_commands_routed_to_every_pipeline_model(self):
+        scheduler = make_scheduler([["0", "1"]])
+        job = Job()
+        task = asyncio.create_task(scheduler.run("j", make_channel(), job))
+        await job.started.wait()
+        executors = [MagicMock(_cancel_requested=False) for _ in range(2)]
+        job.slot.pipeline = ExecutorGroup(executors)
+
+        group = scheduler.executor_for(job_id="j")
+        group.stop_running_job()
+        group._cancel_requested = True
+
+        assert group is job.slot.pipeline
+        assert all(e.stop_running_job.called for e in executors)
+        assert all(e._cancel_requested for e in executors)
+        job.finish.set()
+        await task
+
+    async def test_capacity_limited_by_queue_length(self):
+        scheduler = make_scheduler([["0"]], max_queue=1)
+        running, queued = Job(), Job()
+        first = asyncio.create_task(scheduler.run("a", make_channel(), running))
+        await running.started.wait()
+        assert scheduler.has_capacity
+
+        second = asyncio.create_task(scheduler.run("b", make_channel(), queued))
+        await asyncio.sleep(0)
+        assert not scheduler.has_capacity
+
+        running.finish.set()
+        await queued.started.wait()
+        assert scheduler.has_capacity
+        queued.finish.set()
+        await asyncio.gather(first, second)
+
+
+def dead_pid():
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def records(store):
+    return [json.loads(p.read_text()) for p in store.root.glob("*.json")]
+
+
+class TestJobQueueStore:
+    async def test_job_recorded_until_done(self, tmp_path):
+        store = JobQueueStore(tmp_path)
+        scheduler = make_scheduler([["0"]], store=store)
+        running, queued = Job(), Job()
+        first = asyncio.create_task(
+            scheduler.run("a", make_channel(), running, spec='{"a": 1}')
+        )
+        await running.started.wait()
+        second = asyncio.create_task(
+            scheduler.run("b", make_channel(), queued, spec='{"b": 2}')
+        )
+        await asyncio.sleep(0)
+
+        states = {r["job_id"]: (r["state"], r["spec"]) for r in records(store)}
+        assert states == {"a": ("running", '{"a": 1}'), "b": ("queued", '{"b": 2}')}
+
+        running.finish.set()
+        queued.finish.set()
+        await asyncio.gather(first, second)
+        assert records(store) == []
+
+    async def test_cancelled_job_forgotten(self, tmp_path):
+        store = JobQueueStore(tmp_path)
+        scheduler = make_scheduler([["0"]], store=store)
+        running = Job()
+        first = asyncio.create_task(scheduler.run("a", make_channel(), running))
+        await running.started.wait()
+        second = asyncio.create_task(
+            scheduler.run("b", make_channel(), Job(), spec="{}")
+        )
+        await asyncio.sleep(0)
+
+        scheduler.cancel_queued(job_id="b")
+        await second
+        assert records(store) == []
+        running.finish.set()
+        await first
+
+    def test_recover_takes_records_of_dead_workers(self, tmp_path):
+        store = JobQueueStore(tmp_path)
+        mine = store.add("mine", "{}")
+        for job_id in ("old", "older"):
+            key = store.add(job_id, "{}")
+            record = json.loads((tmp_path / f"{key}.json").read_text())
+            record["pid"] = dead_pid()
+            record["queued_at"] -= 10 if job_id == "older" else 5
+            (tmp_path / f"{key}.json").write_text(json.dumps(record))
+        (tmp_path / "broken.json").write_text("{")
+
+        recovered = store.recover()
+
+        assert [r["job_id"] for r in recovered] == ["older", "old"]
+        assert [p.stem for p in tmp_path.glob("*.json")] == [mine]
+        assert store.recover() == []
+
+
+def make_client_worker(device_groups, **kwargs):
+    from sleap_rtc.worker.worker_class import RTCWorkerClient
+
+    worker = RTCWorkerClient.__new__(RTCWorkerClient)
+    worker.status = "available"
+    worker.shutting_down = False
+    worker.job_scheduler = make_scheduler(device_groups, **kwargs)
+    worker.client_connections = {}
+    worker._client_roles = {}
+    worker._channel_peers = {}
+    worker.pc = None
+    worker.received_files = {}
+    worker.file_manager = MagicMock()
+    worker.job_coordinator = None
+    worker.state_manager = MagicMock(reregister_worker=AsyncMock())
+    return worker
+
+
+class TestConcurrentClients:
+    async def test_multi_job_worker_accepts_clients_until_queue_full(self):
+        worker = make_client_worker([["0"], ["1"]], max_queue=1)
+        scheduler = worker.job_scheduler
+        jobs = [Job() for _ in range(3)]
+        tasks = [
+            asyncio.create_task(scheduler.run(f"j{i}", make_channel(), job))
+            for i, job in enumerate(jobs)
+        ]
+        await jobs[1].started.wait()
+        await asyncio.sleep(0)
+
+        assert not worker._can_accept_client()
+
+        jobs[0].finish.set()
+        await jobs[2].started.wait()
+        assert worker._can_accept_client()
+        for job in jobs:
+            job.finish.set()
+        await asyncio.gather(*tasks)
+
+    def test_single_job_worker_serves_one_client(self):
+        worker = make_client_worker([["0"]])
+        assert worker._can_accept_client()
+
+        worker.status = "reserved"
+        assert not worker._can_accept_client()
+
+    async def test_client_disconnect_leaves_other_clients_connected(self):
+        worker = make_client_worker([["0"], ["1"]])
+        pcs = {"a": MagicMock(close=AsyncMock()), "b": MagicMock(close=AsyncMock())}
+        worker.client_connections = dict(pcs)
+        worker.pc = pcs["a"]
+
+        await worker._handle_client_disconnect("a")
+
+        pcs["a"].close.assert_awaited_once()
+        assert worker.client_connections == {"b": pcs["b"]}
+        assert worker.pc is pcs["b"]
+        worker.file_manager.forget_client.assert_called_once_with("a")
+        worker.state_manager.reregister_worker.assert_not_awaited()
+
+        await worker._handle_client_disconnect("b")
+        assert worker.pc is None
+        worker.state_manager.reregister_worker.assert_awaited_once()
+
+    def test_channels_with_same_label_authenticated_per_client(self):
+        worker = make_client_worker([["0"], ["1"]])
+        worker._pending_auth = {}
+        worker._auth_timeout_tasks = {}
+        worker._authenticated_channels = set()
+        a, b = make_channel(), make_channel()
+        a.label = b.label = "training"
+        worker._channel_peers = {a: "client-a", b: "client-b"}
+
+        worker._auth_success(a)
+
+        assert worker._channel_key(a) in worker._authenticated_channels
+        assert worker._channel_key(b) not in worker._authenticated_channels
+
+    async def test_queued_jobs_resubmitted_after_restart(self, tmp_path):
+        store = JobQueueStore(tmp_path)
+        worker = make_client_worker([["0"]], store=store)
+        worker.handle_job_submit = AsyncMock()
+        for job_id, state in (("queued", "queued"), ("running", "running")):
+            key = store.add(job_id, '{"type": "train"}')
+            record = json.loads((tmp_path / f"{key}.json").read_text())
+            record.update(pid=dead_pid(), state=state)
+            (tmp_path / f"{key}.json").write_text(json.dumps(record))
+
+        worker._recover_job_queue()
+        await asyncio.sleep(0)
+
+        (channel, message), _ = worker.handle_job_submit.call_args
+        assert worker.handle_job_submit.call_count == 1
+        assert isinstance(channel, DetachedChannel)
+        assert message == 'JOB_SUBMIT::queued::{"type": "train"}'
+        assert records(store) == []
+
+
+class PipelineExecutor:
+    """Executor whose model fails at once ("fail") or trains until cancelled."""
+
+    def __init__(self, worker=None, capabilities=None):
+        self.env = {}
+        self._cancel_requested = False
+        self.cancelled = asyncio.Event()
+
+    async def execute_from_spec(self, channel, cmd, job_id, **kwargs):
+        if cmd == ["fail"]:
+            return {"success": False, "cancelled": False}
+        await self.cancelled.wait()
+        return {"success": False, "cancelled": True}
+
+    def cancel_running_job(self):
+        self.cancelled.set()
+
+
+class TestParallelPipeline:
+    async def test_failure_cancels_sibling_models(self, monkeypatch):
+        from sleap_rtc.worker import worker_class
+
+        reporter = MagicMock(async_cleanup=AsyncMock())
+        monkeypatch.setattr(worker_class, "JobExecutor", PipelineExecutor)
+        monkeypatch.setattr(
+            worker_class, "ProgressReporter", MagicMock(return_value=reporter)
+        )
+        worker = worker_class.RTCWorkerClient.__new__(worker_class.RTCWorkerClient)
+        worker.capabilities = MagicMock()
+        worker.job_scheduler = make_scheduler([["0", "1", "2"]])
+        spec = SimpleNamespace(
+            config_paths=["a.yaml", "b.yaml", "c.yaml"], model_types=None
+        )
+
+        outcomes, paths, cancelled, failed = await asyncio.wait_for(
+            worker._train_models_parallel(
+                make_channel(),
+                spec,
+                "job",
+                worker.job_scheduler.slots[0],
+                [["train"], ["fail"], ["train"]],
+                ["a", "b", "c"],
+                [["0"], ["1"], ["2"]],
+            ),
+            timeout=2.0,
+        )
+
+        assert [r.get("cancelled") for _, r in outcomes] == [True, False, True]
+        assert (cancelled, failed, paths) == (False, True, [])
+
+
+class TestStatusUpdateProperties:
+    def test_round_trip(self):
+        message = create_status_update("w1", "available", properties={"queue": 2})
+
+        assert deserialize_message(serialize_message(message)).properties == {
+            "queue": 2
+        }
+
+    def test_unset_fields_omitted_and_unknown_fields_ignored(self):
+        data = json.loads(serialize_message(create_status_update("w1", "busy")))
+        assert "properties" not in data
+
+        data["added_by_newer_peer"] = True
+        message = deserialize_message(json.dumps(data))
+
+        assert message.status == "busy"
+        assert message.properties is None
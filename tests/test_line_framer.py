@@ -0,0 +1,82 @@
+"""Tests for framing subprocess output into lines."""
+
+import asyncio
+
+from sleap_rtc.worker.line_framer import (
+    LINE_CR,
+    LINE_EOF,
+    LINE_LF,
+    LINE_OVERFLOW,
+    LineFramer,
+    read_lines,
+)
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    async def read(self, n):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+class TestLineFramer:
+    def test_lf_and_cr_lines(self):
+        framer = LineFramer()
+
+        lines = framer.feed(b"Epoch 1\n 10%|#\r 20%|##\rtail")
+
+        assert lines == [
+            ("Epoch 1", LINE_LF),
+            (" 10%|#", LINE_CR),
+            (" 20%|##", LINE_CR),
+        ]
+        assert framer.flush() == "tail"
+        assert framer.flush() == ""
+
+    def test_crlf_and_empty_lines_skipped(self):
+        framer = LineFramer()
+
+        assert framer.feed(b"a\r\n\n\nb\n") == [("a", LINE_CR), ("b", LINE_LF)]
+
+    def test_line_split_across_chunks(self):
+        framer = LineFramer()
+
+        assert framer.feed(b"val_lo") == []
+        assert framer.feed(b"ss=0.5") == []
+        assert framer.feed(b"\nnext") == [("val_loss=0.5", LINE_LF)]
+        assert framer.flush() == "next"
+
+    def test_multibyte_character_split_across_chunks(self):
+        framer = LineFramer()
+        data = "█ 50%\n".encode()
+
+        assert framer.feed(data[:1]) == []
+        assert framer.feed(data[1:]) == [("█ 50%", LINE_LF)]
+
+    def test_overflow(self):
+        framer = LineFramer(max_line=8)
+
+        assert framer.feed(b"0123") == []
+        assert framer.feed(b"456789") == [("0123456789", LINE_OVERFLOW)]
+        assert framer.feed(b"ok\n") == [("ok", LINE_LF)]
+
+
+class TestReadLines:
+    def test_yields_lines_then_eof_tail(self):
+        stream = FakeStream([b"one\ntw", b"o\rthr", b"ee"])
+
+        async def collect():
+            return [line async for line in read_lines(stream)]
+
+        assert asyncio.run(collect()) == [
+            ("one", LINE_LF),
+            ("two", LINE_CR),
+            ("three", LINE_EOF),
+        ]
+
+    def test_empty_stream(self):
+        async def collect():
+            return [line async for line in read_lines(FakeStream([]))]
+
+        assert asyncio.run(collect()) == [("", LINE_EOF)]
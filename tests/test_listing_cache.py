@@ -0,0 +1,75 @@
+"""Tests for cached directory listing snapshots."""
+
+import os
+
+import pytest
+
+from sleap_rtc.worker.listing_cache import ListingCache
+
+
+@pytest.fixture
+def directory(tmp_path):
+    (tmp_path / "b.txt").write_text("b")
+    (tmp_path / "A.txt").write_text("a")
+    (tmp_path / "zdir").mkdir()
+    return tmp_path
+
+
+def touch_dir(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+class TestListingCache:
+    def test_sorts_directories_first_then_name(self, directory):
+        snapshot = ListingCache().get(str(directory))
+
+        assert [e.name for e in snapshot.entries] == ["zdir", "A.txt", "b.txt"]
+
+    def test_unchanged_directory_reuses_snapshot(self, directory):
+        cache = ListingCache()
+
+        first = cache.get(str(directory))
+
+        assert cache.get(str(directory)) is first
+        assert len(cache) == 1
+
+    def test_changed_directory_is_relisted(self, directory):
+        cache = ListingCache()
+        first = cache.get(str(directory))
+        (directory / "c.txt").write_text("c")
+        touch_dir(directory)
+
+        second = cache.get(str(directory))
+
+        assert second is not first
+        assert len(second.entries) == 4
+
+    def test_cursor_continues_old_snapshot(self, directory):
+        cache = ListingCache()
+        first = cache.get(str(directory))
+        (directory / "c.txt").write_text("c")
+        touch_dir(directory)
+
+        assert cache.get(str(directory), first.cursor) is first
+
+    def test_cursor_of_other_path_ignored(self, directory):
+        cache = ListingCache()
+        other = cache.get(str(directory / "zdir"))
+
+        assert cache.get(str(directory), other.cursor).path == str(directory)
+
+    def test_expired_snapshots_dropped(self, directory):
+        cache = ListingCache(ttl=0)
+        first = cache.get(str(directory))
+        first.last_used -= 1
+
+        assert cache.get(str(directory), first.cursor) is not first
+
+    def test_least_recently_used_evicted(self, directory):
+        cache = ListingCache(max_snapshots=1)
+        first = cache.get(str(directory))
+        cache.get(str(directory / "zdir"))
+
+        assert len(cache) == 1
+        assert cache.get(str(directory), first.cursor) is not first
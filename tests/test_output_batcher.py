@@ -0,0 +1,118 @@
+"""Tests for coalescing job output sent to clients."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+from sleap_rtc.api import _unbatch_output
+from sleap_rtc.worker.output_batcher import OutputBatcher, output_batcher
+
+
+def make_channel(buffered=0):
+    channel = MagicMock()
+    channel.readyState = "open"
+    channel.bufferedAmount = buffered
+    return channel
+
+
+def sent(channel):
+    return [c.args[0] for c in channel.send.call_args_list]
+
+
+def progress(event, **fields):
+    return "PROGRESS_REPORT::" + json.dumps({"event": event, **fields})
+
+
+class TestOutputBatcher:
+    async def test_flushes_after_interval_in_order(self):
+        channel = make_channel()
+        out = OutputBatcher(channel, flush_interval=0.01)
+
+        out.send("JOB_LOG::one")
+        out.send("JOB_LOG::two")
+        assert sent(channel) == []
+
+        await asyncio.sleep(0.05)
+        assert sent(channel) == ["JOB_LOG::one", "JOB_LOG::two"]
+
+    async def test_cr_updates_collapse_per_stream(self):
+        channel = make_channel()
+        out = OutputBatcher(channel)
+
+        out.send("CR::10%")
+        out.send("JOB_LOG::CR::a 10%")
+        out.send("line\n")
+        out.send("CR::20%")
+        out.send("JOB_LOG::CR::a 20%")
+        out.flush()
+
+        assert sent(channel) == ["line\n", "CR::20%", "JOB_LOG::CR::a 20%"]
+        assert out.dropped == 2
+
+    async def test_full_queue_flushes_in_size_limited_batches(self):
+        channel = make_channel()
+        out = OutputBatcher(channel, max_batch_bytes=25)
+        out.framed = True
+
+        out.send("JOB_LOG::a")
+        out.send("JOB_LOG::b")
+        assert sent(channel) == []
+        out.send("JOB_LOG::c")
+
+        assert sent(channel) == [
+            'OUTPUT_BATCH::["JOB_LOG::a", "JOB_LOG::b"]',
+            "JOB_LOG::c",
+        ]
+
+    async def test_framed_batch_round_trips(self):
+        channel = make_channel()
+        out = OutputBatcher(channel)
+        out.framed = True
+        messages = ["JOB_LOG::a", progress("epoch_end", epoch=1), "CR::█ 50%"]
+
+        for m in messages:
+            out.send(m)
+        out.flush()
+
+        assert len(sent(channel)) == 1
+        assert _unbatch_output(sent(channel)[0]) == messages
+
+    async def test_backpressure_samples_batch_end_only(self):
+        channel = make_channel(buffered=10**9)
+        out = OutputBatcher(channel, high_water=1024)
+
+        out.send(progress("batch_end", batch=1))
+        out.send(progress("epoch_end", epoch=1))
+        out.send(progress("batch_end", batch=2))
+        out.send("JOB_LOG::kept")
+        out.flush()
+
+        assert sent(channel) == [
+            progress("epoch_end", epoch=1),
+            progress("batch_end", batch=2),
+            "JOB_LOG::kept",
+        ]
+
+    async def test_closed_channel_discards_queue(self):
+        channel = make_channel()
+        channel.readyState = "closed"
+        out = OutputBatcher(channel)
+
+        out.send("JOB_LOG::late")
+        out.flush()
+
+        channel.send.assert_not_called()
+
+    def test_one_batcher_per_channel(self):
+        channel = make_channel()
+
+        assert output_batcher(channel) is output_batcher(channel)
+        assert output_batcher(make_channel()) is not output_batcher(channel)
+
+
+class TestUnbatchOutput:
+    def test_plain_message_passes_through(self):
+        assert _unbatch_output("JOB_COMPLETE::{}") == ["JOB_COMPLETE::{}"]
+
+    def test_malformed_batch_dropped(self):
+        assert _unbatch_output("OUTPUT_BATCH::not json") == []
@@ -129,6 +129,28 @@ class TestExecuteFromSpecReporterOwnership:
 
         owned_reporter.async_cleanup.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_flushes_reports_before_job_complete(
+        self, executor, mock_channel, mock_process
+    ):
+        """Queued progress reports must reach the client before JOB_COMPLETE."""
+        external_reporter = MagicMock()
+        external_reporter.flush_reports = AsyncMock(
+            side_effect=lambda ch: ch.send('PROGRESS_REPORT::{"event": "train_end"}')
+        )
+
+        with patch("asyncio.create_subprocess_exec", new=AsyncMock(return_value=mock_process)):
+            await executor.execute_from_spec(
+                mock_channel, ["echo", "done"], "job_1",
+                job_type="train",
+                zmq_ports={"controller": 9000, "publish": 9001},
+                progress_reporter=external_reporter,
+            )
+
+        sent = [c.args[0] for c in mock_channel.send.call_args_list]
+        assert sent[-2] == 'PROGRESS_REPORT::{"event": "train_end"}'
+        assert sent[-1].startswith("JOB_COMPLETE")
+
 
 # ── handle_job_submit pipeline reporter ──────────────────────────────────────
 
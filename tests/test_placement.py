@@ -0,0 +1,116 @@
+"""Tests for load- and RTT-aware worker placement."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sleap_rtc.placement import probe_rtts, rank_workers, worker_load
+from sleap_rtc.worker.job_coordinator import JobCoordinator
+
+
+def peer(peer_id, **properties):
+    return {"peer_id": peer_id, "metadata": {"properties": properties}}
+
+
+def ids(peers):
+    return [p["peer_id"] for p in peers]
+
+
+class FakeSignaling:
+    """Signaling server where workers answer pings after a per-worker delay."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.inbox = asyncio.Queue()
+
+    async def send(self, message):
+        data = json.loads(message)
+        worker = data["to_peer_id"]
+        if worker in self.delays:
+            asyncio.get_running_loop().call_later(
+                self.delays[worker], self._reply, worker, data["payload"]["nonce"]
+            )
+
+    def _reply(self, worker, nonce):
+        reply = {
+            "type": "peer_message",
+            "from_peer_id": worker,
+            "payload": {"app_message_type": "pong", "nonce": nonce},
+        }
+        self.inbox.put_nowait(json.dumps(reply))
+
+
+class TestWorkerLoad:
+    def test_queue_metadata(self):
+        assert worker_load({"job_slots": 2, "running_jobs": 1}) == 0.5
+        assert worker_load({"job_slots": 2, "running_jobs": 2, "queue_depth": 2}) == 2
+
+    def test_status_only(self):
+        assert worker_load({"status": "available"}) == 0
+        assert worker_load({"status": "busy"}) == 1
+
+
+class TestRankWorkers:
+    peers = [
+        peer("busy", status="busy", gpu_memory_mb=80000),
+        peer("small", status="available", gpu_memory_mb=8000),
+        peer("big", status="available", gpu_memory_mb=24000),
+    ]
+
+    def test_first_keeps_discovery_order(self):
+        assert ids(rank_workers(self.peers, "first")) == ["busy", "small", "big"]
+
+    def test_gpu_memory(self):
+        assert ids(rank_workers(self.peers, "gpu_memory"))[0] == "busy"
+
+    def test_least_loaded_then_memory(self):
+        assert ids(rank_workers(self.peers, "least_loaded")) == [
+            "big",
+            "small",
+            "busy",
+        ]
+
+    def test_balanced_prefers_closer_worker(self):
+        rtts = {"busy": 0.01, "small": 0.01, "big": 0.2}
+
+        assert ids(rank_workers(self.peers, "balanced", rtts))[0] == "small"
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            rank_workers(self.peers, "random")
+
+
+class TestProbeRtts:
+    async def test_measures_replies_and_skips_silent_workers(self):
+        signaling = FakeSignaling({"near": 0.0, "far": 0.05})
+
+        rtts = await probe_rtts(
+            signaling.send,
+            signaling.inbox.get,
+            "client",
+            ["near", "far", "old"],
+            timeout=0.3,
+        )
+
+        assert set(rtts) == {"near", "far"}
+        assert rtts["near"] < rtts["far"]
+
+    async def test_worker_answers_ping(self):
+        coordinator = JobCoordinator(
+            "w1", MagicMock(), MagicMock(), AsyncMock(), MagicMock()
+        )
+        coordinator.websocket.send = AsyncMock()
+
+        await coordinator.handle_peer_message(
+            {
+                "type": "peer_message",
+                "from_peer_id": "client",
+                "payload": {"app_message_type": "ping", "nonce": "n1"},
+            }
+        )
+
+        reply = json.loads(coordinator.websocket.send.call_args.args[0])
+        assert reply["to_peer_id"] == "client"
+        assert reply["payload"] == {"app_message_type": "pong", "nonce": "n1"}
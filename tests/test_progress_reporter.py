@@ -0,0 +1,108 @@
+"""Tests for forwarding ZMQ progress reports to the client."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import zmq
+
+from sleap_rtc.worker.progress_reporter import ProgressReporter, tag_report
+
+
+async def test_listener_forwards_reports_as_they_arrive():
+    channel = MagicMock()
+    channel.readyState = "open"
+    reporter = ProgressReporter(progress_address="tcp://127.0.0.1:*")
+    task = reporter.start_progress_listener_task(channel)
+    while reporter.progress_socket is None:
+        await asyncio.sleep(0.01)
+    endpoint = reporter.progress_socket.getsockopt_string(zmq.LAST_ENDPOINT)
+
+    pub = reporter.context.socket(zmq.PUB)
+    pub.connect(endpoint)
+    try:
+        sent = []
+        for _ in range(200):
+            # Publish until the subscription has propagated (slow joiner).
+            pub.send_string('{"event": "train_begin"}')
+            await asyncio.sleep(0.01)
+            sent = [c.args[0] for c in channel.send.call_args_list]
+            if sent:
+                break
+        assert sent
+        assert sent[0] == 'PROGRESS_REPORT::{"event": "train_begin"}'
+
+        channel.send.reset_mock()
+        for i in range(50):
+            pub.send_string(f'{{"event": "batch_end", "batch": {i}}}')
+        await asyncio.sleep(0.2)
+
+        sent = [c.args[0] for c in channel.send.call_args_list]
+        assert sent == [
+            f'PROGRESS_REPORT::{{"event": "batch_end", "batch": {i}}}'
+            for i in range(50)
+        ]
+        assert not task.done()
+    finally:
+        pub.close(linger=0)
+        await reporter.async_cleanup()
+
+    assert task.done()
+
+
+def test_tag_report_adds_model_type():
+    assert tag_report('{"event": "epoch_end"}', "centroid") == (
+        '{"what": "centroid", "event": "epoch_end"}'
+    )
+    assert tag_report("{}", "centroid") == '{"what": "centroid"}'
+    assert tag_report("not json", "centroid") == "not json"
+
+
+async def test_restart_sends_queued_reports_before_returning():
+    from sleap_rtc.worker.output_batcher import output_batcher
+
+    channel = MagicMock()
+    channel.readyState = "open"
+    reporter = ProgressReporter(progress_address="tcp://127.0.0.1:*")
+    reporter.start_progress_listener_task(channel)
+    while reporter.progress_socket is None:
+        await asyncio.sleep(0.01)
+    try:
+        output_batcher(channel).send('PROGRESS_REPORT::{"event": "epoch_end"}')
+        await reporter.restart_progress_listener(channel)
+
+        # Sent before the caller announces the next model
+        channel.send.assert_called_once_with('PROGRESS_REPORT::{"event": "epoch_end"}')
+    finally:
+        await reporter.async_cleanup()
+
+
+async def test_cleanup_sends_reports_still_in_socket():
+    channel = MagicMock()
+    channel.readyState = "open"
+    reporter = ProgressReporter(progress_address="tcp://127.0.0.1:*")
+    reporter.start_progress_listener_task(channel)
+    while reporter.progress_socket is None:
+        await asyncio.sleep(0.01)
+    endpoint = reporter.progress_socket.getsockopt_string(zmq.LAST_ENDPOINT)
+
+    pub = reporter.context.socket(zmq.PUB)
+    pub.connect(endpoint)
+    try:
+        while not channel.send.called:
+            pub.send_string('{"event": "train_begin"}')
+            await asyncio.sleep(0.01)
+        channel.send.reset_mock()
+
+        # Published while the listener gets no chance to forward them
+        for i in range(5):
+            pub.send_string(f'{{"event": "epoch_end", "epoch": {i}}}')
+        time.sleep(0.2)
+    finally:
+        pub.close(linger=0)
+        await reporter.async_cleanup()
+
+    sent = [c.args[0] for c in channel.send.call_args_list]
+    assert sent[-5:] == [
+        f'PROGRESS_REPORT::{{"event": "epoch_end", "epoch": {i}}}' for i in range(5)
+    ]
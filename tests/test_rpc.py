@@ -0,0 +1,320 @@
+"""Tests for FS request multiplexing over correlation IDs."""
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from sleap_rtc.config import MountConfig
+from sleap_rtc.protocol import (
+    MSG_FS_ERROR,
+    MSG_FS_LIST_RESPONSE,
+    MSG_FS_MOUNTS_RESPONSE,
+    MSG_RPC_HELLO,
+    MSG_SEPARATOR,
+    MSG_WORKER_PATH_OK,
+)
+from sleap_rtc.rpc import RPC_VERSION, RpcClient, RpcServer, parse_envelope
+from sleap_rtc.tui.bridge import WebRTCBridge
+from sleap_rtc.worker.worker_class import RTCWorkerClient
+
+
+class FakeChannel:
+    """Worker-side data channel that records what it sends."""
+
+    def __init__(self, label="client-1"):
+        self.label = label
+        self.readyState = "open"
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+def loopback(server, label="client-1"):
+    """Connect an RpcClient to an RpcServer through a fake channel."""
+    client = RpcClient(send=None, timeout=5.0)
+    channel = FakeChannel(label)
+    channel.send = client.handle
+    client.send = lambda message: server.handle(channel, message)
+    return client, channel
+
+
+def reply(request_id, message):
+    return f"RPC_REPLY{MSG_SEPARATOR}{request_id}{MSG_SEPARATOR}{message}"
+
+
+class TestRpcClient:
+    def test_enabled_after_hello_answer(self):
+        sent = []
+        client = RpcClient(sent.append)
+        client.hello()
+
+        assert sent == [MSG_RPC_HELLO]
+        assert client.enabled is False
+        assert client.handle(f"{MSG_RPC_HELLO}{MSG_SEPARATOR}1") is True
+        assert client.enabled is True
+
+    def test_ignores_other_messages(self):
+        client = RpcClient(lambda m: None)
+
+        assert client.handle(f"{MSG_FS_MOUNTS_RESPONSE}{MSG_SEPARATOR}[]") is False
+        assert client.handle(b"KEEP_ALIVE") is False
+
+    async def test_same_type_requests_resolve_independently(self):
+        sent = []
+        client = RpcClient(sent.append)
+        first = asyncio.create_task(client.request("FS_LIST_DIR::/a::0"))
+        second = asyncio.create_task(client.request("FS_LIST_DIR::/b::0"))
+        await asyncio.sleep(0)
+
+        ids = [parse_envelope(m)[0] for m in sent]
+        assert len(set(ids)) == 2
+        # Answer out of order
+        client.handle(reply(ids[1], "FS_LIST_RESPONSE::b"))
+        client.handle(reply(ids[0], "FS_LIST_RESPONSE::a"))
+
+        assert await first == "FS_LIST_RESPONSE::a"
+        assert await second == "FS_LIST_RESPONSE::b"
+        assert client.pending == 0
+
+    async def test_timeout_cancels_request(self):
+        sent = []
+        client = RpcClient(sent.append)
+
+        assert await client.request("FS_RESOLVE::x", timeout=0.01) is None
+        request_id = parse_envelope(sent[0])[0]
+        assert sent[1] == f"RPC_CANCEL{MSG_SEPARATOR}{request_id}"
+        assert client.pending == 0
+
+    async def test_late_reply_dropped(self):
+        client = RpcClient(lambda m: None)
+        await client.request("FS_GET_MOUNTS", timeout=0.01)
+
+        assert client.handle(reply("1", "FS_MOUNTS_RESPONSE::[]")) is True
+
+    async def test_reset_wakes_callers(self):
+        client = RpcClient(lambda m: None)
+        client.enabled = True
+        task = asyncio.create_task(client.request("FS_GET_MOUNTS"))
+        await asyncio.sleep(0)
+        client.reset()
+
+        assert await task is None
+        assert client.enabled is False
+
+
+class TestRpcServer:
+    async def test_answers_hello(self):
+        server = RpcServer(handler=None)
+        channel = FakeChannel()
+
+        assert server.handle(channel, MSG_RPC_HELLO) is True
+        assert channel.sent == [f"{MSG_RPC_HELLO}{MSG_SEPARATOR}{RPC_VERSION}"]
+
+    async def test_ignores_plain_messages(self):
+        server = RpcServer(handler=None)
+
+        assert server.handle(FakeChannel(), "FS_GET_MOUNTS") is False
+
+    async def test_requests_run_concurrently(self):
+        release = {"slow": asyncio.Event(), "fast": asyncio.Event()}
+
+        async def handler(channel, message, client_id):
+            await release[message].wait()
+            channel.send(f"done {message}")
+            return True
+
+        server = RpcServer(handler)
+        channel = FakeChannel()
+        server.handle(channel, "RPC::1::slow")
+        server.handle(channel, "RPC::2::fast")
+        await asyncio.sleep(0)
+        assert server.pending("client-1") == 2
+
+        release["fast"].set()
+        await asyncio.sleep(0.01)
+        assert channel.sent == ["RPC_REPLY::2::done fast"]
+
+        release["slow"].set()
+        await asyncio.sleep(0.01)
+        assert channel.sent[1] == "RPC_REPLY::1::done slow"
+        assert server.pending("client-1") == 0
+
+    async def test_cancel(self):
+        started = asyncio.Event()
+
+        async def handler(channel, message, client_id):
+            started.set()
+            await asyncio.sleep(10)
+            return True
+
+        server = RpcServer(handler)
+        channel = FakeChannel()
+        server.handle(channel, "RPC::7::FS_RESOLVE::x")
+        await started.wait()
+        server.handle(channel, "RPC_CANCEL::7")
+        await asyncio.sleep(0.01)
+
+        assert server.pending("client-1") == 0
+        assert channel.sent == []
+
+    async def test_cancel_channel_leaves_other_channels(self):
+        async def handler(channel, message, client_id):
+            await asyncio.sleep(10)
+            return True
+
+        server = RpcServer(handler)
+        server.handle(FakeChannel("a"), "RPC::1::FS_GET_MOUNTS")
+        server.handle(FakeChannel("b"), "RPC::1::FS_GET_MOUNTS")
+        await asyncio.sleep(0)
+
+        assert server.cancel_channel("a") == 1
+        await asyncio.sleep(0.01)
+        assert server.pending("a") == 0
+        assert server.pending("b") == 1
+        server.cancel_channel("b")
+
+    async def test_clients_with_same_label_kept_apart(self):
+        client_ids = []
+
+        async def handler(channel, message, client_id):
+            client_ids.append(client_id)
+            await asyncio.sleep(10)
+            return True
+
+        a, b = FakeChannel("training"), FakeChannel("training")
+        server = RpcServer(handler, client_key={a: "x", b: "y"}.get)
+        server.handle(a, "RPC::1::FS_GET_MOUNTS")
+        server.handle(b, "RPC::1::FS_GET_MOUNTS")
+        await asyncio.sleep(0)
+
+        assert sorted(client_ids) == ["x", "y"]
+        server.handle(a, "RPC_CANCEL::1")
+        await asyncio.sleep(0.01)
+        assert server.pending("x") == 0
+        assert server.pending("y") == 1
+        server.cancel_channel("y")
+
+    async def test_unhandled_request_gets_error(self):
+        async def handler(channel, message, client_id):
+            return False
+
+        server = RpcServer(handler)
+        channel = FakeChannel()
+        server.handle(channel, "RPC::3::JOB_SUBMIT::{}")
+        await asyncio.sleep(0.01)
+
+        request_id, response = parse_envelope(channel.sent[0])
+        assert request_id == "3"
+        assert response.startswith(f"{MSG_FS_ERROR}{MSG_SEPARATOR}INVALID_REQUEST")
+
+
+class TestWorkerRpc:
+    @pytest.fixture
+    def worker(self, tmp_path):
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            for i in range(3):
+                (tmp_path / name / f"{name}{i}.slp").write_text("x")
+        mount = MountConfig(path=str(tmp_path), label="Test Mount")
+        return RTCWorkerClient(mounts=[mount], working_dir=str(tmp_path))
+
+    async def test_concurrent_listings(self, worker, tmp_path):
+        client, _ = loopback(worker.rpc_server)
+        client.hello()
+        assert client.enabled
+
+        responses = await asyncio.gather(
+            client.request(f"FS_LIST_DIR::{tmp_path / 'a'}::0"),
+            client.request(f"FS_LIST_DIR::{tmp_path / 'b'}::0"),
+        )
+
+        for name, response in zip("ab", responses):
+            assert response.startswith(f"{MSG_FS_LIST_RESPONSE}{MSG_SEPARATOR}")
+            data = json.loads(response.split(MSG_SEPARATOR, 1)[1])
+            assert {e["name"] for e in data["entries"]} == {
+                f"{name}{i}.slp" for i in range(3)
+            }
+
+    async def test_streamed_listing_pages_share_id(self, worker, tmp_path):
+        client, _ = loopback(worker.rpc_server)
+        worker.file_manager.LIST_PAGE_MAX = 2
+
+        with client.start(f"FS_LIST_DIR::{tmp_path / 'a'}::0::3") as call:
+            first = json.loads((await call.reply()).split(MSG_SEPARATOR, 1)[1])
+            second = json.loads((await call.reply()).split(MSG_SEPARATOR, 1)[1])
+
+        assert len(first["entries"]) == 2
+        assert len(second["entries"]) == 1
+        assert second["has_more"] is False
+
+    async def test_concurrent_video_checks_keep_their_paths(
+        self, worker, tmp_path, monkeypatch
+    ):
+        client, _ = loopback(worker.rpc_server)
+        paths = [str(tmp_path / f"{name}.slp") for name in "ab"]
+        for path in paths:
+            open(path, "w").close()
+
+        def check(path):
+            time.sleep(0.05)
+            return {"slp_path": path, "missing": []}
+
+        monkeypatch.setattr(worker.file_manager, "check_video_accessibility", check)
+
+        async def video_check(path):
+            with client.start(f"USE_WORKER_PATH::{path}") as call:
+                assert (await call.reply()).startswith(MSG_WORKER_PATH_OK)
+                response = await call.reply()
+            return json.loads(response.split(MSG_SEPARATOR, 1)[1])["slp_path"]
+
+        assert await asyncio.gather(*map(video_check, paths)) == paths
+
+
+class TestBridgeRpc:
+    @pytest.fixture
+    def bridge(self):
+        bridge = WebRTCBridge(room_id="room", token="token")
+        bridge.data_channel = MagicMock()
+        bridge.data_channel.readyState = "open"
+        return bridge
+
+    def sent(self, bridge):
+        return [c[0][0] for c in bridge.data_channel.send.call_args_list]
+
+    async def test_legacy_until_worker_answers(self, bridge):
+        task = asyncio.create_task(bridge.get_mounts())
+        await asyncio.sleep(0)
+        await bridge._handle_message(f"{MSG_FS_MOUNTS_RESPONSE}{MSG_SEPARATOR}[]")
+
+        assert await task == []
+        assert self.sent(bridge) == ["FS_GET_MOUNTS"]
+
+    async def test_concurrent_listings(self, bridge):
+        await bridge._handle_message(f"{MSG_RPC_HELLO}{MSG_SEPARATOR}1")
+        first = asyncio.create_task(bridge.list_dir("/a"))
+        second = asyncio.create_task(bridge.list_dir("/b"))
+        await asyncio.sleep(0)
+
+        requests = [parse_envelope(m) for m in self.sent(bridge)]
+        for request_id, request in reversed(requests):
+            path = request.split(MSG_SEPARATOR)[1]
+            data = json.dumps({"path": path, "entries": []})
+            await bridge._handle_message(
+                reply(request_id, f"{MSG_FS_LIST_RESPONSE}{MSG_SEPARATOR}{data}")
+            )
+
+        assert (await first)["path"] == "/a"
+        assert (await second)["path"] == "/b"
+
+    async def test_abandoned_stream_is_cancelled(self, bridge):
+        await bridge._handle_message(f"{MSG_RPC_HELLO}{MSG_SEPARATOR}1")
+
+        assert await bridge.list_dir_stream("/a", lambda p: None, timeout=0.01) is (
+            False
+        )
+        request_id = parse_envelope(self.sent(bridge)[0])[0]
+        assert self.sent(bridge)[1] == f"RPC_CANCEL{MSG_SEPARATOR}{request_id}"
@@ -0,0 +1,346 @@
+"""Tests for reading and patching SLP metadata without loading the labels."""
+
+import json
+import os
+import shutil
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sio = pytest.importorskip("sleap_io")
+h5py = pytest.importorskip("h5py")
+iio = pytest.importorskip("imageio.v2")
+
+from sleap_rtc.config import MountConfig
+from sleap_rtc.worker.file_manager import FileManager
+from sleap_rtc.worker.slp_metadata import (
+    SlpHeaderCache,
+    clone_file,
+    patch_video_paths,
+    paths_exist,
+    read_slp_header,
+    video_entry_embedded,
+    video_entry_path,
+)
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i in range(2):
+        path = tmp_path / "img" / f"{i}.png"
+        path.parent.mkdir(exist_ok=True)
+        iio.imwrite(path, np.full((8, 8), i * 50, dtype=np.uint8))
+        paths.append(str(path))
+    return paths
+
+
+def make_labels(videos):
+    skeleton = sio.Skeleton(["head", "tail"])
+    instance = sio.Instance.from_numpy(
+        np.array([[1.0, 2.0], [3.0, 4.0]]), skeleton=skeleton
+    )
+    frame = sio.LabeledFrame(video=videos[0], frame_idx=0, instances=[instance])
+    return sio.Labels(labeled_frames=[frame], videos=videos, skeletons=[skeleton])
+
+
+@pytest.fixture
+def slp_file(tmp_path, images):
+    videos = [
+        sio.Video(filename="/old/videos/a.mp4", open_backend=False),
+        sio.load_video(images),
+    ]
+    path = tmp_path / "labels.slp"
+    make_labels(videos).save(str(path))
+    return path
+
+
+@pytest.fixture
+def pkg_file(tmp_path, images):
+    path = tmp_path / "labels.pkg.slp"
+    make_labels([sio.load_video(images)]).save(str(path), embed="user", verbose=False)
+    return path
+
+
+class TestCloneFile:
+    def test_copies_contents(self, tmp_path):
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"x" * 100_000)
+
+        clone_file(src, tmp_path / "dst.bin")
+
+        assert (tmp_path / "dst.bin").read_bytes() == src.read_bytes()
+
+    def test_falls_back_to_copy_without_reflink(self, tmp_path):
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"data")
+
+        with patch("fcntl.ioctl", side_effect=OSError("not supported")):
+            reflinked = clone_file(src, tmp_path / "dst.bin")
+
+        assert reflinked is False
+        assert (tmp_path / "dst.bin").read_bytes() == b"data"
+
+
+class TestReadSlpHeader:
+    def test_matches_loaded_videos(self, slp_file):
+        labels = sio.load_file(str(slp_file), open_videos=False)
+
+        header = read_slp_header(slp_file)
+
+        assert [video_entry_path(v, str(slp_file)) for v in header.videos] == [
+            labels.videos[0].filename,
+            labels.videos[1].filename[0],
+        ]
+        assert not any(video_entry_embedded(v) for v in header.videos)
+
+    def test_embedded_video(self, pkg_file):
+        header = read_slp_header(pkg_file)
+
+        assert video_entry_embedded(header.videos[0])
+        assert video_entry_path(header.videos[0], str(pkg_file)) == str(pkg_file)
+
+    def test_reads_provenance(self, tmp_path):
+        labels = make_labels([sio.Video(filename="/a.mp4", open_backend=False)])
+        labels.provenance["source"] = "test"
+        labels.save(str(tmp_path / "p.slp"))
+
+        assert read_slp_header(tmp_path / "p.slp").provenance["source"] == "test"
+
+    def test_not_hdf5_returns_none(self, tmp_path):
+        (tmp_path / "labels.slp").write_text("not hdf5")
+
+        assert read_slp_header(tmp_path / "labels.slp") is None
+
+
+class TestSlpHeaderCache:
+    def test_unchanged_file_is_read_once(self, slp_file):
+        cache = SlpHeaderCache()
+
+        with patch(
+            "sleap_rtc.worker.slp_metadata.read_slp_header",
+            wraps=read_slp_header,
+        ) as read:
+            first = cache.get(str(slp_file))
+            assert cache.get(str(slp_file)) is first
+
+        read.assert_called_once()
+
+    def test_changed_file_is_read_again(self, slp_file):
+        cache = SlpHeaderCache()
+        first = cache.get(str(slp_file))
+        patch_video_paths(
+            slp_file, slp_file.with_name("new.slp"), {"/old/videos/a.mp4": "/b"}
+        )
+        os.replace(slp_file.with_name("new.slp"), slp_file)
+
+        second = cache.get(str(slp_file))
+
+        assert second is not first
+        assert second.videos[0]["filename"] == "/b"
+
+    def test_evicts_least_recently_used(self, tmp_path, slp_file):
+        cache = SlpHeaderCache(max_entries=2)
+        copies = []
+        for i in range(3):
+            copies.append(str(tmp_path / f"copy{i}.slp"))
+            shutil.copyfile(slp_file, copies[-1])
+
+        first = cache.get(copies[0])
+        cache.get(copies[1])
+        cache.get(copies[0])
+        cache.get(copies[2])
+
+        assert len(cache) == 2
+        assert cache.get(copies[0]) is first
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            SlpHeaderCache().get(str(tmp_path / "missing.slp"))
+
+
+class TestPathsExist:
+    def test_checks_each_unique_path(self, tmp_path):
+        (tmp_path / "a").write_text("a")
+        paths = [str(tmp_path / "a"), str(tmp_path / "b"), str(tmp_path / "a")]
+
+        assert paths_exist(paths) == {paths[0]: True, paths[1]: False}
+
+    def test_empty(self):
+        assert paths_exist([]) == {}
+
+
+class TestPatchVideoPaths:
+    def test_replaces_media_and_image_paths(self, tmp_path, slp_file, images):
+        out = tmp_path / "out.slp"
+        filename_map = {
+            "/old/videos/a.mp4": "/a/much/longer/new/location/for/videos/a.mp4",
+            images[1]: "/new/img/1.png",
+        }
+
+        updated = patch_video_paths(slp_file, out, filename_map)
+
+        assert updated == 2
+        labels = sio.load_file(str(out), open_videos=False)
+        assert labels.videos[0].filename == filename_map["/old/videos/a.mp4"]
+        assert labels.videos[1].filename == [images[0], "/new/img/1.png"]
+        assert len(labels) == 1
+        np.testing.assert_array_equal(
+            labels[0].instances[0].numpy(), [[1.0, 2.0], [3.0, 4.0]]
+        )
+
+    def test_matches_replace_filenames(self, tmp_path, slp_file, images):
+        filename_map = {"/old/videos/a.mp4": "/new/a.mp4", images[0]: "/new/0.png"}
+        expected = sio.load_file(str(slp_file), open_videos=False)
+        expected.replace_filenames(filename_map=filename_map, open_videos=False)
+
+        patch_video_paths(slp_file, tmp_path / "out.slp", filename_map)
+
+        labels = sio.load_file(str(tmp_path / "out.slp"), open_videos=False)
+        assert [v.filename for v in labels.videos] == [
+            v.filename for v in expected.videos
+        ]
+
+    def test_original_is_untouched(self, tmp_path, slp_file):
+        before = slp_file.read_bytes()
+
+        patch_video_paths(slp_file, tmp_path / "out.slp", {"/old/videos/a.mp4": "/b"})
+
+        assert slp_file.read_bytes() == before
+
+    def test_embedded_frames_are_kept(self, tmp_path, pkg_file, images):
+        out = tmp_path / "out.pkg.slp"
+
+        updated = patch_video_paths(pkg_file, out, {images[0]: "/new/0.png"})
+
+        assert updated == 0
+        labels = sio.load_file(str(out))
+        assert labels.videos[0].backend.has_embedded_images
+        assert labels.videos[0][0].shape == (8, 8, 1)
+        with h5py.File(pkg_file, "r") as a, h5py.File(out, "r") as b:
+            assert a["video0/video"][:].tobytes() == b["video0/video"][:].tobytes()
+
+    def test_unmapped_videos_leave_metadata_unchanged(self, tmp_path, slp_file):
+        out = tmp_path / "out.slp"
+
+        assert patch_video_paths(slp_file, out, {"/elsewhere.mp4": "/x.mp4"}) == 0
+
+        with h5py.File(slp_file, "r") as a, h5py.File(out, "r") as b:
+            assert list(a["videos_json"][:]) == list(b["videos_json"][:])
+
+    def test_not_hdf5_returns_none(self, tmp_path):
+        src = tmp_path / "labels.slp"
+        src.write_text("not hdf5")
+
+        assert patch_video_paths(src, tmp_path / "out.slp", {}) is None
+        assert not (tmp_path / "out.slp").exists()
+
+    def test_same_output_path_returns_none(self, slp_file):
+        before = slp_file.read_bytes()
+
+        assert (
+            patch_video_paths(slp_file, slp_file, {"/old/videos/a.mp4": "/b"}) is None
+        )
+        assert slp_file.read_bytes() == before
+
+    def test_corrupt_metadata_removes_output(self, tmp_path, slp_file):
+        with h5py.File(slp_file, "r+") as f:
+            del f["videos_json"]
+            f.create_dataset("videos_json", data=[b"{not json"])
+
+        with pytest.raises(json.JSONDecodeError):
+            patch_video_paths(slp_file, tmp_path / "out.slp", {})
+        assert not (tmp_path / "out.slp").exists()
+
+
+class TestCheckVideoAccessibilityHeader:
+    @pytest.fixture
+    def file_manager(self, tmp_path):
+        return FileManager(mounts=[MountConfig(path=str(tmp_path), label="Test")])
+
+    def test_does_not_load_labels(self, file_manager, slp_file, images):
+        with patch("sleap_rtc.worker.file_manager.sio.load_file") as load_file:
+            result = file_manager.check_video_accessibility(str(slp_file))
+
+        load_file.assert_not_called()
+        assert result == {
+            "slp_path": str(slp_file),
+            "total_videos": 2,
+            "missing": [{"filename": "a.mp4", "original_path": "/old/videos/a.mp4"}],
+            "accessible": 1,
+            "embedded": 0,
+        }
+
+    def test_embedded_videos_skipped(self, file_manager, pkg_file):
+        result = file_manager.check_video_accessibility(str(pkg_file))
+
+        assert result["embedded"] == 1
+        assert result["accessible"] == 0
+        assert result["missing"] == []
+
+    def test_repeated_checks_reuse_header(self, file_manager, slp_file, images):
+        file_manager.check_video_accessibility(str(slp_file))
+        os.remove(images[0])
+
+        with patch("sleap_rtc.worker.slp_metadata.h5py.File") as open_file:
+            result = file_manager.check_video_accessibility(str(slp_file))
+
+        open_file.assert_not_called()
+        assert result["accessible"] == 0
+        assert len(result["missing"]) == 2
+
+
+class TestWriteSlpFastPath:
+    @pytest.fixture
+    def file_manager(self, tmp_path):
+        return FileManager(mounts=[MountConfig(path=str(tmp_path), label="Test")])
+
+    def test_does_not_load_labels(self, tmp_path, file_manager, pkg_file, images):
+        (tmp_path / "out").mkdir()
+
+        with patch("sleap_rtc.worker.file_manager.sio.load_file") as load_file:
+            result = file_manager.write_slp_with_new_paths(
+                slp_path=str(pkg_file),
+                output_dir=str(tmp_path / "out"),
+                filename_map={"/old/videos/a.mp4": "/new/a.mp4"},
+            )
+
+        load_file.assert_not_called()
+        assert result["output_path"].endswith(".pkg.slp")
+        assert sio.load_file(result["output_path"]).videos[0][0].shape == (8, 8, 1)
+
+    def test_reports_updated_count(self, tmp_path, file_manager, slp_file):
+        (tmp_path / "out").mkdir()
+
+        result = file_manager.write_slp_with_new_paths(
+            slp_path=str(slp_file),
+            output_dir=str(tmp_path / "out"),
+            filename_map={"/old/videos/a.mp4": "/new/a.mp4"},
+            output_filename="fixed.slp",
+        )
+
+        assert result == {
+            "output_path": str(tmp_path / "out" / "fixed.slp"),
+            "videos_updated": 1,
+        }
+        labels = sio.load_file(result["output_path"], open_videos=False)
+        assert labels.videos[0].filename == "/new/a.mp4"
+
+    def test_falls_back_when_patch_fails(self, tmp_path, file_manager, slp_file):
+        (tmp_path / "out").mkdir()
+
+        with patch(
+            "sleap_rtc.worker.file_manager.patch_video_paths",
+            side_effect=OSError("disk full"),
+        ):
+            result = file_manager.write_slp_with_new_paths(
+                slp_path=str(slp_file),
+                output_dir=str(tmp_path / "out"),
+                filename_map={"/old/videos/a.mp4": "/new/a.mp4"},
+                output_filename="fixed.slp",
+            )
+
+        assert result["videos_updated"] == 1
+        labels = sio.load_file(result["output_path"], open_videos=False)
+        assert labels.videos[0].filename == "/new/a.mp4"
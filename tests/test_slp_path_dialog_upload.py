@@ -0,0 +1,296 @@
+"""Tests for uploads started from SlpPathDialog over the path-check connection."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from sleap_rtc.api import _ChannelSender
+from sleap_rtc.client.hash_cache import HashCache
+from sleap_rtc.compression import codec_offer, decode_chunk
+from sleap_rtc.delta_sync import compute_signature
+from sleap_rtc.gui.widgets import _UploadThread
+from sleap_rtc.protocol import (
+    MSG_FILE_UPLOAD_CHECK,
+    MSG_FILE_UPLOAD_COMPLETE,
+    MSG_FILE_UPLOAD_COPY,
+    MSG_FILE_UPLOAD_DELTA_REQUEST,
+    MSG_FILE_UPLOAD_DELTA_START,
+    MSG_FILE_UPLOAD_END,
+    MSG_FILE_UPLOAD_ERROR,
+    MSG_FILE_UPLOAD_OFFSET,
+    MSG_FILE_UPLOAD_PROGRESS,
+    MSG_FILE_UPLOAD_READY,
+    MSG_FILE_UPLOAD_RESUME,
+    MSG_FILE_UPLOAD_SIGNATURE,
+    MSG_FILE_UPLOAD_STRIPED,
+    MSG_SEPARATOR,
+)
+from sleap_rtc.striping import unpack_frame
+
+
+@pytest.fixture(autouse=True)
+def isolated_hash_cache(tmp_path, monkeypatch):
+    """Keep upload_file's digest cache out of the real home directory."""
+    monkeypatch.setattr(
+        "sleap_rtc.client.hash_cache.default_hash_cache_path",
+        lambda: tmp_path / "hash-cache.json",
+    )
+
+
+@pytest.fixture
+def loop():
+    """Event loop running in a background thread, like the path-check API."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+class FakeWorker:
+    """Data channel whose far end answers upload messages like a worker.
+
+    Args:
+        offset: Bytes the worker already holds of a resumed upload.
+        error: If set, FILE_UPLOAD_CHECK is rejected with this reason.
+        basis: Path of an earlier upload of the file to offer as delta basis.
+        codec: Compression codec to accept for resumed uploads.
+    """
+
+    BLOCK_SIZE = 1024
+
+    def __init__(self, offset=0, error=None, basis=None, codec=None):
+        self.readyState = "open"
+        self.bufferedAmount = 0
+        self.offset = offset
+        self.error = error
+        self.basis = basis
+        self.codec = codec
+        self.messages = []
+        self.data = b""
+        self.chunks = []
+        self.sender = None
+
+    def reply(self, *messages):
+        for message in messages:
+            self.sender.upload_responses.put_nowait(message)
+
+    def send(self, message):
+        if isinstance(message, bytes):
+            self.data += message
+            self.chunks.append(message)
+            return
+        self.messages.append(message)
+        kind = message.split(MSG_SEPARATOR)[0]
+        if kind == MSG_FILE_UPLOAD_CHECK:
+            if self.error:
+                self.reply(f"{MSG_FILE_UPLOAD_ERROR}{MSG_SEPARATOR}{self.error}")
+            else:
+                self.reply(MSG_FILE_UPLOAD_READY)
+        elif kind == MSG_FILE_UPLOAD_DELTA_REQUEST:
+            blocks = (
+                compute_signature(self.basis, self.BLOCK_SIZE) if self.basis else []
+            )
+            page = {
+                "basis": "basis-sha256" if self.basis else None,
+                "block_size": self.BLOCK_SIZE,
+                "total_blocks": len(blocks),
+                "start": 0,
+                "blocks": blocks,
+            }
+            self.reply(f"{MSG_FILE_UPLOAD_SIGNATURE}{MSG_SEPARATOR}{json.dumps(page)}")
+        elif kind in (MSG_FILE_UPLOAD_DELTA_START, MSG_FILE_UPLOAD_STRIPED):
+            self.reply(MSG_FILE_UPLOAD_READY)
+        elif kind == MSG_FILE_UPLOAD_RESUME:
+            reply = f"{MSG_FILE_UPLOAD_OFFSET}{MSG_SEPARATOR}{self.offset}"
+            if self.codec:
+                reply += f"{MSG_SEPARATOR}{self.codec}"
+            self.reply(reply)
+        elif kind == MSG_FILE_UPLOAD_END:
+            total = self.offset + len(self.data)
+            self.reply(
+                f"{MSG_FILE_UPLOAD_PROGRESS}{MSG_SEPARATOR}{total}{MSG_SEPARATOR}{total}",
+                f"{MSG_FILE_UPLOAD_COMPLETE}{MSG_SEPARATOR}/remote/labels.pkg.slp",
+            )
+
+
+class FakeStripe:
+    """Stripe channel that is open from the start and records its frames."""
+
+    def __init__(self, label):
+        self.label = label
+        self.readyState = "open"
+        self.bufferedAmount = 0
+        self.frames = []
+
+    def on(self, event, handler=None):
+        return handler if handler is not None else (lambda f: f)
+
+    def send(self, frame):
+        self.frames.append(frame)
+        self.bufferedAmount += len(frame)
+
+
+class FakePeerConnection:
+    def __init__(self):
+        self.stripes = []
+
+    def createDataChannel(self, label):
+        self.stripes.append(FakeStripe(label))
+        return self.stripes[-1]
+
+
+def make_sender(loop, worker, **kwargs):
+    sender = _ChannelSender(worker, loop, **kwargs)
+    worker.sender = sender
+    return sender
+
+
+class TestChannelSenderUpload:
+    def test_resumes_after_bytes_the_worker_holds(self, loop, tmp_path):
+        data = b"0123456789" * 1000
+        src = tmp_path / "labels.pkg.slp"
+        src.write_bytes(data)
+        worker = FakeWorker(offset=4000)
+        sender = make_sender(loop, worker)
+        progress = []
+
+        path = sender.upload(
+            str(src), "/remote", "0", on_progress=lambda *p: progress.append(p)
+        )
+
+        assert path == "/remote/labels.pkg.slp"
+        assert worker.messages[1].startswith(MSG_FILE_UPLOAD_DELTA_REQUEST)
+        assert worker.messages[2].startswith(MSG_FILE_UPLOAD_RESUME + MSG_SEPARATOR)
+        assert worker.data == data[4000:]
+        assert progress == [(len(data), len(data))]
+        assert sender.upload_responses is None
+
+    def test_sends_only_changed_blocks_of_earlier_upload(self, loop, tmp_path):
+        earlier = bytes(range(256)) * 40
+        basis = tmp_path / "basis.pkg.slp"
+        basis.write_bytes(earlier)
+        src = tmp_path / "labels.pkg.slp"
+        src.write_bytes(earlier[:5120] + b"new labels" + earlier[5120:])
+        worker = FakeWorker(basis=str(basis))
+        sender = make_sender(loop, worker)
+
+        path = sender.upload(str(src), "/remote", "0")
+
+        assert path == "/remote/labels.pkg.slp"
+        kinds = [m.split(MSG_SEPARATOR)[0] for m in worker.messages]
+        assert MSG_FILE_UPLOAD_DELTA_START in kinds
+        assert MSG_FILE_UPLOAD_RESUME not in kinds
+        assert kinds.count(MSG_FILE_UPLOAD_COPY) == 10
+        assert worker.data == b"new labels"
+
+    def test_compresses_chunks_when_worker_accepts_codec(self, loop, tmp_path):
+        data = b"\x00" * (300 * 1024)
+        src = tmp_path / "labels.pkg.slp"
+        src.write_bytes(data)
+        worker = FakeWorker(codec="zlib")
+        sender = make_sender(loop, worker)
+
+        sender.upload(str(src), "/remote", "0")
+
+        assert worker.messages[2].endswith(f"{MSG_SEPARATOR}{codec_offer()}")
+        assert len(worker.data) < len(data) // 10
+        assert b"".join(decode_chunk("zlib", c) for c in worker.chunks) == data
+
+    def test_spreads_upload_across_configured_stripes(self, loop, tmp_path):
+        data = bytes(range(256)) * 1024
+        src = tmp_path / "labels.pkg.slp"
+        src.write_bytes(data)
+        worker = FakeWorker()
+        pc = FakePeerConnection()
+        sender = make_sender(loop, worker, pc=pc, stripes=2)
+
+        sender.upload(str(src), "/remote", "0")
+        sender.upload(str(src), "/remote", "0")
+
+        assert [s.label for s in pc.stripes] == ["stripe-0", "stripe-1"]
+        kinds = [m.split(MSG_SEPARATOR)[0] for m in worker.messages]
+        assert kinds.count(MSG_FILE_UPLOAD_STRIPED) == 2
+        assert MSG_FILE_UPLOAD_RESUME not in kinds
+        assert worker.data == b""
+        received = bytearray(len(data))
+        for stripe in pc.stripes:
+            assert stripe.frames
+            for frame in stripe.frames:
+                offset, payload = unpack_frame(frame)
+                received[offset : offset + len(payload)] = payload
+        assert bytes(received) == data
+
+    def test_reuses_digest_from_hash_cache(self, loop, tmp_path):
+        src = tmp_path / "labels.pkg.slp"
+        src.write_bytes(b"data")
+        cache = HashCache(tmp_path / "gui-cache.json")
+        cache.store(str(src), src.stat(), "cached-sha256")
+        worker = FakeWorker()
+        sender = make_sender(loop, worker, hash_cache=cache)
+
+        sender.upload(str(src), "/remote", "0")
+
+        assert worker.messages[0].split(MSG_SEPARATOR)[1] == "cached-sha256"
+
+    def test_rejection_raises(self, loop, tmp_path):
+        src = tmp_path / "labels.pkg.slp"
+        src.write_bytes(b"data")
+        sender = make_sender(loop, FakeWorker(error="Path outside mounts"))
+
+        with pytest.raises(RuntimeError, match="Path outside mounts"):
+            sender.upload(str(src), "/remote", "0")
+
+
+class TestUploadThread:
+    def make_thread(self, send_fn):
+        thread = _UploadThread(
+            send_fn=send_fn,
+            local_path="/local/labels.pkg.slp",
+            dest_dir="/remote",
+            create_subdir="1",
+            response_queue=MagicMock(),
+        )
+        self.events = []
+        thread.progress.connect(lambda *p: self.events.append(("progress", p)))
+        thread.complete.connect(lambda path: self.events.append(("complete", path)))
+        thread.error.connect(lambda reason: self.events.append(("error", reason)))
+        return thread
+
+    def test_hands_upload_to_sender(self):
+        class Sender:
+            def __call__(self, message):
+                raise AssertionError("protocol must not be driven by the thread")
+
+            def upload(self, local_path, dest_dir, create_subdir, on_progress):
+                assert (local_path, dest_dir, create_subdir) == (
+                    "/local/labels.pkg.slp",
+                    "/remote",
+                    "1",
+                )
+                on_progress(5, 10)
+                return "/remote/sleap_rtc_downloads/labels.pkg.slp"
+
+        self.make_thread(Sender()).run()
+
+        assert self.events == [
+            ("progress", (5, 10)),
+            ("complete", "/remote/sleap_rtc_downloads/labels.pkg.slp"),
+        ]
+
+    def test_reports_upload_failure(self):
+        class Sender:
+            def __call__(self, message):
+                pass
+
+            def upload(self, *args, **kwargs):
+                raise RuntimeError("Upload failed: disk full")
+
+        self.make_thread(Sender()).run()
+
+        assert self.events == [("error", "Upload failed: disk full")]
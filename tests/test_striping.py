@@ -0,0 +1,150 @@
+"""Tests for striped transfers across multiple data channels."""
+
+import asyncio
+import io
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from sleap_rtc.striping import (
+    StripeReassembler,
+    is_stripe_channel,
+    pack_frame,
+    send_striped,
+    unpack_frame,
+)
+
+
+def fake_stripe(label: str = "stripe-0", buffered: int = 0) -> MagicMock:
+    ch = MagicMock()
+    ch.label = label
+    ch.readyState = "open"
+    ch.bufferedAmount = buffered
+    return ch
+
+
+class TestFrames:
+    def test_round_trip(self):
+        offset, payload = unpack_frame(pack_frame(2**40, b"abc"))
+        assert offset == 2**40
+        assert bytes(payload) == b"abc"
+
+    def test_short_frame_rejected(self):
+        with pytest.raises(ValueError):
+            unpack_frame(b"\x00\x01")
+
+    def test_is_stripe_channel(self):
+        assert is_stripe_channel(fake_stripe("stripe-3"))
+        assert not is_stripe_channel(fake_stripe("training"))
+
+
+class TestSendStriped:
+    @pytest.mark.asyncio
+    async def test_spreads_frames_across_channels(self):
+        data = os.urandom(10 * 1024)
+        channels = [fake_stripe(f"stripe-{i}") for i in range(3)]
+
+        def track(ch):
+            def send(frame):
+                ch.bufferedAmount += len(frame)
+
+            return send
+
+        for ch in channels:
+            ch.send.side_effect = track(ch)
+
+        sent = await send_striped(channels, io.BytesIO(data), chunk_size=1024)
+
+        assert sent == len(data)
+        frames = [c[0][0] for ch in channels for c in ch.send.call_args_list]
+        assert all(ch.send.call_count >= 3 for ch in channels)
+        rebuilt = bytearray(len(data))
+        for frame in frames:
+            offset, payload = unpack_frame(frame)
+            rebuilt[offset : offset + len(payload)] = payload
+        assert bytes(rebuilt) == data
+
+    @pytest.mark.asyncio
+    async def test_skips_closed_channels(self):
+        closed = fake_stripe("stripe-0")
+        closed.readyState = "closed"
+        live = fake_stripe("stripe-1")
+
+        await send_striped([closed, live], io.BytesIO(b"x" * 100), chunk_size=10)
+
+        closed.send.assert_not_called()
+        assert live.send.call_count == 10
+
+    @pytest.mark.asyncio
+    async def test_all_closed_raises(self):
+        ch = fake_stripe()
+        ch.readyState = "closed"
+
+        with pytest.raises(ConnectionError):
+            await send_striped([ch], io.BytesIO(b"data"))
+
+    @pytest.mark.asyncio
+    async def test_offset_and_length(self):
+        ch = fake_stripe()
+
+        await send_striped([ch], io.BytesIO(b"0123456789"), offset=2, length=5)
+
+        offset, payload = unpack_frame(ch.send.call_args[0][0])
+        assert (offset, bytes(payload)) == (2, b"23456")
+
+
+class TestStripeReassembler:
+    @pytest.mark.asyncio
+    async def test_out_of_order_frames(self, tmp_path):
+        target = tmp_path / "out.bin"
+        with open(target, "wb") as fh:
+            r = StripeReassembler(fh.fileno(), 9)
+            r.write_frame(pack_frame(6, b"ghi"))
+            r.write_frame(pack_frame(0, b"abc"))
+            assert not await r.wait(timeout=0.01)
+            r.write_frame(pack_frame(3, b"def"))
+            assert await r.wait(timeout=0.01)
+
+        assert target.read_bytes() == b"abcdefghi"
+
+    def test_frame_past_end_rejected(self, tmp_path):
+        with open(tmp_path / "out.bin", "wb") as fh:
+            r = StripeReassembler(fh.fileno(), 4)
+            with pytest.raises(ValueError):
+                r.write_frame(pack_frame(2, b"abc"))
+
+    @pytest.mark.asyncio
+    async def test_empty_file_is_complete(self, tmp_path):
+        with open(tmp_path / "out.bin", "wb") as fh:
+            assert await StripeReassembler(fh.fileno(), 0).wait(timeout=0.01)
+
+
+class TestTransferStripesConfig:
+    def test_default_off(self, monkeypatch):
+        from sleap_rtc.config import Config
+
+        monkeypatch.delenv("SLEAP_RTC_TRANSFER_STRIPES", raising=False)
+        assert Config().get_transfer_stripes() == 0
+
+    def test_from_config_file(self, monkeypatch):
+        from sleap_rtc.config import Config
+
+        monkeypatch.delenv("SLEAP_RTC_TRANSFER_STRIPES", raising=False)
+        cfg = Config()
+        cfg._config_data = {"transfer": {"stripes": 4}}
+        assert cfg.get_transfer_stripes() == 4
+
+    def test_env_overrides_file(self, monkeypatch):
+        from sleap_rtc.config import Config
+
+        monkeypatch.setenv("SLEAP_RTC_TRANSFER_STRIPES", "2")
+        cfg = Config()
+        cfg._config_data = {"transfer": {"stripes": 4}}
+        assert cfg.get_transfer_stripes() == 2
+
+    def test_invalid_value_disables(self, monkeypatch):
+        from sleap_rtc.config import Config
+
+        monkeypatch.setenv("SLEAP_RTC_TRANSFER_STRIPES", "many")
+        assert Config().get_transfer_stripes() == 0
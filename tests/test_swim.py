@@ -0,0 +1,197 @@
+"""Tests for SWIM failure detection in the worker mesh."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sleap_rtc.worker.mesh_messages import (
+    create_heartbeat,
+    deserialize_message,
+    serialize_message,
+)
+from sleap_rtc.worker.swim import ALIVE, DEAD, SUSPECT, SWIM_VERSION, SwimMembership
+from sleap_rtc.worker.worker_class import RTCWorkerClient
+
+
+class Mesh:
+    """Fully connected room of SWIM nodes over an in-memory network."""
+
+    def __init__(self, size, **kwargs):
+        self.nodes = {}
+        self.failures = {}
+        self.down = set()
+        self.cut = set()  # (sender, receiver) links that drop messages
+        self.sent = []
+        self._tasks = set()
+        for i in range(size):
+            peer_id = f"w{i}"
+            self.failures[peer_id] = []
+            self.nodes[peer_id] = SwimMembership(
+                send=lambda to, message, sender=peer_id: self.deliver(
+                    sender, to, message
+                ),
+                on_failure=self._recorder(peer_id),
+                local_id=peer_id,
+                probe_interval=0.05,
+                probe_timeout=0.02,
+                **kwargs,
+            )
+        for node in self.nodes.values():
+            for peer_id in self.nodes:
+                node.add_member(peer_id)
+
+    def _recorder(self, peer_id):
+        async def on_failure(failed):
+            self.failures[peer_id].append(failed)
+
+        return on_failure
+
+    def deliver(self, sender, to, message):
+        self.sent.append((sender, to, message.type))
+        if {sender, to} & self.down or (sender, to) in self.cut:
+            return
+        received = deserialize_message(serialize_message(message))
+        task = asyncio.create_task(self.nodes[to].handle_message(received, sender))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def cut_link(self, a, b):
+        self.cut |= {(a, b), (b, a)}
+
+    async def run(self, until, timeout=3.0):
+        """Run rounds on the live nodes until a condition holds."""
+        tasks = [
+            asyncio.create_task(node.run())
+            for peer_id, node in self.nodes.items()
+            if peer_id not in self.down
+        ]
+        try:
+            for _ in range(int(timeout / 0.01)):
+                if until():
+                    return True
+                await asyncio.sleep(0.01)
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class TestSwimProbing:
+    async def test_direct_ack(self):
+        mesh = Mesh(2)
+
+        assert await mesh.nodes["w0"].probe_round() is True
+        assert [m[2] for m in mesh.sent] == ["swim_ping", "swim_ack"]
+
+    async def test_indirect_probe_avoids_suspicion(self):
+        mesh = Mesh(3)
+        mesh.cut_link("w0", "w1")
+        node = mesh.nodes["w0"]
+        node._probe_order = ["w1"]
+
+        assert await node.probe_round() is True
+        assert node.members["w1"].state == ALIVE
+        assert ("w0", "w2", "swim_ping_req") in mesh.sent
+
+    async def test_unreachable_peer_suspected(self):
+        mesh = Mesh(3)
+        mesh.down.add("w1")
+        node = mesh.nodes["w0"]
+        node._probe_order = ["w1"]
+
+        assert await node.probe_round() is False
+        assert node.members["w1"].state == SUSPECT
+        assert mesh.failures["w0"] == []
+
+    async def test_round_robin_probes_every_peer(self):
+        mesh = Mesh(5)
+        node = mesh.nodes["w0"]
+        targets = [node._next_target() for _ in range(8)]
+
+        assert sorted(targets[:4]) == ["w1", "w2", "w3", "w4"]
+        assert sorted(targets[4:]) == ["w1", "w2", "w3", "w4"]
+
+    async def test_round_message_load_is_linear(self):
+        mesh = Mesh(30)
+        await asyncio.gather(*(node.probe_round() for node in mesh.nodes.values()))
+
+        # One ping and one ack per worker, not one heartbeat per pair
+        assert len(mesh.sent) == 60
+
+
+class TestSwimMembership:
+    async def test_failure_confirmed_and_disseminated(self):
+        mesh = Mesh(5)
+        mesh.down.add("w4")
+        live = [p for p in mesh.nodes if p != "w4"]
+
+        assert await mesh.run(lambda: all(mesh.failures[p] for p in live))
+        for peer_id in live:
+            assert mesh.failures[peer_id] == ["w4"]
+            assert mesh.nodes[peer_id].members["w4"].state == DEAD
+
+    async def test_suspected_peer_refutes(self):
+        mesh = Mesh(3)
+        mesh.nodes["w0"]._suspect("w1")
+
+        # w1 hears the rumour with the next message from w0 and refutes it
+        assert await mesh.run(
+            lambda: mesh.nodes["w0"].members["w1"].state == ALIVE, timeout=1.0
+        )
+        assert mesh.nodes["w1"].incarnation == 1
+        assert mesh.nodes["w0"].members["w1"].incarnation == 1
+        assert not any(mesh.failures.values())
+
+    async def test_dead_peer_not_revived_by_gossip(self):
+        mesh = Mesh(2)
+        node = mesh.nodes["w0"]
+        await node._apply({"peer_id": "w1", "state": DEAD, "incarnation": 0})
+        await node._apply({"peer_id": "w1", "state": ALIVE, "incarnation": 5})
+
+        assert node.members["w1"].state == DEAD
+        assert node._next_target() is None
+        assert node.add_member("w1") is True
+        assert node.members["w1"].state == ALIVE
+
+
+class TestWorkerSwim:
+    @pytest.fixture
+    def worker(self):
+        worker = RTCWorkerClient()
+        worker.peer_id = "me"
+        return worker
+
+    async def test_heartbeat_advertising_swim_moves_peer_to_swim(self, worker):
+        await worker._handle_heartbeat(create_heartbeat("new", 1, swim=1), "new")
+        await worker._handle_heartbeat(create_heartbeat("old", 1), "old")
+
+        assert worker.swim.is_member("new")
+        assert not worker.swim.is_member("old")
+        assert list(worker.last_heartbeat) == ["old"]
+
+    async def test_heartbeats_only_sent_to_legacy_peers(self, worker):
+        worker.worker_connections = {"new": MagicMock(), "old": MagicMock()}
+        worker.swim.add_member("new")
+        worker._send_mesh_message_to_peer = MagicMock()
+        worker.shutting_down = False
+
+        task = asyncio.create_task(worker._heartbeat_loop())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        (peer_id, message), _ = worker._send_mesh_message_to_peer.call_args
+        assert worker._send_mesh_message_to_peer.call_count == 1
+        assert peer_id == "old"
+        assert message.swim == SWIM_VERSION
+
+    async def test_confirmed_admin_failure_triggers_failover(self, worker):
+        worker.worker_connections = {"admin": MagicMock()}
+        worker.admin_peer_id = "admin"
+        worker._handle_admin_disconnect = AsyncMock()
+        worker.swim.add_member("admin")
+        await worker.swim._apply({"peer_id": "admin", "state": DEAD, "incarnation": 0})
+
+        worker._handle_admin_disconnect.assert_awaited_once_with("admin")
@@ -0,0 +1,110 @@
+"""Tests for low-overhead data-channel message tracing."""
+
+import logging
+
+import pytest
+
+from sleap_rtc.tracing import MessageTracer, message_type
+
+
+class Unprintable(bytes):
+    """Binary payload that fails the test if it is ever stringified."""
+
+    def __str__(self):
+        raise AssertionError("binary payload stringified")
+
+    __repr__ = __str__
+
+
+@pytest.fixture
+def tracer_logs(caplog):
+    caplog.set_level(logging.INFO, logger="trace-test")
+    return caplog
+
+
+def make_tracer(**kwargs):
+    return MessageTracer(
+        "Worker", logger=logging.getLogger("trace-test"), level=logging.INFO, **kwargs
+    )
+
+
+class TestMessageType:
+    def test_types(self):
+        assert message_type(b"\x00" * 10) == "binary"
+        assert message_type("FS_LIST_DIR::/data::0") == "FS_LIST_DIR"
+        assert message_type("AUTH_SUCCESS") == "AUTH_SUCCESS"
+        assert message_type("some free-form log text") == "text"
+
+
+class TestMessageTracer:
+    def test_binary_logged_by_size_only(self, tracer_logs):
+        tracer = make_tracer(mode="all")
+
+        tracer.trace(Unprintable(b"x" * 65536))
+
+        assert "<65536 bytes>" in tracer_logs.text
+        assert tracer.binary_bytes == 65536
+
+    def test_per_type_sampling(self, tracer_logs):
+        tracer = make_tracer(sample_every=2, type_sample_every={"binary": 100})
+
+        for _ in range(250):
+            tracer.trace(b"chunk")
+        for _ in range(4):
+            tracer.trace("JOB_LOG::line")
+
+        lines = [r.getMessage() for r in tracer_logs.records]
+        assert sum("binary" in line for line in lines) == 3
+        assert sum("JOB_LOG" in line for line in lines) == 2
+        assert tracer.counts == {"binary": 250, "JOB_LOG": 4}
+
+    def test_count_mode_logs_nothing(self, tracer_logs):
+        tracer = make_tracer(mode="count")
+
+        tracer.trace("JOB_LOG::line")
+        tracer.trace(b"chunk")
+
+        assert tracer_logs.records == []
+        assert tracer.summary() == "JOB_LOG=1, binary=1, binary_bytes=5"
+
+    def test_no_formatting_when_level_disabled(self):
+        tracer = MessageTracer("Client", logger=logging.getLogger("trace-test"))
+        logging.getLogger("trace-test").setLevel(logging.INFO)
+
+        tracer.trace(Unprintable(b"x" * 10))
+
+        assert tracer.counts["binary"] == 1
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            MessageTracer("Worker", mode="verbose")
+
+
+class TestMessageTraceConfig:
+    def test_defaults(self, monkeypatch):
+        from sleap_rtc.config import Config
+
+        monkeypatch.delenv("SLEAP_RTC_TRACE", raising=False)
+        monkeypatch.delenv("SLEAP_RTC_TRACE_SAMPLE", raising=False)
+
+        settings = Config().get_message_trace()
+
+        assert settings["mode"] == "sample"
+        assert settings["sample_every"] == 1
+        assert settings["type_sample_every"]["binary"] > 1
+
+    def test_env_overrides_file(self, monkeypatch):
+        from sleap_rtc.config import Config
+
+        monkeypatch.setenv("SLEAP_RTC_TRACE", "count")
+        monkeypatch.delenv("SLEAP_RTC_TRACE_SAMPLE", raising=False)
+        cfg = Config()
+        cfg._config_data = {
+            "trace": {"mode": "all", "sample_every": 10, "types": {"binary": 5}}
+        }
+
+        settings = cfg.get_message_trace()
+
+        assert settings["mode"] == "count"
+        assert settings["sample_every"] == 10
+        assert settings["type_sample_every"]["binary"] == 5
@@ -0,0 +1,68 @@
+"""Tests for the TUI WebRTC bridge's streamed directory listings."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from sleap_rtc.protocol import MSG_FS_ERROR, MSG_FS_LIST_RESPONSE, MSG_SEPARATOR
+from sleap_rtc.tui.bridge import WebRTCBridge
+
+
+def page(offset, names, has_more, next_offset=None):
+    data = {"entries": [{"name": n} for n in names], "has_more": has_more}
+    data["offset"] = offset
+    if next_offset is not None:
+        data["next_offset"] = next_offset
+    return f"{MSG_FS_LIST_RESPONSE}{MSG_SEPARATOR}{json.dumps(data)}"
+
+
+@pytest.fixture
+def bridge():
+    bridge = WebRTCBridge(room_id="room", token="token")
+    bridge.data_channel = MagicMock()
+    bridge.data_channel.readyState = "open"
+    return bridge
+
+
+async def deliver(bridge, *messages):
+    await asyncio.sleep(0)
+    for message in messages:
+        await bridge._handle_message(message)
+
+
+class TestListDirStream:
+    @pytest.mark.asyncio
+    async def test_pages_delivered_until_last(self, bridge):
+        pages = []
+        task = asyncio.create_task(
+            bridge.list_dir_stream("/data", pages.append, max_entries=10)
+        )
+        await deliver(
+            bridge,
+            page(0, ["a", "b"], True, next_offset=2),
+            page(2, ["c"], False, next_offset=3),
+        )
+
+        assert await task is True
+        assert [len(p["entries"]) for p in pages] == [2, 1]
+        sent = bridge.data_channel.send.call_args[0][0]
+        assert sent.split(MSG_SEPARATOR)[1:4] == ["/data", "0", "10"]
+
+    @pytest.mark.asyncio
+    async def test_old_worker_single_page_ends_stream(self, bridge):
+        pages = []
+        task = asyncio.create_task(bridge.list_dir_stream("/data", pages.append))
+        await deliver(bridge, page(0, ["a"], True))
+
+        assert await task is True
+        assert len(pages) == 1
+
+    @pytest.mark.asyncio
+    async def test_error_fails_stream(self, bridge):
+        task = asyncio.create_task(bridge.list_dir_stream("/etc", lambda p: None))
+        await deliver(bridge, f"{MSG_FS_ERROR}{MSG_SEPARATOR}ACCESS_DENIED")
+
+        assert await task is False
+        assert bridge._list_stream is None
@@ -0,0 +1,210 @@
+"""Tests for the TUI's client-side listing cache and prefetching."""
+
+import pytest
+from textual.app import App
+
+from sleap_rtc.tui.listing_cache import ListingCache
+from sleap_rtc.tui.widgets import miller as miller_module
+from sleap_rtc.tui.widgets.miller import MillerColumns
+
+
+def page(names, offset=0, has_more=False, mtime_ns=1, total=None):
+    entries = [{"name": n, "type": "directory"} for n in names]
+    return {
+        "entries": entries,
+        "total_count": total if total is not None else offset + len(entries),
+        "has_more": has_more,
+        "offset": offset,
+        "next_offset": offset + len(entries),
+        "cursor": "c1",
+        "mtime_ns": mtime_ns,
+    }
+
+
+class TestListingCache:
+    def test_pages_extend_listing(self):
+        cache = ListingCache()
+        cache.store_page("w", "/d", page(["a", "b"], has_more=True, total=3), True)
+        cache.store_page("w", "/d", page(["c"], offset=2), False)
+
+        listing = cache.get("w", "/d")
+        assert [e["name"] for e in listing.entries] == ["a", "b", "c"]
+        assert listing.has_more is False
+        assert listing.mtime_ns == 1
+
+    def test_discontinuous_page_dropped(self):
+        cache = ListingCache()
+        cache.store_page("w", "/d", page(["a"], has_more=True, total=9), True)
+        cache.store_page("w", "/d", page(["x"], offset=5), False)
+
+        assert len(cache.get("w", "/d").entries) == 1
+
+    def test_keyed_by_worker(self):
+        cache = ListingCache()
+        cache.store_page("w1", "/d", page(["a"]), True)
+
+        assert cache.get("w2", "/d") is None
+        cache.invalidate("w1")
+        assert cache.get("w1", "/d") is None
+
+    def test_errors_not_cached(self):
+        cache = ListingCache()
+        cache.store_page("w", "/d", {"error": "Access denied"}, True)
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ListingCache(max_listings=2)
+        for path in ("/a", "/b"):
+            cache.store_page("w", path, page(["x"]), True)
+        cache.get("w", "/a")
+        cache.store_page("w", "/c", page(["x"]), True)
+
+        assert cache.get("w", "/b") is None
+        assert cache.get("w", "/a") is not None
+
+    def test_revalidate_by_mtime(self):
+        cache = ListingCache(fresh_for=0)
+        cache.store_page("w", "/d", page(["a"], mtime_ns=5), True)
+        listing = cache.get("w", "/d")
+
+        assert cache.is_fresh(listing) is False
+        assert cache.revalidate(listing, page(["a"], mtime_ns=6)) is False
+        assert cache.revalidate(listing, {"entries": []}) is False
+        assert cache.revalidate(listing, page(["a"], mtime_ns=5)) is True
+
+
+class FakeWorker:
+    """Directory tree served page by page, recording requests."""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.mtimes = {path: 1 for path in tree}
+        self.fetches = []
+        self.streams = []
+
+    def listing(self, path):
+        return page(self.tree[path], mtime_ns=self.mtimes[path])
+
+    async def fetch(self, path, offset):
+        self.fetches.append(path)
+        return self.listing(path)
+
+    async def stream(self, path, offset, cursor, on_page):
+        self.streams.append(path)
+        on_page(self.listing(path))
+        return True
+
+
+class Harness(App):
+    def __init__(self, widget):
+        super().__init__()
+        self.widget = widget
+
+    def compose(self):
+        yield self.widget
+
+
+@pytest.fixture
+def worker():
+    return FakeWorker(
+        {
+            "/": ["a", "b", "c", "d"],
+            "/a": ["a1"],
+            "/b": ["b1"],
+            "/c": ["c1"],
+            "/d": ["d1"],
+        }
+    )
+
+
+def columns(worker, cache, prefetch=False):
+    widget = MillerColumns(
+        fetch_directory=worker.fetch,
+        stream_directory=worker.stream,
+        listing_cache=cache,
+        can_prefetch=lambda: prefetch,
+    )
+    widget.worker_id = "w"
+    return widget
+
+
+async def open_dir(pilot, widget, path):
+    widget._load_column(1, path)
+    await pilot.pause()
+
+
+class TestMillerListingCache:
+    async def test_reopened_directory_served_from_cache(self, worker):
+        widget = columns(worker, ListingCache())
+        async with Harness(widget).run_test() as pilot:
+            await open_dir(pilot, widget, "/a")
+            await open_dir(pilot, widget, "/b")
+            await open_dir(pilot, widget, "/a")
+
+            assert worker.streams == ["/a", "/b"]
+            assert worker.fetches == []
+            assert [e.name for e in widget.columns[1].entries] == ["a1"]
+
+    async def test_stale_unchanged_listing_revalidated(self, worker):
+        widget = columns(worker, ListingCache(fresh_for=0))
+        async with Harness(widget).run_test() as pilot:
+            await open_dir(pilot, widget, "/a")
+            await open_dir(pilot, widget, "/a")
+
+            assert worker.streams == ["/a"]
+            assert worker.fetches == ["/a"]
+
+    async def test_stale_changed_listing_replaced(self, worker):
+        widget = columns(worker, ListingCache(fresh_for=0))
+        async with Harness(widget).run_test() as pilot:
+            await open_dir(pilot, widget, "/a")
+            worker.tree["/a"] = ["a1", "a2"]
+            worker.mtimes["/a"] = 2
+            await open_dir(pilot, widget, "/a")
+
+            assert [e.name for e in widget.columns[1].entries] == ["a1", "a2"]
+            assert widget.listing_cache.get("w", "/a").mtime_ns == 2
+
+    async def test_refresh_bypasses_cache(self, worker):
+        widget = columns(worker, ListingCache())
+        async with Harness(widget).run_test() as pilot:
+            await open_dir(pilot, widget, "/a")
+            widget.active_column = 1
+            widget.refresh_current()
+            await pilot.pause()
+
+            assert worker.streams == ["/a", "/a"]
+
+    async def test_highlight_prefetches_child_and_siblings(self, worker, monkeypatch):
+        monkeypatch.setattr(miller_module, "PREFETCH_DELAY", 0)
+        monkeypatch.setattr(miller_module, "PREFETCH_SIBLINGS", 1)
+        widget = columns(worker, ListingCache(), prefetch=True)
+        async with Harness(widget).run_test() as pilot:
+            widget.load_root()
+            await pilot.pause()
+            root = widget.columns[0]
+            root.index = 1  # "b"
+            widget._schedule_prefetch(root)
+            await pilot.pause(0.05)
+
+            # The highlighted directory is streamed, its neighbours get a page
+            assert "/b" in worker.streams
+            assert sorted(worker.fetches) == ["/a", "/c"]
+
+            await open_dir(pilot, widget, "/b")
+            assert worker.streams.count("/b") == 1
+            assert [e.name for e in widget.columns[1].entries] == ["b1"]
+
+    async def test_no_prefetch_without_concurrency(self, worker, monkeypatch):
+        monkeypatch.setattr(miller_module, "PREFETCH_DELAY", 0)
+        widget = columns(worker, ListingCache(), prefetch=False)
+        async with Harness(widget).run_test() as pilot:
+            widget.load_root()
+            await pilot.pause()
+            widget.columns[0].index = 0
+            widget._schedule_prefetch(widget.columns[0])
+            await pilot.pause(0.05)
+
+            assert worker.streams == ["/"]
+            assert len(widget.listing_cache) == 1
@@ -0,0 +1,97 @@
+"""Tests for the persistent content-addressed upload store."""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from sleap_rtc.worker.upload_store import UploadStore
+
+
+def sha256_of(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UploadStore(str(tmp_path / "cache"), max_bytes=1024)
+
+
+def upload(tmp_path, name: str, data: bytes):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return sha256_of(data), path
+
+
+class TestUploadStore:
+    def test_add_links_blob_and_records_path(self, store, tmp_path):
+        sha, path = upload(tmp_path, "labels.slp", b"data")
+
+        store.add(sha, path, "labels.slp")
+
+        blob = store.blob_path(sha)
+        assert blob.read_bytes() == b"data"
+        assert blob.parent.name == sha[:2]
+        assert os.path.samefile(blob, path)
+        assert store.find_placed_path(sha) == str(path)
+
+    def test_index_survives_new_instance(self, store, tmp_path):
+        sha, path = upload(tmp_path, "labels.slp", b"data")
+        store.add(sha, path, "labels.slp")
+
+        reopened = UploadStore(str(store.root), max_bytes=1024)
+
+        assert reopened.contains(sha)
+        assert reopened.find_placed_path(sha) == str(path)
+        assert reopened.find_by_name("labels.slp") == [sha]
+
+    def test_deleted_placement_not_returned(self, store, tmp_path):
+        sha, path = upload(tmp_path, "labels.slp", b"data")
+        store.add(sha, path, "labels.slp")
+        path.unlink()
+
+        assert store.find_placed_path(sha) is None
+        assert store.contains(sha)
+
+    def test_place_into_new_destination(self, store, tmp_path):
+        sha, path = upload(tmp_path, "labels.slp", b"data")
+        store.add(sha, path, "labels.slp")
+        path.unlink()
+        dest = tmp_path / "elsewhere.slp"
+
+        assert store.place(sha, dest)
+
+        assert dest.read_bytes() == b"data"
+        assert store.find_placed_path(sha) == str(dest)
+
+    def test_place_unknown_hash(self, store, tmp_path):
+        assert not store.place("0" * 64, tmp_path / "x")
+
+    def test_blob_modified_in_place_is_dropped(self, store, tmp_path):
+        sha, path = upload(tmp_path, "labels.slp", b"data")
+        store.add(sha, path, "labels.slp")
+        # Writing through the hard link changes the blob too.
+        with open(path, "ab") as fh:
+            fh.write(b"more")
+
+        assert not store.contains(sha)
+        assert not store.blob_path(sha).exists()
+
+    def test_lru_eviction_by_total_bytes(self, store, tmp_path):
+        old_sha, old = upload(tmp_path, "old.slp", b"a" * 600)
+        store.add(old_sha, old, "old.slp")
+        time.sleep(0.01)
+        new_sha, new = upload(tmp_path, "new.slp", b"b" * 600)
+
+        store.add(new_sha, new, "new.slp")
+
+        assert not store.contains(old_sha)
+        assert store.contains(new_sha)
+        # The placed file itself is a separate link and survives eviction.
+        assert old.read_bytes() == b"a" * 600
+
+    def test_corrupt_index_starts_empty(self, store):
+        (store.root / UploadStore.INDEX_NAME).write_text("{not json")
+
+        assert store.find_by_name("labels.slp") == []
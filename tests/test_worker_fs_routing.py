@@ -248,3 +248,152 @@ class TestUnknownMessage:
         assert response.startswith(MSG_FS_ERROR)
         parts = response.split(MSG_SEPARATOR)
         assert parts[1] == FS_ERROR_INVALID_REQUEST
+
+
+class TestHandleFsMessageAsync:
+    """Tests for FS handling on the worker's FS thread pool."""
+
+    @pytest.mark.asyncio
+    async def test_matches_sync_handler(self, worker_with_mount, temp_mount):
+        message = f"{MSG_FS_LIST_DIR}{MSG_SEPARATOR}{temp_mount}{MSG_SEPARATOR}0"
+
+        response = await worker_with_mount.handle_fs_message_async(message, "client")
+
+        assert response == worker_with_mount.handle_fs_message(message)
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_fs_error(self, worker_with_mount, monkeypatch):
+        import time
+
+        from sleap_rtc.protocol import FS_ERROR_TIMEOUT
+
+        worker_with_mount.fs_service.timeout = 0.05
+        monkeypatch.setattr(
+            worker_with_mount, "handle_fs_message", lambda m: time.sleep(0.3)
+        )
+
+        response = await worker_with_mount.handle_fs_message_async(
+            MSG_FS_GET_INFO, "client"
+        )
+
+        assert response.startswith(f"{MSG_FS_ERROR}{MSG_SEPARATOR}{FS_ERROR_TIMEOUT}")
+
+
+class TestHandleFsRefreshIndex:
+    """Tests for FS_REFRESH_INDEX message handling."""
+
+    def test_without_index(self, worker_with_mount):
+        response = worker_with_mount.handle_fs_message("FS_REFRESH_INDEX")
+
+        assert response == 'FS_REFRESH_INDEX_RESPONSE::{"refreshing": false}'
+
+    def test_requests_rescan(self, worker_with_mount, temp_mount):
+        from sleap_rtc.worker.filename_index import FilenameIndex
+
+        index = FilenameIndex([str(temp_mount)])
+        worker_with_mount.file_manager.filename_index = index
+
+        response = worker_with_mount.handle_fs_message("FS_REFRESH_INDEX")
+
+        assert response == 'FS_REFRESH_INDEX_RESPONSE::{"refreshing": true}'
+        assert index._wake.is_set()
+
+
+class TestSlpVideoCheck:
+    """Tests for the video check that follows an accepted worker path."""
+
+    def test_checks_given_path(self, worker_with_mount, temp_mount, monkeypatch):
+        checked = []
+        monkeypatch.setattr(
+            worker_with_mount.file_manager,
+            "check_video_accessibility",
+            lambda path: checked.append(path) or {"missing": []},
+        )
+        # Another request's path, accepted after this one's
+        worker_with_mount.worker_input_path = str(temp_mount / "fly_tracking.slp")
+
+        worker_with_mount._check_slp_videos_if_needed(str(temp_mount / "fly.slp"))
+
+        assert checked == [str(temp_mount / "fly.slp")]
+
+    def test_skips_non_slp(self, worker_with_mount, temp_mount):
+        assert worker_with_mount._check_slp_videos_if_needed(str(temp_mount)) is None
+
+
+class TestStreamFsListing:
+    """Tests for streamed FS_LIST_DIR pages."""
+
+    @staticmethod
+    def make_channel():
+        from unittest.mock import MagicMock
+
+        channel = MagicMock()
+        channel.readyState = "open"
+        return channel
+
+    @staticmethod
+    def pages(channel):
+        return [
+            json.loads(c[0][0].split(MSG_SEPARATOR, 1)[1])
+            for c in channel.send.call_args_list
+        ]
+
+    @pytest.mark.asyncio
+    async def test_streams_pages_until_max_entries(
+        self, worker_with_mount, temp_mount, monkeypatch
+    ):
+        for i in range(10):
+            (temp_mount / f"frame{i:03d}.png").write_text("x")
+        monkeypatch.setattr(worker_with_mount.file_manager, "LIST_PAGE_MAX", 4)
+        channel = self.make_channel()
+        message = MSG_SEPARATOR.join([MSG_FS_LIST_DIR, str(temp_mount), "1", "9"])
+
+        await worker_with_mount.stream_fs_listing(message, channel, "client")
+
+        pages = self.pages(channel)
+        assert [(p["offset"], len(p["entries"])) for p in pages] == [
+            (1, 4),
+            (5, 4),
+            (9, 1),
+        ]
+        assert len({p["cursor"] for p in pages}) == 1
+
+    @pytest.mark.asyncio
+    async def test_stops_at_end_of_listing(self, worker_with_mount, temp_mount):
+        channel = self.make_channel()
+        message = MSG_SEPARATOR.join([MSG_FS_LIST_DIR, str(temp_mount), "0", "1000"])
+
+        await worker_with_mount.stream_fs_listing(message, channel, "client")
+
+        pages = self.pages(channel)
+        assert len(pages) == 1
+        assert pages[0]["has_more"] is False
+        assert len(pages[0]["entries"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_without_max_entries_sends_one_page(
+        self, worker_with_mount, temp_mount
+    ):
+        for i in range(30):
+            (temp_mount / f"frame{i:03d}.png").write_text("x")
+        channel = self.make_channel()
+        message = f"{MSG_FS_LIST_DIR}{MSG_SEPARATOR}{temp_mount}{MSG_SEPARATOR}0"
+
+        await worker_with_mount.stream_fs_listing(message, channel, "client")
+
+        pages = self.pages(channel)
+        assert len(pages) == 1
+        assert len(pages[0]["entries"]) == 20
+        assert pages[0]["has_more"] is True
+
+    @pytest.mark.asyncio
+    async def test_error_sent_once(self, worker_with_mount):
+        channel = self.make_channel()
+        message = (
+            f"{MSG_FS_LIST_DIR}{MSG_SEPARATOR}/etc{MSG_SEPARATOR}0{MSG_SEPARATOR}100"
+        )
+
+        await worker_with_mount.stream_fs_listing(message, channel, "client")
+
+        assert channel.send.call_count == 1
+        assert channel.send.call_args[0][0].startswith(MSG_FS_ERROR)